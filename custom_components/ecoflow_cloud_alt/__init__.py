@@ -43,6 +43,16 @@ CONF_LOAD_ALL_DEVICES: Final = "load_all_devices"
 CONF_GROUP: Final = "group"
 CONF_DEVICE_LIST: Final = "devices_list"
 CONF_ENTRY_ID: Final = "entry_id"
+CONF_WILDCARD_SUBSCRIPTION: Final = "wildcard_subscription"
+CONF_MQTT_SHARDS: Final = "mqtt_shards"
+CONF_PERSISTENT_SESSION: Final = "persistent_session"
+CONF_MQTT_CLIENT_IDS: Final = "mqtt_client_ids"
+# not exposed in the UI: points the entry at a local cloud stand-in (see tools/ecoflow_standin)
+CONF_API_BASE_URI: Final = "api_base_uri"
+# not exposed in the UI: appends all inbound MQTT messages to this file (see tools/mqtt_replay.py)
+CONF_MQTT_CAPTURE_FILE: Final = "mqtt_capture_file"
+# not exposed in the UI: file of the energy history (see OPTS_ENERGY_HISTORY) instead of the default one
+CONF_ENERGY_STORE_FILE: Final = "energy_store_file"
 
 CONF_SELECT_DEVICE_KEY: Final = "select_device"
 
@@ -52,8 +62,28 @@ CONF_DEVICE_ID: Final = "device_id"
 OPTS_DIAGNOSTIC_MODE: Final = "diagnostic_mode"
 OPTS_POWER_STEP: Final = "power_step"
 OPTS_REFRESH_PERIOD_SEC: Final = "refresh_period_sec"
+# publish policies of watt, volt and temperature sensors (devices/publish_policy.py), 0 turns a limit off
+OPTS_DEADBAND_WATTS: Final = "deadband_watts"
+OPTS_DEADBAND_VOLTS: Final = "deadband_volts"
+OPTS_DEADBAND_TEMPERATURES: Final = "deadband_temperatures"
+OPTS_DEADBAND_PERCENT: Final = "deadband_percent"
+OPTS_MIN_PUBLISH_INTERVAL_SEC: Final = "min_publish_interval_sec"
+OPTS_MAX_PUBLISH_INTERVAL_SEC: Final = "max_publish_interval_sec"
+# entry wide: broadcast new data as it arrives, at most once per push_min_interval_sec, instead of polling
+OPTS_PUSH_MODE: Final = "push_mode"
+OPTS_PUSH_MIN_INTERVAL_SEC: Final = "push_min_interval_sec"
+# entry wide: keep reported energy totals and event records locally (api/energy_store.py), with energy
+# sensors reading them; energy_history_retention_days of history are kept, 0 keeps everything
+OPTS_ENERGY_HISTORY: Final = "energy_history"
+OPTS_ENERGY_HISTORY_RETENTION_DAYS: Final = "energy_history_retention_days"
 
 DEFAULT_REFRESH_PERIOD_SEC: Final = 5
+DEFAULT_PUSH_MIN_INTERVAL_SEC: Final = 1.0
+DEFAULT_MQTT_SHARDS: Final = 1
+MAX_MQTT_SHARDS: Final = 8
+DEFAULT_ENERGY_HISTORY_RETENTION_DAYS: Final = 90.0
+
+SIGNAL_ENERGY_TYPES: Final = ECOFLOW_DOMAIN + "_energy_types_{}"
 
 
 @dataclasses.dataclass
@@ -68,6 +98,12 @@ class DeviceOptions:
     refresh_period: int
     power_step: int
     diagnostic_mode: bool
+    deadband_watts: float = 0.0
+    deadband_volts: float = 0.0
+    deadband_temperatures: float = 0.0
+    deadband_percent: float = 0.0
+    min_publish_interval: float = 0.0
+    max_publish_interval: float = 0.0
 
 
 async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry):
@@ -166,7 +202,10 @@ def extract_options(entry: ConfigEntry) -> dict[str, DeviceOptions]:
     options: dict[str, DeviceOptions] = {}
     for sn, device_option in entry.options[CONF_DEVICE_LIST].items():
         options[sn] = DeviceOptions(
-            device_option[OPTS_REFRESH_PERIOD_SEC], device_option[OPTS_POWER_STEP], device_option[OPTS_DIAGNOSTIC_MODE]
+            device_option[OPTS_REFRESH_PERIOD_SEC], device_option[OPTS_POWER_STEP], device_option[OPTS_DIAGNOSTIC_MODE],
+            device_option.get(OPTS_DEADBAND_WATTS, 0.0), device_option.get(OPTS_DEADBAND_VOLTS, 0.0),
+            device_option.get(OPTS_DEADBAND_TEMPERATURES, 0.0), device_option.get(OPTS_DEADBAND_PERCENT, 0.0),
+            device_option.get(OPTS_MIN_PUBLISH_INTERVAL_SEC, 0.0), device_option.get(OPTS_MAX_PUBLISH_INTERVAL_SEC, 0.0)
         )
     return options
 
@@ -181,14 +220,31 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
 
     if CONF_USERNAME in entry.data and CONF_PASSWORD in entry.data:
         api_client = EcoflowPrivateApiClient(entry.data[CONF_USERNAME], entry.data[CONF_PASSWORD],
-                                             entry.data[CONF_GROUP])
+                                             entry.data[CONF_GROUP], entry.data.get(CONF_API_BASE_URI))
 
     elif CONF_ACCESS_KEY in entry.data and CONF_SECRET_KEY in entry.data:
         api_client = EcoflowPublicApiClient(entry.data[CONF_ACCESS_KEY], entry.data[CONF_SECRET_KEY],
-                                            entry.data[CONF_GROUP])
+                                            entry.data[CONF_GROUP], entry.data.get(CONF_API_BASE_URI))
     else:
         return False
 
+    api_client.wildcard_subscription = entry.data.get(CONF_WILDCARD_SUBSCRIPTION, False)
+    api_client.mqtt_shards = entry.data.get(CONF_MQTT_SHARDS, DEFAULT_MQTT_SHARDS)
+    api_client.persistent_session = entry.data.get(CONF_PERSISTENT_SESSION, False)
+    api_client.stored_client_ids = list(entry.data.get(CONF_MQTT_CLIENT_IDS, []))
+    if entry.data.get(CONF_MQTT_CAPTURE_FILE):
+        api_client.capture_path = hass.config.path(entry.data[CONF_MQTT_CAPTURE_FILE])
+    if entry.options.get(OPTS_ENERGY_HISTORY, False):
+        from homeassistant.helpers.dispatcher import dispatcher_send
+        from .api.energy_store import EcoflowEnergyStore
+        api_client.energy_store = EcoflowEnergyStore(
+            hass.config.path(entry.data.get(CONF_ENERGY_STORE_FILE, f"{ECOFLOW_DOMAIN}_energy_{entry.entry_id}.db")),
+            retention_days=float(entry.options.get(OPTS_ENERGY_HISTORY_RETENTION_DAYS,
+                                                   DEFAULT_ENERGY_HISTORY_RETENTION_DAYS)))
+        await hass.async_add_executor_job(api_client.energy_store.load_latest)
+        # the sensor platform adds an energy sensor for every new watth_type
+        signal = SIGNAL_ENERGY_TYPES.format(entry.entry_id)
+        api_client.energy_store.new_type_listener = lambda: dispatcher_send(hass, signal)
     await api_client.login()
 
     devices_list: dict[str, DeviceData] = {}
@@ -209,15 +265,32 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         except Exception:  # pylint: disable=broad-except
             _LOGGER.exception("Unexpected exception in fetch device action")
 
+    if entry.options.get(OPTS_PUSH_MODE, False):
+        from .devices.push_scheduler import EcoflowPushScheduler
+        api_client.push_scheduler = EcoflowPushScheduler(
+            hass, float(entry.options.get(OPTS_PUSH_MIN_INTERVAL_SEC, DEFAULT_PUSH_MIN_INTERVAL_SEC)))
+
+    from .devices.publish_policy import publish_policies
     for sn, device_data in devices_list.items():
         device_option = devices_options[sn]
         device = api_client.configure_device(device_data.sn, device_data.name, device_data.device_type,
                                              device_option.power_step)
-        device.configure(hass, device_option.refresh_period, device_option.diagnostic_mode)
+        device.configure(hass, device_option.refresh_period, device_option.diagnostic_mode,
+                         api_client.push_scheduler,
+                         publish_policies(device_option.deadband_watts, device_option.deadband_volts,
+                                          device_option.deadband_temperatures, device_option.deadband_percent,
+                                          device_option.min_publish_interval, device_option.max_publish_interval))
 
     await hass.async_add_executor_job(api_client.start)
+    if api_client.mqtt_client_ids != api_client.stored_client_ids:
+        hass.config_entries.async_update_entry(entry, data={**entry.data,
+                                                            CONF_MQTT_CLIENT_IDS: api_client.mqtt_client_ids})
     hass.data[ECOFLOW_DOMAIN][entry.entry_id] = api_client
     await hass.config_entries.async_forward_entry_setups(entry, _PLATFORMS)
+    for device in api_client.devices.values():
+        device.data.apply_keys()
+    if api_client.push_scheduler:
+        api_client.push_scheduler.start()
     await api_client.quota_all(None)
 
     entry.async_on_unload(entry.add_update_listener(update_listener))
@@ -230,7 +303,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
         return False
 
     client: EcoflowApiClient = hass.data[ECOFLOW_DOMAIN].pop(entry.entry_id)
-    client.stop()
+    if client.push_scheduler:
+        client.push_scheduler.stop()
+    # joins the MQTT threads and closes the files of the entry, off the event loop
+    await hass.async_add_executor_job(client.stop)
     return True
 
 
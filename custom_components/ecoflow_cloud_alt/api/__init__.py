@@ -20,6 +20,7 @@ class EcoflowMqttInfo:
     username: str
     password: str
     client_id: str | None = None
+    tls: bool = True
 
 
 class EcoflowApiClient:
@@ -28,6 +29,15 @@ class EcoflowApiClient:
         self.mqtt_info: EcoflowMqttInfo
         self.devices: dict[str, Any] = {}
         self.mqtt_client = None
+        self.wildcard_subscription = False
+        self.mqtt_shards = 1
+        self.persistent_session = False
+        self.stored_client_ids: list[str] = []
+        self.mqtt_client_ids: list[str] = []
+        self.capture_path: str | None = None
+        self.capture = None
+        self.energy_store = None
+        self.push_scheduler = None
 
     @abstractmethod
     async def login(self):
@@ -46,10 +56,15 @@ class EcoflowApiClient:
         pass
 
     def add_device(self, device):
+        device.energy_store = self.energy_store
         self.devices[device.device_info.sn] = device
+        if self.mqtt_client:
+            self.mqtt_client.rebuild_routes()
 
     def remove_device(self, device):
         self.devices.pop(device.device_info.sn, None)
+        if self.mqtt_client:
+            self.mqtt_client.rebuild_routes()
 
     def _accept_mqqt_certification(self, resp_json: dict):
         _LOGGER.info(f"Received MQTT credentials: {resp_json}")
@@ -58,7 +73,8 @@ class EcoflowApiClient:
             mqtt_port = int(resp_json["data"]["port"])
             mqtt_username = resp_json["data"]["certificateAccount"]
             mqtt_password = resp_json["data"]["certificatePassword"]
-            self.mqtt_info = EcoflowMqttInfo(mqtt_url, mqtt_port, mqtt_username, mqtt_password)
+            mqtt_tls = resp_json["data"].get("protocol", "mqtts") != "mqtt"
+            self.mqtt_info = EcoflowMqttInfo(mqtt_url, mqtt_port, mqtt_username, mqtt_password, tls=mqtt_tls)
         except KeyError as key:
             raise EcoflowException(f"Failed to extract key {key} from {resp_json}")
 
@@ -81,9 +97,41 @@ class EcoflowApiClient:
 
         return json_resp
 
+    def _shard_client_id(self, index: int) -> str:
+        if index == 0:
+            return self.mqtt_info.client_id
+        return f"{self.mqtt_info.client_id}-{index}"
+
+    def _resolve_client_ids(self) -> list[str]:
+        # reuse the client ids of previous runs, so the broker can resume their sessions
+        # and no new ids are spent from the daily client id quota
+        client_ids = list(self.stored_client_ids[:self.mqtt_shards])
+        while len(client_ids) < self.mqtt_shards:
+            client_ids.append(self._shard_client_id(len(client_ids)))
+        return client_ids + self.stored_client_ids[len(client_ids):]
+
     def start(self):
-        from custom_components.ecoflow_cloud_alt.api.ecoflow_mqtt import EcoflowMQTTClient
-        self.mqtt_client = EcoflowMQTTClient(self.mqtt_info, self.devices)
+        from custom_components.ecoflow_cloud_alt.api.capture import EcoflowCaptureWriter
+        from custom_components.ecoflow_cloud_alt.api.ecoflow_mqtt import EcoflowMQTTClient, EcoflowShardedMQTTClient
+        self.mqtt_client_ids = self._resolve_client_ids()
+        self.mqtt_info.client_id = self.mqtt_client_ids[0]
+        if self.capture_path:
+            self.capture = EcoflowCaptureWriter(self.capture_path)
+            self.capture.open()
+        if self.mqtt_shards > 1:
+            self.mqtt_client = EcoflowShardedMQTTClient(self.mqtt_info, self.devices,
+                                                        self.mqtt_client_ids[:self.mqtt_shards],
+                                                        self.wildcard_subscription, self.persistent_session,
+                                                        self.capture)
+        else:
+            self.mqtt_client = EcoflowMQTTClient(self.mqtt_info, self.devices, self.wildcard_subscription,
+                                                 self.persistent_session, self.capture)
 
     def stop(self):
+        """Blocking: joins the threads of the MQTT connections. The push scheduler is stopped
+        on the event loop before."""
         self.mqtt_client.stop()
+        if self.capture:
+            self.capture.close()
+        if self.energy_store:
+            self.energy_store.close()
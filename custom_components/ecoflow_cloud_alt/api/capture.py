@@ -0,0 +1,89 @@
+import dataclasses
+import json
+import logging
+import struct
+import threading
+import time
+from typing import Any, BinaryIO, Iterator
+
+_LOGGER = logging.getLogger(__name__)
+
+CAPTURE_MAGIC = b"EFCAP1\n"
+
+RECORD_MESSAGE = b"M"
+RECORD_DEVICES = b"D"
+
+# record type, receive time (unix seconds), topic length, payload length
+_RECORD_HEADER = struct.Struct("<cdHI")
+
+
+class EcoflowCaptureWriter:
+    """Appends every inbound MQTT message to a compact binary file.
+
+    Each record is a fixed header (type, receive time, topic and payload lengths) followed by
+    the topic and the raw payload bytes. Device records hold the device infos as JSON, so a
+    capture can be replayed without the config entry it was taken from. Writes go through a
+    buffered file; one writer can be shared by several MQTT connections.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.__lock = threading.Lock()
+        self.__file: BinaryIO | None = None
+        self.records = 0
+        self.bytes_written = 0
+
+    def open(self):
+        with self.__lock:
+            if self.__file is not None:
+                return
+            self.__file = open(self.path, "ab", buffering=64 * 1024)
+            if self.__file.tell() == 0:
+                self.__file.write(CAPTURE_MAGIC)
+        _LOGGER.info(f"Capturing MQTT messages to {self.path}")
+
+    def close(self):
+        with self.__lock:
+            if self.__file is not None:
+                self.__file.close()
+                self.__file = None
+
+    def write_devices(self, devices: dict[str, Any]):
+        infos = {sn: dataclasses.asdict(device.device_info) for (sn, device) in devices.items()}
+        self.__write(RECORD_DEVICES, "", json.dumps(infos).encode("utf-8"))
+
+    def write_message(self, topic: str, payload: bytes):
+        self.__write(RECORD_MESSAGE, topic, payload)
+
+    def __write(self, record_type: bytes, topic: str, payload: bytes):
+        topic_bytes = topic.encode("utf-8")
+        header = _RECORD_HEADER.pack(record_type, time.time(), len(topic_bytes), len(payload))
+        with self.__lock:
+            if self.__file is None:
+                return
+            self.__file.write(header)
+            self.__file.write(topic_bytes)
+            self.__file.write(payload)
+            self.records += 1
+            self.bytes_written += len(header) + len(topic_bytes) + len(payload)
+
+    def stats(self) -> dict[str, Any]:
+        return {"path": self.path, "records": self.records, "bytes": self.bytes_written}
+
+
+def read_capture(path: str) -> Iterator[tuple[bytes, float, str, bytes]]:
+    """Yields (record type, receive time, topic, payload) from a capture file."""
+    with open(path, "rb") as file:
+        if file.read(len(CAPTURE_MAGIC)) != CAPTURE_MAGIC:
+            raise ValueError(f"{path} is not an MQTT capture file")
+        while True:
+            header = file.read(_RECORD_HEADER.size)
+            if len(header) < _RECORD_HEADER.size:
+                return
+            (record_type, received, topic_len, payload_len) = _RECORD_HEADER.unpack(header)
+            topic = file.read(topic_len).decode("utf-8")
+            payload = file.read(payload_len)
+            if len(payload) < payload_len:
+                # the last record of a capture that was cut off mid-write
+                return
+            yield record_type, received, topic, payload
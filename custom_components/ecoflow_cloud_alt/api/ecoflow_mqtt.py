@@ -1,3 +1,4 @@
+import hashlib
 import json
 import logging
 import random
@@ -6,57 +7,130 @@ import time
 from _socket import SocketType
 from typing import Any
 
+import attr
 from homeassistant.core import callback
 
 from custom_components.ecoflow_cloud_alt.api import EcoflowMqttInfo
-from custom_components.ecoflow_cloud_alt.devices import BaseDevice
+from custom_components.ecoflow_cloud_alt.api.capture import EcoflowCaptureWriter
+from custom_components.ecoflow_cloud_alt.api.ingest import EcoflowIngestQueue
+from custom_components.ecoflow_cloud_alt.api.supervisor import EcoflowConnectionSupervisor, merge_supervisor_stats
+from custom_components.ecoflow_cloud_alt.devices import BaseDevice, TOPIC_KIND_DATA
 
 _LOGGER = logging.getLogger(__name__)
 
+RATE_WINDOW_SEC = 60
+
+
+def build_routes(devices: dict[str, BaseDevice]) -> dict[str, tuple[BaseDevice, str]]:
+    """Maps every topic of the devices to (device, topic kind)."""
+    routes: dict[str, tuple[BaseDevice, str]] = {}
+    for (sn, device) in devices.items():
+        for (topic, kind) in device.device_info.topic_kinds().items():
+            routes[topic] = (device, kind)
+    return routes
+
 
 class EcoflowMQTTClient:
 
-    def __init__(self, mqtt_info: EcoflowMqttInfo, devices: dict[str, BaseDevice]):
+    def __init__(self, mqtt_info: EcoflowMqttInfo, devices: dict[str, BaseDevice], wildcard: bool = False,
+                 persistent_session: bool = False, capture: EcoflowCaptureWriter | None = None):
 
         from ..devices import BaseDevice
         self.connected = False
+        # a failed connect attempt is reported to the supervisor once, however paho reports it
+        self.__attempt_failed = False
+        self.__stopped = False
+        self.__capture = capture
+        self.__persistent_session = persistent_session
+        self.__subscribed_topics: list[str] = []
         self.__mqtt_info = mqtt_info
         self.__devices: dict[str, BaseDevice] = devices
+        self.__wildcard = wildcard
+        self.__routes: dict[str, tuple[BaseDevice, str]] = {}
+        self.unmatched_messages = 0
+        self.received_messages = 0
+        self.message_rate = 0.0
+        self.__rate_window_start = time.monotonic()
+        self.__rate_window_count = 0
+        self.rebuild_routes()
+
+        self.__ingest = EcoflowIngestQueue(self.__handle_message, coalesced_kinds=(TOPIC_KIND_DATA,),
+                                           coalesce=BaseDevice.merge_data)
+        self.__ingest.start()
 
         from homeassistant.components.mqtt.async_client import AsyncMQTTClient
         self.__client: AsyncMQTTClient = AsyncMQTTClient(
                                                          client_id=self.__mqtt_info.client_id,
-                                                         reconnect_on_failure=True,
-                                                         clean_session=True)
+                                                         reconnect_on_failure=False,
+                                                         clean_session=not persistent_session)
 
         # self.__client._connect_timeout = 15.0
         self.__client.setup()
         self.__client.username_pw_set(self.__mqtt_info.username, self.__mqtt_info.password)
-        self.__client.tls_set(certfile=None, keyfile=None, cert_reqs=ssl.CERT_REQUIRED)
-        self.__client.tls_insecure_set(False)
+        if self.__mqtt_info.tls:
+            self.__client.tls_set(certfile=None, keyfile=None, cert_reqs=ssl.CERT_REQUIRED)
+            self.__client.tls_insecure_set(False)
         self.__client.on_connect = self._on_connect
         self.__client.on_disconnect = self._on_disconnect
         self.__client.on_message = self._on_message
         self.__client.on_socket_close = self._on_socket_close
 
+        # reconnects are driven by the supervisor instead of paho's own retry loop
+        self.__supervisor = EcoflowConnectionSupervisor(self.__mqtt_info.client_id, self.__do_reconnect)
+        self.__supervisor.start()
+
         _LOGGER.info(
             f"Connecting to MQTT Broker {self.__mqtt_info.url}:{self.__mqtt_info.port} with client id {self.__mqtt_info.client_id} and username {self.__mqtt_info.username}")
-        self.__client.connect(self.__mqtt_info.url, self.__mqtt_info.port, keepalive=15)
-        self.__client.loop_start()
+        try:
+            self.__client.connect(self.__mqtt_info.url, self.__mqtt_info.port, keepalive=15)
+            self.__client.loop_start()
+        except Exception as error:
+            _LOGGER.error(f"Failed to connect to MQTT Broker: {error}")
+            self.__notify_attempt_failed(str(error))
+
+    def rebuild_routes(self):
+        # swapped in one assignment, so the paho thread never sees a half-built table
+        self.__routes = build_routes(self.__devices)
+        if self.__capture:
+            self.__capture.write_devices(self.__devices)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "client_id": self.__mqtt_info.client_id,
+            "connected": self.is_connected(),
+            "devices": len(self.__devices),
+            "received_messages": self.received_messages,
+            "message_rate": round(self.message_rate, 2),
+            "routes": len(self.__routes),
+            "wildcard_subscription": self.__wildcard,
+            "persistent_session": self.__persistent_session,
+            "unmatched_messages": self.unmatched_messages,
+            "ingest": self.__ingest.stats(),
+            "capture": self.__capture.stats() if self.__capture else None,
+            "supervisor": self.__supervisor.stats(),
+        }
 
-    def is_connected(self):
+    def supervisor_stats(self, device_sn: str | None = None) -> dict[str, Any]:
+        return self.__supervisor.stats()
+
+    def connection_anchors(self) -> list[str]:
+        """The SN of one device per connection (the lowest, stable across restarts), to hang
+        entities describing the connection on."""
+        return [min(self.__devices)] if self.__devices else []
+
+    def is_connected(self, device_sn: str | None = None):
         return self.__client.is_connected()
 
-    def reconnect(self) -> bool:
-        try:
-            _LOGGER.info(f"Re-connecting to MQTT Broker {self.__mqtt_info.url}:{self.__mqtt_info.port}")
-            self.__client.loop_stop(True)
-            self.__client.reconnect()
-            self.__client.loop_start()
-            return True
-        except Exception as e:
-            _LOGGER.error(e)
-            return False
+    def reconnect(self, device_sn: str | None = None) -> bool:
+        self.__supervisor.request_reconnect("requested" if device_sn is None else f"stale data from {device_sn}")
+        return True
+
+    def __do_reconnect(self):
+        _LOGGER.info(f"Re-connecting to MQTT Broker {self.__mqtt_info.url}:{self.__mqtt_info.port}")
+        self.__attempt_failed = False
+        self.__client.loop_stop()
+        self.__client.reconnect()
+        self.__client.loop_start()
 
     @callback
     def _on_socket_close(self, client, userdata: Any, sock: SocketType) -> None:
@@ -66,30 +140,72 @@ class EcoflowMQTTClient:
     def _on_connect(self, client, userdata, flags, rc):
         if rc == 0:
             self.connected = True
-            target_topics = [(topic, 1) for topic in self.__target_topics()]
+            self.__supervisor.notify_connected()
+            topics = self.__target_topics()
+            if self.__session_present(flags) and topics == self.__subscribed_topics:
+                # the broker kept our subscriptions and queued QoS1 messages while we were away
+                _LOGGER.info(f"Resumed MQTT session {self.__mqtt_info.client_id}, keeping {len(topics)} subscriptions")
+                return
+            target_topics = [(topic, 1) for topic in topics]
             self.__client.subscribe(target_topics)
+            self.__subscribed_topics = topics
             _LOGGER.info(f"Subscribed to MQTT topics {target_topics}")
         else:
             self.__log_with_reason("connect", client, userdata, rc)
+            self.__notify_attempt_failed(self.__error_string(rc))
 
     @callback
     def _on_disconnect(self, client, userdata, rc):
+        if self.__stopped:
+            return
         if not self.connected:
-            # from homeassistant/components/mqtt/client.py
-            # This function is re-entrant and may be called multiple times
-            # when there is a broken pipe error.
+            # the socket closed before CONNACK: paho does not retry (reconnect_on_failure=False),
+            # so the supervisor has to. This function is also re-entrant and may be called
+            # multiple times when there is a broken pipe error (homeassistant/components/mqtt/client.py)
+            self.__notify_attempt_failed(self.__error_string(rc))
             return
         self.connected = False
         if rc != 0:
             self.__log_with_reason("disconnect", client, userdata, rc)
-            time.sleep(5)
+            self.__supervisor.notify_disconnected(self.__error_string(rc))
+            self.__supervisor.request_reconnect("unexpected disconnect")
+
+    def __notify_attempt_failed(self, error: str):
+        if not self.__attempt_failed:
+            self.__attempt_failed = True
+            self.__supervisor.notify_connect_failed(error)
 
     @callback
     def _on_message(self, client, userdata, message):
+        self.__count_message()
+        if self.__capture:
+            self.__capture.write_message(message.topic, message.payload)
+        route = self.__routes.get(message.topic)
+        if route is None:
+            self.unmatched_messages += 1
+            _LOGGER.debug(f"No device for topic {message.topic}")
+            return
+
+        (device, kind) = route
+        # decoding happens on the ingest thread, keep the network thread free for socket reads
+        self.__ingest.put(device, kind, message.topic, message.payload)
+
+    def __count_message(self):
+        self.received_messages += 1
+        self.__rate_window_count += 1
+        now = time.monotonic()
+        elapsed = now - self.__rate_window_start
+        if elapsed >= RATE_WINDOW_SEC:
+            self.message_rate = self.__rate_window_count / elapsed
+            self.__rate_window_start = now
+            self.__rate_window_count = 0
+
+    def __handle_message(self, device: BaseDevice, kind: str, payload: bytes | None, merged: dict[str, Any] | None):
         try:
-            for (sn, device) in self.__devices.items():
-                if device.update_data(message.payload, message.topic):
-                    _LOGGER.debug(f"Message for {sn} and Topic {message.topic}")
+            # merged: data messages that arrived while this one was pending, already decoded
+            handled = device.handle_message(kind, payload) if merged is None else device.apply_message(kind, merged)
+            if handled:
+                _LOGGER.debug(f"Message for {device.device_info.sn} ({kind})")
         except UnicodeDecodeError as error:
             _LOGGER.error(f"UnicodeDecodeError: {error}. Ignoring message and waiting for the next one.")
 
@@ -125,13 +241,28 @@ class EcoflowMQTTClient:
         self.__devices[device_sn].data.update_to_target_state(mqtt_state)
 
     def stop(self):
-        self.__client.unsubscribe(self.__target_topics())
+        self.__stopped = True
+        self.__supervisor.stop()
+        if not self.__persistent_session:
+            self.__client.unsubscribe(self.__target_topics())
         self.__client.loop_stop()
         self.__client.disconnect()
+        self.__ingest.stop()
+
+    def __session_present(self, flags) -> bool:
+        if not self.__persistent_session:
+            return False
+        if isinstance(flags, dict):
+            return bool(flags.get("session present", 0))
+        return bool(getattr(flags, "session_present", False))
 
     def __log_with_reason(self, action: str, client, userdata, rc):
+        _LOGGER.error(f"MQTT {action}: {self.__error_string(rc)} ({self.__mqtt_info.client_id}) - {userdata}")
+
+    @staticmethod
+    def __error_string(rc) -> str:
         import paho.mqtt.client as mqtt_client
-        _LOGGER.error(f"MQTT {action}: {mqtt_client.error_string(rc)} ({self.__mqtt_info.client_id}) - {userdata}")
+        return mqtt_client.error_string(rc)
 
     message_id = 999900000 + random.randint(10000, 99999)
 
@@ -163,8 +294,104 @@ class EcoflowMQTTClient:
             _LOGGER.error(f"Error sending to {topic}: {error}")
 
     def __target_topics(self) -> list[str]:
+        if self.__wildcard:
+            # a handful of wildcard filters cover every device of the account,
+            # messages are matched back to devices through the routing table
+            topics = set[str]()
+            for (sn, device) in self.__devices.items():
+                topics.update(device.device_info.wildcard_topics())
+            return sorted(topics)
+
         topics = []
         for (sn, device) in self.__devices.items():
             for topic in device.device_info.topics():
                 topics.append(topic)
         return topics
+
+
+def shard_for(device_sn: str, shards: int) -> int:
+    """Jump consistent hash of the SN: stable across restarts, and only ~1/n of the
+    devices move to another shard when the shard count changes from n-1 to n."""
+    key = int.from_bytes(hashlib.md5(device_sn.encode("utf-8")).digest()[:8], "little")
+    bucket, j = -1, 0
+    while j < shards:
+        bucket = j
+        key = (key * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+        j = int((bucket + 1) * ((1 << 31) / ((key >> 33) + 1)))
+    return bucket
+
+
+class EcoflowShardedMQTTClient:
+    """Spreads the devices of one account over several MQTT connections.
+
+    Every shard is a complete EcoflowMQTTClient (own client id, paho loop thread and
+    ingest thread) that only subscribes to the topics of its own devices."""
+
+    def __init__(self, mqtt_info: EcoflowMqttInfo, devices: dict[str, BaseDevice], client_ids: list[str],
+                 wildcard: bool = False, persistent_session: bool = False,
+                 capture: EcoflowCaptureWriter | None = None):
+        if wildcard:
+            # the config flow rejects this combination, only entries edited by hand get here
+            _LOGGER.warning("Wildcard subscription is not used with multiple MQTT connections")
+
+        self.__devices: dict[str, BaseDevice] = devices
+        self.__shard_devices: list[dict[str, BaseDevice]] = [{} for _ in client_ids]
+        self.__assign_devices()
+
+        self.__shards: list[EcoflowMQTTClient] = []
+        for (index, client_id) in enumerate(client_ids):
+            shard_info = attr.evolve(mqtt_info, client_id=client_id)
+            self.__shards.append(EcoflowMQTTClient(shard_info, self.__shard_devices[index],
+                                                   persistent_session=persistent_session, capture=capture))
+
+    def rebuild_routes(self):
+        self.__assign_devices()
+        for shard in self.__shards:
+            shard.rebuild_routes()
+
+    def stats(self) -> dict[str, Any]:
+        shards = [shard.stats() for shard in self.__shards]
+        return {
+            "shards": shards,
+            "received_messages": sum(s["received_messages"] for s in shards),
+            "unmatched_messages": sum(s["unmatched_messages"] for s in shards),
+        }
+
+    def is_connected(self, device_sn: str | None = None):
+        if device_sn is None:
+            return all(shard.is_connected() for shard in self.__shards)
+        return self.__shard(device_sn).is_connected()
+
+    def reconnect(self, device_sn: str | None = None) -> bool:
+        if device_sn is None:
+            return all([shard.reconnect() for shard in self.__shards])
+        return self.__shard(device_sn).reconnect(device_sn)
+
+    def supervisor_stats(self, device_sn: str | None = None) -> dict[str, Any]:
+        if device_sn is None:
+            return merge_supervisor_stats([shard.supervisor_stats() for shard in self.__shards])
+        return self.__shard(device_sn).supervisor_stats(device_sn)
+
+    def connection_anchors(self) -> list[str]:
+        return [sn for shard in self.__shards for sn in shard.connection_anchors()]
+
+    def send_get_message(self, device_sn: str, command: dict):
+        self.__shard(device_sn).send_get_message(device_sn, command)
+
+    def send_set_message(self, device_sn: str, mqtt_state: dict[str, Any], command: dict):
+        self.__shard(device_sn).send_set_message(device_sn, mqtt_state, command)
+
+    def stop(self):
+        for shard in self.__shards:
+            shard.stop()
+
+    def __shard(self, device_sn: str) -> EcoflowMQTTClient:
+        return self.__shards[shard_for(device_sn, len(self.__shards))]
+
+    def __assign_devices(self):
+        count = len(self.__shard_devices)
+        for (index, shard_devices) in enumerate(self.__shard_devices):
+            for sn in [sn for sn in shard_devices if sn not in self.__devices]:
+                shard_devices.pop(sn)
+        for (sn, device) in self.__devices.items():
+            self.__shard_devices[shard_for(sn, count)][sn] = device
@@ -0,0 +1,230 @@
+import array
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Iterable
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_ROWS = 64
+DEFAULT_FLUSH_INTERVAL_SEC = 60.0
+DEFAULT_RETENTION_DAYS = 90.0
+PRUNE_INTERVAL_SEC = 24 * 3600.0
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS energy (
+        sn TEXT NOT NULL,
+        watth_type INTEGER NOT NULL,
+        timestamp INTEGER NOT NULL,
+        watth BLOB NOT NULL,
+        received REAL NOT NULL,
+        PRIMARY KEY (sn, watth_type, timestamp)
+    ) WITHOUT ROWID""",
+    """CREATE TABLE IF NOT EXISTS event (
+        sn TEXT NOT NULL,
+        timestamp INTEGER NOT NULL,
+        sys_ms INTEGER NOT NULL,
+        event_no INTEGER NOT NULL,
+        detail BLOB NOT NULL,
+        PRIMARY KEY (sn, timestamp, sys_ms, event_no)
+    ) WITHOUT ROWID""",
+)
+
+
+def _pack(values: Iterable, typecode: str) -> bytes:
+    return array.array(typecode, values).tobytes()
+
+
+def _unpack(blob: bytes, typecode: str) -> list:
+    return array.array(typecode, blob).tolist()
+
+
+class EcoflowEnergyStore:
+    """Local history of the energy totals and event records that devices report.
+
+    Energy items are kept per (sn, watth_type, timestamp), with the watth array packed as
+    unsigned 32-bit values; devices re-send the item of the running period with a growing
+    array, so a newer report replaces the stored one. Rows are buffered and written in one
+    transaction once enough are pending or the flush interval has passed. The database is
+    only created when the first report arrives. Rows with a (device) timestamp older than
+    retention_days are deleted on the first flush and then once a day (0 keeps everything).
+
+    The total of the newest item of each (sn, watth_type) is also kept in memory, for the energy
+    sensors to read on the event loop; load_latest fills it from the database at startup, and
+    new_type_listener is called (from the reporting thread) when a device reports a new type.
+    """
+
+    def __init__(self, path: str, flush_rows: int = DEFAULT_FLUSH_ROWS,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL_SEC, retention_days: float = DEFAULT_RETENTION_DAYS):
+        self.path = path
+        self.__flush_rows = max(flush_rows, 1)
+        self.__flush_interval = flush_interval
+        self.__retention = max(retention_days, 0.0) * 24 * 3600
+        self.__last_prune: float | None = None
+        self.__lock = threading.Lock()
+        self.__connection: sqlite3.Connection | None = None
+        self.__energy: dict[tuple[str, int, int], tuple[bytes, float]] = {}
+        self.__events: dict[tuple[str, int, int, int], bytes] = {}
+        self.__last_flush = time.monotonic()
+        # (sn, watth_type) -> (timestamp, sum of watth) of the newest item
+        self.__latest: dict[tuple[str, int], tuple[int, int]] = {}
+        self.new_type_listener: Callable[[], None] | None = None
+        self.energy_rows = 0
+        self.event_rows = 0
+        self.flushes = 0
+        self.pruned_rows = 0
+
+    def add_energy(self, sn: str, items: Iterable[tuple[int, int, Iterable[int]]]):
+        """Buffers (watth_type, timestamp, watth) items of one device."""
+        received = time.time()
+        new_type = False
+        with self.__lock:
+            for (watth_type, timestamp, watth) in items:
+                values = array.array("I", watth)
+                self.__energy[(sn, watth_type, timestamp)] = (values.tobytes(), received)
+                new_type |= self.__set_latest(sn, watth_type, timestamp, sum(values))
+            self.__flush_if_due()
+        if new_type and self.new_type_listener is not None:
+            self.new_type_listener()
+
+    def add_events(self, sn: str, items: Iterable[tuple[int, int, int, Iterable[float]]]):
+        """Buffers (timestamp, sys_ms, event_no, event_detail) records of one device."""
+        with self.__lock:
+            for (timestamp, sys_ms, event_no, detail) in items:
+                self.__events[(sn, timestamp, sys_ms, event_no)] = _pack(detail, "f")
+            self.__flush_if_due()
+
+    def flush(self):
+        with self.__lock:
+            self.__flush()
+
+    def close(self):
+        with self.__lock:
+            self.__flush()
+            if self.__connection is not None:
+                self.__connection.close()
+                self.__connection = None
+
+    def energy(self, sn: str, watth_type: int, start: int = 0, end: int | None = None) -> list[tuple[int, list[int]]]:
+        """(timestamp, watth) of the stored items of one type, oldest first."""
+        query = "SELECT timestamp, watth FROM energy WHERE sn = ? AND watth_type = ? AND timestamp >= ?"
+        args: list[Any] = [sn, watth_type, start]
+        if end is not None:
+            query += " AND timestamp < ?"
+            args.append(end)
+        with self.__lock:
+            connection = self.__reader()
+            if connection is None:
+                return []
+            rows = connection.execute(query + " ORDER BY timestamp", args).fetchall()
+        return [(timestamp, _unpack(watth, "I")) for (timestamp, watth) in rows]
+
+    def latest_energy(self, sn: str) -> dict[int, tuple[int, int]]:
+        """watth_type -> (timestamp, sum of watth) of the newest item of each type; memory only."""
+        with self.__lock:
+            return {watth_type: latest for ((item_sn, watth_type), latest) in self.__latest.items() if item_sn == sn}
+
+    def load_latest(self):
+        """Blocking: reads the newest stored item of each (sn, watth_type) into memory."""
+        with self.__lock:
+            connection = self.__reader()
+            if connection is None:
+                return
+            # SQLite takes the other columns from the row holding the MAX
+            rows = connection.execute("SELECT sn, watth_type, MAX(timestamp), watth FROM energy "
+                                      "GROUP BY sn, watth_type").fetchall()
+            for (sn, watth_type, timestamp, watth) in rows:
+                self.__set_latest(sn, watth_type, timestamp, sum(_unpack(watth, "I")))
+
+    def energy_types(self, sn: str) -> list[int]:
+        with self.__lock:
+            connection = self.__reader()
+            if connection is None:
+                return []
+            rows = connection.execute("SELECT DISTINCT watth_type FROM energy WHERE sn = ? ORDER BY watth_type",
+                                      (sn,)).fetchall()
+        return [watth_type for (watth_type,) in rows]
+
+    def events(self, sn: str, start: int = 0) -> list[tuple[int, int, int, list[float]]]:
+        """(timestamp, sys_ms, event_no, event_detail) of the stored records, oldest first."""
+        with self.__lock:
+            connection = self.__reader()
+            if connection is None:
+                return []
+            rows = connection.execute("SELECT timestamp, sys_ms, event_no, detail FROM event "
+                                      "WHERE sn = ? AND timestamp >= ? ORDER BY timestamp, sys_ms",
+                                      (sn, start)).fetchall()
+        return [(timestamp, sys_ms, event_no, _unpack(detail, "f")) for (timestamp, sys_ms, event_no, detail) in rows]
+
+    def stats(self) -> dict[str, Any]:
+        return {"path": self.path, "energy_rows": self.energy_rows, "event_rows": self.event_rows,
+                "pending": len(self.__energy) + len(self.__events), "flushes": self.flushes,
+                "retention_days": self.__retention / (24 * 3600), "pruned_rows": self.pruned_rows}
+
+    def __set_latest(self, sn: str, watth_type: int, timestamp: int, total: int) -> bool:
+        key = (sn, watth_type)
+        latest = self.__latest.get(key)
+        if latest is None or timestamp >= latest[0]:
+            self.__latest[key] = (timestamp, total)
+        return latest is None
+
+    def __flush_if_due(self):
+        if (len(self.__energy) + len(self.__events) >= self.__flush_rows
+                or time.monotonic() - self.__last_flush >= self.__flush_interval):
+            self.__flush()
+
+    def __flush(self):
+        self.__last_flush = time.monotonic()
+        if not self.__energy and not self.__events:
+            return
+        # taken out first: a failing database must not grow the buffers without bound
+        energy = [key + value for (key, value) in self.__energy.items()]
+        events = [key + (detail,) for (key, detail) in self.__events.items()]
+        self.__energy.clear()
+        self.__events.clear()
+        try:
+            connection = self.__connect()
+            with connection:
+                connection.executemany("INSERT OR REPLACE INTO energy VALUES (?, ?, ?, ?, ?)", energy)
+                connection.executemany("INSERT OR IGNORE INTO event VALUES (?, ?, ?, ?, ?)", events)
+        except sqlite3.Error as error:
+            _LOGGER.error(f"Failed to write energy history to {self.path}: {error}")
+            return
+        self.energy_rows += len(energy)
+        self.event_rows += len(events)
+        self.flushes += 1
+        self.__prune_if_due(connection)
+
+    def __prune_if_due(self, connection: sqlite3.Connection):
+        now = time.monotonic()
+        if self.__retention <= 0 or (self.__last_prune is not None and now - self.__last_prune < PRUNE_INTERVAL_SEC):
+            return
+        self.__last_prune = now
+        cutoff = int(time.time() - self.__retention)
+        try:
+            with connection:
+                pruned = connection.execute("DELETE FROM energy WHERE timestamp < ?", (cutoff,)).rowcount
+                pruned += connection.execute("DELETE FROM event WHERE timestamp < ?", (cutoff,)).rowcount
+        except sqlite3.Error as error:
+            _LOGGER.error(f"Failed to prune energy history in {self.path}: {error}")
+            return
+        self.pruned_rows += pruned
+
+    def __reader(self) -> sqlite3.Connection | None:
+        # pending rows first, so reads see everything received so far
+        self.__flush()
+        if self.__connection is None and not os.path.exists(self.path):
+            return None
+        return self.__connect()
+
+    def __connect(self) -> sqlite3.Connection:
+        if self.__connection is None:
+            # used from the ingest thread and from executor jobs, always under the lock
+            self.__connection = sqlite3.connect(self.path, check_same_thread=False)
+            self.__connection.execute("PRAGMA journal_mode=WAL")
+            for statement in _SCHEMA:
+                self.__connection.execute(statement)
+            _LOGGER.info(f"Storing energy history in {self.path}")
+        return self.__connection
@@ -0,0 +1,162 @@
+import logging
+import threading
+from collections import deque
+from typing import Any, Callable, Iterable
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_INGEST_QUEUE_SIZE = 256
+
+
+class EcoflowIngestQueue:
+    """Bounded hand-off between the paho network thread and message decoding.
+
+    Messages of a coalesced kind (data) are kept once per (device, kind): a newer message for a
+    pending entry is decoded and merged into it by coalesce(device, merged, payload), newer params
+    replacing older ones, so the last value of every key is kept and the entry keeps its place in
+    the queue. The handler then gets either the raw payload of a message that was not merged, or
+    the merged message. Other kinds (set and get messages and their replies) are handled in
+    arrival order; when maxlen of them are pending, the oldest one is dropped. Drops are counted
+    per kind.
+    """
+
+    def __init__(self, handler: Callable[[Any, str, bytes | None, Any], Any],
+                 maxlen: int = DEFAULT_INGEST_QUEUE_SIZE, coalesced_kinds: Iterable[str] = (),
+                 coalesce: Callable[[Any, Any, bytes], Any] | None = None):
+        self.__handler = handler
+        self.__maxlen = max(maxlen, 1)
+        self.__coalesced_kinds = frozenset(coalesced_kinds) if coalesce is not None else frozenset()
+        self.__coalesce = coalesce
+        # entries are [device, kind, payload, merged]: a raw payload, or the merged message once coalesced
+        self.__pending = deque[list]()
+        self.__coalescing: dict[tuple[str, str], list] = {}
+        self.__fifo_count = 0
+        self.__cond = threading.Condition()
+        self.__thread: threading.Thread | None = None
+        self.__running = False
+
+        self.received = 0
+        self.processed = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.dropped_by_kind: dict[str, int] = {}
+        self.errors = 0
+        self.max_depth = 0
+
+    def start(self):
+        with self.__cond:
+            if self.__running:
+                return
+            self.__running = True
+        self.__thread = threading.Thread(target=self.__run, name="ecoflow-ingest", daemon=True)
+        self.__thread.start()
+
+    def stop(self):
+        with self.__cond:
+            self.__running = False
+            self.__pending.clear()
+            self.__coalescing.clear()
+            self.__fifo_count = 0
+            self.__cond.notify_all()
+        if self.__thread and self.__thread is not threading.current_thread():
+            self.__thread.join(5)
+        self.__thread = None
+
+    def put(self, device, kind: str, topic: str, payload: bytes):
+        if kind in self.__coalesced_kinds:
+            self.__put_coalesced(device, kind, payload)
+            return
+
+        with self.__cond:
+            self.received += 1
+            if self.__fifo_count >= self.__maxlen:
+                self.__drop_oldest()
+            self.__append([device, kind, payload, None])
+
+    def depth(self) -> int:
+        return len(self.__pending)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "depth": len(self.__pending),
+            "max_depth": self.max_depth,
+            "capacity": self.__maxlen,
+            "received": self.received,
+            "processed": self.processed,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "dropped_by_kind": dict(self.dropped_by_kind),
+            "errors": self.errors,
+        }
+
+    def __put_coalesced(self, device, kind: str, payload: bytes):
+        key = (device.device_info.sn, kind)
+        with self.__cond:
+            self.received += 1
+            entry = self.__coalescing.get(key)
+            if entry is None:
+                entry = self.__coalescing[key] = [device, kind, payload, None]
+                self.__append(entry)
+                return
+            # the older raw payload is decoded here too, so messages are merged in arrival order
+            (earlier, entry[2]) = (entry[2], None)
+
+        # decoded outside the lock; only this (paho) thread coalesces, so merged is not written meanwhile
+        merged = entry[3]
+        try:
+            if earlier is not None:
+                merged = self.__coalesce(device, merged, earlier)
+            merged = self.__coalesce(device, merged, payload)
+        except Exception as error:
+            self.errors += 1
+            _LOGGER.error(f"Failed to merge message for {device.device_info.sn} ({kind}): {error}")
+
+        with self.__cond:
+            self.coalesced += 1
+            if self.__coalescing.get(key) is entry:
+                entry[3] = merged
+            elif merged is not None:
+                # taken by the ingest thread meanwhile (with nothing to handle): queued again
+                entry = self.__coalescing[key] = [device, kind, None, merged]
+                self.__append(entry)
+
+    def __append(self, entry: list):
+        if entry[1] not in self.__coalesced_kinds:
+            self.__fifo_count += 1
+        self.__pending.append(entry)
+        self.max_depth = max(self.max_depth, len(self.__pending))
+        self.__cond.notify()
+
+    def __run(self):
+        while True:
+            with self.__cond:
+                while self.__running and not self.__pending:
+                    self.__cond.wait()
+                if not self.__running:
+                    return
+                (device, kind, payload, merged) = entry = self.__pending.popleft()
+                if kind in self.__coalesced_kinds:
+                    key = (device.device_info.sn, kind)
+                    if self.__coalescing.get(key) is entry:
+                        del self.__coalescing[key]
+                else:
+                    self.__fifo_count -= 1
+
+            if payload is None and merged is None:
+                # being merged by put, which queues the result again
+                continue
+            try:
+                self.__handler(device, kind, payload, merged)
+            except Exception as error:
+                self.errors += 1
+                _LOGGER.error(f"Failed to process message for {device.device_info.sn} ({kind}): {error}")
+            self.processed += 1
+
+    def __drop_oldest(self):
+        for (index, entry) in enumerate(self.__pending):
+            if entry[1] not in self.__coalesced_kinds:
+                del self.__pending[index]
+                self.__fifo_count -= 1
+                self.dropped += 1
+                self.dropped_by_kind[entry[1]] = self.dropped_by_kind.get(entry[1], 0) + 1
+                return
@@ -16,8 +16,9 @@ BASE_URI = "https://api.ecoflow.com"
 
 class EcoflowPrivateApiClient(EcoflowApiClient):
 
-    def __init__(self, ecoflow_username: str, ecoflow_password: str, group: str):
+    def __init__(self, ecoflow_username: str, ecoflow_password: str, group: str, base_uri: str | None = None):
         super().__init__()
+        self.base_uri = base_uri or BASE_URI
         self.ecoflow_password = ecoflow_password
         self.ecoflow_username = ecoflow_username
         self.group = group
@@ -28,7 +29,7 @@ class EcoflowPrivateApiClient(EcoflowApiClient):
 
     async def login(self):
         async with aiohttp.ClientSession() as session:
-            url = f"{BASE_URI}/auth/login"
+            url = f"{self.base_uri}/auth/login"
             headers = {"lang": "en_US", "content-type": "application/json"}
             data = {"email": self.ecoflow_username,
                     "password": base64.b64encode(self.ecoflow_password.encode()).decode(),
@@ -57,6 +58,12 @@ class EcoflowPrivateApiClient(EcoflowApiClient):
             self.mqtt_info.client_id = f'ANDROID_{str(uuid.random_uuid_hex()).upper()}_{self.user_id}'
 
 
+    def _shard_client_id(self, index: int) -> str:
+        # the broker only accepts ANDROID_..str.._user_id client ids
+        if index == 0:
+            return self.mqtt_info.client_id
+        return f'ANDROID_{str(uuid.random_uuid_hex()).upper()}_{self.user_id}'
+
     # Failed to connect to MQTT: not authorised
     def gen_client_id(self):
         base = f'ANDROID_{str(uuid.random_uuid_hex()).upper()}_{self.user_id}'
@@ -116,6 +123,6 @@ class EcoflowPrivateApiClient(EcoflowApiClient):
             if params is not None:
                 req_params.update(params)
 
-            resp = await session.get(f"{BASE_URI}{endpoint}", data=user_data, params=req_params, headers=headers)
+            resp = await session.get(f"{self.base_uri}{endpoint}", data=user_data, params=req_params, headers=headers)
             _LOGGER.info(f"Request: {endpoint} {req_params}: got {resp}")
             return await self._get_json_response(resp)
\ No newline at end of file
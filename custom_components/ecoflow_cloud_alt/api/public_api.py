@@ -25,8 +25,9 @@ BASE_URI = "https://api-e.ecoflow.com/iot-open/sign"
 
 class EcoflowPublicApiClient(EcoflowApiClient):
 
-    def __init__(self, access_key: str, secret_key: str, group: str):
+    def __init__(self, access_key: str, secret_key: str, group: str, base_uri: str | None = None):
         super().__init__()
+        self.base_uri = base_uri or BASE_URI
         self.access_key = access_key
         self.secret_key = secret_key
         self.group = group
@@ -117,7 +118,7 @@ class EcoflowPublicApiClient(EcoflowApiClient):
                 'sign': sign
             }
 
-            resp = await session.get(f"{BASE_URI}{endpoint}?{params_str}", headers=headers)
+            resp = await session.get(f"{self.base_uri}{endpoint}?{params_str}", headers=headers)
             return await self._get_json_response(resp)
 
     def __create_device_info(self, device_sn: str, device_name: str, device_type: str, status: int = -1) -> EcoflowDeviceInfo:
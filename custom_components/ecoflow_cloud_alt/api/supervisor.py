@@ -0,0 +1,183 @@
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CONNECTING = "connecting"
+STATE_CONNECTED = "connected"
+STATE_DISCONNECTED = "disconnected"
+STATE_BACKOFF = "backoff"
+STATE_STOPPED = "stopped"
+
+SUPERVISOR_STATES = [STATE_CONNECTING, STATE_CONNECTED, STATE_DISCONNECTED, STATE_BACKOFF, STATE_STOPPED]
+
+DEFAULT_BACKOFF_BASE_SEC = 2.0
+DEFAULT_BACKOFF_MAX_SEC = 300.0
+
+
+def merge_supervisor_stats(shard_stats: list[dict[str, Any]]) -> dict[str, Any]:
+    """Supervisor stats of several connections as one: counters and times summed, the state of
+    the first connection that is not connected, and the stats of each connection in "shards"."""
+    merged: dict[str, Any] = {
+        "state": next((s["state"] for s in shard_stats if s["state"] != STATE_CONNECTED), STATE_CONNECTED),
+        "consecutive_failures": max(s["consecutive_failures"] for s in shard_stats),
+        "last_error": next((s["last_error"] for s in shard_stats if s["last_error"]), None),
+        "last_reason": next((s["last_reason"] for s in shard_stats if s["last_reason"]), None),
+        "time_in_state": {state: round(sum(s["time_in_state"][state] for s in shard_stats), 1)
+                          for state in SUPERVISOR_STATES},
+        "shards": shard_stats,
+    }
+    for key in ("attempts", "failures", "requests", "merged_requests"):
+        merged[key] = sum(s[key] for s in shard_stats)
+    return merged
+
+
+class EcoflowConnectionSupervisor:
+    """Owns reconnecting of one MQTT connection.
+
+    Paho callbacks and status entities only report events or ask for a reconnect; the
+    blocking reconnect itself runs on the supervisor thread. Requests that arrive while a
+    reconnect is already pending are merged into it, and failed attempts are retried with
+    capped exponential backoff and jitter.
+    """
+
+    def __init__(self, name: str, reconnect: Callable[[], None],
+                 backoff_base: float = DEFAULT_BACKOFF_BASE_SEC, backoff_max: float = DEFAULT_BACKOFF_MAX_SEC):
+        self.__name = name
+        self.__reconnect = reconnect
+        self.__backoff_base = backoff_base
+        self.__backoff_max = backoff_max
+
+        self.__cond = threading.Condition()
+        self.__thread: threading.Thread | None = None
+        self.__pending = False
+        self.__in_progress = False
+        self.__running = False
+
+        self.state = STATE_CONNECTING
+        self.__state_since = time.monotonic()
+        self.__time_in_state: dict[str, float] = {state: 0.0 for state in SUPERVISOR_STATES}
+
+        self.attempts = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.requests = 0
+        self.merged_requests = 0
+        self.last_error: str | None = None
+        self.last_reason: str | None = None
+
+    def start(self):
+        with self.__cond:
+            if self.__running:
+                return
+            self.__running = True
+        self.__thread = threading.Thread(target=self.__run, name=f"ecoflow-supervisor-{self.__name}", daemon=True)
+        self.__thread.start()
+
+    def stop(self):
+        with self.__cond:
+            self.__running = False
+            self.__set_state(STATE_STOPPED)
+            self.__cond.notify_all()
+        if self.__thread and self.__thread is not threading.current_thread():
+            self.__thread.join(5)
+        self.__thread = None
+
+    def request_reconnect(self, reason: str):
+        with self.__cond:
+            self.requests += 1
+            if self.__pending or self.__in_progress:
+                self.merged_requests += 1
+                return
+            self.__pending = True
+            self.last_reason = reason
+            self.__cond.notify()
+
+    def notify_connected(self):
+        with self.__cond:
+            self.consecutive_failures = 0
+            self.__set_state(STATE_CONNECTED)
+
+    def notify_connect_failed(self, error: str):
+        with self.__cond:
+            self.failures += 1
+            self.consecutive_failures += 1
+            self.last_error = error
+            self.__set_state(STATE_DISCONNECTED)
+            if not self.__pending:
+                self.__pending = True
+                self.last_reason = "connect failed"
+                self.__cond.notify()
+
+    def notify_disconnected(self, error: str | None):
+        with self.__cond:
+            if error:
+                self.last_error = error
+            self.__set_state(STATE_DISCONNECTED)
+
+    def stats(self) -> dict[str, Any]:
+        with self.__cond:
+            now = time.monotonic()
+            time_in_state = dict(self.__time_in_state)
+            time_in_state[self.state] += now - self.__state_since
+            return {
+                "state": self.state,
+                "attempts": self.attempts,
+                "failures": self.failures,
+                "consecutive_failures": self.consecutive_failures,
+                "requests": self.requests,
+                "merged_requests": self.merged_requests,
+                "last_error": self.last_error,
+                "last_reason": self.last_reason,
+                "time_in_state": {state: round(sec, 1) for (state, sec) in time_in_state.items()},
+            }
+
+    def backoff_delay(self) -> float:
+        delay = min(self.__backoff_max, self.__backoff_base * (2 ** min(self.consecutive_failures, 16)))
+        # "equal jitter": keep at least half of the delay, randomise the rest
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def __set_state(self, state: str):
+        now = time.monotonic()
+        self.__time_in_state[self.state] += now - self.__state_since
+        self.__state_since = now
+        self.state = state
+
+    def __run(self):
+        while True:
+            with self.__cond:
+                while self.__running and not self.__pending:
+                    self.__cond.wait()
+                if not self.__running:
+                    return
+
+                if self.consecutive_failures > 0:
+                    delay = self.backoff_delay()
+                    self.__set_state(STATE_BACKOFF)
+                    _LOGGER.info(f"MQTT {self.__name}: next reconnect attempt in {delay:.1f} sec")
+                    self.__cond.wait(delay)
+                    if not self.__running:
+                        return
+
+                self.__pending = False
+                self.__in_progress = True
+                self.attempts += 1
+                self.__set_state(STATE_CONNECTING)
+
+            try:
+                self.__reconnect()
+                with self.__cond:
+                    self.__in_progress = False
+            except Exception as error:
+                with self.__cond:
+                    self.__in_progress = False
+                    self.failures += 1
+                    self.consecutive_failures += 1
+                    self.last_error = str(error)
+                    self.__set_state(STATE_DISCONNECTED)
+                    # keep trying until a connection is established
+                    self.__pending = True
+                _LOGGER.error(f"MQTT {self.__name}: reconnect failed: {error}")
@@ -15,7 +15,12 @@ from . import ECOFLOW_DOMAIN, CONFIG_VERSION, CONF_ACCESS_KEY, CONF_SECRET_KEY,
     CONF_SELECT_DEVICE_KEY, CONF_DEVICE_TYPE, CONF_DEVICE_LIST, CONF_LOAD_ALL_DEVICES, \
     CONF_DEVICE_NAME, CONF_DEVICE_ID, OPTS_DIAGNOSTIC_MODE, \
     OPTS_POWER_STEP, OPTS_REFRESH_PERIOD_SEC, DEFAULT_REFRESH_PERIOD_SEC, extract_options, extract_devices, \
-    DeviceOptions, DeviceData, CONF_GROUP
+    OPTS_DEADBAND_WATTS, OPTS_DEADBAND_VOLTS, OPTS_DEADBAND_TEMPERATURES, OPTS_DEADBAND_PERCENT, \
+    OPTS_MIN_PUBLISH_INTERVAL_SEC, OPTS_MAX_PUBLISH_INTERVAL_SEC, OPTS_PUSH_MODE, OPTS_PUSH_MIN_INTERVAL_SEC, \
+    DEFAULT_PUSH_MIN_INTERVAL_SEC, OPTS_ENERGY_HISTORY, OPTS_ENERGY_HISTORY_RETENTION_DAYS, \
+    DEFAULT_ENERGY_HISTORY_RETENTION_DAYS, \
+    DeviceOptions, DeviceData, CONF_GROUP, CONF_WILDCARD_SUBSCRIPTION, CONF_MQTT_SHARDS, DEFAULT_MQTT_SHARDS, \
+    MAX_MQTT_SHARDS, CONF_PERSISTENT_SESSION
 from .api import EcoflowException
 from .devices import EcoflowDeviceInfo
 
@@ -133,13 +138,23 @@ class EcoflowConfigFlow(ConfigFlow, domain=ECOFLOW_DOMAIN):
         user_auth_schema = vol.Schema({
             vol.Required(CONF_USERNAME, default=self.new_data.get(CONF_USERNAME, "")): str,
             vol.Required(CONF_PASSWORD, default=self.new_data.get(CONF_PASSWORD, "")): str,
+            vol.Optional(CONF_WILDCARD_SUBSCRIPTION, default=self.new_data.get(CONF_WILDCARD_SUBSCRIPTION, False)): bool,
+            vol.Optional(CONF_MQTT_SHARDS, default=self.new_data.get(CONF_MQTT_SHARDS, DEFAULT_MQTT_SHARDS)):
+                vol.All(int, vol.Range(min=1, max=MAX_MQTT_SHARDS)),
+            vol.Optional(CONF_PERSISTENT_SESSION, default=self.new_data.get(CONF_PERSISTENT_SESSION, False)): bool,
         })
 
         if not user_input:
             return self.async_show_form(step_id="manual", data_schema=user_auth_schema)
+        if user_input.get(CONF_WILDCARD_SUBSCRIPTION) and user_input.get(CONF_MQTT_SHARDS, DEFAULT_MQTT_SHARDS) > 1:
+            return self.async_show_form(step_id="manual", data_schema=user_auth_schema,
+                                        errors={"base": "wildcard_with_shards"})
 
         self.new_data[CONF_USERNAME] = user_input.get(CONF_USERNAME)
         self.new_data[CONF_PASSWORD] = user_input.get(CONF_PASSWORD)
+        self.new_data[CONF_WILDCARD_SUBSCRIPTION] = user_input.get(CONF_WILDCARD_SUBSCRIPTION, False)
+        self.new_data[CONF_MQTT_SHARDS] = user_input.get(CONF_MQTT_SHARDS, DEFAULT_MQTT_SHARDS)
+        self.new_data[CONF_PERSISTENT_SESSION] = user_input.get(CONF_PERSISTENT_SESSION, False)
 
         from .api.private_api import EcoflowPrivateApiClient
         self.auth = EcoflowPrivateApiClient(self.new_data[CONF_USERNAME], self.new_data[CONF_PASSWORD], self.new_data[CONF_GROUP])
@@ -209,14 +224,24 @@ class EcoflowConfigFlow(ConfigFlow, domain=ECOFLOW_DOMAIN):
         api_keys_auth_schema = vol.Schema({
             vol.Required(CONF_ACCESS_KEY, default=self.new_data.get(CONF_ACCESS_KEY, "")): str,
             vol.Required(CONF_SECRET_KEY, default=self.new_data.get(CONF_SECRET_KEY, "")): str,
+            vol.Optional(CONF_WILDCARD_SUBSCRIPTION, default=self.new_data.get(CONF_WILDCARD_SUBSCRIPTION, False)): bool,
+            vol.Optional(CONF_MQTT_SHARDS, default=self.new_data.get(CONF_MQTT_SHARDS, DEFAULT_MQTT_SHARDS)):
+                vol.All(int, vol.Range(min=1, max=MAX_MQTT_SHARDS)),
+            vol.Optional(CONF_PERSISTENT_SESSION, default=self.new_data.get(CONF_PERSISTENT_SESSION, False)): bool,
             # vol.Required(CONF_LOAD_ALL_DEVICES, default=self.new_data.get(CONF_LOAD_ALL_DEVICES, False)): bool
         })
 
         if not user_input:
             return self.async_show_form(step_id="api", data_schema=api_keys_auth_schema)
+        if user_input.get(CONF_WILDCARD_SUBSCRIPTION) and user_input.get(CONF_MQTT_SHARDS, DEFAULT_MQTT_SHARDS) > 1:
+            return self.async_show_form(step_id="api", data_schema=api_keys_auth_schema,
+                                        errors={"base": "wildcard_with_shards"})
 
         self.new_data[CONF_ACCESS_KEY] = user_input.get(CONF_ACCESS_KEY)
         self.new_data[CONF_SECRET_KEY] = user_input.get(CONF_SECRET_KEY)
+        self.new_data[CONF_WILDCARD_SUBSCRIPTION] = user_input.get(CONF_WILDCARD_SUBSCRIPTION, False)
+        self.new_data[CONF_MQTT_SHARDS] = user_input.get(CONF_MQTT_SHARDS, DEFAULT_MQTT_SHARDS)
+        self.new_data[CONF_PERSISTENT_SESSION] = user_input.get(CONF_PERSISTENT_SESSION, False)
         # self.new_data[CONF_LOAD_ALL_DEVICES] = user_input.get(CONF_LOAD_ALL_DEVICES)
         self.new_data[CONF_LOAD_ALL_DEVICES] = False
 
@@ -342,16 +367,36 @@ class EcoflowOptionsFlow(OptionsFlow):
             self.device_selector[f"{device.name} ({device.sn})"] = device
 
         self.selected_device = None
+        self.entry_options = {}
 
     async def async_step_init(self, user_input: dict[str, Any] | None = None):
         if user_input is None:
+            options = self.config_entry.options
             return self.async_show_form(step_id="init",
                                         data_schema=vol.Schema({
                                             vol.Required(CONF_SELECT_DEVICE_KEY): vol.In(
-                                                list(self.device_selector.keys()))
+                                                list(self.device_selector.keys())),
+                                            vol.Optional(OPTS_PUSH_MODE, default=options.get(OPTS_PUSH_MODE, False)): bool,
+                                            vol.Optional(OPTS_PUSH_MIN_INTERVAL_SEC,
+                                                         default=options.get(OPTS_PUSH_MIN_INTERVAL_SEC,
+                                                                             DEFAULT_PUSH_MIN_INTERVAL_SEC)):
+                                                vol.All(vol.Coerce(float), vol.Range(min=0)),
+                                            vol.Optional(OPTS_ENERGY_HISTORY,
+                                                         default=options.get(OPTS_ENERGY_HISTORY, False)): bool,
+                                            vol.Optional(OPTS_ENERGY_HISTORY_RETENTION_DAYS,
+                                                         default=options.get(OPTS_ENERGY_HISTORY_RETENTION_DAYS,
+                                                                             DEFAULT_ENERGY_HISTORY_RETENTION_DAYS)):
+                                                vol.All(vol.Coerce(float), vol.Range(min=0)),
                                         }))
 
         self.selected_device = self.device_selector[user_input[CONF_SELECT_DEVICE_KEY]]
+        self.entry_options = {
+            OPTS_PUSH_MODE: user_input.get(OPTS_PUSH_MODE, False),
+            OPTS_PUSH_MIN_INTERVAL_SEC: user_input.get(OPTS_PUSH_MIN_INTERVAL_SEC, DEFAULT_PUSH_MIN_INTERVAL_SEC),
+            OPTS_ENERGY_HISTORY: user_input.get(OPTS_ENERGY_HISTORY, False),
+            OPTS_ENERGY_HISTORY_RETENTION_DAYS: user_input.get(OPTS_ENERGY_HISTORY_RETENTION_DAYS,
+                                                               DEFAULT_ENERGY_HISTORY_RETENTION_DAYS)
+        }
         return await self.async_step_options()
 
     async def async_step_options(self, user_input: dict[str, Any] | None = None):
@@ -364,14 +409,32 @@ class EcoflowOptionsFlow(OptionsFlow):
                     vol.Required(OPTS_POWER_STEP, default=device_options.power_step): int,
                     vol.Required(OPTS_REFRESH_PERIOD_SEC, default=device_options.refresh_period): int,
                     vol.Required(OPTS_DIAGNOSTIC_MODE, default=device_options.diagnostic_mode): bool,
+                    vol.Optional(OPTS_DEADBAND_WATTS, default=device_options.deadband_watts):
+                        vol.All(vol.Coerce(float), vol.Range(min=0)),
+                    vol.Optional(OPTS_DEADBAND_VOLTS, default=device_options.deadband_volts):
+                        vol.All(vol.Coerce(float), vol.Range(min=0)),
+                    vol.Optional(OPTS_DEADBAND_TEMPERATURES, default=device_options.deadband_temperatures):
+                        vol.All(vol.Coerce(float), vol.Range(min=0)),
+                    vol.Optional(OPTS_DEADBAND_PERCENT, default=device_options.deadband_percent):
+                        vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+                    vol.Optional(OPTS_MIN_PUBLISH_INTERVAL_SEC, default=device_options.min_publish_interval):
+                        vol.All(vol.Coerce(float), vol.Range(min=0)),
+                    vol.Optional(OPTS_MAX_PUBLISH_INTERVAL_SEC, default=device_options.max_publish_interval):
+                        vol.All(vol.Coerce(float), vol.Range(min=0)),
                 })
             )
 
-        new_options = {**self.config_entry.options}
+        new_options = {**self.config_entry.options, **self.entry_options}
         new_options[CONF_DEVICE_LIST][self.selected_device.sn] = {
             OPTS_POWER_STEP: user_input[OPTS_POWER_STEP],
             OPTS_REFRESH_PERIOD_SEC: user_input[OPTS_REFRESH_PERIOD_SEC],
-            OPTS_DIAGNOSTIC_MODE: user_input[OPTS_DIAGNOSTIC_MODE]
+            OPTS_DIAGNOSTIC_MODE: user_input[OPTS_DIAGNOSTIC_MODE],
+            OPTS_DEADBAND_WATTS: user_input.get(OPTS_DEADBAND_WATTS, 0.0),
+            OPTS_DEADBAND_VOLTS: user_input.get(OPTS_DEADBAND_VOLTS, 0.0),
+            OPTS_DEADBAND_TEMPERATURES: user_input.get(OPTS_DEADBAND_TEMPERATURES, 0.0),
+            OPTS_DEADBAND_PERCENT: user_input.get(OPTS_DEADBAND_PERCENT, 0.0),
+            OPTS_MIN_PUBLISH_INTERVAL_SEC: user_input.get(OPTS_MIN_PUBLISH_INTERVAL_SEC, 0.0),
+            OPTS_MAX_PUBLISH_INTERVAL_SEC: user_input.get(OPTS_MAX_PUBLISH_INTERVAL_SEC, 0.0)
         }
 
         return self.async_create_entry(title="", data=new_options)
@@ -1,24 +1,37 @@
 import dataclasses
 import datetime
-import json
 import logging
+import time
 from abc import ABC, abstractmethod
+from typing import Any, Callable, Iterable
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.components.number import NumberEntity
 from homeassistant.components.select import SelectEntity
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.components.switch import SwitchEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt
 
 from .data_holder import EcoflowDataHolder
+from .json_payload import JsonPayloadParser
+from .proto import get_alternator_protobuf
+from .publish_policy import PublishPolicy
+from .push_scheduler import EcoflowPushScheduler
 from ..api import EcoflowApiClient
 
 _LOGGER = logging.getLogger(__name__)
 
-@dataclasses.dataclass
+TOPIC_KIND_DATA = "data"
+TOPIC_KIND_SET = "set"
+TOPIC_KIND_SET_REPLY = "set_reply"
+TOPIC_KIND_GET = "get"
+TOPIC_KIND_GET_REPLY = "get_reply"
+TOPIC_KIND_STATUS = "status"
+
+
+@dataclasses.dataclass(slots=True)
 class EcoflowDeviceInfo:
     public_api: bool
     sn: str
@@ -43,26 +56,150 @@ class EcoflowDeviceInfo:
         ]
         return list(filter(lambda v: v is not None, topics))
 
-@dataclasses.dataclass
+    def topic_kinds(self) -> dict[str, str]:
+        kinds = {
+            self.data_topic: TOPIC_KIND_DATA,
+            self.get_topic: TOPIC_KIND_GET,
+            self.get_reply_topic: TOPIC_KIND_GET_REPLY,
+            self.set_topic: TOPIC_KIND_SET,
+            self.set_reply_topic: TOPIC_KIND_SET_REPLY,
+            self.status_topic: TOPIC_KIND_STATUS
+        }
+        return {topic: kinds[topic] for topic in self.topics()}
+
+    def wildcard_topics(self) -> list[str]:
+        # the same topics with the SN level replaced by a single-level wildcard
+        return ["/".join("+" if level == self.sn else level for level in topic.split("/"))
+                for topic in self.topics()]
+
+@dataclasses.dataclass(slots=True)
 class EcoflowBroadcastDataHolder:
     data_holder: EcoflowDataHolder
     changed: bool
 
+@dataclasses.dataclass(frozen=True, slots=True)
+class EcoflowKeyContext:
+    """Listener context of entities: the params keys they read (None: any key)."""
+    keys: frozenset[str] | None
+
+
 class EcoflowDeviceUpdateCoordinator(DataUpdateCoordinator[EcoflowBroadcastDataHolder]):
-    def __init__(self, hass, holder: EcoflowDataHolder, refresh_period: int) -> None:
-        """Initialize the coordinator."""
+    def __init__(self, hass, holder: EcoflowDataHolder, refresh_period: int,
+                 push: EcoflowPushScheduler | None = None) -> None:
+        """Initialize the coordinator. With push, new data is broadcast by the scheduler instead of polling."""
+        self.refresh_period = max(refresh_period, 5)
         super().__init__(hass, _LOGGER, name="Ecoflow update coordinator", always_update=True,
-                         update_interval= datetime.timedelta(seconds=max(refresh_period, 5)),
+                         update_interval=datetime.timedelta(seconds=self.refresh_period) if push is None else None,
         )
         self.holder = holder
+        if push is not None:
+            push.add(self)
+            holder.listener = lambda: push.mark(self)
         self.__last_broadcast = dt.utcnow().replace(year=2000, month=1, day=1, hour=0, minute=0, second=0)
+        # params key -> callbacks of the entities reading it, None: callbacks for every change
+        self.__key_listeners: dict[str | None, dict[Callable[[], None], None]] = {}
+        self.__remove_fan_out: Callable[[], None] | None = None
+        self.__fan_out_version = 0
+        self.fan_outs = 0
+        self.fan_out_callbacks = 0
+        self.__pending_writes: dict[Any, None] = {}
+        self.write_flushes = 0
+        self.written_states = 0
+        # values held back by the publish policies of the entities (devices/publish_policy.py)
+        self.held_states = 0
+        self.__counting_since = time.monotonic()
+
+    def state_writes_per_hour(self) -> float:
+        hours = max(time.monotonic() - self.__counting_since, 1.0) / 3600
+        return self.written_states / hours
 
     async def _async_update_data(self) -> EcoflowBroadcastDataHolder:
+        return self.__broadcast()
+
+    @callback
+    def async_push(self) -> None:
+        self.async_set_updated_data(self.__broadcast())
+
+    def __broadcast(self) -> EcoflowBroadcastDataHolder:
         received_time = self.holder.last_received_time()
         changed = self.__last_broadcast < received_time
         self.__last_broadcast = received_time
         return EcoflowBroadcastDataHolder(self.holder, changed)
 
+    @callback
+    def async_schedule_write(self, entity) -> None:
+        """Writes the state of entity in one batch with every entity of the device that
+        changed in the same loop iteration."""
+        if not self.__pending_writes:
+            self.hass.loop.call_soon(self.__flush_writes)
+        self.__pending_writes[entity] = None
+
+    @callback
+    def __flush_writes(self) -> None:
+        entities = self.__pending_writes
+        self.__pending_writes = {}
+        self.write_flushes += 1
+        self.written_states += len(entities)
+        for entity in entities:
+            if entity.hass is None:
+                continue
+            try:
+                entity.async_write_ha_state()
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(f"Failed to write the state of {entity.entity_id}")
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None], context=None) -> Callable[[], None]:
+        if isinstance(context, EcoflowKeyContext):
+            return self.async_add_key_listener(context.keys, update_callback)
+        return super().async_add_listener(update_callback, context)
+
+    @callback
+    def async_add_key_listener(self, keys: Iterable[str] | None, update_callback: Callable[[], None]) -> Callable[[], None]:
+        """Calls update_callback after a broadcast that changed one of keys (None: any key).
+
+        Only changes after the listener is added are delivered, the caller reads the current values itself.
+        """
+        keys = list(keys) if keys is not None else [None]
+        for key in keys:
+            self.__key_listeners.setdefault(key, {})[update_callback] = None
+        if self.__remove_fan_out is None:
+            self.__fan_out_version = self.holder.version
+            self.__remove_fan_out = self.async_add_listener(self.__fan_out)
+
+        @callback
+        def remove_listener() -> None:
+            for key in keys:
+                listeners = self.__key_listeners.get(key)
+                if listeners is not None:
+                    listeners.pop(update_callback, None)
+                    if not listeners:
+                        del self.__key_listeners[key]
+            if not self.__key_listeners and self.__remove_fan_out is not None:
+                self.__remove_fan_out()
+                self.__remove_fan_out = None
+
+        return remove_listener
+
+    @callback
+    def __fan_out(self) -> None:
+        if not self.data.changed:
+            return
+        # read the version first: keys changed meanwhile are rather delivered twice than lost
+        version = self.holder.version
+        changed = self.holder.changed_since(self.__fan_out_version)
+        self.__fan_out_version = version
+
+        dirty: dict[Callable[[], None], None] = dict(self.__key_listeners.get(None, {}))
+        for key in changed:
+            listeners = self.__key_listeners.get(key)
+            if listeners is not None:
+                dirty.update(listeners)
+        self.fan_outs += 1
+        self.fan_out_callbacks += len(dirty)
+        for update_callback in dirty:
+            update_callback()
+
 class BaseDevice(ABC):
 
     def __init__(self, device_info: EcoflowDeviceInfo):
@@ -71,10 +208,18 @@ class BaseDevice(ABC):
         self.data = None
         self.device_info: EcoflowDeviceInfo = device_info
         self.power_step: int = -1
+        # set by the API client when the entry keeps an energy history (api/energy_store.py)
+        self.energy_store = None
+        self.publish_policies: dict[str, PublishPolicy] = {}
+        # the DeviceInfo of all entities of the device, made by the first entity asking for it
+        self.entity_device_info = None
+        self.json_parser = JsonPayloadParser(device_info.sn)
 
-    def configure(self, hass: HomeAssistant, refresh_period: int, diag: bool = False):
+    def configure(self, hass: HomeAssistant, refresh_period: int, diag: bool = False,
+                  push: EcoflowPushScheduler | None = None, publish_policies: dict[str, PublishPolicy] | None = None):
         self.data = EcoflowDataHolder(diag)
-        self.coordinator = EcoflowDeviceUpdateCoordinator(hass, self.data, refresh_period)
+        self.publish_policies = publish_policies or {}
+        self.coordinator = EcoflowDeviceUpdateCoordinator(hass, self.data, refresh_period, push)
 
     @staticmethod
     def default_charging_power_step() -> int:
@@ -109,32 +254,58 @@ class BaseDevice(ABC):
         return []
 
     def update_data(self, raw_data, data_type: str) -> bool:
-        if data_type == self.device_info.data_topic:
-            raw = self._prepare_data(raw_data)
+        kind = self.device_info.topic_kinds().get(data_type)
+        if kind is None:
+            return False
+        return self.handle_message(kind, raw_data)
+
+    def handle_message(self, kind: str, raw_data) -> bool:
+        if kind not in (TOPIC_KIND_DATA, TOPIC_KIND_SET, TOPIC_KIND_SET_REPLY, TOPIC_KIND_GET, TOPIC_KIND_GET_REPLY):
+            # status topic messages are not handled: the online status comes from the device list
+            # of EcoflowPublicApiClient
+            return False
+
+        raw = self._prepare_data(raw_data)
+        if raw is None:
+            # the payload could not be decoded, the parser has already reported it
+            return False
+        return self.apply_message(kind, raw)
+
+    def apply_message(self, kind: str, raw: dict[str, Any]) -> bool:
+        """Hands a decoded message (see _prepare_data) to the data holder."""
+        if kind == TOPIC_KIND_DATA:
             self.data.update_data(raw)
-        elif data_type == self.device_info.set_topic:
-            raw = self._prepare_data(raw_data)
+        elif kind == TOPIC_KIND_SET:
             self.data.add_set_message(raw)
-        elif data_type == self.device_info.set_reply_topic:
-            raw = self._prepare_data(raw_data)
+        elif kind == TOPIC_KIND_SET_REPLY:
             self.data.add_set_reply_message(raw)
-        elif data_type == self.device_info.get_topic:
-            raw = self._prepare_data(raw_data)
+        elif kind == TOPIC_KIND_GET:
             self.data.add_get_message(raw)
-        elif data_type == self.device_info.get_reply_topic:
-            raw = self._prepare_data(raw_data)
+        elif kind == TOPIC_KIND_GET_REPLY:
             self.data.add_get_reply_message(raw)
         else:
             return False
         return True
 
+    def merge_data(self, merged: dict[str, Any] | None, raw_data) -> dict[str, Any] | None:
+        """Decodes a data message and merges it over merged (an earlier result, or None): its params
+        replace those of merged, the same as applying both in turn."""
+        raw = self._prepare_data(raw_data)
+        if raw is None or merged is None:
+            return merged if raw is None else raw
+        params = merged.get("params")
+        newer = raw.get("params")
+        if isinstance(params, dict) and isinstance(newer, dict):
+            params.update(newer)
+            raw["params"] = params
+        merged.update(raw)
+        return merged
 
-    def _prepare_data(self, raw_data) -> dict[str, any]:
+    def _prepare_data(self, raw_data) -> dict[str, any] | None:
         # Check if this is Alternator Charger (protobuf device)
         if self.device_info.device_type == "ALTERNATOR_CHARGER":
             try:
                 # Try protobuf decoding
-                from .proto import get_alternator_protobuf
                 decoder = get_alternator_protobuf()
                 result = decoder.decode_heartbeat(raw_data)
                 
@@ -151,18 +322,7 @@ class BaseDevice(ABC):
                 pass
         
         # Standard JSON decoding for other devices
-        try:
-            try:
-                payload = raw_data.decode("utf-8", errors='ignore')
-                return json.loads(payload)
-            except UnicodeDecodeError as error:
-                _LOGGER.warning(f"UnicodeDecodeError: {error}. Trying to load json.")
-                return json.loads(raw_data)
-            except Exception as error:
-                _LOGGER.warning(f"Exception: {error}. Trying to load json.")
-                return json.loads(raw_data)
-        except Exception as error1:
-            _LOGGER.error(f"constant: {error1}. Ignoring message and waiting for the next one.")
+        return self.json_parser.parse(raw_data)
 
 class DiagnosticDevice(BaseDevice):
 
@@ -0,0 +1,63 @@
+import sys
+from typing import Any, Collection
+
+plain_to_status: dict[str, str] = {
+        "pd": "pdStatus",
+        "mppt": "mpptStatus",
+        "bms_emsStatus": "emsStatus",
+        "bms_bmsStatus": "bmsStatus",
+        "inv": "invStatus",
+        "bms_slave": "bmsSlaveStatus",
+        "bms_slave_bmsSlaveStatus_1": "bmsSlaveStatus_1",
+        "bms_slave_bmsSlaveStatus_2": "bmsSlaveStatus_2"
+}
+
+status_to_plain = dict((v, k) for (k, v) in plain_to_status.items())
+
+# (prefix, raw key -> interned "<prefix>.<raw key>"), per typeCode and per (cmdFunc, cmdId)
+_TYPE_CODE_KEYS: dict[str, tuple[str, dict[str, str]]] = {}
+_COMMAND_KEYS: dict[Any, dict[Any, tuple[str, dict[str, str]]]] = {}
+
+
+def _type_code_keys(type_code: str) -> tuple[str, dict[str, str]]:
+    flat_keys = _TYPE_CODE_KEYS.get(type_code)
+    if flat_keys is None:
+        flat_keys = _TYPE_CODE_KEYS[type_code] = (status_to_plain.get(type_code, "unknown_" + type_code), {})
+    return flat_keys
+
+
+def _command_keys(cmd_func, cmd_id) -> tuple[str, dict[str, str]]:
+    by_id = _COMMAND_KEYS.get(cmd_func)
+    if by_id is None:
+        by_id = _COMMAND_KEYS[cmd_func] = {}
+    flat_keys = by_id.get(cmd_id)
+    if flat_keys is None:
+        flat_keys = by_id[cmd_id] = (f"{cmd_func}_{cmd_id}", {})
+    return flat_keys
+
+
+def _flatten(raw_data: dict[str, Any], flat_keys: tuple[str, dict[str, str]], fields: tuple[str, str],
+             keys: Collection[str] | None):
+    (prefix, cache) = flat_keys
+    params = {}
+    for field in fields:
+        values = raw_data.pop(field, None)
+        if not values:
+            continue
+        for (k, v) in values.items():
+            key = cache.get(k)
+            if key is None:
+                key = cache[k] = sys.intern(f"{prefix}.{k}")
+            if keys is None or key in keys:
+                params[key] = v
+    raw_data["params"] = params
+
+
+def to_plain(raw_data: dict[str, Any], keys: Collection[str] | None = None) -> dict[str, Any]:
+    """Prefixes the params of typed messages with their module, in place; with keys, only those
+    params are kept. Each prefixed key is built once and interned."""
+    if "typeCode" in raw_data:
+        _flatten(raw_data, _type_code_keys(raw_data["typeCode"]), ("params", "param"), keys)
+    elif "cmdFunc" in raw_data and "cmdId" in raw_data:
+        _flatten(raw_data, _command_keys(raw_data["cmdFunc"], raw_data["cmdId"]), ("param", "params"), keys)
+    return raw_data
@@ -1,13 +1,17 @@
+import array
 import logging
-from typing import Any, List, TypeVar
+import time
+from typing import Any, Callable, Iterable, List, TypeVar
 
-import jsonpath_ng.ext as jp
 from homeassistant.util import utcnow, dt
 
+from .key_path import MISSING, key_path
+
 _LOGGER = logging.getLogger(__name__)
 
 _T = TypeVar("_T")
 class BoundFifoList(List):
+    __slots__ = ("maxlen",)
 
     def __init__(self, maxlen=20) -> None:
         super().__init__()
@@ -21,6 +25,9 @@ class BoundFifoList(List):
 
 
 class EcoflowDataHolder:
+    __slots__ = ("__collect_raw", "set", "set_reply", "set_reply_time", "get", "get_reply", "get_reply_time",
+                 "params", "params_time", "status", "status_time", "raw_data", "keys", "__consumers",
+                 "version", "changed", "__key_slots", "__key_names", "__key_versions", "__key_seen", "listener")
 
     def __init__(self, collect_raw: bool = False):
         self.__collect_raw = collect_raw
@@ -40,6 +47,22 @@ class EcoflowDataHolder:
 
         self.raw_data = BoundFifoList[dict[str, Any]]()
 
+        # params keys read by the entities added to Home Assistant, None keeps every key
+        self.keys: frozenset[str] | None = None
+        self.__consumers: dict[Any, frozenset[str]] = {}
+
+        # per-key change tracking: every key gets a slot in compact arrays holding the version
+        # that last changed its value and the time (unix seconds) it was last received
+        self.version = 0
+        self.changed: list[str] = []
+        self.__key_slots: dict[str, int] = {}
+        self.__key_names: list[str] = []
+        self.__key_versions = array.array("Q")
+        self.__key_seen = array.array("d")
+
+        # called after every update, from the thread that made it (see EcoflowPushScheduler)
+        self.listener: Callable[[], None] | None = None
+
     def last_received_time(self):
         return max(self.status_time, self.params_time, self.get_reply_time, self.set_reply_time)
 
@@ -49,6 +72,7 @@ class EcoflowDataHolder:
     def add_set_reply_message(self, msg: dict[str, Any]):
         self.set_reply.append(msg)
         self.set_reply_time = dt.utcnow()
+        self.__notify()
 
     def add_get_message(self, msg: dict[str, Any]):
         self.get.append(msg)
@@ -62,28 +86,125 @@ class EcoflowDataHolder:
 
         self.get_reply.append(msg)
         self.get_reply_time = dt.utcnow()
-
+        self.__notify()
+
+
+    def consume_keys(self, consumer: Any, keys: Iterable[str]):
+        keys = frozenset(keys)
+        self.__consumers[consumer] = keys
+        # entities added after apply_keys (e.g. enabled later) only extend the applied key set
+        if self.keys is not None:
+            self.keys = self.keys | keys
+
+    def release_keys(self, consumer: Any):
+        if self.__consumers.pop(consumer, None) is not None and not self.__consumers:
+            self.keys = None
+
+    def apply_keys(self):
+        """Keeps only the params keys of the consumers from now on, called once all platforms are set up."""
+        # diagnostic mode keeps the full payloads
+        if self.__collect_raw or not self.__consumers:
+            self.keys = None
+            return
+        keys = frozenset().union(*self.__consumers.values())
+        self.keys = keys
+        # the ingest thread may add keys meanwhile
+        for key in [key for key in list(self.params) if key not in keys]:
+            self.params.pop(key, None)
+
+    def changed_since(self, version: int) -> list[str]:
+        """Keys whose value changed after the given version."""
+        names = self.__key_names
+        return [names[slot] for (slot, key_version) in enumerate(self.__key_versions) if key_version > version]
+
+    def key_version(self, key: str) -> int:
+        slot = self.__key_slots.get(key)
+        return self.__key_versions[slot] if slot is not None else 0
+
+    def key_last_seen(self, key: str) -> float | None:
+        slot = self.__key_slots.get(key)
+        return self.__key_seen[slot] if slot is not None else None
+
+    def __slot(self, key: str) -> int:
+        slot = self.__key_slots[key] = len(self.__key_names)
+        self.__key_names.append(key)
+        self.__key_versions.append(0)
+        self.__key_seen.append(0.0)
+        return slot
+
+    def __merge(self, items: Iterable[tuple[str, Any]]) -> list[str]:
+        """Stores the values, the keys whose value changed get the next version."""
+        params = self.params
+        slots = self.__key_slots
+        versions = self.__key_versions
+        seen = self.__key_seen
+        version = self.version + 1
+        now = time.time()
+        changed = []
+        for (key, value) in items:
+            slot = slots.get(key)
+            if slot is None:
+                slot = self.__slot(key)
+            seen[slot] = now
+            if params.get(key, MISSING) != value:
+                params[key] = value
+                versions[slot] = version
+                changed.append(key)
+        if changed:
+            self.version = version
+        self.changed = changed
+        return changed
+
+    def __touch(self, keys: list[str]):
+        version = self.version = self.version + 1
+        for key in keys:
+            slot = self.__key_slots.get(key)
+            self.__key_versions[slot if slot is not None else self.__slot(key)] = version
+        self.changed = keys
 
     def update_to_target_state(self, target_state: dict[str, Any]):
         # key can be xpath!
+        items = []
         for key, value in target_state.items():
-            jp.parse(key).update(self.params, value)
+            path = key_path(key)
+            if path.key is None:
+                # whatever a real path touched is unknown, every key counts as changed
+                path.set(self.params, value)
+                self.__touch(list(self.params))
+            elif path.key in self.params:
+                items.append((path.key, value))
+        if items:
+            self.__merge(items)
 
         self.params_time = dt.utcnow()
+        self.__notify()
 
     def update_status(self, raw: dict[str, Any]):
         self.status.update({"status" : int(raw['params']['status'])})
         self.status_time = dt.utcnow()
+        self.__notify()
 
     def update_data(self, raw: dict[str, Any]):
         self.__add_raw_data(raw)
         try:
-            self.params.update(raw['params'])
+            params = raw['params']
+            keys = self.keys
+            if keys is None:
+                self.__merge(params.items())
+            elif len(keys) < len(params):
+                self.__merge((key, params[key]) for key in keys if key in params)
+            else:
+                self.__merge((key, value) for (key, value) in params.items() if key in keys)
             self.params_time = dt.utcnow()
+            self.__notify()
 
         except Exception as error:
             _LOGGER.error("Error updating data", error)
 
+    def __notify(self):
+        if self.listener is not None:
+            self.listener()
+
     def __add_raw_data(self, raw: dict[str, Any]):
         if self.__collect_raw:
             self.raw_data.append(raw)
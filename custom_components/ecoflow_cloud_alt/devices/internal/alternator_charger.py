@@ -5,6 +5,7 @@ from homeassistant.components.switch import SwitchEntity
 
 from custom_components.ecoflow_cloud_alt import EcoflowApiClient
 from custom_components.ecoflow_cloud_alt.devices import BaseDevice, const
+from custom_components.ecoflow_cloud_alt.entities import EcoFlowEntityDescription, create_entities
 from custom_components.ecoflow_cloud_alt.sensor import (
     LevelSensorEntity,
     TempSensorEntity,
@@ -18,6 +19,28 @@ from custom_components.ecoflow_cloud_alt.number import MaxBatteryLevelEntity, Mi
 from custom_components.ecoflow_cloud_alt.select import DictSelectEntity
 
 
+ALTERNATOR_CHARGER_SENSORS = (
+    # Battery
+    EcoFlowEntityDescription(LevelSensorEntity, "batSoc", const.MAIN_BATTERY_LEVEL),
+
+    # Temperature
+    EcoFlowEntityDescription(TempSensorEntity, "temp", const.BATTERY_TEMP),
+
+    # Power
+    EcoFlowEntityDescription(InWattsSensorEntity, "alternatorPower", "Alternator Power"),
+    EcoFlowEntityDescription(InWattsSensorEntity, "stationPower", "Station Power"),
+    EcoFlowEntityDescription(InWattsSensorEntity, "ratedPower", "Rated Power", False),
+
+    # Voltage
+    EcoFlowEntityDescription(VoltSensorEntity, "carBatVolt", "Car Battery Voltage"),
+
+    # Time
+    EcoFlowEntityDescription(RemainSensorEntity, "chargeToFull268", "Charging Time", False),
+
+    # Status
+)
+
+
 class AlternatorCharger(BaseDevice):
     """EcoFlow Alternator Charger device (500W/800W).
     
@@ -26,27 +49,7 @@ class AlternatorCharger(BaseDevice):
     """
 
     def sensors(self, client: EcoflowApiClient) -> list[SensorEntity]:
-        return [
-            # Battery
-            LevelSensorEntity(client, self, "batSoc", const.MAIN_BATTERY_LEVEL),
-            
-            # Temperature
-            TempSensorEntity(client, self, "temp", const.BATTERY_TEMP),
-            
-            # Power
-            InWattsSensorEntity(client, self, "alternatorPower", "Alternator Power"),
-            InWattsSensorEntity(client, self, "stationPower", "Station Power"),
-            InWattsSensorEntity(client, self, "ratedPower", "Rated Power", False),
-            
-            # Voltage
-            VoltSensorEntity(client, self, "carBatVolt", "Car Battery Voltage"),
-            
-            # Time
-            RemainSensorEntity(client, self, "chargeToFull268", "Charging Time", False),
-            
-            # Status
-            StatusSensorEntity(client, self)
-        ]
+        return create_entities(client, self, ALTERNATOR_CHARGER_SENSORS) + [StatusSensorEntity(client, self)]
 
     def numbers(self, client: EcoflowApiClient) -> list[NumberEntity]:
         return [
@@ -1,6 +1,7 @@
 from .. import const, BaseDevice
 from ...api import EcoflowApiClient
-from ...entities import BaseSensorEntity, BaseNumberEntity, BaseSwitchEntity, BaseSelectEntity
+from ...entities import BaseSensorEntity, BaseNumberEntity, BaseSwitchEntity, BaseSelectEntity, EcoFlowEntityDescription, create_entities, \
+    reads_params
 from ...number import ChargingPowerEntity, MinBatteryLevelEntity, MaxBatteryLevelEntity, \
     MaxGenStopLevelEntity, MinGenStartLevelEntity, BatteryBackupLevel
 from ...select import DictSelectEntity, TimeoutDictSelectEntity
@@ -10,91 +11,92 @@ from ...sensor import LevelSensorEntity, RemainSensorEntity, TempSensorEntity, C
 from ...switch import BeeperEntity, EnabledEntity
 
 
+DELTA2_SENSORS = (
+    EcoFlowEntityDescription(LevelSensorEntity, "bms_bmsStatus.soc", const.MAIN_BATTERY_LEVEL)
+    .attr("bms_bmsStatus.designCap", const.ATTR_DESIGN_CAPACITY, 0)
+    .attr("bms_bmsStatus.fullCap", const.ATTR_FULL_CAPACITY, 0)
+    .attr("bms_bmsStatus.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bms_bmsStatus.designCap", const.MAIN_DESIGN_CAPACITY, False),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bms_bmsStatus.fullCap", const.MAIN_FULL_CAPACITY, False),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bms_bmsStatus.remainCap", const.MAIN_REMAIN_CAPACITY, False),
+
+    EcoFlowEntityDescription(LevelSensorEntity, "bms_bmsStatus.soh", const.SOH),
+
+    EcoFlowEntityDescription(LevelSensorEntity, "bms_emsStatus.lcdShowSoc", const.COMBINED_BATTERY_LEVEL),
+    EcoFlowEntityDescription(InWattsSensorEntity, "pd.wattsInSum", const.TOTAL_IN_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.wattsOutSum", const.TOTAL_OUT_POWER),
+
+    EcoFlowEntityDescription(InWattsSensorEntity, "inv.inputWatts", const.AC_IN_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "inv.outputWatts", const.AC_OUT_POWER),
+
+    EcoFlowEntityDescription(InMilliVoltSensorEntity, "inv.acInVol", const.AC_IN_VOLT),
+    EcoFlowEntityDescription(OutMilliVoltSensorEntity, "inv.invOutVol", const.AC_OUT_VOLT),
+
+    EcoFlowEntityDescription(InWattsSensorEntity, "mppt.inWatts", const.SOLAR_IN_POWER),
+
+    # EcoFlowEntityDescription(OutWattsSensorEntity, "pd.carWatts", const.DC_OUT_POWER),
+    # the same value as pd.carWatts
+    EcoFlowEntityDescription(OutWattsSensorEntity, "mppt.outWatts", const.DC_OUT_POWER),
+
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.typec1Watts", const.TYPEC_1_OUT_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.typec2Watts", const.TYPEC_2_OUT_POWER),
+
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.usb1Watts", const.USB_1_OUT_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.usb2Watts", const.USB_2_OUT_POWER),
+
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.qcUsb1Watts", const.USB_QC_1_OUT_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.qcUsb2Watts", const.USB_QC_2_OUT_POWER),
+
+    EcoFlowEntityDescription(RemainSensorEntity, "bms_emsStatus.chgRemainTime", const.CHARGE_REMAINING_TIME),
+    EcoFlowEntityDescription(RemainSensorEntity, "bms_emsStatus.dsgRemainTime", const.DISCHARGE_REMAINING_TIME),
+
+    EcoFlowEntityDescription(TempSensorEntity, "inv.outTemp", "Inv Out Temperature"),
+    EcoFlowEntityDescription(CyclesSensorEntity, "bms_bmsStatus.cycles", const.CYCLES),
+
+    EcoFlowEntityDescription(TempSensorEntity, "bms_bmsStatus.temp", const.BATTERY_TEMP)
+    .attr("bms_bmsStatus.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
+    .attr("bms_bmsStatus.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
+    EcoFlowEntityDescription(TempSensorEntity, "bms_bmsStatus.minCellTemp", const.MIN_CELL_TEMP, False),
+    EcoFlowEntityDescription(TempSensorEntity, "bms_bmsStatus.maxCellTemp", const.MAX_CELL_TEMP, False),
+
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bms_bmsStatus.vol", const.BATTERY_VOLT, False)
+    .attr("bms_bmsStatus.minCellVol", const.ATTR_MIN_CELL_VOLT, 0)
+    .attr("bms_bmsStatus.maxCellVol", const.ATTR_MAX_CELL_VOLT, 0),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bms_bmsStatus.minCellVol", const.MIN_CELL_VOLT, False),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bms_bmsStatus.maxCellVol", const.MAX_CELL_VOLT, False),
+
+    # Optional Slave Battery
+    EcoFlowEntityDescription(LevelSensorEntity, "bms_slave.soc", const.SLAVE_BATTERY_LEVEL, False, True)
+    .attr("bms_slave.designCap", const.ATTR_DESIGN_CAPACITY, 0)
+    .attr("bms_slave.fullCap", const.ATTR_FULL_CAPACITY, 0)
+    .attr("bms_slave.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bms_slave.designCap", const.SLAVE_DESIGN_CAPACITY, False),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bms_slave.fullCap", const.SLAVE_FULL_CAPACITY, False),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bms_slave.remainCap", const.SLAVE_REMAIN_CAPACITY, False),
+
+    EcoFlowEntityDescription(LevelSensorEntity, "bms_slave.soh", const.SLAVE_SOH),
+    EcoFlowEntityDescription(TempSensorEntity, "bms_slave.temp", const.SLAVE_BATTERY_TEMP, False, True)
+    .attr("bms_slave.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
+    .attr("bms_slave.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
+    EcoFlowEntityDescription(TempSensorEntity, "bms_slave.minCellTemp", const.SLAVE_MIN_CELL_TEMP, False),
+    EcoFlowEntityDescription(TempSensorEntity, "bms_slave.maxCellTemp", const.SLAVE_MAX_CELL_TEMP, False),
+
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bms_slave.vol", const.SLAVE_BATTERY_VOLT, False)
+    .attr("bms_slave.minCellVol", const.ATTR_MIN_CELL_VOLT, 0)
+    .attr("bms_slave.maxCellVol", const.ATTR_MAX_CELL_VOLT, 0),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bms_slave.minCellVol", const.SLAVE_MIN_CELL_VOLT, False),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bms_slave.maxCellVol", const.SLAVE_MAX_CELL_VOLT, False),
+
+    EcoFlowEntityDescription(CyclesSensorEntity, "bms_slave.cycles", const.SLAVE_CYCLES, False, True),
+    EcoFlowEntityDescription(InWattsSensorEntity, "bms_slave.inputWatts", const.SLAVE_IN_POWER, False, True),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "bms_slave.outputWatts", const.SLAVE_OUT_POWER, False, True),
+)
+
+
 class Delta2(BaseDevice):
 
     def sensors(self, client: EcoflowApiClient) -> list[BaseSensorEntity]:
-        return [
-            LevelSensorEntity(client, self, "bms_bmsStatus.soc", const.MAIN_BATTERY_LEVEL)
-            .attr("bms_bmsStatus.designCap", const.ATTR_DESIGN_CAPACITY, 0)
-            .attr("bms_bmsStatus.fullCap", const.ATTR_FULL_CAPACITY, 0)
-            .attr("bms_bmsStatus.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
-            CapacitySensorEntity(client, self, "bms_bmsStatus.designCap", const.MAIN_DESIGN_CAPACITY, False),
-            CapacitySensorEntity(client, self, "bms_bmsStatus.fullCap", const.MAIN_FULL_CAPACITY, False),
-            CapacitySensorEntity(client, self, "bms_bmsStatus.remainCap", const.MAIN_REMAIN_CAPACITY, False),
-
-            LevelSensorEntity(client, self, "bms_bmsStatus.soh", const.SOH),
-
-            LevelSensorEntity(client, self, "bms_emsStatus.lcdShowSoc", const.COMBINED_BATTERY_LEVEL),
-            InWattsSensorEntity(client, self, "pd.wattsInSum", const.TOTAL_IN_POWER),
-            OutWattsSensorEntity(client, self, "pd.wattsOutSum", const.TOTAL_OUT_POWER),
-
-            InWattsSensorEntity(client, self, "inv.inputWatts", const.AC_IN_POWER),
-            OutWattsSensorEntity(client, self, "inv.outputWatts", const.AC_OUT_POWER),
-
-            InMilliVoltSensorEntity(client, self, "inv.acInVol", const.AC_IN_VOLT),
-            OutMilliVoltSensorEntity(client, self, "inv.invOutVol", const.AC_OUT_VOLT),
-
-            InWattsSensorEntity(client, self, "mppt.inWatts", const.SOLAR_IN_POWER),
-
-            # OutWattsSensorEntity(client, self, "pd.carWatts", const.DC_OUT_POWER),
-            # the same value as pd.carWatts
-            OutWattsSensorEntity(client, self, "mppt.outWatts", const.DC_OUT_POWER),
-
-            OutWattsSensorEntity(client, self, "pd.typec1Watts", const.TYPEC_1_OUT_POWER),
-            OutWattsSensorEntity(client, self, "pd.typec2Watts", const.TYPEC_2_OUT_POWER),
-
-            OutWattsSensorEntity(client, self, "pd.usb1Watts", const.USB_1_OUT_POWER),
-            OutWattsSensorEntity(client, self, "pd.usb2Watts", const.USB_2_OUT_POWER),
-
-            OutWattsSensorEntity(client, self, "pd.qcUsb1Watts", const.USB_QC_1_OUT_POWER),
-            OutWattsSensorEntity(client, self, "pd.qcUsb2Watts", const.USB_QC_2_OUT_POWER),
-
-            RemainSensorEntity(client, self, "bms_emsStatus.chgRemainTime", const.CHARGE_REMAINING_TIME),
-            RemainSensorEntity(client, self, "bms_emsStatus.dsgRemainTime", const.DISCHARGE_REMAINING_TIME),
-
-            TempSensorEntity(client, self, "inv.outTemp", "Inv Out Temperature"),
-            CyclesSensorEntity(client, self, "bms_bmsStatus.cycles", const.CYCLES),
-
-            TempSensorEntity(client, self, "bms_bmsStatus.temp", const.BATTERY_TEMP)
-            .attr("bms_bmsStatus.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
-            .attr("bms_bmsStatus.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
-            TempSensorEntity(client, self, "bms_bmsStatus.minCellTemp", const.MIN_CELL_TEMP, False),
-            TempSensorEntity(client, self, "bms_bmsStatus.maxCellTemp", const.MAX_CELL_TEMP, False),
-
-            MilliVoltSensorEntity(client, self, "bms_bmsStatus.vol", const.BATTERY_VOLT, False)
-            .attr("bms_bmsStatus.minCellVol", const.ATTR_MIN_CELL_VOLT, 0)
-            .attr("bms_bmsStatus.maxCellVol", const.ATTR_MAX_CELL_VOLT, 0),
-            MilliVoltSensorEntity(client, self, "bms_bmsStatus.minCellVol", const.MIN_CELL_VOLT, False),
-            MilliVoltSensorEntity(client, self, "bms_bmsStatus.maxCellVol", const.MAX_CELL_VOLT, False),
-
-            # Optional Slave Battery
-            LevelSensorEntity(client, self, "bms_slave.soc", const.SLAVE_BATTERY_LEVEL, False, True)
-            .attr("bms_slave.designCap", const.ATTR_DESIGN_CAPACITY, 0)
-            .attr("bms_slave.fullCap", const.ATTR_FULL_CAPACITY, 0)
-            .attr("bms_slave.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
-            CapacitySensorEntity(client, self, "bms_slave.designCap", const.SLAVE_DESIGN_CAPACITY, False),
-            CapacitySensorEntity(client, self, "bms_slave.fullCap", const.SLAVE_FULL_CAPACITY, False),
-            CapacitySensorEntity(client, self, "bms_slave.remainCap", const.SLAVE_REMAIN_CAPACITY, False),
-
-            LevelSensorEntity(client, self, "bms_slave.soh", const.SLAVE_SOH),
-            TempSensorEntity(client, self, "bms_slave.temp", const.SLAVE_BATTERY_TEMP, False, True)
-            .attr("bms_slave.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
-            .attr("bms_slave.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
-            TempSensorEntity(client, self, "bms_slave.minCellTemp", const.SLAVE_MIN_CELL_TEMP, False),
-            TempSensorEntity(client, self, "bms_slave.maxCellTemp", const.SLAVE_MAX_CELL_TEMP, False),
-
-            MilliVoltSensorEntity(client, self, "bms_slave.vol", const.SLAVE_BATTERY_VOLT, False)
-            .attr("bms_slave.minCellVol", const.ATTR_MIN_CELL_VOLT, 0)
-            .attr("bms_slave.maxCellVol", const.ATTR_MAX_CELL_VOLT, 0),
-            MilliVoltSensorEntity(client, self, "bms_slave.minCellVol", const.SLAVE_MIN_CELL_VOLT, False),
-            MilliVoltSensorEntity(client, self, "bms_slave.maxCellVol", const.SLAVE_MAX_CELL_VOLT, False),
-
-            CyclesSensorEntity(client, self, "bms_slave.cycles", const.SLAVE_CYCLES, False, True),
-            InWattsSensorEntity(client, self, "bms_slave.inputWatts", const.SLAVE_IN_POWER, False, True),
-            OutWattsSensorEntity(client, self, "bms_slave.outputWatts", const.SLAVE_OUT_POWER, False, True),
-            self._status_sensor(client),
-
-        ]
+        return create_entities(client, self, DELTA2_SENSORS) + [self._status_sensor(client)]
 
     def numbers(self, client: EcoflowApiClient) -> list[BaseNumberEntity]:
         return [
@@ -135,10 +137,11 @@ class Delta2(BaseDevice):
                           lambda value: {"moduleType": 1, "operateType": "dcOutCfg", "params": {"enabled": value}}),
 
             EnabledEntity(client, self, "pd.acAutoOutConfig", const.AC_ALWAYS_ENABLED,
-                          lambda value, params: {"moduleType": 1, "operateType": "acAutoOutConfig",
-                                                 "params": {"acAutoOutConfig": value,
-                                                            "minAcOutSoc": int(
-                                                                params.get("bms_emsStatus.minDsgSoc", 0)) + 5}}),
+                          reads_params(["bms_emsStatus.minDsgSoc"],
+                                       lambda value, params: {"moduleType": 1, "operateType": "acAutoOutConfig",
+                                                              "params": {"acAutoOutConfig": value,
+                                                                         "minAcOutSoc": int(
+                                                                             params.get("bms_emsStatus.minDsgSoc", 0)) + 5}})),
 
             EnabledEntity(client, self, "pd.pvChgPrioSet", const.PV_PRIO,
                           lambda value: {"moduleType": 1, "operateType": "pvChangePrio",
@@ -1,7 +1,7 @@
 from custom_components.ecoflow_cloud_alt.api import EcoflowApiClient
 from custom_components.ecoflow_cloud_alt.devices import const, BaseDevice
 from custom_components.ecoflow_cloud_alt.entities import BaseSensorEntity, BaseNumberEntity, BaseSwitchEntity, \
-    BaseSelectEntity
+    BaseSelectEntity, EcoFlowEntityDescription, create_entities
 from custom_components.ecoflow_cloud_alt.number import ChargingPowerEntity, MinBatteryLevelEntity, MaxBatteryLevelEntity, \
     MaxGenStopLevelEntity, MinGenStartLevelEntity, BatteryBackupLevel
 from custom_components.ecoflow_cloud_alt.select import TimeoutDictSelectEntity
@@ -13,135 +13,134 @@ from custom_components.ecoflow_cloud_alt.sensor import LevelSensorEntity, Remain
 from custom_components.ecoflow_cloud_alt.switch import BeeperEntity, EnabledEntity
 
 
+DELTA2_MAX_SENSORS = (
+    EcoFlowEntityDescription(LevelSensorEntity, "bms_bmsStatus.soc", const.MAIN_BATTERY_LEVEL)
+    .attr("bms_bmsStatus.designCap", const.ATTR_DESIGN_CAPACITY, 0)
+    .attr("bms_bmsStatus.fullCap", const.ATTR_FULL_CAPACITY, 0)
+    .attr("bms_bmsStatus.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bms_bmsStatus.designCap", const.MAIN_DESIGN_CAPACITY, False),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bms_bmsStatus.fullCap", const.MAIN_FULL_CAPACITY, False),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bms_bmsStatus.remainCap", const.MAIN_REMAIN_CAPACITY, False),
+
+    EcoFlowEntityDescription(LevelSensorEntity, "bms_bmsStatus.soh", const.SOH),
+
+    EcoFlowEntityDescription(LevelSensorEntity, "bms_emsStatus.lcdShowSoc", const.COMBINED_BATTERY_LEVEL),
+
+    EcoFlowEntityDescription(InWattsSensorEntity, "pd.wattsInSum", const.TOTAL_IN_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.wattsOutSum", const.TOTAL_OUT_POWER),
+
+    EcoFlowEntityDescription(InWattsSensorEntity, "inv.inputWatts", const.AC_IN_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "inv.outputWatts", const.AC_OUT_POWER),
+
+    EcoFlowEntityDescription(InMilliVoltSensorEntity, "inv.acInVol", const.AC_IN_VOLT),
+    EcoFlowEntityDescription(OutMilliVoltSensorEntity, "inv.invOutVol", const.AC_OUT_VOLT),
+
+    EcoFlowEntityDescription(InWattsSensorEntity, "mppt.inWatts", const.SOLAR_1_IN_POWER),
+    EcoFlowEntityDescription(InWattsSensorEntity, "mppt.pv2InWatts", const.SOLAR_2_IN_POWER),
+
+    EcoFlowEntityDescription(InMilliVoltSensorEntity, "mppt.inVol", const.SOLAR_1_IN_VOLTS),
+    EcoFlowEntityDescription(InMilliVoltSensorEntity, "mppt.pv2InVol", const.SOLAR_2_IN_VOLTS),
+    EcoFlowEntityDescription(InAmpSensorEntity, "mppt.inAmp", const.SOLAR_1_IN_AMPS),
+    EcoFlowEntityDescription(InAmpSensorEntity, "mppt.pv2InAmp", const.SOLAR_2_IN_AMPS),
+
+    # EcoFlowEntityDescription(OutWattsSensorEntity, "pd.carWatts", const.DC_OUT_POWER),
+    # the same value as pd.carWatts
+    EcoFlowEntityDescription(OutWattsSensorEntity, "mppt.outWatts", const.DC_OUT_POWER),
+
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.typec1Watts", const.TYPEC_1_OUT_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.typec2Watts", const.TYPEC_2_OUT_POWER),
+
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.usb1Watts", const.USB_1_OUT_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.usb2Watts", const.USB_2_OUT_POWER),
+
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.qcUsb1Watts", const.USB_QC_1_OUT_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.qcUsb2Watts", const.USB_QC_2_OUT_POWER),
+
+    EcoFlowEntityDescription(RemainSensorEntity, "bms_emsStatus.chgRemainTime", const.CHARGE_REMAINING_TIME),
+    EcoFlowEntityDescription(RemainSensorEntity, "bms_emsStatus.dsgRemainTime", const.DISCHARGE_REMAINING_TIME),
+
+    EcoFlowEntityDescription(TempSensorEntity, "inv.outTemp", "Inv Out Temperature"),
+    EcoFlowEntityDescription(CyclesSensorEntity, "bms_bmsStatus.cycles", const.CYCLES),
+
+    EcoFlowEntityDescription(TempSensorEntity, "bms_bmsStatus.temp", const.BATTERY_TEMP)
+    .attr("bms_bmsStatus.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
+    .attr("bms_bmsStatus.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
+    EcoFlowEntityDescription(TempSensorEntity, "bms_bmsStatus.minCellTemp", const.MIN_CELL_TEMP, False),
+    EcoFlowEntityDescription(TempSensorEntity, "bms_bmsStatus.maxCellTemp", const.MAX_CELL_TEMP, False),
+
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bms_bmsStatus.vol", const.BATTERY_VOLT, False)
+    .attr("bms_bmsStatus.minCellVol", const.ATTR_MIN_CELL_VOLT, 0)
+    .attr("bms_bmsStatus.maxCellVol", const.ATTR_MAX_CELL_VOLT, 0),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bms_bmsStatus.minCellVol", const.MIN_CELL_VOLT, False),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bms_bmsStatus.maxCellVol", const.MAX_CELL_VOLT, False),
+    EcoFlowEntityDescription(LevelSensorEntity, "bms_bmsStatus.f32ShowSoc", const.BATTERY_LEVEL_SOC, False, True),
+
+    # Energy Device Class for Delta 2 Max for HA Energy Dashboard Config
+    EcoFlowEntityDescription(InEnergySensorEntity, "pd.chgSunPower", const.SOLAR_IN_ENERGY),
+    EcoFlowEntityDescription(InEnergySensorEntity, "pd.chgPowerAC", const.CHARGE_AC_ENERGY),
+    EcoFlowEntityDescription(InEnergySensorEntity, "pd.chgPowerDC", const.CHARGE_DC_ENERGY),
+    EcoFlowEntityDescription(OutEnergySensorEntity, "pd.dsgPowerAC", const.DISCHARGE_AC_ENERGY),
+    EcoFlowEntityDescription(OutEnergySensorEntity, "pd.dsgPowerDC", const.DISCHARGE_DC_ENERGY),
+
+    # Optional Slave 1 Battery
+    EcoFlowEntityDescription(LevelSensorEntity, "bms_slave_bmsSlaveStatus_1.soc", const.SLAVE_N_BATTERY_LEVEL % 1, False, True)
+    .attr("bms_slave_bmsSlaveStatus_1.designCap", const.ATTR_DESIGN_CAPACITY, 0)
+    .attr("bms_slave_bmsSlaveStatus_1.fullCap", const.ATTR_FULL_CAPACITY, 0)
+    .attr("bms_slave_bmsSlaveStatus_1.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bms_slave_bmsSlaveStatus_1.designCap", const.SLAVE_N_DESIGN_CAPACITY % 1,False),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bms_slave_bmsSlaveStatus_1.fullCap", const.SLAVE_N_FULL_CAPACITY % 1, False),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bms_slave_bmsSlaveStatus_1.remainCap", const.SLAVE_N_REMAIN_CAPACITY % 1,False),
+
+    EcoFlowEntityDescription(TempSensorEntity, "bms_slave_bmsSlaveStatus_1.temp", const.SLAVE_N_BATTERY_TEMP % 1, False, True)
+    .attr("bms_slave_bmsSlaveStatus_1.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
+    .attr("bms_slave_bmsSlaveStatus_1.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
+    EcoFlowEntityDescription(TempSensorEntity, "bms_slave_bmsSlaveStatus_1.minCellTemp", const.SLAVE_N_MIN_CELL_TEMP % 1, False),
+    EcoFlowEntityDescription(TempSensorEntity, "bms_slave_bmsSlaveStatus_1.maxCellTemp", const.SLAVE_N_MAX_CELL_TEMP % 1, False),
+
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bms_slave_bmsSlaveStatus_1.vol", const.SLAVE_N_BATTERY_VOLT % 1, False)
+    .attr("bms_slave_bmsSlaveStatus_1.minCellVol", const.ATTR_MIN_CELL_VOLT, 0)
+    .attr("bms_slave_bmsSlaveStatus_1.maxCellVol", const.ATTR_MAX_CELL_VOLT, 0),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bms_slave_bmsSlaveStatus_1.minCellVol", const.SLAVE_N_MIN_CELL_VOLT % 1,False),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bms_slave_bmsSlaveStatus_1.maxCellVol", const.SLAVE_N_MAX_CELL_VOLT % 1,False),
+
+    EcoFlowEntityDescription(CyclesSensorEntity, "bms_slave_bmsSlaveStatus_1.cycles", const.SLAVE_N_CYCLES % 1, False, True),
+    EcoFlowEntityDescription(LevelSensorEntity, "bms_slave_bmsSlaveStatus_1.soh", const.SLAVE_N_SOH % 1, False, True),
+    EcoFlowEntityDescription(InWattsSensorEntity, "bms_slave_bmsSlaveStatus_1.inputWatts", const.SLAVE_N_IN_POWER % 1, False,True),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "bms_slave_bmsSlaveStatus_1.outputWatts", const.SLAVE_N_OUT_POWER % 1, False,True),
+    EcoFlowEntityDescription(LevelSensorEntity, "bms_slave_bmsSlaveStatus_1.f32ShowSoc", const.SLAVE_N_BATTERY_LEVEL_SOC % 1, False, True),
+
+    # Optional Slave 2 Battery
+    EcoFlowEntityDescription(LevelSensorEntity, "bms_slave_bmsSlaveStatus_2.soc", const.SLAVE_N_BATTERY_LEVEL % 2, False, True)
+    .attr("bms_slave_bmsSlaveStatus_2.designCap", const.ATTR_DESIGN_CAPACITY, 0)
+    .attr("bms_slave_bmsSlaveStatus_2.fullCap", const.ATTR_FULL_CAPACITY, 0)
+    .attr("bms_slave_bmsSlaveStatus_2.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bms_slave_bmsSlaveStatus_2.designCap", const.SLAVE_N_DESIGN_CAPACITY % 2,False),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bms_slave_bmsSlaveStatus_2.fullCap", const.SLAVE_N_FULL_CAPACITY % 2, False),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bms_slave_bmsSlaveStatus_2.remainCap", const.SLAVE_N_REMAIN_CAPACITY % 2,False),
+
+    EcoFlowEntityDescription(TempSensorEntity, "bms_slave_bmsSlaveStatus_2.temp", const.SLAVE_N_BATTERY_TEMP % 2, False, True)
+    .attr("bms_slave_bmsSlaveStatus_2.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
+    .attr("bms_slave_bmsSlaveStatus_2.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
+    EcoFlowEntityDescription(TempSensorEntity, "bms_slave_bmsSlaveStatus_2.minCellTemp", const.SLAVE_N_MIN_CELL_TEMP % 2, False),
+    EcoFlowEntityDescription(TempSensorEntity, "bms_slave_bmsSlaveStatus_2.maxCellTemp", const.SLAVE_N_MAX_CELL_TEMP % 2, False),
+
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bms_slave_bmsSlaveStatus_2.vol", const.SLAVE_N_BATTERY_VOLT % 2, False)
+    .attr("bms_slave_bmsSlaveStatus_2.minCellVol", const.ATTR_MIN_CELL_VOLT, 0)
+    .attr("bms_slave_bmsSlaveStatus_2.maxCellVol", const.ATTR_MAX_CELL_VOLT, 0),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bms_slave_bmsSlaveStatus_2.minCellVol", const.SLAVE_N_MIN_CELL_VOLT % 2, False),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bms_slave_bmsSlaveStatus_2.maxCellVol", const.SLAVE_N_MAX_CELL_VOLT % 2, False),
+
+    EcoFlowEntityDescription(CyclesSensorEntity, "bms_slave_bmsSlaveStatus_2.cycles", const.SLAVE_N_CYCLES % 2, False, True),
+    EcoFlowEntityDescription(LevelSensorEntity, "bms_slave_bmsSlaveStatus_2.soh", const.SLAVE_N_SOH % 2, False, True),
+    EcoFlowEntityDescription(InWattsSensorEntity, "bms_slave_bmsSlaveStatus_2.inputWatts", const.SLAVE_N_IN_POWER % 2, False, True),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "bms_slave_bmsaSlaveStatus_2.outputWatts", const.SLAVE_N_OUT_POWER % 2, False, True),
+    EcoFlowEntityDescription(LevelSensorEntity, "bms_slave_bmsSlaveStatus_2.f32ShowSoc", const.SLAVE_N_BATTERY_LEVEL_SOC % 2, False, True),
+)
+
+
 class Delta2Max(BaseDevice):
     def sensors(self, client: EcoflowApiClient) -> list[BaseSensorEntity]:
-        return [
-            LevelSensorEntity(client, self, "bms_bmsStatus.soc", const.MAIN_BATTERY_LEVEL)
-            .attr("bms_bmsStatus.designCap", const.ATTR_DESIGN_CAPACITY, 0)
-            .attr("bms_bmsStatus.fullCap", const.ATTR_FULL_CAPACITY, 0)
-            .attr("bms_bmsStatus.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
-            CapacitySensorEntity(client, self, "bms_bmsStatus.designCap", const.MAIN_DESIGN_CAPACITY, False),
-            CapacitySensorEntity(client, self, "bms_bmsStatus.fullCap", const.MAIN_FULL_CAPACITY, False),
-            CapacitySensorEntity(client, self, "bms_bmsStatus.remainCap", const.MAIN_REMAIN_CAPACITY, False),
-
-            LevelSensorEntity(client, self, "bms_bmsStatus.soh", const.SOH),
-
-            LevelSensorEntity(client, self, "bms_emsStatus.lcdShowSoc", const.COMBINED_BATTERY_LEVEL),
-
-            InWattsSensorEntity(client, self, "pd.wattsInSum", const.TOTAL_IN_POWER),
-            OutWattsSensorEntity(client, self, "pd.wattsOutSum", const.TOTAL_OUT_POWER),
-
-            InWattsSensorEntity(client, self, "inv.inputWatts", const.AC_IN_POWER),
-            OutWattsSensorEntity(client, self, "inv.outputWatts", const.AC_OUT_POWER),
-
-            InMilliVoltSensorEntity(client, self, "inv.acInVol", const.AC_IN_VOLT),
-            OutMilliVoltSensorEntity(client, self, "inv.invOutVol", const.AC_OUT_VOLT),
-
-            InWattsSensorEntity(client, self, "mppt.inWatts", const.SOLAR_1_IN_POWER),
-            InWattsSensorEntity(client, self, "mppt.pv2InWatts", const.SOLAR_2_IN_POWER),
-
-            InMilliVoltSensorEntity(client, self, "mppt.inVol", const.SOLAR_1_IN_VOLTS), 
-            InMilliVoltSensorEntity(client, self, "mppt.pv2InVol", const.SOLAR_2_IN_VOLTS), 
-            InAmpSensorEntity(client, self, "mppt.inAmp", const.SOLAR_1_IN_AMPS),        
-            InAmpSensorEntity(client, self, "mppt.pv2InAmp", const.SOLAR_2_IN_AMPS),     
-
-            # OutWattsSensorEntity(client, self, "pd.carWatts", const.DC_OUT_POWER),
-            # the same value as pd.carWatts
-            OutWattsSensorEntity(client, self, "mppt.outWatts", const.DC_OUT_POWER),
-
-            OutWattsSensorEntity(client, self, "pd.typec1Watts", const.TYPEC_1_OUT_POWER),
-            OutWattsSensorEntity(client, self, "pd.typec2Watts", const.TYPEC_2_OUT_POWER),
-
-            OutWattsSensorEntity(client, self, "pd.usb1Watts", const.USB_1_OUT_POWER),
-            OutWattsSensorEntity(client, self, "pd.usb2Watts", const.USB_2_OUT_POWER),
-
-            OutWattsSensorEntity(client, self, "pd.qcUsb1Watts", const.USB_QC_1_OUT_POWER),
-            OutWattsSensorEntity(client, self, "pd.qcUsb2Watts", const.USB_QC_2_OUT_POWER),
-
-            RemainSensorEntity(client, self, "bms_emsStatus.chgRemainTime", const.CHARGE_REMAINING_TIME),
-            RemainSensorEntity(client, self, "bms_emsStatus.dsgRemainTime", const.DISCHARGE_REMAINING_TIME),
-
-            TempSensorEntity(client, self, "inv.outTemp", "Inv Out Temperature"),
-            CyclesSensorEntity(client, self, "bms_bmsStatus.cycles", const.CYCLES),
-
-            TempSensorEntity(client, self, "bms_bmsStatus.temp", const.BATTERY_TEMP)
-            .attr("bms_bmsStatus.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
-            .attr("bms_bmsStatus.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
-            TempSensorEntity(client, self, "bms_bmsStatus.minCellTemp", const.MIN_CELL_TEMP, False),
-            TempSensorEntity(client, self, "bms_bmsStatus.maxCellTemp", const.MAX_CELL_TEMP, False),
-
-            MilliVoltSensorEntity(client, self, "bms_bmsStatus.vol", const.BATTERY_VOLT, False)
-            .attr("bms_bmsStatus.minCellVol", const.ATTR_MIN_CELL_VOLT, 0)
-            .attr("bms_bmsStatus.maxCellVol", const.ATTR_MAX_CELL_VOLT, 0),
-            MilliVoltSensorEntity(client, self, "bms_bmsStatus.minCellVol", const.MIN_CELL_VOLT, False),
-            MilliVoltSensorEntity(client, self, "bms_bmsStatus.maxCellVol", const.MAX_CELL_VOLT, False),
-            LevelSensorEntity(client, self, "bms_bmsStatus.f32ShowSoc", const.BATTERY_LEVEL_SOC, False, True),
-
-            # Energy Device Class for Delta 2 Max for HA Energy Dashboard Config
-            InEnergySensorEntity(client, self, "pd.chgSunPower", const.SOLAR_IN_ENERGY),
-            InEnergySensorEntity(client, self, "pd.chgPowerAC", const.CHARGE_AC_ENERGY),
-            InEnergySensorEntity(client, self, "pd.chgPowerDC", const.CHARGE_DC_ENERGY),
-            OutEnergySensorEntity(client, self, "pd.dsgPowerAC", const.DISCHARGE_AC_ENERGY),
-            OutEnergySensorEntity(client, self, "pd.dsgPowerDC", const.DISCHARGE_DC_ENERGY),
-
-            # Optional Slave 1 Battery
-            LevelSensorEntity(client, self, "bms_slave_bmsSlaveStatus_1.soc", const.SLAVE_N_BATTERY_LEVEL % 1, False, True)
-            .attr("bms_slave_bmsSlaveStatus_1.designCap", const.ATTR_DESIGN_CAPACITY, 0)
-            .attr("bms_slave_bmsSlaveStatus_1.fullCap", const.ATTR_FULL_CAPACITY, 0)
-            .attr("bms_slave_bmsSlaveStatus_1.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
-            CapacitySensorEntity(client, self, "bms_slave_bmsSlaveStatus_1.designCap", const.SLAVE_N_DESIGN_CAPACITY % 1,False),
-            CapacitySensorEntity(client, self, "bms_slave_bmsSlaveStatus_1.fullCap", const.SLAVE_N_FULL_CAPACITY % 1, False),
-            CapacitySensorEntity(client, self, "bms_slave_bmsSlaveStatus_1.remainCap", const.SLAVE_N_REMAIN_CAPACITY % 1,False),
-
-            TempSensorEntity(client, self, "bms_slave_bmsSlaveStatus_1.temp", const.SLAVE_N_BATTERY_TEMP % 1, False, True)
-            .attr("bms_slave_bmsSlaveStatus_1.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
-            .attr("bms_slave_bmsSlaveStatus_1.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
-            TempSensorEntity(client, self, "bms_slave_bmsSlaveStatus_1.minCellTemp", const.SLAVE_N_MIN_CELL_TEMP % 1, False),
-            TempSensorEntity(client, self, "bms_slave_bmsSlaveStatus_1.maxCellTemp", const.SLAVE_N_MAX_CELL_TEMP % 1, False),
-
-            MilliVoltSensorEntity(client, self, "bms_slave_bmsSlaveStatus_1.vol", const.SLAVE_N_BATTERY_VOLT % 1, False)
-            .attr("bms_slave_bmsSlaveStatus_1.minCellVol", const.ATTR_MIN_CELL_VOLT, 0)
-            .attr("bms_slave_bmsSlaveStatus_1.maxCellVol", const.ATTR_MAX_CELL_VOLT, 0),
-            MilliVoltSensorEntity(client, self, "bms_slave_bmsSlaveStatus_1.minCellVol", const.SLAVE_N_MIN_CELL_VOLT % 1,False),
-            MilliVoltSensorEntity(client, self, "bms_slave_bmsSlaveStatus_1.maxCellVol", const.SLAVE_N_MAX_CELL_VOLT % 1,False),
-
-            CyclesSensorEntity(client, self, "bms_slave_bmsSlaveStatus_1.cycles", const.SLAVE_N_CYCLES % 1, False, True),
-            LevelSensorEntity(client, self, "bms_slave_bmsSlaveStatus_1.soh", const.SLAVE_N_SOH % 1, False, True),
-            InWattsSensorEntity(client, self, "bms_slave_bmsSlaveStatus_1.inputWatts", const.SLAVE_N_IN_POWER % 1, False,True),
-            OutWattsSensorEntity(client, self, "bms_slave_bmsSlaveStatus_1.outputWatts", const.SLAVE_N_OUT_POWER % 1, False,True),
-            LevelSensorEntity(client, self, "bms_slave_bmsSlaveStatus_1.f32ShowSoc", const.SLAVE_N_BATTERY_LEVEL_SOC % 1, False, True),
-
-            # Optional Slave 2 Battery
-            LevelSensorEntity(client, self, "bms_slave_bmsSlaveStatus_2.soc", const.SLAVE_N_BATTERY_LEVEL % 2, False, True)
-            .attr("bms_slave_bmsSlaveStatus_2.designCap", const.ATTR_DESIGN_CAPACITY, 0)
-            .attr("bms_slave_bmsSlaveStatus_2.fullCap", const.ATTR_FULL_CAPACITY, 0)
-            .attr("bms_slave_bmsSlaveStatus_2.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
-            CapacitySensorEntity(client, self, "bms_slave_bmsSlaveStatus_2.designCap", const.SLAVE_N_DESIGN_CAPACITY % 2,False),
-            CapacitySensorEntity(client, self, "bms_slave_bmsSlaveStatus_2.fullCap", const.SLAVE_N_FULL_CAPACITY % 2, False),
-            CapacitySensorEntity(client, self, "bms_slave_bmsSlaveStatus_2.remainCap", const.SLAVE_N_REMAIN_CAPACITY % 2,False),
-
-            TempSensorEntity(client, self, "bms_slave_bmsSlaveStatus_2.temp", const.SLAVE_N_BATTERY_TEMP % 2, False, True)
-            .attr("bms_slave_bmsSlaveStatus_2.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
-            .attr("bms_slave_bmsSlaveStatus_2.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
-            TempSensorEntity(client, self, "bms_slave_bmsSlaveStatus_2.minCellTemp", const.SLAVE_N_MIN_CELL_TEMP % 2, False),
-            TempSensorEntity(client, self, "bms_slave_bmsSlaveStatus_2.maxCellTemp", const.SLAVE_N_MAX_CELL_TEMP % 2, False),
-
-            MilliVoltSensorEntity(client, self, "bms_slave_bmsSlaveStatus_2.vol", const.SLAVE_N_BATTERY_VOLT % 2, False)
-            .attr("bms_slave_bmsSlaveStatus_2.minCellVol", const.ATTR_MIN_CELL_VOLT, 0)
-            .attr("bms_slave_bmsSlaveStatus_2.maxCellVol", const.ATTR_MAX_CELL_VOLT, 0),
-            MilliVoltSensorEntity(client, self, "bms_slave_bmsSlaveStatus_2.minCellVol", const.SLAVE_N_MIN_CELL_VOLT % 2, False),
-            MilliVoltSensorEntity(client, self, "bms_slave_bmsSlaveStatus_2.maxCellVol", const.SLAVE_N_MAX_CELL_VOLT % 2, False),
-
-            CyclesSensorEntity(client, self, "bms_slave_bmsSlaveStatus_2.cycles", const.SLAVE_N_CYCLES % 2, False, True),
-            LevelSensorEntity(client, self, "bms_slave_bmsSlaveStatus_2.soh", const.SLAVE_N_SOH % 2, False, True),
-            InWattsSensorEntity(client, self, "bms_slave_bmsSlaveStatus_2.inputWatts", const.SLAVE_N_IN_POWER % 2, False, True),
-            OutWattsSensorEntity(client, self, "bms_slave_bmsaSlaveStatus_2.outputWatts", const.SLAVE_N_OUT_POWER % 2, False, True),
-            LevelSensorEntity(client, self, "bms_slave_bmsSlaveStatus_2.f32ShowSoc", const.SLAVE_N_BATTERY_LEVEL_SOC % 2, False, True),
-
-                       
-            QuotaStatusSensorEntity(client, self)
-
-        ]
+        return create_entities(client, self, DELTA2_MAX_SENSORS) + [QuotaStatusSensorEntity(client, self)]
 
     def numbers(self, client: EcoflowApiClient) -> list[BaseNumberEntity]:
         return [
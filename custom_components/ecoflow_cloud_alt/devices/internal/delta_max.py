@@ -1,6 +1,6 @@
 from custom_components.ecoflow_cloud_alt.api import EcoflowApiClient
 from custom_components.ecoflow_cloud_alt.devices import const, BaseDevice
-from custom_components.ecoflow_cloud_alt.entities import BaseSensorEntity, BaseNumberEntity, BaseSwitchEntity, BaseSelectEntity
+from custom_components.ecoflow_cloud_alt.entities import BaseSensorEntity, BaseNumberEntity, BaseSwitchEntity, BaseSelectEntity, EcoFlowEntityDescription, create_entities
 from custom_components.ecoflow_cloud_alt.number import ChargingPowerEntity, MinBatteryLevelEntity, MaxBatteryLevelEntity, \
     MaxGenStopLevelEntity, MinGenStartLevelEntity
 from custom_components.ecoflow_cloud_alt.sensor import LevelSensorEntity, RemainSensorEntity, TempSensorEntity, \
@@ -11,72 +11,74 @@ from custom_components.ecoflow_cloud_alt.sensor import LevelSensorEntity, Remain
 from custom_components.ecoflow_cloud_alt.switch import BeeperEntity, EnabledEntity
 
 
+DELTA_MAX_SENSORS = (
+    EcoFlowEntityDescription(LevelSensorEntity, "bmsMaster.soc", const.MAIN_BATTERY_LEVEL)
+        .attr("bmsMaster.designCap", const.ATTR_DESIGN_CAPACITY, 0)
+        .attr("bmsMaster.fullCap", const.ATTR_FULL_CAPACITY, 0)
+        .attr("bmsMaster.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bmsMaster.designCap", const.MAIN_DESIGN_CAPACITY, False),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bmsMaster.fullCap", const.MAIN_FULL_CAPACITY, False),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bmsMaster.remainCap", const.MAIN_REMAIN_CAPACITY, False),
+
+    EcoFlowEntityDescription(LevelSensorEntity, "ems.lcdShowSoc", const.COMBINED_BATTERY_LEVEL),
+    EcoFlowEntityDescription(InWattsSensorEntity, "pd.wattsInSum", const.TOTAL_IN_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.wattsOutSum", const.TOTAL_OUT_POWER),
+
+    EcoFlowEntityDescription(InWattsSensorEntity, "inv.inputWatts", const.AC_IN_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "inv.outputWatts", const.AC_OUT_POWER),
+
+    EcoFlowEntityDescription(InMilliVoltSensorEntity, "inv.acInVol", const.AC_IN_VOLT),
+    EcoFlowEntityDescription(OutMilliVoltSensorEntity, "inv.invOutVol", const.AC_OUT_VOLT),
+
+    EcoFlowEntityDescription(InWattsSolarSensorEntity, "mppt.inWatts", const.SOLAR_IN_POWER),
+    EcoFlowEntityDescription(OutWattsDcSensorEntity, "mppt.outWatts", const.DC_OUT_POWER),
+
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.typec1Watts", const.TYPEC_1_OUT_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.typec2Watts", const.TYPEC_2_OUT_POWER),
+
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.usb1Watts", const.USB_1_OUT_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.usb2Watts", const.USB_2_OUT_POWER),
+
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.qcUsb1Watts", const.USB_QC_1_OUT_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.qcUsb2Watts", const.USB_QC_2_OUT_POWER),
+
+    EcoFlowEntityDescription(RemainSensorEntity, "ems.chgRemainTime", const.CHARGE_REMAINING_TIME),
+    EcoFlowEntityDescription(RemainSensorEntity, "ems.dsgRemainTime", const.DISCHARGE_REMAINING_TIME),
+
+    EcoFlowEntityDescription(TempSensorEntity, "inv.outTemp", "Inv Out Temperature"),
+    EcoFlowEntityDescription(CyclesSensorEntity, "bmsMaster.cycles", const.CYCLES),
+
+    EcoFlowEntityDescription(TempSensorEntity, "bmsMaster.temp", const.BATTERY_TEMP)
+        .attr("bmsMaster.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
+        .attr("bmsMaster.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
+    EcoFlowEntityDescription(TempSensorEntity, "bmsMaster.minCellTemp", const.MIN_CELL_TEMP, False),
+    EcoFlowEntityDescription(TempSensorEntity, "bmsMaster.maxCellTemp", const.MAX_CELL_TEMP, False),
+
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bmsMaster.vol", const.BATTERY_VOLT, False)
+        .attr("bmsMaster.minCellVol", const.ATTR_MIN_CELL_VOLT, 0)
+        .attr("bmsMaster.maxCellVol", const.ATTR_MAX_CELL_VOLT, 0),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bmsMaster.minCellVol", const.MIN_CELL_VOLT, False),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bmsMaster.maxCellVol", const.MAX_CELL_VOLT, False),
+
+    # Optional Slave Battery
+    #EcoFlowEntityDescription(LevelSensorEntity, "bms_slave.soc", const.SLAVE_BATTERY_LEVEL, False, True),
+    #EcoFlowEntityDescription(TempSensorEntity, "bms_slave.temp", const.SLAVE_BATTERY_TEMP, False, True),
+    #EcoFlowEntityDescription(TempSensorEntity, "bms_slave.minCellTemp", const.SLAVE_MIN_CELL_TEMP, False),
+    #EcoFlowEntityDescription(TempSensorEntity, "bms_slave.maxCellTemp", const.SLAVE_MAX_CELL_TEMP, False),
+
+    #EcoFlowEntityDescription(VoltSensorEntity, "bms_slave.vol", const.SLAVE_BATTERY_VOLT, False),
+    #EcoFlowEntityDescription(VoltSensorEntity, "bms_slave.minCellVol", const.SLAVE_MIN_CELL_VOLT, False),
+    #EcoFlowEntityDescription(VoltSensorEntity, "bms_slave.maxCellVol", const.SLAVE_MAX_CELL_VOLT, False),
+
+    #EcoFlowEntityDescription(CyclesSensorEntity, "bms_slave.cycles", const.SLAVE_CYCLES, False, True),
+    #EcoFlowEntityDescription(InWattsSensorEntity, "bms_slave.inputWatts", const.SLAVE_IN_POWER, False, True),
+    #EcoFlowEntityDescription(OutWattsSensorEntity, "bms_slave.outputWatts", const.SLAVE_OUT_POWER, False, True)
+)
+
+
 class DeltaMax(BaseDevice):
     def sensors(self, client: EcoflowApiClient) -> list[BaseSensorEntity]:
-        return [
-            LevelSensorEntity(client, self, "bmsMaster.soc", const.MAIN_BATTERY_LEVEL)
-                .attr("bmsMaster.designCap", const.ATTR_DESIGN_CAPACITY, 0)
-                .attr("bmsMaster.fullCap", const.ATTR_FULL_CAPACITY, 0)
-                .attr("bmsMaster.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
-            CapacitySensorEntity(client, self, "bmsMaster.designCap", const.MAIN_DESIGN_CAPACITY, False),
-            CapacitySensorEntity(client, self, "bmsMaster.fullCap", const.MAIN_FULL_CAPACITY, False),
-            CapacitySensorEntity(client, self, "bmsMaster.remainCap", const.MAIN_REMAIN_CAPACITY, False),
-
-            LevelSensorEntity(client, self, "ems.lcdShowSoc", const.COMBINED_BATTERY_LEVEL),
-            InWattsSensorEntity(client, self, "pd.wattsInSum", const.TOTAL_IN_POWER),
-            OutWattsSensorEntity(client, self, "pd.wattsOutSum", const.TOTAL_OUT_POWER),
-
-            InWattsSensorEntity(client, self, "inv.inputWatts", const.AC_IN_POWER),
-            OutWattsSensorEntity(client, self, "inv.outputWatts", const.AC_OUT_POWER),
-
-            InMilliVoltSensorEntity(client, self, "inv.acInVol", const.AC_IN_VOLT),
-            OutMilliVoltSensorEntity(client, self, "inv.invOutVol", const.AC_OUT_VOLT),
-
-            InWattsSolarSensorEntity(client, self, "mppt.inWatts", const.SOLAR_IN_POWER),
-            OutWattsDcSensorEntity(client, self, "mppt.outWatts", const.DC_OUT_POWER),
-
-            OutWattsSensorEntity(client, self, "pd.typec1Watts", const.TYPEC_1_OUT_POWER),
-            OutWattsSensorEntity(client, self, "pd.typec2Watts", const.TYPEC_2_OUT_POWER),
-
-            OutWattsSensorEntity(client, self, "pd.usb1Watts", const.USB_1_OUT_POWER),
-            OutWattsSensorEntity(client, self, "pd.usb2Watts", const.USB_2_OUT_POWER),
-
-            OutWattsSensorEntity(client, self, "pd.qcUsb1Watts", const.USB_QC_1_OUT_POWER),
-            OutWattsSensorEntity(client, self, "pd.qcUsb2Watts", const.USB_QC_2_OUT_POWER),
-
-            RemainSensorEntity(client, self, "ems.chgRemainTime", const.CHARGE_REMAINING_TIME),
-            RemainSensorEntity(client, self, "ems.dsgRemainTime", const.DISCHARGE_REMAINING_TIME),
-
-            TempSensorEntity(client, self, "inv.outTemp", "Inv Out Temperature"),
-            CyclesSensorEntity(client, self, "bmsMaster.cycles", const.CYCLES),
-
-            TempSensorEntity(client, self, "bmsMaster.temp", const.BATTERY_TEMP)
-                .attr("bmsMaster.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
-                .attr("bmsMaster.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
-            TempSensorEntity(client, self, "bmsMaster.minCellTemp", const.MIN_CELL_TEMP, False),
-            TempSensorEntity(client, self, "bmsMaster.maxCellTemp", const.MAX_CELL_TEMP, False),
-
-            MilliVoltSensorEntity(client, self, "bmsMaster.vol", const.BATTERY_VOLT, False)
-                .attr("bmsMaster.minCellVol", const.ATTR_MIN_CELL_VOLT, 0)
-                .attr("bmsMaster.maxCellVol", const.ATTR_MAX_CELL_VOLT, 0),
-            MilliVoltSensorEntity(client, self, "bmsMaster.minCellVol", const.MIN_CELL_VOLT, False),
-            MilliVoltSensorEntity(client, self, "bmsMaster.maxCellVol", const.MAX_CELL_VOLT, False),
-
-            # Optional Slave Battery
-            #LevelSensorEntity(client, self, "bms_slave.soc", const.SLAVE_BATTERY_LEVEL, False, True),
-            #TempSensorEntity(client, self, "bms_slave.temp", const.SLAVE_BATTERY_TEMP, False, True),
-            #TempSensorEntity(client, self, "bms_slave.minCellTemp", const.SLAVE_MIN_CELL_TEMP, False),
-            #TempSensorEntity(client, self, "bms_slave.maxCellTemp", const.SLAVE_MAX_CELL_TEMP, False),
-
-            #VoltSensorEntity(client, self, "bms_slave.vol", const.SLAVE_BATTERY_VOLT, False),
-            #VoltSensorEntity(client, self, "bms_slave.minCellVol", const.SLAVE_MIN_CELL_VOLT, False),
-            #VoltSensorEntity(client, self, "bms_slave.maxCellVol", const.SLAVE_MAX_CELL_VOLT, False),
-
-            #CyclesSensorEntity(client, self, "bms_slave.cycles", const.SLAVE_CYCLES, False, True),
-            #InWattsSensorEntity(client, self, "bms_slave.inputWatts", const.SLAVE_IN_POWER, False, True),
-            #OutWattsSensorEntity(client, self, "bms_slave.outputWatts", const.SLAVE_OUT_POWER, False, True)
-            QuotaStatusSensorEntity(client, self)
-        ]
+        return create_entities(client, self, DELTA_MAX_SENSORS) + [QuotaStatusSensorEntity(client, self)]
 
     def numbers(self, client: EcoflowApiClient) -> list[BaseNumberEntity]:
         return [
@@ -1,6 +1,6 @@
 from custom_components.ecoflow_cloud_alt.api import EcoflowApiClient
 from custom_components.ecoflow_cloud_alt.devices import const, BaseDevice
-from custom_components.ecoflow_cloud_alt.entities import BaseSensorEntity, BaseNumberEntity, BaseSwitchEntity, BaseSelectEntity
+from custom_components.ecoflow_cloud_alt.entities import BaseSensorEntity, BaseNumberEntity, BaseSwitchEntity, BaseSelectEntity, EcoFlowEntityDescription, create_entities
 from custom_components.ecoflow_cloud_alt.number import ChargingPowerEntity, MaxBatteryLevelEntity, MinBatteryLevelEntity
 from custom_components.ecoflow_cloud_alt.select import DictSelectEntity, TimeoutDictSelectEntity
 from custom_components.ecoflow_cloud_alt.sensor import LevelSensorEntity, WattsSensorEntity, RemainSensorEntity, \
@@ -11,67 +11,68 @@ from custom_components.ecoflow_cloud_alt.sensor import LevelSensorEntity, WattsS
 from custom_components.ecoflow_cloud_alt.switch import BeeperEntity, EnabledEntity
 
 
-class DeltaMini(BaseDevice):
-    def sensors(self, client: EcoflowApiClient) -> list[BaseSensorEntity]:
-        return [
-            LevelSensorEntity(client, self, "bmsMaster.soc", const.MAIN_BATTERY_LEVEL)
-            .attr("bmsMaster.designCap", const.ATTR_DESIGN_CAPACITY, 0)
-            .attr("bmsMaster.fullCap", const.ATTR_FULL_CAPACITY, 0)
-            .attr("bmsMaster.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
-            CapacitySensorEntity(client, self, "bmsMaster.designCap", const.MAIN_DESIGN_CAPACITY, False),
-            CapacitySensorEntity(client, self, "bmsMaster.fullCap", const.MAIN_FULL_CAPACITY, False),
-            CapacitySensorEntity(client, self, "bmsMaster.remainCap", const.MAIN_REMAIN_CAPACITY, False),
+DELTA_MINI_SENSORS = (
+    EcoFlowEntityDescription(LevelSensorEntity, "bmsMaster.soc", const.MAIN_BATTERY_LEVEL)
+    .attr("bmsMaster.designCap", const.ATTR_DESIGN_CAPACITY, 0)
+    .attr("bmsMaster.fullCap", const.ATTR_FULL_CAPACITY, 0)
+    .attr("bmsMaster.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bmsMaster.designCap", const.MAIN_DESIGN_CAPACITY, False),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bmsMaster.fullCap", const.MAIN_FULL_CAPACITY, False),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bmsMaster.remainCap", const.MAIN_REMAIN_CAPACITY, False),
 
-            LevelSensorEntity(client, self, "bmsMaster.soh", const.SOH),
+    EcoFlowEntityDescription(LevelSensorEntity, "bmsMaster.soh", const.SOH),
 
-            LevelSensorEntity(client, self, "ems.lcdShowSoc", const.COMBINED_BATTERY_LEVEL),
+    EcoFlowEntityDescription(LevelSensorEntity, "ems.lcdShowSoc", const.COMBINED_BATTERY_LEVEL),
 
-            WattsSensorEntity(client, self, "pd.wattsInSum", const.TOTAL_IN_POWER),
-            WattsSensorEntity(client, self, "pd.wattsOutSum", const.TOTAL_OUT_POWER),
+    EcoFlowEntityDescription(WattsSensorEntity, "pd.wattsInSum", const.TOTAL_IN_POWER),
+    EcoFlowEntityDescription(WattsSensorEntity, "pd.wattsOutSum", const.TOTAL_OUT_POWER),
 
-            InWattsSensorEntity(client, self, "inv.inputWatts", const.AC_IN_POWER),
-            OutWattsSensorEntity(client, self, "inv.outputWatts", const.AC_OUT_POWER),
+    EcoFlowEntityDescription(InWattsSensorEntity, "inv.inputWatts", const.AC_IN_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "inv.outputWatts", const.AC_OUT_POWER),
 
-            InMilliVoltSensorEntity(client, self, "inv.acInVol", const.AC_IN_VOLT),
-            OutMilliVoltSensorEntity(client, self, "inv.invOutVol", const.AC_OUT_VOLT),
+    EcoFlowEntityDescription(InMilliVoltSensorEntity, "inv.acInVol", const.AC_IN_VOLT),
+    EcoFlowEntityDescription(OutMilliVoltSensorEntity, "inv.invOutVol", const.AC_OUT_VOLT),
 
-            InWattsSolarSensorEntity(client, self, "mppt.inWatts", const.SOLAR_IN_POWER),
+    EcoFlowEntityDescription(InWattsSolarSensorEntity, "mppt.inWatts", const.SOLAR_IN_POWER),
 
-            OutWattsDcSensorEntity(client, self, "mppt.outWatts", const.DC_OUT_POWER),
+    EcoFlowEntityDescription(OutWattsDcSensorEntity, "mppt.outWatts", const.DC_OUT_POWER),
 
-            OutWattsDcSensorEntity(client, self, "mppt.carOutWatts", const.DC_CAR_OUT_POWER),
-            OutWattsSensorEntity(client, self, "mppt.dcdc12vWatts", const.DC_ANDERSON_OUT_POWER),
+    EcoFlowEntityDescription(OutWattsDcSensorEntity, "mppt.carOutWatts", const.DC_CAR_OUT_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "mppt.dcdc12vWatts", const.DC_ANDERSON_OUT_POWER),
 
-            OutWattsSensorEntity(client, self, "pd.typec1Watts", const.TYPEC_1_OUT_POWER),
-            OutWattsSensorEntity(client, self, "pd.typec2Watts", const.TYPEC_2_OUT_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.typec1Watts", const.TYPEC_1_OUT_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.typec2Watts", const.TYPEC_2_OUT_POWER),
 
-            OutWattsSensorEntity(client, self, "pd.usb1Watts", const.USB_1_OUT_POWER),
-            OutWattsSensorEntity(client, self, "pd.usb2Watts", const.USB_2_OUT_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.usb1Watts", const.USB_1_OUT_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.usb2Watts", const.USB_2_OUT_POWER),
 
-            OutWattsSensorEntity(client, self, "pd.qcUsb1Watts", const.USB_QC_1_OUT_POWER),
-            OutWattsSensorEntity(client, self, "pd.qcUsb2Watts", const.USB_QC_2_OUT_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.qcUsb1Watts", const.USB_QC_1_OUT_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.qcUsb2Watts", const.USB_QC_2_OUT_POWER),
 
-            RemainSensorEntity(client, self, "ems.chgRemainTime", const.CHARGE_REMAINING_TIME),
-            RemainSensorEntity(client, self, "ems.dsgRemainTime", const.DISCHARGE_REMAINING_TIME),
-            CyclesSensorEntity(client, self, "bmsMaster.cycles", const.CYCLES),
+    EcoFlowEntityDescription(RemainSensorEntity, "ems.chgRemainTime", const.CHARGE_REMAINING_TIME),
+    EcoFlowEntityDescription(RemainSensorEntity, "ems.dsgRemainTime", const.DISCHARGE_REMAINING_TIME),
+    EcoFlowEntityDescription(CyclesSensorEntity, "bmsMaster.cycles", const.CYCLES),
 
-            TempSensorEntity(client, self, "bmsMaster.temp", const.BATTERY_TEMP, False)
-            .attr("bmsMaster.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
-            .attr("bmsMaster.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
+    EcoFlowEntityDescription(TempSensorEntity, "bmsMaster.temp", const.BATTERY_TEMP, False)
+    .attr("bmsMaster.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
+    .attr("bmsMaster.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
 
-            MilliVoltSensorEntity(client, self, "bmsMaster.vol", const.BATTERY_VOLT, False)
-            .attr("bmsMaster.minCellVol", const.ATTR_MIN_CELL_VOLT, 0)
-            .attr("bmsMaster.maxCellVol", const.ATTR_MAX_CELL_VOLT, 0),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bmsMaster.vol", const.BATTERY_VOLT, False)
+    .attr("bmsMaster.minCellVol", const.ATTR_MIN_CELL_VOLT, 0)
+    .attr("bmsMaster.maxCellVol", const.ATTR_MAX_CELL_VOLT, 0),
 
-            # https://github.com/tolwi/hassio-ecoflow-cloud/discussions/87
-            InEnergySensorEntity(client, self, "pd.chgSunPower", const.SOLAR_IN_ENERGY),
-            InEnergySensorEntity(client, self, "pd.chgPowerAc", const.CHARGE_AC_ENERGY),
-            InEnergySensorEntity(client, self, "pd.chgPowerDc", const.CHARGE_DC_ENERGY),
-            OutEnergySensorEntity(client, self, "pd.dsgPowerAc", const.DISCHARGE_AC_ENERGY),
-            OutEnergySensorEntity(client, self, "pd.dsgPowerDc", const.DISCHARGE_DC_ENERGY),
+    # https://github.com/tolwi/hassio-ecoflow-cloud/discussions/87
+    EcoFlowEntityDescription(InEnergySensorEntity, "pd.chgSunPower", const.SOLAR_IN_ENERGY),
+    EcoFlowEntityDescription(InEnergySensorEntity, "pd.chgPowerAc", const.CHARGE_AC_ENERGY),
+    EcoFlowEntityDescription(InEnergySensorEntity, "pd.chgPowerDc", const.CHARGE_DC_ENERGY),
+    EcoFlowEntityDescription(OutEnergySensorEntity, "pd.dsgPowerAc", const.DISCHARGE_AC_ENERGY),
+    EcoFlowEntityDescription(OutEnergySensorEntity, "pd.dsgPowerDc", const.DISCHARGE_DC_ENERGY),
+)
 
-            QuotaStatusSensorEntity(client, self)
-        ]
+
+class DeltaMini(BaseDevice):
+    def sensors(self, client: EcoflowApiClient) -> list[BaseSensorEntity]:
+        return create_entities(client, self, DELTA_MINI_SENSORS) + [QuotaStatusSensorEntity(client, self)]
 
     def numbers(self, client: EcoflowApiClient) -> list[BaseNumberEntity]:
         return [
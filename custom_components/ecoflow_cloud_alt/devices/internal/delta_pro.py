@@ -1,7 +1,7 @@
 from custom_components.ecoflow_cloud_alt.api import EcoflowApiClient
 from custom_components.ecoflow_cloud_alt.devices import const, BaseDevice
 from custom_components.ecoflow_cloud_alt.entities import BaseSensorEntity, BaseNumberEntity, BaseSwitchEntity, \
-    BaseSelectEntity
+    BaseSelectEntity, EcoFlowEntityDescription, create_entities
 from custom_components.ecoflow_cloud_alt.number import ChargingPowerEntity, MaxBatteryLevelEntity, MinBatteryLevelEntity, \
     MinGenStartLevelEntity, \
     MaxGenStopLevelEntity
@@ -15,125 +15,127 @@ from custom_components.ecoflow_cloud_alt.sensor import LevelSensorEntity, WattsS
 from custom_components.ecoflow_cloud_alt.switch import BeeperEntity, EnabledEntity
 
 
+DELTA_PRO_SENSORS = (
+    EcoFlowEntityDescription(LevelSensorEntity, "bmsMaster.soc", const.MAIN_BATTERY_LEVEL)
+    .attr("bmsMaster.designCap", const.ATTR_DESIGN_CAPACITY, 0)
+    .attr("bmsMaster.fullCap", const.ATTR_FULL_CAPACITY, 0)
+    .attr("bmsMaster.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
+    EcoFlowEntityDescription(LevelSensorEntity, "bmsMaster.f32ShowSoc", const.MAIN_BATTERY_LEVEL_F32, False)
+    .attr("bmsMaster.designCap", const.ATTR_DESIGN_CAPACITY, 0)
+    .attr("bmsMaster.fullCap", const.ATTR_FULL_CAPACITY, 0)
+    .attr("bmsMaster.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bmsMaster.designCap", const.MAIN_DESIGN_CAPACITY, False),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bmsMaster.fullCap", const.MAIN_FULL_CAPACITY, False),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bmsMaster.remainCap", const.MAIN_REMAIN_CAPACITY, False),
+    EcoFlowEntityDescription(LevelSensorEntity, "bmsMaster.soh", const.SOH),
+
+    EcoFlowEntityDescription(LevelSensorEntity, "ems.lcdShowSoc", const.COMBINED_BATTERY_LEVEL),
+    EcoFlowEntityDescription(LevelSensorEntity, "ems.f32LcdShowSoc", const.COMBINED_BATTERY_LEVEL_F32, False),
+    EcoFlowEntityDescription(WattsSensorEntity, "pd.wattsInSum", const.TOTAL_IN_POWER),
+    EcoFlowEntityDescription(WattsSensorEntity, "pd.wattsOutSum", const.TOTAL_OUT_POWER),
+    EcoFlowEntityDescription(AmpSensorEntity, "bmsMaster.amp", const.MAIN_BATTERY_CURRENT),
+
+    EcoFlowEntityDescription(InWattsSensorEntity, "inv.inputWatts", const.AC_IN_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "inv.outputWatts", const.AC_OUT_POWER),
+
+    EcoFlowEntityDescription(InMilliVoltSensorEntity, "inv.acInVol", const.AC_IN_VOLT),
+    EcoFlowEntityDescription(OutMilliVoltSensorEntity, "inv.invOutVol", const.AC_OUT_VOLT),
+
+    EcoFlowEntityDescription(InWattsSolarSensorEntity, "mppt.inWatts", const.SOLAR_IN_POWER),
+    EcoFlowEntityDescription(InVoltSolarSensorEntity, "mppt.inVol", const.SOLAR_IN_VOLTAGE),
+    EcoFlowEntityDescription(InAmpSolarSensorEntity, "mppt.inAmp", const.SOLAR_IN_CURRENT),
+
+    EcoFlowEntityDescription(OutWattsDcSensorEntity, "mppt.outWatts", const.DC_OUT_POWER),
+    EcoFlowEntityDescription(OutVoltDcSensorEntity, "mppt.outVol", const.DC_OUT_VOLTAGE),
+
+    EcoFlowEntityDescription(OutWattsSensorEntity, "mppt.carOutWatts", const.DC_CAR_OUT_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "mppt.dcdc12vWatts", const.DC_ANDERSON_OUT_POWER),
+
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.typec1Watts", const.TYPEC_1_OUT_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.typec2Watts", const.TYPEC_2_OUT_POWER),
+
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.usb1Watts", const.USB_1_OUT_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.usb2Watts", const.USB_2_OUT_POWER),
+
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.qcUsb1Watts", const.USB_QC_1_OUT_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.qcUsb2Watts", const.USB_QC_2_OUT_POWER),
+
+    EcoFlowEntityDescription(RemainSensorEntity, "ems.chgRemainTime", const.CHARGE_REMAINING_TIME),
+    EcoFlowEntityDescription(RemainSensorEntity, "ems.dsgRemainTime", const.DISCHARGE_REMAINING_TIME),
+    EcoFlowEntityDescription(CyclesSensorEntity, "bmsMaster.cycles", const.CYCLES),
+
+    EcoFlowEntityDescription(TempSensorEntity, "bmsMaster.temp", const.BATTERY_TEMP)
+    .attr("bmsMaster.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
+    .attr("bmsMaster.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
+    EcoFlowEntityDescription(TempSensorEntity, "bmsMaster.minCellTemp", const.MIN_CELL_TEMP, False),
+    EcoFlowEntityDescription(TempSensorEntity, "bmsMaster.maxCellTemp", const.MAX_CELL_TEMP, False),
+
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bmsMaster.vol", const.BATTERY_VOLT, False)
+    .attr("bmsMaster.minCellVol", const.ATTR_MIN_CELL_VOLT, 0)
+    .attr("bmsMaster.maxCellVol", const.ATTR_MAX_CELL_VOLT, 0),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bmsMaster.minCellVol", const.MIN_CELL_VOLT, False),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bmsMaster.maxCellVol", const.MAX_CELL_VOLT, False),
+
+    # https://github.com/tolwi/hassio-ecoflow-cloud/discussions/87
+    EcoFlowEntityDescription(InEnergySensorEntity, "pd.chgSunPower", const.SOLAR_IN_ENERGY),
+    EcoFlowEntityDescription(InEnergySensorEntity, "pd.chgPowerAc", const.CHARGE_AC_ENERGY),
+    EcoFlowEntityDescription(InEnergySensorEntity, "pd.chgPowerDc", const.CHARGE_DC_ENERGY),
+    EcoFlowEntityDescription(OutEnergySensorEntity, "pd.dsgPowerAc", const.DISCHARGE_AC_ENERGY),
+    EcoFlowEntityDescription(OutEnergySensorEntity, "pd.dsgPowerDc", const.DISCHARGE_DC_ENERGY),
+
+    # Optional Slave Batteries
+    EcoFlowEntityDescription(LevelSensorEntity, "bmsSlave1.soc", const.SLAVE_N_BATTERY_LEVEL % 1, False, True)
+    .attr("bmsSlave1.designCap", const.ATTR_DESIGN_CAPACITY, 0)
+    .attr("bmsSlave1.fullCap", const.ATTR_FULL_CAPACITY, 0)
+    .attr("bmsSlave1.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
+    EcoFlowEntityDescription(LevelSensorEntity, "bmsSlave1.f32ShowSoc", const.SLAVE_N_BATTERY_LEVEL_F32 % 1, False, False)
+    .attr("bmsSlave1.designCap", const.ATTR_DESIGN_CAPACITY, 0)
+    .attr("bmsSlave1.fullCap", const.ATTR_FULL_CAPACITY, 0)
+    .attr("bmsSlave1.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bmsSlave1.designCap", const.SLAVE_N_DESIGN_CAPACITY % 1, False),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bmsSlave1.fullCap", const.SLAVE_N_FULL_CAPACITY % 1, False),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bmsSlave1.remainCap", const.SLAVE_N_REMAIN_CAPACITY % 1, False),
+    EcoFlowEntityDescription(LevelSensorEntity, "bmsSlave1.soh", const.SLAVE_N_SOH % 1),
+
+    EcoFlowEntityDescription(TempSensorEntity, "bmsSlave1.temp", const.SLAVE_N_BATTERY_TEMP % 1, False, True)
+    .attr("bmsSlave1.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
+    .attr("bmsSlave1.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
+    EcoFlowEntityDescription(WattsSensorEntity, "bmsSlave1.inputWatts", const.SLAVE_N_IN_POWER % 1, False, True),
+    EcoFlowEntityDescription(WattsSensorEntity, "bmsSlave1.outputWatts", const.SLAVE_N_OUT_POWER % 1, False, True),
+
+    EcoFlowEntityDescription(LevelSensorEntity, "bmsSlave2.soc", const.SLAVE_N_BATTERY_LEVEL % 2, False, True)
+    .attr("bmsSlave2.designCap", const.ATTR_DESIGN_CAPACITY, 0)
+    .attr("bmsSlave2.fullCap", const.ATTR_FULL_CAPACITY, 0)
+    .attr("bmsSlave2.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
+    EcoFlowEntityDescription(LevelSensorEntity, "bmsSlave2.f32ShowSoc", const.SLAVE_N_BATTERY_LEVEL_F32 % 2, False, False)
+    .attr("bmsSlave2.designCap", const.ATTR_DESIGN_CAPACITY, 0)
+    .attr("bmsSlave2.fullCap", const.ATTR_FULL_CAPACITY, 0)
+    .attr("bmsSlave2.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bmsSlave2.designCap", const.SLAVE_N_DESIGN_CAPACITY % 2, False),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bmsSlave2.fullCap", const.SLAVE_N_FULL_CAPACITY % 2, False),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bmsSlave2.remainCap", const.SLAVE_N_REMAIN_CAPACITY % 2, False),
+    EcoFlowEntityDescription(LevelSensorEntity, "bmsSlave2.soh", const.SLAVE_N_SOH % 2),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bmsSlave1.vol", const.SLAVE_N_BATTERY_VOLT % 1, False),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bmsSlave1.minCellVol", const.SLAVE_N_MIN_CELL_VOLT % 1, False),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bmsSlave1.maxCellVol", const.SLAVE_N_MAX_CELL_VOLT % 1, False),
+    EcoFlowEntityDescription(AmpSensorEntity, "bmsSlave1.amp", const.SLAVE_N_BATTERY_CURRENT % 1, False),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bmsSlave2.vol", const.SLAVE_N_BATTERY_VOLT % 2, False),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bmsSlave2.minCellVol", const.SLAVE_N_MIN_CELL_VOLT % 2, False),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bmsSlave2.maxCellVol", const.SLAVE_N_MAX_CELL_VOLT % 2, False),
+    EcoFlowEntityDescription(AmpSensorEntity, "bmsSlave2.amp", const.SLAVE_N_BATTERY_CURRENT % 2, False),
+    EcoFlowEntityDescription(TempSensorEntity, "bmsSlave2.temp", const.SLAVE_N_BATTERY_TEMP % 2, False, True)
+    .attr("bmsSlave2.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
+    .attr("bmsSlave2.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
+    EcoFlowEntityDescription(WattsSensorEntity, "bmsSlave2.inputWatts", const.SLAVE_N_IN_POWER % 2, False, True),
+    EcoFlowEntityDescription(WattsSensorEntity, "bmsSlave2.outputWatts", const.SLAVE_N_OUT_POWER % 2, False, True),
+    EcoFlowEntityDescription(CyclesSensorEntity, "bmsSlave1.cycles", const.SLAVE_N_CYCLES % 1, False),
+    EcoFlowEntityDescription(CyclesSensorEntity, "bmsSlave2.cycles", const.SLAVE_N_CYCLES % 2, False),
+)
+
+
 class DeltaPro(BaseDevice):
     def sensors(self, client: EcoflowApiClient) -> list[BaseSensorEntity]:
-        return [
-            LevelSensorEntity(client, self, "bmsMaster.soc", const.MAIN_BATTERY_LEVEL)
-            .attr("bmsMaster.designCap", const.ATTR_DESIGN_CAPACITY, 0)
-            .attr("bmsMaster.fullCap", const.ATTR_FULL_CAPACITY, 0)
-            .attr("bmsMaster.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
-            LevelSensorEntity(client, self, "bmsMaster.f32ShowSoc", const.MAIN_BATTERY_LEVEL_F32, False)
-            .attr("bmsMaster.designCap", const.ATTR_DESIGN_CAPACITY, 0)
-            .attr("bmsMaster.fullCap", const.ATTR_FULL_CAPACITY, 0)
-            .attr("bmsMaster.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
-            CapacitySensorEntity(client, self, "bmsMaster.designCap", const.MAIN_DESIGN_CAPACITY, False),
-            CapacitySensorEntity(client, self, "bmsMaster.fullCap", const.MAIN_FULL_CAPACITY, False),
-            CapacitySensorEntity(client, self, "bmsMaster.remainCap", const.MAIN_REMAIN_CAPACITY, False),
-            LevelSensorEntity(client, self, "bmsMaster.soh", const.SOH),
-
-            LevelSensorEntity(client, self, "ems.lcdShowSoc", const.COMBINED_BATTERY_LEVEL),
-            LevelSensorEntity(client, self, "ems.f32LcdShowSoc", const.COMBINED_BATTERY_LEVEL_F32, False),
-            WattsSensorEntity(client, self, "pd.wattsInSum", const.TOTAL_IN_POWER),
-            WattsSensorEntity(client, self, "pd.wattsOutSum", const.TOTAL_OUT_POWER),
-            AmpSensorEntity(client, self, "bmsMaster.amp", const.MAIN_BATTERY_CURRENT),
-
-            InWattsSensorEntity(client, self, "inv.inputWatts", const.AC_IN_POWER),
-            OutWattsSensorEntity(client, self, "inv.outputWatts", const.AC_OUT_POWER),
-
-            InMilliVoltSensorEntity(client, self, "inv.acInVol", const.AC_IN_VOLT),
-            OutMilliVoltSensorEntity(client, self, "inv.invOutVol", const.AC_OUT_VOLT),
-
-            InWattsSolarSensorEntity(client, self, "mppt.inWatts", const.SOLAR_IN_POWER),
-            InVoltSolarSensorEntity(client, self, "mppt.inVol", const.SOLAR_IN_VOLTAGE),
-            InAmpSolarSensorEntity(client, self, "mppt.inAmp", const.SOLAR_IN_CURRENT),
-
-            OutWattsDcSensorEntity(client, self, "mppt.outWatts", const.DC_OUT_POWER),
-            OutVoltDcSensorEntity(client, self, "mppt.outVol", const.DC_OUT_VOLTAGE),
-
-            OutWattsSensorEntity(client, self, "mppt.carOutWatts", const.DC_CAR_OUT_POWER),
-            OutWattsSensorEntity(client, self, "mppt.dcdc12vWatts", const.DC_ANDERSON_OUT_POWER),
-
-            OutWattsSensorEntity(client, self, "pd.typec1Watts", const.TYPEC_1_OUT_POWER),
-            OutWattsSensorEntity(client, self, "pd.typec2Watts", const.TYPEC_2_OUT_POWER),
-
-            OutWattsSensorEntity(client, self, "pd.usb1Watts", const.USB_1_OUT_POWER),
-            OutWattsSensorEntity(client, self, "pd.usb2Watts", const.USB_2_OUT_POWER),
-
-            OutWattsSensorEntity(client, self, "pd.qcUsb1Watts", const.USB_QC_1_OUT_POWER),
-            OutWattsSensorEntity(client, self, "pd.qcUsb2Watts", const.USB_QC_2_OUT_POWER),
-
-            RemainSensorEntity(client, self, "ems.chgRemainTime", const.CHARGE_REMAINING_TIME),
-            RemainSensorEntity(client, self, "ems.dsgRemainTime", const.DISCHARGE_REMAINING_TIME),
-            CyclesSensorEntity(client, self, "bmsMaster.cycles", const.CYCLES),
-
-            TempSensorEntity(client, self, "bmsMaster.temp", const.BATTERY_TEMP)
-            .attr("bmsMaster.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
-            .attr("bmsMaster.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
-            TempSensorEntity(client, self, "bmsMaster.minCellTemp", const.MIN_CELL_TEMP, False),
-            TempSensorEntity(client, self, "bmsMaster.maxCellTemp", const.MAX_CELL_TEMP, False),
-
-            MilliVoltSensorEntity(client, self, "bmsMaster.vol", const.BATTERY_VOLT, False)
-            .attr("bmsMaster.minCellVol", const.ATTR_MIN_CELL_VOLT, 0)
-            .attr("bmsMaster.maxCellVol", const.ATTR_MAX_CELL_VOLT, 0),
-            MilliVoltSensorEntity(client, self, "bmsMaster.minCellVol", const.MIN_CELL_VOLT, False),
-            MilliVoltSensorEntity(client, self, "bmsMaster.maxCellVol", const.MAX_CELL_VOLT, False),
-
-            # https://github.com/tolwi/hassio-ecoflow-cloud/discussions/87
-            InEnergySensorEntity(client, self, "pd.chgSunPower", const.SOLAR_IN_ENERGY),
-            InEnergySensorEntity(client, self, "pd.chgPowerAc", const.CHARGE_AC_ENERGY),
-            InEnergySensorEntity(client, self, "pd.chgPowerDc", const.CHARGE_DC_ENERGY),
-            OutEnergySensorEntity(client, self, "pd.dsgPowerAc", const.DISCHARGE_AC_ENERGY),
-            OutEnergySensorEntity(client, self, "pd.dsgPowerDc", const.DISCHARGE_DC_ENERGY),
-
-            # Optional Slave Batteries
-            LevelSensorEntity(client, self, "bmsSlave1.soc", const.SLAVE_N_BATTERY_LEVEL % 1, False, True)
-            .attr("bmsSlave1.designCap", const.ATTR_DESIGN_CAPACITY, 0)
-            .attr("bmsSlave1.fullCap", const.ATTR_FULL_CAPACITY, 0)
-            .attr("bmsSlave1.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
-            LevelSensorEntity(client, self, "bmsSlave1.f32ShowSoc", const.SLAVE_N_BATTERY_LEVEL_F32 % 1, False, False)
-            .attr("bmsSlave1.designCap", const.ATTR_DESIGN_CAPACITY, 0)
-            .attr("bmsSlave1.fullCap", const.ATTR_FULL_CAPACITY, 0)
-            .attr("bmsSlave1.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
-            CapacitySensorEntity(client, self, "bmsSlave1.designCap", const.SLAVE_N_DESIGN_CAPACITY % 1, False),
-            CapacitySensorEntity(client, self, "bmsSlave1.fullCap", const.SLAVE_N_FULL_CAPACITY % 1, False),
-            CapacitySensorEntity(client, self, "bmsSlave1.remainCap", const.SLAVE_N_REMAIN_CAPACITY % 1, False),
-            LevelSensorEntity(client, self, "bmsSlave1.soh", const.SLAVE_N_SOH % 1),
-
-            TempSensorEntity(client, self, "bmsSlave1.temp", const.SLAVE_N_BATTERY_TEMP % 1, False, True)
-            .attr("bmsSlave1.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
-            .attr("bmsSlave1.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
-            WattsSensorEntity(client, self, "bmsSlave1.inputWatts", const.SLAVE_N_IN_POWER % 1, False, True),
-            WattsSensorEntity(client, self, "bmsSlave1.outputWatts", const.SLAVE_N_OUT_POWER % 1, False, True),
-
-            LevelSensorEntity(client, self, "bmsSlave2.soc", const.SLAVE_N_BATTERY_LEVEL % 2, False, True)
-            .attr("bmsSlave2.designCap", const.ATTR_DESIGN_CAPACITY, 0)
-            .attr("bmsSlave2.fullCap", const.ATTR_FULL_CAPACITY, 0)
-            .attr("bmsSlave2.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
-            LevelSensorEntity(client, self, "bmsSlave2.f32ShowSoc", const.SLAVE_N_BATTERY_LEVEL_F32 % 2, False, False)
-            .attr("bmsSlave2.designCap", const.ATTR_DESIGN_CAPACITY, 0)
-            .attr("bmsSlave2.fullCap", const.ATTR_FULL_CAPACITY, 0)
-            .attr("bmsSlave2.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
-            CapacitySensorEntity(client, self, "bmsSlave2.designCap", const.SLAVE_N_DESIGN_CAPACITY % 2, False),
-            CapacitySensorEntity(client, self, "bmsSlave2.fullCap", const.SLAVE_N_FULL_CAPACITY % 2, False),
-            CapacitySensorEntity(client, self, "bmsSlave2.remainCap", const.SLAVE_N_REMAIN_CAPACITY % 2, False),
-            LevelSensorEntity(client, self, "bmsSlave2.soh", const.SLAVE_N_SOH % 2),
-            MilliVoltSensorEntity(client, self, "bmsSlave1.vol", const.SLAVE_N_BATTERY_VOLT % 1, False),
-            MilliVoltSensorEntity(client, self, "bmsSlave1.minCellVol", const.SLAVE_N_MIN_CELL_VOLT % 1, False),
-            MilliVoltSensorEntity(client, self, "bmsSlave1.maxCellVol", const.SLAVE_N_MAX_CELL_VOLT % 1, False),
-            AmpSensorEntity(client, self, "bmsSlave1.amp", const.SLAVE_N_BATTERY_CURRENT % 1, False),
-            MilliVoltSensorEntity(client, self, "bmsSlave2.vol", const.SLAVE_N_BATTERY_VOLT % 2, False),
-            MilliVoltSensorEntity(client, self, "bmsSlave2.minCellVol", const.SLAVE_N_MIN_CELL_VOLT % 2, False),
-            MilliVoltSensorEntity(client, self, "bmsSlave2.maxCellVol", const.SLAVE_N_MAX_CELL_VOLT % 2, False),
-            AmpSensorEntity(client, self, "bmsSlave2.amp", const.SLAVE_N_BATTERY_CURRENT % 2, False),
-            TempSensorEntity(client, self, "bmsSlave2.temp", const.SLAVE_N_BATTERY_TEMP % 2, False, True)
-            .attr("bmsSlave2.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
-            .attr("bmsSlave2.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
-            WattsSensorEntity(client, self, "bmsSlave2.inputWatts", const.SLAVE_N_IN_POWER % 2, False, True),
-            WattsSensorEntity(client, self, "bmsSlave2.outputWatts", const.SLAVE_N_OUT_POWER % 2, False, True),
-            CyclesSensorEntity(client, self, "bmsSlave1.cycles", const.SLAVE_N_CYCLES % 1, False),
-            CyclesSensorEntity(client, self, "bmsSlave2.cycles", const.SLAVE_N_CYCLES % 2, False),
-            QuotaStatusSensorEntity(client, self)
-        ]
+        return create_entities(client, self, DELTA_PRO_SENSORS) + [QuotaStatusSensorEntity(client, self)]
 
     def numbers(self, client: EcoflowApiClient) -> list[BaseNumberEntity]:
         return [
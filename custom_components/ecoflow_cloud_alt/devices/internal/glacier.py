@@ -2,7 +2,7 @@ from custom_components.ecoflow_cloud_alt.api import EcoflowApiClient
 from custom_components.ecoflow_cloud_alt.button import EnabledButtonEntity
 from custom_components.ecoflow_cloud_alt.devices import const, BaseDevice
 from custom_components.ecoflow_cloud_alt.entities import BaseSensorEntity, BaseNumberEntity, BaseSwitchEntity, \
-    BaseSelectEntity, BaseButtonEntity
+    BaseSelectEntity, BaseButtonEntity, EcoFlowEntityDescription, create_entities, reads_params
 from custom_components.ecoflow_cloud_alt.number import SetTempEntity
 from custom_components.ecoflow_cloud_alt.sensor import LevelSensorEntity, RemainSensorEntity, SecondsRemainSensorEntity, \
     TempSensorEntity, \
@@ -13,95 +13,98 @@ from custom_components.ecoflow_cloud_alt.sensor import LevelSensorEntity, Remain
 from custom_components.ecoflow_cloud_alt.switch import EnabledEntity, InvertedBeeperEntity
 
 
-class Glacier(BaseDevice):
+GLACIER_SENSORS = (
+    # Power and Battery Entities
+    EcoFlowEntityDescription(LevelSensorEntity, "bms_bmsStatus.soc", const.MAIN_BATTERY_LEVEL)
+        .attr("bms_bmsStatus.designCap", const.ATTR_DESIGN_CAPACITY, 0)
+        .attr("bms_bmsStatus.fullCap", const.ATTR_FULL_CAPACITY, 0)
+        .attr("bms_bmsStatus.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bms_bmsStatus.designCap", const.MAIN_DESIGN_CAPACITY, False),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bms_bmsStatus.fullCap", const.MAIN_FULL_CAPACITY, False),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bms_bmsStatus.remainCap", const.MAIN_REMAIN_CAPACITY, False),
 
-    @staticmethod
-    def default_charging_power_step() -> int:
-        return 50
+    EcoFlowEntityDescription(LevelSensorEntity, "bms_emsStatus.f32LcdSoc", const.COMBINED_BATTERY_LEVEL),
 
-    def sensors(self, client: EcoflowApiClient) -> list[BaseSensorEntity]:
-        return [
-            # Power and Battery Entities
-            LevelSensorEntity(client, self, "bms_bmsStatus.soc", const.MAIN_BATTERY_LEVEL)
-                .attr("bms_bmsStatus.designCap", const.ATTR_DESIGN_CAPACITY, 0)
-                .attr("bms_bmsStatus.fullCap", const.ATTR_FULL_CAPACITY, 0)
-                .attr("bms_bmsStatus.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
-            CapacitySensorEntity(client, self, "bms_bmsStatus.designCap", const.MAIN_DESIGN_CAPACITY, False),
-            CapacitySensorEntity(client, self, "bms_bmsStatus.fullCap", const.MAIN_FULL_CAPACITY, False),
-            CapacitySensorEntity(client, self, "bms_bmsStatus.remainCap", const.MAIN_REMAIN_CAPACITY, False),
+    EcoFlowEntityDescription(ChargingStateSensorEntity, "bms_emsStatus.chgState", const.BATTERY_CHARGING_STATE),
 
-            LevelSensorEntity(client, self, "bms_emsStatus.f32LcdSoc", const.COMBINED_BATTERY_LEVEL),
+    EcoFlowEntityDescription(InWattsSensorEntity, "bms_bmsStatus.inWatts", const.TOTAL_IN_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "bms_bmsStatus.outWatts", const.TOTAL_OUT_POWER),
 
-            ChargingStateSensorEntity(client, self, "bms_emsStatus.chgState", const.BATTERY_CHARGING_STATE),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.motorWat", "Motor Power"),
 
-            InWattsSensorEntity(client, self, "bms_bmsStatus.inWatts", const.TOTAL_IN_POWER),
-            OutWattsSensorEntity(client, self, "bms_bmsStatus.outWatts", const.TOTAL_OUT_POWER),
+    EcoFlowEntityDescription(RemainSensorEntity, "bms_emsStatus.chgRemain", const.CHARGE_REMAINING_TIME),
+    EcoFlowEntityDescription(RemainSensorEntity, "bms_emsStatus.dsgRemain", const.DISCHARGE_REMAINING_TIME),
 
-            OutWattsSensorEntity(client, self, "pd.motorWat", "Motor Power"),
+    EcoFlowEntityDescription(CyclesSensorEntity, "bms_bmsStatus.cycles", const.CYCLES),
 
-            RemainSensorEntity(client, self, "bms_emsStatus.chgRemain", const.CHARGE_REMAINING_TIME),
-            RemainSensorEntity(client, self, "bms_emsStatus.dsgRemain", const.DISCHARGE_REMAINING_TIME),
+    EcoFlowEntityDescription(TempSensorEntity, "bms_bmsStatus.tmp", const.BATTERY_TEMP)
+        .attr("bms_bmsStatus.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
+        .attr("bms_bmsStatus.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
+    EcoFlowEntityDescription(TempSensorEntity, "bms_bmsStatus.minCellTmp", const.MIN_CELL_TEMP, False),
+    EcoFlowEntityDescription(TempSensorEntity, "bms_bmsStatus.maxCellTmp", const.MAX_CELL_TEMP, False),
 
-            CyclesSensorEntity(client, self, "bms_bmsStatus.cycles", const.CYCLES),
+    EcoFlowEntityDescription(VoltSensorEntity, "bms_bmsStatus.vol", const.BATTERY_VOLT, False)
+        .attr("bms_bmsStatus.minCellVol", const.ATTR_MIN_CELL_VOLT, 0)
+        .attr("bms_bmsStatus.maxCellVol", const.ATTR_MAX_CELL_VOLT, 0),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bms_bmsStatus.minCellVol", const.MIN_CELL_VOLT, False),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bms_bmsStatus.maxCellVol", const.MAX_CELL_VOLT, False),
 
-            TempSensorEntity(client, self, "bms_bmsStatus.tmp", const.BATTERY_TEMP)
-                .attr("bms_bmsStatus.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
-                .attr("bms_bmsStatus.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
-            TempSensorEntity(client, self, "bms_bmsStatus.minCellTmp", const.MIN_CELL_TEMP, False),
-            TempSensorEntity(client, self, "bms_bmsStatus.maxCellTmp", const.MAX_CELL_TEMP, False),
+    EcoFlowEntityDescription(MiscBinarySensorEntity, "pd.batFlag", "Battery Present"),
 
-            VoltSensorEntity(client, self, "bms_bmsStatus.vol", const.BATTERY_VOLT, False)
-                .attr("bms_bmsStatus.minCellVol", const.ATTR_MIN_CELL_VOLT, 0)
-                .attr("bms_bmsStatus.maxCellVol", const.ATTR_MAX_CELL_VOLT, 0),
-            MilliVoltSensorEntity(client, self, "bms_bmsStatus.minCellVol", const.MIN_CELL_VOLT, False),
-            MilliVoltSensorEntity(client, self, "bms_bmsStatus.maxCellVol", const.MAX_CELL_VOLT, False),
+    EcoFlowEntityDescription(MiscSensorEntity, "pd.xt60InState", "XT60 State"),
 
-            MiscBinarySensorEntity(client,self,"pd.batFlag", "Battery Present"),
+    #Fridge Entities
+    EcoFlowEntityDescription(FanSensorEntity, "bms_emsStatus.fanLvl", "Fan Level"),
 
-            MiscSensorEntity(client, self, "pd.xt60InState", "XT60 State"),  
+    EcoFlowEntityDescription(DecicelsiusSensorEntity, "pd.ambientTmp", "Ambient Temperature"),
+    EcoFlowEntityDescription(DecicelsiusSensorEntity, "pd.exhaustTmp", "Exhaust Temperature"),
+    EcoFlowEntityDescription(DecicelsiusSensorEntity, "pd.tempWater", "Water Temperature"),
+    EcoFlowEntityDescription(DecicelsiusSensorEntity, "pd.tmpL", "Left Temperature"),
+    EcoFlowEntityDescription(DecicelsiusSensorEntity, "pd.tmpR", "Right Temperature"),
 
-            #Fridge Entities
-            FanSensorEntity(client, self, "bms_emsStatus.fanLvl", "Fan Level"),
+    EcoFlowEntityDescription(MiscBinarySensorEntity, "pd.flagTwoZone","Dual Zone Mode"),
 
-            DecicelsiusSensorEntity(client, self, "pd.ambientTmp", "Ambient Temperature"),
-            DecicelsiusSensorEntity(client, self, "pd.exhaustTmp", "Exhaust Temperature"),
-            DecicelsiusSensorEntity(client, self, "pd.tempWater", "Water Temperature"),
-            DecicelsiusSensorEntity(client, self, "pd.tmpL", "Left Temperature"),            
-            DecicelsiusSensorEntity(client, self, "pd.tmpR", "Right Temperature"),            
+    EcoFlowEntityDescription(SecondsRemainSensorEntity, "pd.iceTm", "Ice Time Remain"),
+    EcoFlowEntityDescription(LevelSensorEntity, "pd.icePercent", "Ice Percentage"),
 
-            MiscBinarySensorEntity(client, self,"pd.flagTwoZone","Dual Zone Mode"),
+    EcoFlowEntityDescription(MiscSensorEntity, "pd.iceMkMode", "Ice Make Mode"),
 
-            SecondsRemainSensorEntity(client, self, "pd.iceTm", "Ice Time Remain"),
-            LevelSensorEntity(client, self, "pd.icePercent", "Ice Percentage"),
+    EcoFlowEntityDescription(MiscBinarySensorEntity, "pd.iceAlert","Ice Alert"),
+    EcoFlowEntityDescription(MiscBinarySensorEntity, "pd.waterLine","Ice Water Level OK"),
+)
 
-            MiscSensorEntity(client, self, "pd.iceMkMode", "Ice Make Mode"), 
 
-            MiscBinarySensorEntity(client, self,"pd.iceAlert","Ice Alert"),
-            MiscBinarySensorEntity(client,self, "pd.waterLine","Ice Water Level OK"),
+class Glacier(BaseDevice):
 
-            QuotaStatusSensorEntity(client, self)
+    @staticmethod
+    def default_charging_power_step() -> int:
+        return 50
 
-        ]
+    def sensors(self, client: EcoflowApiClient) -> list[BaseSensorEntity]:
+        return create_entities(client, self, GLACIER_SENSORS) + [QuotaStatusSensorEntity(client, self)]
 
     def numbers(self, client: EcoflowApiClient) -> list[BaseNumberEntity]:
         return [
             SetTempEntity(client, self,"pd.tmpLSet", "Left Set Temperature",-25, 10,
-                                  lambda value, params: {"moduleType": 1, "operateType": "temp",
-                                                 "params": {"tmpM": int(params.get("pd.tmpMSet", 0)),
-                                                            "tmpL": int(value),
-                                                            "tmpR": int(params.get("pd.tmpRSet", 0))}}),
+                                  reads_params(["pd.tmpMSet", "pd.tmpRSet"],
+                                               lambda value, params: {"moduleType": 1, "operateType": "temp",
+                                                                      "params": {"tmpM": int(params.get("pd.tmpMSet", 0)),
+                                                                                 "tmpL": int(value),
+                                                                                 "tmpR": int(params.get("pd.tmpRSet", 0))}})),
             
             SetTempEntity(client, self, "pd.tmpMSet", "Combined Set Temperature",-25, 10,
-                                  lambda value, params: {"moduleType": 1, "operateType": "temp",
-                                                 "params": {"tmpM": int(value),
-                                                            "tmpL": int(params.get("pd.tmpLSet", 0)),
-                                                            "tmpR": int(params.get("pd.tmpRSet", 0))}}),
+                                  reads_params(["pd.tmpLSet", "pd.tmpRSet"],
+                                               lambda value, params: {"moduleType": 1, "operateType": "temp",
+                                                                      "params": {"tmpM": int(value),
+                                                                                 "tmpL": int(params.get("pd.tmpLSet", 0)),
+                                                                                 "tmpR": int(params.get("pd.tmpRSet", 0))}})),
 
             SetTempEntity(client, self,"pd.tmpRSet", "Right Set Temperature",-25, 10,
-                                  lambda value, params: {"moduleType": 1, "operateType": "temp",
-                                                 "params": {"tmpM": int(params.get("pd.tmpMSet", 0)),
-                                                            "tmpL": int(params.get("pd.tmpLSet", 0)),
-                                                            "tmpR": int(value)}}),                                                                                                                        
+                                  reads_params(["pd.tmpMSet", "pd.tmpLSet"],
+                                               lambda value, params: {"moduleType": 1, "operateType": "temp",
+                                                                      "params": {"tmpM": int(params.get("pd.tmpMSet", 0)),
+                                                                                 "tmpL": int(params.get("pd.tmpLSet", 0)),
+                                                                                 "tmpR": int(value)}})),                                                                                                                        
 
         ]
 
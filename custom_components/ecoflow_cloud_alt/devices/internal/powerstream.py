@@ -4,7 +4,8 @@ from homeassistant.util import utcnow
 
 from custom_components.ecoflow_cloud_alt.devices import BaseDevice
 from custom_components.ecoflow_cloud_alt.entities import (
-    BaseSensorEntity, BaseNumberEntity, BaseSelectEntity, BaseSwitchEntity
+    BaseSensorEntity, BaseNumberEntity, BaseSelectEntity, BaseSwitchEntity,
+    EcoFlowEntityDescription, create_entities
 )
 from custom_components.ecoflow_cloud_alt.sensor import (
     AmpSensorEntity, CentivoltSensorEntity, DeciampSensorEntity,
@@ -13,79 +14,98 @@ from custom_components.ecoflow_cloud_alt.sensor import (
     MiscSensorEntity, RemainSensorEntity, StatusSensorEntity, ReconnectStatusSensorEntity,
 )
 from ...api import EcoflowApiClient
+from ..proto.engine import EcoPacketDecoder, ProtoMessage, never_xored
+from .proto import platform_pb2, powerstream_pb2
 
 # from ..number import MinBatteryLevelEntity, MaxBatteryLevelEntity
 # from ..select import DictSelectEntity
 _LOGGER = logging.getLogger(__name__)
 
+# (cmd_func, cmd_id) -> payload message
+POWERSTREAM_MESSAGES = {
+    (20, 1): ProtoMessage(powerstream_pb2.InverterHeartbeat),
+}
+
+# (cmd_func, cmd_id) -> reports kept in the energy history store
+POWERSTREAM_RECORDS = {
+    (platform_pb2.PL_EXT_CMD_SETS, platform_pb2.PL_CMD_ID_WATTH): platform_pb2.BatchEnergyTotalReport,
+    (platform_pb2.PL_EXT_CMD_SETS, platform_pb2.PL_CMD_ID_XLOG): platform_pb2.EventRecordReport,
+}
+
+# PowerStream pdata has always been parsed without XOR decoding; whether frames with enc_type 1
+# need it is not verified against captures, so the engine default is not used here
+_DECODER = EcoPacketDecoder(POWERSTREAM_MESSAGES, encrypted=never_xored, records=POWERSTREAM_RECORDS)
+
+
+POWERSTREAM_SENSORS = (
+    EcoFlowEntityDescription(InWattsSolarSensorEntity, "pv1_input_watts", "Solar 1 Watts"),
+    EcoFlowEntityDescription(DecivoltSensorEntity, "pv1_input_volt", "Solar 1 Input Potential"),
+    EcoFlowEntityDescription(CentivoltSensorEntity, "pv1_op_volt", "Solar 1 Op Potential"),
+    EcoFlowEntityDescription(DeciampSensorEntity, "pv1_input_cur", "Solar 1 Currrent"),
+    EcoFlowEntityDescription(DecicelsiusSensorEntity, "pv1_temp", "Solar 1 Temperature"),
+    EcoFlowEntityDescription(MiscSensorEntity, "pv1_relay_status", "Solar 1 Relay Status"),
+    EcoFlowEntityDescription(MiscSensorEntity, "pv1_error_code", "Solar 1 Error Code", False),
+    EcoFlowEntityDescription(MiscSensorEntity, "pv1_warning_code", "Solar 1 Warning Code", False),
+    EcoFlowEntityDescription(MiscSensorEntity, "pv1_status", "Solar 1 Status", False),
+
+    EcoFlowEntityDescription(InWattsSolarSensorEntity, "pv2_input_watts", "Solar 2 Watts"),
+    EcoFlowEntityDescription(DecivoltSensorEntity, "pv2_input_volt", "Solar 2 Input Potential"),
+    EcoFlowEntityDescription(CentivoltSensorEntity, "pv2_op_volt", "Solar 2 Op Potential"),
+    EcoFlowEntityDescription(DeciampSensorEntity, "pv2_input_cur", "Solar 2 Current"),
+    EcoFlowEntityDescription(DecicelsiusSensorEntity, "pv2_temp", "Solar 2 Temperature"),
+    EcoFlowEntityDescription(MiscSensorEntity, "pv2_relay_status", "Solar 2 Relay Status"),
+    EcoFlowEntityDescription(MiscSensorEntity, "pv2_error_code", "Solar 2 Error Code", False),
+    EcoFlowEntityDescription(MiscSensorEntity, "pv2_warning_code", "Solar 2 Warning Code", False),
+    EcoFlowEntityDescription(MiscSensorEntity, "pv2_status", "Solar 2 Status", False),
+
+    EcoFlowEntityDescription(MiscSensorEntity, "bp_type", "Battery Type", False),
+    EcoFlowEntityDescription(LevelSensorEntity, "bat_soc", "Battery Charge"),
+    EcoFlowEntityDescription(DeciwattsSensorEntity, "bat_input_watts", "Battery Input Watts"),
+    EcoFlowEntityDescription(DecivoltSensorEntity, "bat_input_volt", "Battery Input Potential"),
+    EcoFlowEntityDescription(DecivoltSensorEntity, "bat_op_volt", "Battery Op Potential"),
+    EcoFlowEntityDescription(AmpSensorEntity, "bat_input_cur", "Battery Input Current"),
+    EcoFlowEntityDescription(DecicelsiusSensorEntity, "bat_temp", "Battery Temperature"),
+    EcoFlowEntityDescription(RemainSensorEntity, "battery_charge_remain", "Charge Time"),
+    EcoFlowEntityDescription(RemainSensorEntity, "battery_discharge_remain", "Discharge Time"),
+    EcoFlowEntityDescription(MiscSensorEntity, "bat_error_code", "Battery Error Code", False),
+    EcoFlowEntityDescription(MiscSensorEntity, "bat_warning_code", "Battery Warning Code", False),
+    EcoFlowEntityDescription(MiscSensorEntity, "bat_status", "Battery Status", False),
+
+    EcoFlowEntityDescription(DecivoltSensorEntity, "llc_input_volt", "LLC Input Potential", False),
+    EcoFlowEntityDescription(DecivoltSensorEntity, "llc_op_volt", "LLC Op Potential", False),
+    EcoFlowEntityDescription(MiscSensorEntity, "llc_error_code", "LLC Error Code", False),
+    EcoFlowEntityDescription(MiscSensorEntity, "llc_warning_code", "LLC Warning Code", False),
+    EcoFlowEntityDescription(MiscSensorEntity, "llc_status", "LLC Status", False),
+
+    EcoFlowEntityDescription(MiscSensorEntity, "inv_on_off", "Inverter On/Off Status"),
+    EcoFlowEntityDescription(DeciwattsSensorEntity, "inv_output_watts", "Inverter Output Watts"),
+    EcoFlowEntityDescription(DecivoltSensorEntity, "inv_input_volt", "Inverter Output Potential", False),
+    EcoFlowEntityDescription(DecivoltSensorEntity, "inv_op_volt", "Inverter Op Potential"),
+    EcoFlowEntityDescription(AmpSensorEntity, "inv_output_cur", "Inverter Output Current"),
+    EcoFlowEntityDescription(AmpSensorEntity, "inv_dc_cur", "Inverter DC Current"),
+    EcoFlowEntityDescription(DecihertzSensorEntity, "inv_freq", "Inverter Frequency"),
+    EcoFlowEntityDescription(DecicelsiusSensorEntity, "inv_temp", "Inverter Temperature"),
+    EcoFlowEntityDescription(MiscSensorEntity, "inv_relay_status", "Inverter Relay Status"),
+    EcoFlowEntityDescription(MiscSensorEntity, "inv_error_code", "Inverter Error Code", False),
+    EcoFlowEntityDescription(MiscSensorEntity, "inv_warning_code", "Inverter Warning Code", False),
+    EcoFlowEntityDescription(MiscSensorEntity, "inv_status", "Inverter Status", False),
+
+    EcoFlowEntityDescription(DeciwattsSensorEntity, "permanent_watts", "Other Loads"),
+    EcoFlowEntityDescription(DeciwattsSensorEntity, "dynamic_watts", "Smart Plug Loads"),
+    EcoFlowEntityDescription(DeciwattsSensorEntity, "rated_power", "Rated Power"),
+
+    EcoFlowEntityDescription(MiscSensorEntity, "lower_limit", "Lower Battery Limit", False),
+    EcoFlowEntityDescription(MiscSensorEntity, "upper_limit", "Upper Battery Limit", False),
+    EcoFlowEntityDescription(MiscSensorEntity, "wireless_error_code", "Wireless Error Code", False),
+    EcoFlowEntityDescription(MiscSensorEntity, "wireless_warning_code", "Wireless Warning Code", False),
+    EcoFlowEntityDescription(MiscSensorEntity, "inv_brightness", "LED Brightness", False),
+    EcoFlowEntityDescription(MiscSensorEntity, "heartbeat_frequency", "Heartbeat Frequency", False),
+)
+
+
 class PowerStream(BaseDevice):
     def sensors(self, client: EcoflowApiClient) -> list[BaseSensorEntity]:
-        return [
-            InWattsSolarSensorEntity(client, self,  "pv1_input_watts", "Solar 1 Watts"),
-            DecivoltSensorEntity(client, self,  "pv1_input_volt", "Solar 1 Input Potential"),
-            CentivoltSensorEntity(client, self,  "pv1_op_volt", "Solar 1 Op Potential"),
-            DeciampSensorEntity(client, self,  "pv1_input_cur", "Solar 1 Currrent"),
-            DecicelsiusSensorEntity(client, self,  "pv1_temp", "Solar 1 Temperature"),
-            MiscSensorEntity(client, self,  "pv1_relay_status", "Solar 1 Relay Status"),
-            MiscSensorEntity(client, self,  "pv1_error_code", "Solar 1 Error Code", False),
-            MiscSensorEntity(client, self,  "pv1_warning_code", "Solar 1 Warning Code", False),
-            MiscSensorEntity(client, self,  "pv1_status", "Solar 1 Status", False),
-
-            InWattsSolarSensorEntity(client, self,  "pv2_input_watts", "Solar 2 Watts"),
-            DecivoltSensorEntity(client, self,  "pv2_input_volt", "Solar 2 Input Potential"),
-            CentivoltSensorEntity(client, self,  "pv2_op_volt", "Solar 2 Op Potential"),
-            DeciampSensorEntity(client, self,  "pv2_input_cur", "Solar 2 Current"),
-            DecicelsiusSensorEntity(client, self,  "pv2_temp", "Solar 2 Temperature"),
-            MiscSensorEntity(client, self,  "pv2_relay_status", "Solar 2 Relay Status"),
-            MiscSensorEntity(client, self,  "pv2_error_code", "Solar 2 Error Code", False),
-            MiscSensorEntity(client, self,  "pv2_warning_code", "Solar 2 Warning Code", False),
-            MiscSensorEntity(client, self,  "pv2_status", "Solar 2 Status", False),
-
-            MiscSensorEntity(client, self,  "bp_type", "Battery Type", False),
-            LevelSensorEntity(client, self,  "bat_soc", "Battery Charge"),
-            DeciwattsSensorEntity(client, self,  "bat_input_watts", "Battery Input Watts"),
-            DecivoltSensorEntity(client, self,  "bat_input_volt", "Battery Input Potential"),
-            DecivoltSensorEntity(client, self,  "bat_op_volt", "Battery Op Potential"),
-            AmpSensorEntity(client, self,  "bat_input_cur", "Battery Input Current"),
-            DecicelsiusSensorEntity(client, self,  "bat_temp", "Battery Temperature"),
-            RemainSensorEntity(client, self,  "battery_charge_remain", "Charge Time"),
-            RemainSensorEntity(client, self,  "battery_discharge_remain", "Discharge Time"),
-            MiscSensorEntity(client, self,  "bat_error_code", "Battery Error Code", False),
-            MiscSensorEntity(client, self,  "bat_warning_code", "Battery Warning Code", False),
-            MiscSensorEntity(client, self,  "bat_status", "Battery Status", False),
-
-            DecivoltSensorEntity(client, self,  "llc_input_volt", "LLC Input Potential", False),
-            DecivoltSensorEntity(client, self,  "llc_op_volt", "LLC Op Potential", False),
-            MiscSensorEntity(client, self,  "llc_error_code", "LLC Error Code", False),
-            MiscSensorEntity(client, self,  "llc_warning_code", "LLC Warning Code", False),
-            MiscSensorEntity(client, self,  "llc_status", "LLC Status", False),
-
-            MiscSensorEntity(client, self,  "inv_on_off", "Inverter On/Off Status"),
-            DeciwattsSensorEntity(client, self,  "inv_output_watts", "Inverter Output Watts"),
-            DecivoltSensorEntity(client, self,  "inv_input_volt", "Inverter Output Potential", False),
-            DecivoltSensorEntity(client, self,  "inv_op_volt", "Inverter Op Potential"),
-            AmpSensorEntity(client, self,  "inv_output_cur", "Inverter Output Current"),
-            AmpSensorEntity(client, self,  "inv_dc_cur", "Inverter DC Current"),
-            DecihertzSensorEntity(client, self,  "inv_freq", "Inverter Frequency"),
-            DecicelsiusSensorEntity(client, self,  "inv_temp", "Inverter Temperature"),
-            MiscSensorEntity(client, self,  "inv_relay_status", "Inverter Relay Status"),
-            MiscSensorEntity(client, self,  "inv_error_code", "Inverter Error Code", False),
-            MiscSensorEntity(client, self,  "inv_warning_code", "Inverter Warning Code", False),
-            MiscSensorEntity(client, self,  "inv_status", "Inverter Status", False),
-
-            DeciwattsSensorEntity(client, self,  "permanent_watts", "Other Loads"),
-            DeciwattsSensorEntity(client, self,  "dynamic_watts", "Smart Plug Loads"),
-            DeciwattsSensorEntity(client, self,  "rated_power", "Rated Power"),
-
-            MiscSensorEntity(client, self,  "lower_limit", "Lower Battery Limit", False),
-            MiscSensorEntity(client, self,  "upper_limit", "Upper Battery Limit", False),
-            MiscSensorEntity(client, self,  "wireless_error_code", "Wireless Error Code", False),
-            MiscSensorEntity(client, self,  "wireless_warning_code", "Wireless Warning Code", False),
-            MiscSensorEntity(client, self,  "inv_brightness", "LED Brightness", False),
-            MiscSensorEntity(client, self,  "heartbeat_frequency", "Heartbeat Frequency", False),
-
-            ReconnectStatusSensorEntity(client, self)
-        ]
+        return create_entities(client, self, POWERSTREAM_SENSORS) + [ReconnectStatusSensorEntity(client, self)]
 
 
     def numbers(self, client: EcoflowApiClient) -> list[BaseNumberEntity]:
@@ -111,44 +131,31 @@ class PowerStream(BaseDevice):
 
     def _prepare_data(self, raw_data) -> dict[str, any]:
         raw = {"params": {}}
-        from .proto import ecopacket_pb2 as ecopacket, powerstream_pb2 as powerstream
         try:
-            payload =raw_data
-
-            while True:
-                packet = ecopacket.SendHeaderMsg()
-                packet.ParseFromString(payload)
-
-                _LOGGER.debug("cmd id %u payload \"%s\"", packet.msg.cmd_id, payload.hex())
-
-                if packet.msg.cmd_id != 1:
-                    _LOGGER.info("Unsupported EcoPacket cmd id %u", packet.msg.cmd_id)
-
-                else:
-                    heartbeat = powerstream.InverterHeartbeat()
-                    heartbeat.ParseFromString(packet.msg.pdata)
-
-                    for descriptor in heartbeat.DESCRIPTOR.fields:
-                        if not heartbeat.HasField(descriptor.name):
-                            continue
-
-                        raw["params"][descriptor.name] = getattr(heartbeat, descriptor.name)
-
-                    _LOGGER.info("Found %u fields", len(raw["params"]))
-
-                    raw["timestamp"] = utcnow()
-
-                if packet.ByteSize() >= len(payload):
-                    break
-
-                _LOGGER.info("Found another frame in payload")
-
-                packet_length = len(payload) - packet.ByteSize()
-                payload = payload[:packet_length]
-
+            records = []
+            params = _DECODER.decode(raw_data, records=records)
+            if params:
+                _LOGGER.debug("Found %u fields", len(params))
+                raw["params"] = params
+                raw["timestamp"] = utcnow()
+            if records:
+                self.__store_records(records)
         except Exception as error:
             _LOGGER.error(error)
-            _LOGGER.info(raw_data.hex())
+            _LOGGER.debug(raw_data.hex())
 
         return raw
 
+    def __store_records(self, records: list):
+        if self.energy_store is None:
+            return
+        sn = self.device_info.sn
+        for (_, _, report) in records:
+            if isinstance(report, platform_pb2.BatchEnergyTotalReport):
+                _LOGGER.debug("Energy report %u with %u items", report.watth_seq, len(report.watth_item))
+                self.energy_store.add_energy(sn, [(item.watth_type, item.timestamp, item.watth)
+                                                  for item in report.watth_item])
+            elif isinstance(report, platform_pb2.EventRecordReport):
+                _LOGGER.debug("Event report %u with %u items", report.event_seq, len(report.event_item))
+                self.energy_store.add_events(sn, [(item.timestamp, item.sys_ms, item.event_no, item.event_detail)
+                                                  for item in report.event_item])
@@ -2,7 +2,8 @@ from custom_components.ecoflow_cloud_alt.api import EcoflowApiClient
 from custom_components.ecoflow_cloud_alt.devices import const, BaseDevice
 from custom_components.ecoflow_cloud_alt.devices.const import ATTR_DESIGN_CAPACITY, ATTR_FULL_CAPACITY, ATTR_REMAIN_CAPACITY, BATTERY_CHARGING_STATE, \
     MAIN_DESIGN_CAPACITY, MAIN_FULL_CAPACITY, MAIN_REMAIN_CAPACITY
-from custom_components.ecoflow_cloud_alt.entities import BaseSensorEntity, BaseNumberEntity, BaseSwitchEntity, BaseSelectEntity
+from custom_components.ecoflow_cloud_alt.entities import BaseSensorEntity, BaseNumberEntity, BaseSwitchEntity, BaseSelectEntity, EcoFlowEntityDescription, create_entities, \
+    reads_params
 from custom_components.ecoflow_cloud_alt.number import ChargingPowerEntity, MaxBatteryLevelEntity, MinBatteryLevelEntity, BatteryBackupLevel
 from custom_components.ecoflow_cloud_alt.select import DictSelectEntity, TimeoutDictSelectEntity
 from custom_components.ecoflow_cloud_alt.sensor import LevelSensorEntity, RemainSensorEntity, TempSensorEntity, \
@@ -13,72 +14,73 @@ from custom_components.ecoflow_cloud_alt.sensor import LevelSensorEntity, Remain
 from custom_components.ecoflow_cloud_alt.switch import EnabledEntity
 
 
-class River2(BaseDevice):
+RIVER2_SENSORS = (
+    EcoFlowEntityDescription(LevelSensorEntity, "bms_bmsStatus.soc", const.MAIN_BATTERY_LEVEL)
+        .attr("bms_bmsStatus.designCap", ATTR_DESIGN_CAPACITY, 0)
+        .attr("bms_bmsStatus.fullCap", ATTR_FULL_CAPACITY, 0)
+        .attr("bms_bmsStatus.remainCap", ATTR_REMAIN_CAPACITY, 0),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bms_bmsStatus.designCap", MAIN_DESIGN_CAPACITY, False),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bms_bmsStatus.fullCap", MAIN_FULL_CAPACITY, False),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bms_bmsStatus.remainCap", MAIN_REMAIN_CAPACITY, False),
 
-    @staticmethod
-    def default_charging_power_step() -> int:
-        return 50
+    EcoFlowEntityDescription(LevelSensorEntity, "bms_bmsStatus.soh", const.SOH),
 
-    def sensors(self, client: EcoflowApiClient) -> list[BaseSensorEntity]:
-        return [
-            LevelSensorEntity(client, self, "bms_bmsStatus.soc", const.MAIN_BATTERY_LEVEL)
-                .attr("bms_bmsStatus.designCap", ATTR_DESIGN_CAPACITY, 0)
-                .attr("bms_bmsStatus.fullCap", ATTR_FULL_CAPACITY, 0)
-                .attr("bms_bmsStatus.remainCap", ATTR_REMAIN_CAPACITY, 0),
-            CapacitySensorEntity(client, self, "bms_bmsStatus.designCap", MAIN_DESIGN_CAPACITY, False),
-            CapacitySensorEntity(client, self, "bms_bmsStatus.fullCap", MAIN_FULL_CAPACITY, False),
-            CapacitySensorEntity(client, self, "bms_bmsStatus.remainCap", MAIN_REMAIN_CAPACITY, False),
+    EcoFlowEntityDescription(LevelSensorEntity, "bms_emsStatus.lcdShowSoc", const.COMBINED_BATTERY_LEVEL),
 
-            LevelSensorEntity(client, self, "bms_bmsStatus.soh", const.SOH),
+    EcoFlowEntityDescription(ChargingStateSensorEntity, "bms_emsStatus.chgState", BATTERY_CHARGING_STATE),
 
-            LevelSensorEntity(client, self, "bms_emsStatus.lcdShowSoc", const.COMBINED_BATTERY_LEVEL),
+    EcoFlowEntityDescription(InWattsSensorEntity, "pd.wattsInSum", const.TOTAL_IN_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.wattsOutSum", const.TOTAL_OUT_POWER),
 
-            ChargingStateSensorEntity(client, self, "bms_emsStatus.chgState", BATTERY_CHARGING_STATE),
+    EcoFlowEntityDescription(InAmpSensorEntity, "inv.dcInAmp", const.SOLAR_IN_CURRENT),
+    EcoFlowEntityDescription(InVoltSensorEntity, "inv.dcInVol", const.SOLAR_IN_VOLTAGE),
 
-            InWattsSensorEntity(client, self, "pd.wattsInSum", const.TOTAL_IN_POWER),
-            OutWattsSensorEntity(client, self, "pd.wattsOutSum", const.TOTAL_OUT_POWER),
+    EcoFlowEntityDescription(InWattsSensorEntity, "inv.inputWatts", const.AC_IN_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "inv.outputWatts", const.AC_OUT_POWER),
 
-            InAmpSensorEntity(client, self, "inv.dcInAmp", const.SOLAR_IN_CURRENT),
-            InVoltSensorEntity(client, self, "inv.dcInVol", const.SOLAR_IN_VOLTAGE),
+    EcoFlowEntityDescription(InMilliVoltSensorEntity, "inv.acInVol", const.AC_IN_VOLT),
+    EcoFlowEntityDescription(OutMilliVoltSensorEntity, "inv.invOutVol", const.AC_OUT_VOLT),
 
-            InWattsSensorEntity(client, self, "inv.inputWatts", const.AC_IN_POWER),
-            OutWattsSensorEntity(client, self, "inv.outputWatts", const.AC_OUT_POWER),
+    EcoFlowEntityDescription(InWattsSensorEntity, "pd.typecChaWatts", const.TYPE_C_IN_POWER),
+    EcoFlowEntityDescription(InWattsSensorEntity, "mppt.inWatts", const.SOLAR_IN_POWER),
 
-            InMilliVoltSensorEntity(client, self, "inv.acInVol", const.AC_IN_VOLT),
-            OutMilliVoltSensorEntity(client, self, "inv.invOutVol", const.AC_OUT_VOLT),
 
-            InWattsSensorEntity(client, self, "pd.typecChaWatts", const.TYPE_C_IN_POWER),
-            InWattsSensorEntity(client, self, "mppt.inWatts", const.SOLAR_IN_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.carWatts", const.DC_OUT_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.typec1Watts", const.TYPEC_OUT_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.usb1Watts", const.USB_OUT_POWER),
+    # EcoFlowEntityDescription(OutWattsSensorEntity, "pd.usb2Watts", const.USB_2_OUT_POWER),
 
+    EcoFlowEntityDescription(RemainSensorEntity, "bms_emsStatus.chgRemainTime", const.CHARGE_REMAINING_TIME),
+    EcoFlowEntityDescription(RemainSensorEntity, "bms_emsStatus.dsgRemainTime", const.DISCHARGE_REMAINING_TIME),
+    EcoFlowEntityDescription(RemainSensorEntity, "pd.remainTime", const.REMAINING_TIME),
 
-            OutWattsSensorEntity(client, self, "pd.carWatts", const.DC_OUT_POWER),
-            OutWattsSensorEntity(client, self, "pd.typec1Watts", const.TYPEC_OUT_POWER),
-            OutWattsSensorEntity(client, self, "pd.usb1Watts", const.USB_OUT_POWER),
-            # OutWattsSensorEntity(client, self, "pd.usb2Watts", const.USB_2_OUT_POWER),
+    EcoFlowEntityDescription(TempSensorEntity, "inv.outTemp", "Inv Out Temperature"),
+    EcoFlowEntityDescription(CyclesSensorEntity, "bms_bmsStatus.cycles", const.CYCLES),
 
-            RemainSensorEntity(client, self, "bms_emsStatus.chgRemainTime", const.CHARGE_REMAINING_TIME),
-            RemainSensorEntity(client, self, "bms_emsStatus.dsgRemainTime", const.DISCHARGE_REMAINING_TIME),
-            RemainSensorEntity(client, self, "pd.remainTime", const.REMAINING_TIME),
+    EcoFlowEntityDescription(TempSensorEntity, "bms_bmsStatus.temp", const.BATTERY_TEMP)
+        .attr("bms_bmsStatus.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
+        .attr("bms_bmsStatus.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
+    EcoFlowEntityDescription(TempSensorEntity, "bms_bmsStatus.minCellTemp", const.MIN_CELL_TEMP, False),
+    EcoFlowEntityDescription(TempSensorEntity, "bms_bmsStatus.maxCellTemp", const.MAX_CELL_TEMP, False),
 
-            TempSensorEntity(client, self, "inv.outTemp", "Inv Out Temperature"),
-            CyclesSensorEntity(client, self, "bms_bmsStatus.cycles", const.CYCLES),
+    EcoFlowEntityDescription(VoltSensorEntity, "bms_bmsStatus.vol", const.BATTERY_VOLT, False)
+        .attr("bms_bmsStatus.minCellVol", const.ATTR_MIN_CELL_VOLT, 0)
+        .attr("bms_bmsStatus.maxCellVol", const.ATTR_MAX_CELL_VOLT, 0),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bms_bmsStatus.minCellVol", const.MIN_CELL_VOLT, False),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bms_bmsStatus.maxCellVol", const.MAX_CELL_VOLT, False),
 
-            TempSensorEntity(client, self, "bms_bmsStatus.temp", const.BATTERY_TEMP)
-                .attr("bms_bmsStatus.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
-                .attr("bms_bmsStatus.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
-            TempSensorEntity(client, self, "bms_bmsStatus.minCellTemp", const.MIN_CELL_TEMP, False),
-            TempSensorEntity(client, self, "bms_bmsStatus.maxCellTemp", const.MAX_CELL_TEMP, False),
+    # EcoFlowEntityDescription(FanSensorEntity, "bms_emsStatus.fanLevel", "Fan Level"),
+)
 
-            VoltSensorEntity(client, self, "bms_bmsStatus.vol", const.BATTERY_VOLT, False)
-                .attr("bms_bmsStatus.minCellVol", const.ATTR_MIN_CELL_VOLT, 0)
-                .attr("bms_bmsStatus.maxCellVol", const.ATTR_MAX_CELL_VOLT, 0),
-            MilliVoltSensorEntity(client, self, "bms_bmsStatus.minCellVol", const.MIN_CELL_VOLT, False),
-            MilliVoltSensorEntity(client, self, "bms_bmsStatus.maxCellVol", const.MAX_CELL_VOLT, False),
 
-            self._status_sensor(client),
-            # FanSensorEntity(client, self, "bms_emsStatus.fanLevel", "Fan Level"),
+class River2(BaseDevice):
 
-        ]
+    @staticmethod
+    def default_charging_power_step() -> int:
+        return 50
+
+    def sensors(self, client: EcoflowApiClient) -> list[BaseSensorEntity]:
+        return create_entities(client, self, RIVER2_SENSORS) + [self._status_sensor(client)]
 
     def numbers(self, client: EcoflowApiClient) -> list[BaseNumberEntity]:
         return [
@@ -111,9 +113,10 @@ class River2(BaseDevice):
                                                     "xboost": 255}}),
 
             EnabledEntity(client, self, "pd.acAutoOutConfig", const.AC_ALWAYS_ENABLED,
-                          lambda value, params: {"moduleType": 1, "operateType": "acAutoOutConfig",
-                                                 "params": {"acAutoOutConfig": value,
-                                                            "minAcOutSoc": int(params.get("bms_emsStatus.minDsgSoc", 0)) + 5}}
+                          reads_params(["bms_emsStatus.minDsgSoc"],
+                                       lambda value, params: {"moduleType": 1, "operateType": "acAutoOutConfig",
+                                                              "params": {"acAutoOutConfig": value,
+                                                                         "minAcOutSoc": int(params.get("bms_emsStatus.minDsgSoc", 0)) + 5}})
                           ),
 
             EnabledEntity(client, self, "mppt.cfgAcXboost", const.XBOOST_ENABLED,
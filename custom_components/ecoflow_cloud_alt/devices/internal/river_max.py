@@ -1,6 +1,6 @@
 from custom_components.ecoflow_cloud_alt.api import EcoflowApiClient
 from custom_components.ecoflow_cloud_alt.devices import const, BaseDevice
-from custom_components.ecoflow_cloud_alt.entities import BaseSensorEntity, BaseNumberEntity, BaseSwitchEntity, BaseSelectEntity
+from custom_components.ecoflow_cloud_alt.entities import BaseSensorEntity, BaseNumberEntity, BaseSwitchEntity, BaseSelectEntity, EcoFlowEntityDescription, create_entities
 from custom_components.ecoflow_cloud_alt.number import MaxBatteryLevelEntity
 from custom_components.ecoflow_cloud_alt.select import DictSelectEntity
 from custom_components.ecoflow_cloud_alt.sensor import LevelSensorEntity, WattsSensorEntity, RemainSensorEntity, \
@@ -11,79 +11,81 @@ from custom_components.ecoflow_cloud_alt.sensor import LevelSensorEntity, WattsS
 from custom_components.ecoflow_cloud_alt.switch import EnabledEntity, BeeperEntity, FanModeEntity
 
 
+RIVER_MAX_SENSORS = (
+    EcoFlowEntityDescription(LevelSensorEntity, "bmsMaster.soc", const.MAIN_BATTERY_LEVEL)
+        .attr("bmsMaster.designCap", const.ATTR_DESIGN_CAPACITY, 0)
+        .attr("bmsMaster.fullCap", const.ATTR_FULL_CAPACITY, 0)
+        .attr("bmsMaster.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bmsMaster.designCap", const.MAIN_DESIGN_CAPACITY, False),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bmsMaster.fullCap", const.MAIN_FULL_CAPACITY, False),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bmsMaster.remainCap", const.MAIN_REMAIN_CAPACITY, False),
+
+    EcoFlowEntityDescription(WattsSensorEntity, "pd.wattsInSum", const.TOTAL_IN_POWER),
+    EcoFlowEntityDescription(WattsSensorEntity, "pd.wattsOutSum", const.TOTAL_OUT_POWER),
+
+    EcoFlowEntityDescription(InWattsSensorEntity, "inv.inputWatts", const.AC_IN_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "inv.outputWatts", const.AC_OUT_POWER),
+
+    EcoFlowEntityDescription(InMilliVoltSensorEntity, "inv.acInVol", const.AC_IN_VOLT),
+    EcoFlowEntityDescription(OutMilliVoltSensorEntity, "inv.invOutVol", const.AC_OUT_VOLT),
+
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.carWatts", const.DC_OUT_POWER),
+
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.typecWatts", const.TYPEC_OUT_POWER),
+
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.usb1Watts", const.USB_1_OUT_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.usb2Watts", const.USB_2_OUT_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.usb3Watts", const.USB_3_OUT_POWER),
+
+    EcoFlowEntityDescription(RemainSensorEntity, "pd.remainTime", const.REMAINING_TIME),
+    EcoFlowEntityDescription(CyclesSensorEntity, "bmsMaster.cycles", const.CYCLES),
+
+    EcoFlowEntityDescription(TempSensorEntity, "bmsMaster.temp", const.BATTERY_TEMP)
+        .attr("bmsMaster.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
+        .attr("bmsMaster.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
+    EcoFlowEntityDescription(TempSensorEntity, "bmsMaster.minCellTemp", const.MIN_CELL_TEMP, False),
+    EcoFlowEntityDescription(TempSensorEntity, "bmsMaster.maxCellTemp", const.MAX_CELL_TEMP, False),
+
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bmsMaster.vol", const.BATTERY_VOLT, False)
+        .attr("bmsMaster.minCellVol", const.ATTR_MIN_CELL_VOLT, 0)
+        .attr("bmsMaster.maxCellVol", const.ATTR_MAX_CELL_VOLT, 0),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bmsMaster.minCellVol", const.MIN_CELL_VOLT, False),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bmsMaster.maxCellVol", const.MAX_CELL_VOLT, False),
+
+    # https://github.com/tolwi/hassio-ecoflow-cloud/discussions/87
+    EcoFlowEntityDescription(InEnergySensorEntity, "pd.chgSunPower", const.SOLAR_IN_ENERGY),
+    EcoFlowEntityDescription(InEnergySensorEntity, "pd.chgPowerAC", const.CHARGE_AC_ENERGY),
+    EcoFlowEntityDescription(InEnergySensorEntity, "pd.chgPowerDC", const.CHARGE_DC_ENERGY),
+    EcoFlowEntityDescription(OutEnergySensorEntity, "pd.dsgPowerAC", const.DISCHARGE_AC_ENERGY),
+    EcoFlowEntityDescription(OutEnergySensorEntity, "pd.dsgPowerDC", const.DISCHARGE_DC_ENERGY),
+
+    EcoFlowEntityDescription(LevelSensorEntity, "bmsSlave1.soc", const.SLAVE_BATTERY_LEVEL, False, True)
+        .attr("bmsSlave1.designCap", const.ATTR_DESIGN_CAPACITY, 0)
+        .attr("bmsSlave1.fullCap", const.ATTR_FULL_CAPACITY, 0)
+        .attr("bmsSlave1.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bmsSlave1.designCap", const.SLAVE_DESIGN_CAPACITY, False),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bmsSlave1.fullCap", const.SLAVE_FULL_CAPACITY, False),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bmsSlave1.remainCap", const.SLAVE_REMAIN_CAPACITY, False),
+
+    EcoFlowEntityDescription(TempSensorEntity, "bmsSlave1.temp", const.SLAVE_BATTERY_TEMP, False, True)
+        .attr("bmsSlave1.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
+        .attr("bmsSlave1.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
+    EcoFlowEntityDescription(TempSensorEntity, "bmsSlave1.minCellTemp", const.SLAVE_MIN_CELL_TEMP, False),
+    EcoFlowEntityDescription(TempSensorEntity, "bmsSlave1.maxCellTemp", const.SLAVE_MAX_CELL_TEMP, False),
+
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bmsSlave1.vol", const.BATTERY_VOLT, False)
+        .attr("bmsSlave1.minCellVol", const.ATTR_MIN_CELL_VOLT, 0)
+        .attr("bmsSlave1.maxCellVol", const.ATTR_MAX_CELL_VOLT, 0),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bmsSlave1.minCellVol", const.MIN_CELL_VOLT, False),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bmsSlave1.maxCellVol", const.MAX_CELL_VOLT, False),
+
+    EcoFlowEntityDescription(CyclesSensorEntity, "bmsSlave1.cycles", const.SLAVE_CYCLES, False, True),
+)
+
+
 class RiverMax(BaseDevice):
     def sensors(self, client: EcoflowApiClient) -> list[BaseSensorEntity]:
-        return [
-            LevelSensorEntity(client, self, "bmsMaster.soc", const.MAIN_BATTERY_LEVEL)
-                .attr("bmsMaster.designCap", const.ATTR_DESIGN_CAPACITY, 0)
-                .attr("bmsMaster.fullCap", const.ATTR_FULL_CAPACITY, 0)
-                .attr("bmsMaster.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
-            CapacitySensorEntity(client, self, "bmsMaster.designCap", const.MAIN_DESIGN_CAPACITY, False),
-            CapacitySensorEntity(client, self, "bmsMaster.fullCap", const.MAIN_FULL_CAPACITY, False),
-            CapacitySensorEntity(client, self, "bmsMaster.remainCap", const.MAIN_REMAIN_CAPACITY, False),
-
-            WattsSensorEntity(client, self, "pd.wattsInSum", const.TOTAL_IN_POWER),
-            WattsSensorEntity(client, self, "pd.wattsOutSum", const.TOTAL_OUT_POWER),
-
-            InWattsSensorEntity(client, self, "inv.inputWatts", const.AC_IN_POWER),
-            OutWattsSensorEntity(client, self, "inv.outputWatts", const.AC_OUT_POWER),
-
-            InMilliVoltSensorEntity(client, self, "inv.acInVol", const.AC_IN_VOLT),
-            OutMilliVoltSensorEntity(client, self, "inv.invOutVol", const.AC_OUT_VOLT),
-
-            OutWattsSensorEntity(client, self, "pd.carWatts", const.DC_OUT_POWER),
-
-            OutWattsSensorEntity(client, self, "pd.typecWatts", const.TYPEC_OUT_POWER),
-
-            OutWattsSensorEntity(client, self, "pd.usb1Watts", const.USB_1_OUT_POWER),
-            OutWattsSensorEntity(client, self, "pd.usb2Watts", const.USB_2_OUT_POWER),
-            OutWattsSensorEntity(client, self, "pd.usb3Watts", const.USB_3_OUT_POWER),
-
-            RemainSensorEntity(client, self, "pd.remainTime", const.REMAINING_TIME),
-            CyclesSensorEntity(client, self, "bmsMaster.cycles", const.CYCLES),
-
-            TempSensorEntity(client, self, "bmsMaster.temp", const.BATTERY_TEMP)
-                .attr("bmsMaster.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
-                .attr("bmsMaster.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
-            TempSensorEntity(client, self, "bmsMaster.minCellTemp", const.MIN_CELL_TEMP, False),
-            TempSensorEntity(client, self, "bmsMaster.maxCellTemp", const.MAX_CELL_TEMP, False),
-
-            MilliVoltSensorEntity(client, self, "bmsMaster.vol", const.BATTERY_VOLT, False)
-                .attr("bmsMaster.minCellVol", const.ATTR_MIN_CELL_VOLT, 0)
-                .attr("bmsMaster.maxCellVol", const.ATTR_MAX_CELL_VOLT, 0),
-            MilliVoltSensorEntity(client, self, "bmsMaster.minCellVol", const.MIN_CELL_VOLT, False),
-            MilliVoltSensorEntity(client, self, "bmsMaster.maxCellVol", const.MAX_CELL_VOLT, False),
-
-            # https://github.com/tolwi/hassio-ecoflow-cloud/discussions/87
-            InEnergySensorEntity(client, self, "pd.chgSunPower", const.SOLAR_IN_ENERGY),
-            InEnergySensorEntity(client, self, "pd.chgPowerAC", const.CHARGE_AC_ENERGY),
-            InEnergySensorEntity(client, self, "pd.chgPowerDC", const.CHARGE_DC_ENERGY),
-            OutEnergySensorEntity(client, self, "pd.dsgPowerAC", const.DISCHARGE_AC_ENERGY),
-            OutEnergySensorEntity(client, self, "pd.dsgPowerDC", const.DISCHARGE_DC_ENERGY),
-
-            LevelSensorEntity(client, self, "bmsSlave1.soc", const.SLAVE_BATTERY_LEVEL, False, True)
-                .attr("bmsSlave1.designCap", const.ATTR_DESIGN_CAPACITY, 0)
-                .attr("bmsSlave1.fullCap", const.ATTR_FULL_CAPACITY, 0)
-                .attr("bmsSlave1.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
-            CapacitySensorEntity(client, self, "bmsSlave1.designCap", const.SLAVE_DESIGN_CAPACITY, False),
-            CapacitySensorEntity(client, self, "bmsSlave1.fullCap", const.SLAVE_FULL_CAPACITY, False),
-            CapacitySensorEntity(client, self, "bmsSlave1.remainCap", const.SLAVE_REMAIN_CAPACITY, False),
-
-            TempSensorEntity(client, self, "bmsSlave1.temp", const.SLAVE_BATTERY_TEMP, False, True)
-                .attr("bmsSlave1.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
-                .attr("bmsSlave1.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
-            TempSensorEntity(client, self, "bmsSlave1.minCellTemp", const.SLAVE_MIN_CELL_TEMP, False),
-            TempSensorEntity(client, self, "bmsSlave1.maxCellTemp", const.SLAVE_MAX_CELL_TEMP, False),
-
-            MilliVoltSensorEntity(client, self, "bmsSlave1.vol", const.BATTERY_VOLT, False)
-                .attr("bmsSlave1.minCellVol", const.ATTR_MIN_CELL_VOLT, 0)
-                .attr("bmsSlave1.maxCellVol", const.ATTR_MAX_CELL_VOLT, 0),
-            MilliVoltSensorEntity(client, self, "bmsSlave1.minCellVol", const.MIN_CELL_VOLT, False),
-            MilliVoltSensorEntity(client, self, "bmsSlave1.maxCellVol", const.MAX_CELL_VOLT, False),
-
-            CyclesSensorEntity(client, self, "bmsSlave1.cycles", const.SLAVE_CYCLES, False, True),
-            QuotaStatusSensorEntity(client, self)
-        ]
+        return create_entities(client, self, RIVER_MAX_SENSORS) + [QuotaStatusSensorEntity(client, self)]
 
     def numbers(self, client: EcoflowApiClient) -> list[BaseNumberEntity]:
         return [
@@ -1,6 +1,6 @@
 from custom_components.ecoflow_cloud_alt import EcoflowApiClient
 from custom_components.ecoflow_cloud_alt.devices import const, BaseDevice
-from custom_components.ecoflow_cloud_alt.entities import BaseSensorEntity, BaseNumberEntity, BaseSwitchEntity, BaseSelectEntity
+from custom_components.ecoflow_cloud_alt.entities import BaseSensorEntity, BaseNumberEntity, BaseSwitchEntity, BaseSelectEntity, EcoFlowEntityDescription, create_entities
 from custom_components.ecoflow_cloud_alt.number import MaxBatteryLevelEntity
 from custom_components.ecoflow_cloud_alt.sensor import LevelSensorEntity, WattsSensorEntity, TempSensorEntity, \
     CyclesSensorEntity, InEnergySensorEntity, InWattsSensorEntity, OutEnergySensorEntity, OutWattsSensorEntity, \
@@ -9,36 +9,39 @@ from custom_components.ecoflow_cloud_alt.sensor import LevelSensorEntity, WattsS
 from custom_components.ecoflow_cloud_alt.switch import EnabledEntity
 
 
+RIVER_MINI_SENSORS = (
+    EcoFlowEntityDescription(LevelSensorEntity, "inv.soc", const.MAIN_BATTERY_LEVEL)
+            .attr("inv.maxChargeSoc", const.ATTR_DESIGN_CAPACITY, 0),
+
+    EcoFlowEntityDescription(InWattsSensorEntity, "inv.inputWatts", const.AC_IN_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "inv.outputWatts", const.AC_OUT_POWER),
+
+    EcoFlowEntityDescription(BeMilliVoltSensorEntity, "inv.invInVol", const.AC_IN_VOLT),
+    EcoFlowEntityDescription(BeMilliVoltSensorEntity, "inv.invOutVol", const.AC_OUT_VOLT),
+
+    EcoFlowEntityDescription(InMilliVoltSensorEntity, "inv.dcInVol", const.SOLAR_IN_VOLTAGE),
+    EcoFlowEntityDescription(AmpSensorEntity, "inv.dcInAmp", const.SOLAR_IN_CURRENT),
+
+    EcoFlowEntityDescription(TempSensorEntity, "inv.inTemp", const.INV_IN_TEMP),
+    EcoFlowEntityDescription(TempSensorEntity, "inv.outTemp", const.INV_OUT_TEMP),
+
+    EcoFlowEntityDescription(InEnergySensorEntity, "pd.chgSunPower", const.SOLAR_IN_ENERGY),
+    EcoFlowEntityDescription(InEnergySensorEntity, "pd.chgPowerAC", const.CHARGE_AC_ENERGY),
+    EcoFlowEntityDescription(InEnergySensorEntity, "pd.chgPowerDC", const.CHARGE_DC_ENERGY),
+    EcoFlowEntityDescription(OutEnergySensorEntity, "pd.dsgPowerAC", const.DISCHARGE_AC_ENERGY),
+    EcoFlowEntityDescription(OutEnergySensorEntity, "pd.dsgPowerDC", const.DISCHARGE_DC_ENERGY),
+
+    EcoFlowEntityDescription(WattsSensorEntity, "pd.wattsInSum", const.TOTAL_IN_POWER),
+    EcoFlowEntityDescription(WattsSensorEntity, "pd.wattsOutSum", const.TOTAL_OUT_POWER),
+
+
+    EcoFlowEntityDescription(CyclesSensorEntity, "inv.cycles", const.CYCLES),
+)
+
+
 class RiverMini(BaseDevice):
     def sensors(self, client: EcoflowApiClient) -> list[BaseSensorEntity]:
-        return [
-            LevelSensorEntity(client, self, "inv.soc", const.MAIN_BATTERY_LEVEL)
-                    .attr("inv.maxChargeSoc", const.ATTR_DESIGN_CAPACITY, 0),
-
-            InWattsSensorEntity(client, self, "inv.inputWatts", const.AC_IN_POWER),
-            OutWattsSensorEntity(client, self, "inv.outputWatts", const.AC_OUT_POWER),
-            
-            BeMilliVoltSensorEntity(client, self, "inv.invInVol", const.AC_IN_VOLT),
-            BeMilliVoltSensorEntity(client, self, "inv.invOutVol", const.AC_OUT_VOLT),
-
-            InMilliVoltSensorEntity(client, self, "inv.dcInVol", const.SOLAR_IN_VOLTAGE),
-            AmpSensorEntity(client, self, "inv.dcInAmp", const.SOLAR_IN_CURRENT),
-            
-            TempSensorEntity(client, self, "inv.inTemp", const.INV_IN_TEMP),
-            TempSensorEntity(client, self, "inv.outTemp", const.INV_OUT_TEMP),
-            
-            InEnergySensorEntity(client, self, "pd.chgSunPower", const.SOLAR_IN_ENERGY),
-            InEnergySensorEntity(client, self, "pd.chgPowerAC", const.CHARGE_AC_ENERGY),
-            InEnergySensorEntity(client, self, "pd.chgPowerDC", const.CHARGE_DC_ENERGY),
-            OutEnergySensorEntity(client, self, "pd.dsgPowerAC", const.DISCHARGE_AC_ENERGY),
-            OutEnergySensorEntity(client, self, "pd.dsgPowerDC", const.DISCHARGE_DC_ENERGY),
-            
-            WattsSensorEntity(client, self, "pd.wattsInSum", const.TOTAL_IN_POWER),
-            WattsSensorEntity(client, self, "pd.wattsOutSum", const.TOTAL_OUT_POWER),
-
-            
-            CyclesSensorEntity(client, self, "inv.cycles", const.CYCLES),
-        ]
+        return create_entities(client, self, RIVER_MINI_SENSORS)
 
     def numbers(self, client: EcoflowApiClient) -> list[BaseNumberEntity]:
         return [
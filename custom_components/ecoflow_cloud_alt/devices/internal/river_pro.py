@@ -1,6 +1,6 @@
 from custom_components.ecoflow_cloud_alt.api import EcoflowApiClient
 from custom_components.ecoflow_cloud_alt.devices import const, BaseDevice
-from custom_components.ecoflow_cloud_alt.entities import BaseSensorEntity, BaseNumberEntity, BaseSwitchEntity, BaseSelectEntity
+from custom_components.ecoflow_cloud_alt.entities import BaseSensorEntity, BaseNumberEntity, BaseSwitchEntity, BaseSelectEntity, EcoFlowEntityDescription, create_entities
 from custom_components.ecoflow_cloud_alt.number import MaxBatteryLevelEntity
 from custom_components.ecoflow_cloud_alt.select import TimeoutDictSelectEntity
 from custom_components.ecoflow_cloud_alt.sensor import LevelSensorEntity, WattsSensorEntity, RemainSensorEntity, \
@@ -12,91 +12,90 @@ from custom_components.ecoflow_cloud_alt.sensor import LevelSensorEntity, WattsS
 from custom_components.ecoflow_cloud_alt.switch import EnabledEntity, BeeperEntity
 
 
+RIVER_PRO_SENSORS = (
+    EcoFlowEntityDescription(LevelSensorEntity, "bmsMaster.soc", const.MAIN_BATTERY_LEVEL)
+        .attr("bmsMaster.designCap", const.ATTR_DESIGN_CAPACITY, 0)
+        .attr("bmsMaster.fullCap", const.ATTR_FULL_CAPACITY, 0)
+        .attr("bmsMaster.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bmsMaster.designCap", const.MAIN_DESIGN_CAPACITY, False),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bmsMaster.fullCap", const.MAIN_FULL_CAPACITY, False),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bmsMaster.remainCap", const.MAIN_REMAIN_CAPACITY, False),
+
+    EcoFlowEntityDescription(WattsSensorEntity, "pd.wattsInSum", const.TOTAL_IN_POWER),
+    EcoFlowEntityDescription(WattsSensorEntity, "pd.wattsOutSum", const.TOTAL_OUT_POWER),
+
+    EcoFlowEntityDescription(InAmpSensorEntity, "inv.dcInAmp", const.SOLAR_IN_CURRENT),
+    EcoFlowEntityDescription(InVoltSensorEntity, "inv.dcInVol", const.SOLAR_IN_VOLTAGE),
+
+    EcoFlowEntityDescription(InWattsSensorEntity, "inv.inputWatts", const.AC_IN_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "inv.outputWatts", const.AC_OUT_POWER),
+
+    EcoFlowEntityDescription(InMilliVoltSensorEntity, "inv.invInVol", const.AC_IN_VOLT),
+    EcoFlowEntityDescription(OutMilliVoltSensorEntity, "inv.invOutVol", const.AC_OUT_VOLT),
+
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.carWatts", const.DC_OUT_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.typecWatts", const.TYPEC_OUT_POWER),
+    # disabled by default because they aren't terribly useful
+    EcoFlowEntityDescription(TempSensorEntity, "pd.carTemp", const.DC_CAR_OUT_TEMP, False),
+    EcoFlowEntityDescription(TempSensorEntity, "pd.typecTemp", const.USB_C_TEMP, False),
+
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.usb1Watts", const.USB_1_OUT_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.usb2Watts", const.USB_2_OUT_POWER),
+    EcoFlowEntityDescription(OutWattsSensorEntity, "pd.usb3Watts", const.USB_3_OUT_POWER),
+
+    EcoFlowEntityDescription(RemainSensorEntity, "pd.remainTime", const.REMAINING_TIME),
+    EcoFlowEntityDescription(TempSensorEntity, "bmsMaster.temp", const.BATTERY_TEMP)
+        .attr("bmsMaster.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
+        .attr("bmsMaster.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
+
+    EcoFlowEntityDescription(TempSensorEntity, "bmsMaster.minCellTemp", const.MIN_CELL_TEMP, False),
+    EcoFlowEntityDescription(TempSensorEntity, "bmsMaster.maxCellTemp", const.MAX_CELL_TEMP, False),
+    EcoFlowEntityDescription(TempSensorEntity, "inv.inTemp", const.INV_IN_TEMP),
+    EcoFlowEntityDescription(TempSensorEntity, "inv.outTemp", const.INV_OUT_TEMP),
+
+    # https://github.com/tolwi/hassio-ecoflow-cloud/discussions/87
+    EcoFlowEntityDescription(InEnergySensorEntity, "pd.chgSunPower", const.SOLAR_IN_ENERGY),
+    EcoFlowEntityDescription(InEnergySensorEntity, "pd.chgPowerAC", const.CHARGE_AC_ENERGY),
+    EcoFlowEntityDescription(InEnergySensorEntity, "pd.chgPowerDC", const.CHARGE_DC_ENERGY),
+    EcoFlowEntityDescription(OutEnergySensorEntity, "pd.dsgPowerAC", const.DISCHARGE_AC_ENERGY),
+    EcoFlowEntityDescription(OutEnergySensorEntity, "pd.dsgPowerDC", const.DISCHARGE_DC_ENERGY),
+
+    EcoFlowEntityDescription(AmpSensorEntity, "bmsMaster.amp", const.BATTERY_AMP, False),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bmsMaster.vol", const.BATTERY_VOLT, False)
+        .attr("bmsMaster.minCellVol", const.ATTR_MIN_CELL_VOLT, 0)
+        .attr("bmsMaster.maxCellVol", const.ATTR_MAX_CELL_VOLT, 0),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bmsMaster.minCellVol", const.MIN_CELL_VOLT, False),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bmsMaster.maxCellVol", const.MAX_CELL_VOLT, False),
+
+    EcoFlowEntityDescription(CyclesSensorEntity, "bmsMaster.cycles", const.CYCLES),
+
+
+    # Optional Slave Batteries
+    EcoFlowEntityDescription(LevelSensorEntity, "bmsSlave1.soc", const.SLAVE_BATTERY_LEVEL, False, True)
+        .attr("bmsSlave1.designCap", const.ATTR_DESIGN_CAPACITY, 0)
+        .attr("bmsSlave1.fullCap", const.ATTR_FULL_CAPACITY, 0)
+        .attr("bmsSlave1.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bmsSlave1.designCap", const.SLAVE_DESIGN_CAPACITY, False),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bmsSlave1.fullCap", const.SLAVE_FULL_CAPACITY, False),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bmsSlave1.remainCap", const.SLAVE_REMAIN_CAPACITY, False),
+
+    EcoFlowEntityDescription(CyclesSensorEntity, "bmsSlave1.cycles", const.SLAVE_CYCLES, False, True),
+    EcoFlowEntityDescription(TempSensorEntity, "bmsSlave1.temp", const.SLAVE_BATTERY_TEMP, False, True)
+        .attr("bmsSlave1.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
+        .attr("bmsSlave1.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
+
+    EcoFlowEntityDescription(AmpSensorEntity, "bmsSlave1.amp", const.SLAVE_BATTERY_AMP, False),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bmsSlave1.vol", const.SLAVE_BATTERY_VOLT, False)
+        .attr("bmsSlave1.minCellVol", const.ATTR_MIN_CELL_VOLT, 0)
+        .attr("bmsSlave1.maxCellVol", const.ATTR_MAX_CELL_VOLT, 0),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bmsSlave1.minCellVol", const.SLAVE_MIN_CELL_VOLT, False),
+    EcoFlowEntityDescription(MilliVoltSensorEntity, "bmsSlave1.maxCellVol", const.SLAVE_MAX_CELL_VOLT, False),
+)
+
+
 class RiverPro(BaseDevice):
     def sensors(self, client: EcoflowApiClient) -> list[BaseSensorEntity]:
-        return [
-            LevelSensorEntity(client, self, "bmsMaster.soc", const.MAIN_BATTERY_LEVEL)
-                .attr("bmsMaster.designCap", const.ATTR_DESIGN_CAPACITY, 0)
-                .attr("bmsMaster.fullCap", const.ATTR_FULL_CAPACITY, 0)
-                .attr("bmsMaster.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
-            CapacitySensorEntity(client, self, "bmsMaster.designCap", const.MAIN_DESIGN_CAPACITY, False),
-            CapacitySensorEntity(client, self, "bmsMaster.fullCap", const.MAIN_FULL_CAPACITY, False),
-            CapacitySensorEntity(client, self, "bmsMaster.remainCap", const.MAIN_REMAIN_CAPACITY, False),
-
-            WattsSensorEntity(client, self, "pd.wattsInSum", const.TOTAL_IN_POWER),
-            WattsSensorEntity(client, self, "pd.wattsOutSum", const.TOTAL_OUT_POWER),
-
-            InAmpSensorEntity(client, self, "inv.dcInAmp", const.SOLAR_IN_CURRENT),
-            InVoltSensorEntity(client, self, "inv.dcInVol", const.SOLAR_IN_VOLTAGE),
-
-            InWattsSensorEntity(client, self, "inv.inputWatts", const.AC_IN_POWER),
-            OutWattsSensorEntity(client, self, "inv.outputWatts", const.AC_OUT_POWER),
-
-            InMilliVoltSensorEntity(client, self, "inv.invInVol", const.AC_IN_VOLT),
-            OutMilliVoltSensorEntity(client, self, "inv.invOutVol", const.AC_OUT_VOLT),
-
-            OutWattsSensorEntity(client, self, "pd.carWatts", const.DC_OUT_POWER),
-            OutWattsSensorEntity(client, self, "pd.typecWatts", const.TYPEC_OUT_POWER),
-            # disabled by default because they aren't terribly useful
-            TempSensorEntity(client, self, "pd.carTemp", const.DC_CAR_OUT_TEMP, False),
-            TempSensorEntity(client, self, "pd.typecTemp", const.USB_C_TEMP, False),
-
-            OutWattsSensorEntity(client, self, "pd.usb1Watts", const.USB_1_OUT_POWER),
-            OutWattsSensorEntity(client, self, "pd.usb2Watts", const.USB_2_OUT_POWER),
-            OutWattsSensorEntity(client, self, "pd.usb3Watts", const.USB_3_OUT_POWER),
-
-            RemainSensorEntity(client, self, "pd.remainTime", const.REMAINING_TIME),
-            TempSensorEntity(client, self, "bmsMaster.temp", const.BATTERY_TEMP)
-                .attr("bmsMaster.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
-                .attr("bmsMaster.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
-
-            TempSensorEntity(client, self, "bmsMaster.minCellTemp", const.MIN_CELL_TEMP, False),
-            TempSensorEntity(client, self, "bmsMaster.maxCellTemp", const.MAX_CELL_TEMP, False),
-            TempSensorEntity(client, self, "inv.inTemp", const.INV_IN_TEMP),
-            TempSensorEntity(client, self, "inv.outTemp", const.INV_OUT_TEMP),
-
-            # https://github.com/tolwi/hassio-ecoflow-cloud/discussions/87
-            InEnergySensorEntity(client, self, "pd.chgSunPower", const.SOLAR_IN_ENERGY),
-            InEnergySensorEntity(client, self, "pd.chgPowerAC", const.CHARGE_AC_ENERGY),
-            InEnergySensorEntity(client, self, "pd.chgPowerDC", const.CHARGE_DC_ENERGY),
-            OutEnergySensorEntity(client, self, "pd.dsgPowerAC", const.DISCHARGE_AC_ENERGY),
-            OutEnergySensorEntity(client, self, "pd.dsgPowerDC", const.DISCHARGE_DC_ENERGY),
-
-            AmpSensorEntity(client, self, "bmsMaster.amp", const.BATTERY_AMP, False),
-            MilliVoltSensorEntity(client, self, "bmsMaster.vol", const.BATTERY_VOLT, False)
-                .attr("bmsMaster.minCellVol", const.ATTR_MIN_CELL_VOLT, 0)
-                .attr("bmsMaster.maxCellVol", const.ATTR_MAX_CELL_VOLT, 0),
-            MilliVoltSensorEntity(client, self, "bmsMaster.minCellVol", const.MIN_CELL_VOLT, False),
-            MilliVoltSensorEntity(client, self, "bmsMaster.maxCellVol", const.MAX_CELL_VOLT, False),
-
-            CyclesSensorEntity(client, self, "bmsMaster.cycles", const.CYCLES),
-
-
-            # Optional Slave Batteries
-            LevelSensorEntity(client, self, "bmsSlave1.soc", const.SLAVE_BATTERY_LEVEL, False, True)
-                .attr("bmsSlave1.designCap", const.ATTR_DESIGN_CAPACITY, 0)
-                .attr("bmsSlave1.fullCap", const.ATTR_FULL_CAPACITY, 0)
-                .attr("bmsSlave1.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
-            CapacitySensorEntity(client, self, "bmsSlave1.designCap", const.SLAVE_DESIGN_CAPACITY, False),
-            CapacitySensorEntity(client, self, "bmsSlave1.fullCap", const.SLAVE_FULL_CAPACITY, False),
-            CapacitySensorEntity(client, self, "bmsSlave1.remainCap", const.SLAVE_REMAIN_CAPACITY, False),
-
-            CyclesSensorEntity(client, self, "bmsSlave1.cycles", const.SLAVE_CYCLES, False, True),
-            TempSensorEntity(client, self, "bmsSlave1.temp", const.SLAVE_BATTERY_TEMP, False, True)
-                .attr("bmsSlave1.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
-                .attr("bmsSlave1.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
-
-            AmpSensorEntity(client, self, "bmsSlave1.amp", const.SLAVE_BATTERY_AMP, False),
-            MilliVoltSensorEntity(client, self, "bmsSlave1.vol", const.SLAVE_BATTERY_VOLT, False)
-                .attr("bmsSlave1.minCellVol", const.ATTR_MIN_CELL_VOLT, 0)
-                .attr("bmsSlave1.maxCellVol", const.ATTR_MAX_CELL_VOLT, 0),
-            MilliVoltSensorEntity(client, self, "bmsSlave1.minCellVol", const.SLAVE_MIN_CELL_VOLT, False),
-            MilliVoltSensorEntity(client, self, "bmsSlave1.maxCellVol", const.SLAVE_MAX_CELL_VOLT, False),
-
-
-            QuotaStatusSensorEntity(client, self)
-
-        ]
+        return create_entities(client, self, RIVER_PRO_SENSORS) + [QuotaStatusSensorEntity(client, self)]
 
     def numbers(self, client: EcoflowApiClient) -> list[BaseNumberEntity]:
         return [
@@ -2,60 +2,61 @@ from homeassistant.components.switch import SwitchEntity
 
 from custom_components.ecoflow_cloud_alt.api import EcoflowApiClient
 from custom_components.ecoflow_cloud_alt.devices import const, BaseDevice
-from custom_components.ecoflow_cloud_alt.entities import BaseSensorEntity, BaseNumberEntity, BaseSelectEntity
+from custom_components.ecoflow_cloud_alt.entities import BaseSensorEntity, BaseNumberEntity, BaseSelectEntity, EcoFlowEntityDescription, create_entities
 from custom_components.ecoflow_cloud_alt.number import SetTempEntity
 from custom_components.ecoflow_cloud_alt.select import DictSelectEntity
 from custom_components.ecoflow_cloud_alt.sensor import LevelSensorEntity, RemainSensorEntity, TempSensorEntity, \
     WattsSensorEntity, MilliCelsiusSensorEntity, CapacitySensorEntity, QuotaStatusSensorEntity
 
 
-class Wave2(BaseDevice):
-    def sensors(self, client: EcoflowApiClient) -> list[BaseSensorEntity]:
-        return [
-            # Power and Battery Entities
-            LevelSensorEntity(client, self, "bms.soc", const.MAIN_BATTERY_LEVEL)
-            .attr("bms.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
-            CapacitySensorEntity(client, self, "bms.remainCap", const.MAIN_REMAIN_CAPACITY, False),
+WAVE2_SENSORS = (
+    # Power and Battery Entities
+    EcoFlowEntityDescription(LevelSensorEntity, "bms.soc", const.MAIN_BATTERY_LEVEL)
+    .attr("bms.remainCap", const.ATTR_REMAIN_CAPACITY, 0),
+    EcoFlowEntityDescription(CapacitySensorEntity, "bms.remainCap", const.MAIN_REMAIN_CAPACITY, False),
 
-            TempSensorEntity(client, self, "bms.tmp", const.BATTERY_TEMP)
-            .attr("bms.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
-            .attr("bms.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
-            TempSensorEntity(client, self, "bms.minCellTmp", const.MIN_CELL_TEMP, False),
-            TempSensorEntity(client, self, "bms.maxCellTmp", const.MAX_CELL_TEMP, False),
+    EcoFlowEntityDescription(TempSensorEntity, "bms.tmp", const.BATTERY_TEMP)
+    .attr("bms.minCellTemp", const.ATTR_MIN_CELL_TEMP, 0)
+    .attr("bms.maxCellTemp", const.ATTR_MAX_CELL_TEMP, 0),
+    EcoFlowEntityDescription(TempSensorEntity, "bms.minCellTmp", const.MIN_CELL_TEMP, False),
+    EcoFlowEntityDescription(TempSensorEntity, "bms.maxCellTmp", const.MAX_CELL_TEMP, False),
 
-            RemainSensorEntity(client, self, "pd.batChgRemain", const.CHARGE_REMAINING_TIME),
-            RemainSensorEntity(client, self, "pd.batDsgRemain", const.DISCHARGE_REMAINING_TIME),
+    EcoFlowEntityDescription(RemainSensorEntity, "pd.batChgRemain", const.CHARGE_REMAINING_TIME),
+    EcoFlowEntityDescription(RemainSensorEntity, "pd.batDsgRemain", const.DISCHARGE_REMAINING_TIME),
 
-            # heat pump
-            MilliCelsiusSensorEntity(client, self, "pd.condTemp", "Condensation temperature", False),
-            MilliCelsiusSensorEntity(client, self, "pd.heatEnv", "Return air temperature in condensation zone", False),
-            MilliCelsiusSensorEntity(client, self, "pd.coolEnv", "Air outlet temperature", False),
-            MilliCelsiusSensorEntity(client, self, "pd.evapTemp", "Evaporation temperature", False),
-            MilliCelsiusSensorEntity(client, self, "pd.motorOutTemp", "Exhaust temperature", False),
-            MilliCelsiusSensorEntity(client, self, "pd.airInTemp", "Evaporation zone return air temperature", False),
+    # heat pump
+    EcoFlowEntityDescription(MilliCelsiusSensorEntity, "pd.condTemp", "Condensation temperature", False),
+    EcoFlowEntityDescription(MilliCelsiusSensorEntity, "pd.heatEnv", "Return air temperature in condensation zone", False),
+    EcoFlowEntityDescription(MilliCelsiusSensorEntity, "pd.coolEnv", "Air outlet temperature", False),
+    EcoFlowEntityDescription(MilliCelsiusSensorEntity, "pd.evapTemp", "Evaporation temperature", False),
+    EcoFlowEntityDescription(MilliCelsiusSensorEntity, "pd.motorOutTemp", "Exhaust temperature", False),
+    EcoFlowEntityDescription(MilliCelsiusSensorEntity, "pd.airInTemp", "Evaporation zone return air temperature", False),
 
-            TempSensorEntity(client, self, "pd.coolTemp", "Air outlet temperature", False),
-            TempSensorEntity(client, self, "pd.envTemp", "Ambient temperature", False),
+    EcoFlowEntityDescription(TempSensorEntity, "pd.coolTemp", "Air outlet temperature", False),
+    EcoFlowEntityDescription(TempSensorEntity, "pd.envTemp", "Ambient temperature", False),
 
-            # power (pd)
-            WattsSensorEntity(client, self, "pd.mpptPwr", "PV input power"),
-            WattsSensorEntity(client, self, "pd.batPwrOut", "Battery output power"),
-            WattsSensorEntity(client, self, "pd.pvPower", "PV charging power"),
-            WattsSensorEntity(client, self, "pd.acPwrIn", "AC input power"),
-            WattsSensorEntity(client, self, "pd.psdrPower ", "Power supply power"),
-            WattsSensorEntity(client, self, "pd.sysPowerWatts", "System power"),
-            WattsSensorEntity(client, self, "pd.batPower ", "Battery power"),
+    # power (pd)
+    EcoFlowEntityDescription(WattsSensorEntity, "pd.mpptPwr", "PV input power"),
+    EcoFlowEntityDescription(WattsSensorEntity, "pd.batPwrOut", "Battery output power"),
+    EcoFlowEntityDescription(WattsSensorEntity, "pd.pvPower", "PV charging power"),
+    EcoFlowEntityDescription(WattsSensorEntity, "pd.acPwrIn", "AC input power"),
+    EcoFlowEntityDescription(WattsSensorEntity, "pd.psdrPower ", "Power supply power"),
+    EcoFlowEntityDescription(WattsSensorEntity, "pd.sysPowerWatts", "System power"),
+    EcoFlowEntityDescription(WattsSensorEntity, "pd.batPower ", "Battery power"),
 
-            # power (motor)
-            WattsSensorEntity(client, self, "motor.power", "Motor operating power"),
+    # power (motor)
+    EcoFlowEntityDescription(WattsSensorEntity, "motor.power", "Motor operating power"),
 
-            # power (power)
-            WattsSensorEntity(client, self, "power.batPwrOut", "Battery output power"),
-            WattsSensorEntity(client, self, "power.acPwrI", "AC input power"),
-            WattsSensorEntity(client, self, "power.mpptPwr ", "PV input power"),
+    # power (power)
+    EcoFlowEntityDescription(WattsSensorEntity, "power.batPwrOut", "Battery output power"),
+    EcoFlowEntityDescription(WattsSensorEntity, "power.acPwrI", "AC input power"),
+    EcoFlowEntityDescription(WattsSensorEntity, "power.mpptPwr ", "PV input power"),
+)
 
-            QuotaStatusSensorEntity(client, self)
-        ]
+
+class Wave2(BaseDevice):
+    def sensors(self, client: EcoflowApiClient) -> list[BaseSensorEntity]:
+        return create_entities(client, self, WAVE2_SENSORS) + [QuotaStatusSensorEntity(client, self)]
 
     def numbers(self, client: EcoflowApiClient) -> list[BaseNumberEntity]:
         return [
@@ -0,0 +1,62 @@
+import json
+import logging
+import time
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # Home Assistant ships orjson, the standalone tools may run without it
+    orjson = None
+
+
+def json_loads(raw_data: bytes) -> Any:
+    # a plain UTF-8 decode is cheaper than the encoding detection of json.loads(bytes)
+    return json.loads(raw_data.decode("utf-8") if isinstance(raw_data, (bytes, bytearray)) else raw_data)
+
+
+JSON_PARSER = "orjson" if orjson is not None else "json"
+# decode errors of both (and UnicodeDecodeError) are ValueErrors
+_loads = orjson.loads if orjson is not None else json_loads
+
+ERROR_LOG_INTERVAL_SEC = 60.0
+
+
+class JsonPayloadParser:
+    """Parses JSON MQTT payloads straight from bytes.
+
+    A failing payload is logged at most once per ERROR_LOG_INTERVAL_SEC, with the number of
+    failures that were not logged in between, so a device sending garbage cannot flood the log.
+    """
+
+    def __init__(self, name: str):
+        self.__name = name
+        self.__next_log = 0.0
+        self.__suppressed = 0
+        self.errors = 0
+
+    def parse(self, raw_data: bytes) -> Any:
+        try:
+            return _loads(raw_data)
+        except ValueError as error:
+            if isinstance(raw_data, bytes) and not raw_data.isascii():
+                # stray non-UTF-8 bytes were always dropped, keep accepting such payloads
+                try:
+                    return _loads(raw_data.decode("utf-8", errors="ignore"))
+                except ValueError:
+                    pass
+            self.__failed(error)
+            return None
+
+    def __failed(self, error: ValueError):
+        self.errors += 1
+        now = time.monotonic()
+        if now < self.__next_log:
+            self.__suppressed += 1
+            return
+        suppressed = f" ({self.__suppressed} more since the last report)" if self.__suppressed else ""
+        _LOGGER.error(f"{self.__name}: invalid JSON payload: {error}{suppressed}. "
+                      f"Ignoring message and waiting for the next one.")
+        self.__next_log = now + ERROR_LOG_INTERVAL_SEC
+        self.__suppressed = 0
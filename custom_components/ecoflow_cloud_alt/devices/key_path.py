@@ -0,0 +1,57 @@
+from typing import Any
+
+MISSING = object()
+
+
+class KeyPath:
+    """Compiled read/write access to params by an entity key.
+
+    Devices with flat JSON address params by quoted keys ('pd.soc'), which are plain dict
+    lookups. Anything else is a real jsonpath and goes through jsonpath_ng, which is only
+    imported and parsed the first time such a path is used.
+    """
+    __slots__ = ("path", "key", "__expr")
+
+    def __init__(self, path: str):
+        self.path = path
+        self.key = _flat_key(path)
+        self.__expr = None
+
+    def get(self, data: dict[str, Any], default: Any = MISSING) -> Any:
+        """The single value at the path, default when there is none (or more than one)."""
+        if self.key is not None:
+            return data.get(self.key, default)
+        values = self.__compiled().find(data)
+        return values[0].value if len(values) == 1 else default
+
+    def set(self, data: dict[str, Any], value: Any):
+        """Replaces the value at the path; like a jsonpath update, missing keys are not created."""
+        if self.key is not None:
+            if self.key in data:
+                data[self.key] = value
+        else:
+            self.__compiled().update(data, value)
+
+    def __compiled(self):
+        if self.__expr is None:
+            import jsonpath_ng.ext as jp
+            self.__expr = jp.parse(self.path)
+        return self.__expr
+
+
+def _flat_key(path: str) -> str | None:
+    # 'key' is a single field of that name, whatever characters it has ('a','b' and escapes are not)
+    if len(path) >= 2 and path[0] == path[-1] == "'" and "'" not in path[1:-1] and "\\" not in path:
+        return path[1:-1]
+    return None
+
+
+_KEY_PATHS: dict[str, KeyPath] = {}
+
+
+def key_path(path: str) -> KeyPath:
+    """The shared compiled KeyPath of a key string."""
+    compiled = _KEY_PATHS.get(path)
+    if compiled is None:
+        compiled = _KEY_PATHS[path] = KeyPath(path)
+    return compiled
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: alternator.proto
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10\x61lternator.proto\x12\nalternator\"\xb3\x06\n\x13\x41lternatorHeartbeat\x12\x14\n\x07status1\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x11\n\x04temp\x18\x66 \x01(\x05H\x01\x88\x01\x01\x12\x1c\n\x0f\x61lternatorPower\x18i \x01(\x02H\x02\x88\x01\x01\x12\x1a\n\x0cswitchOFF130\x18\x82\x01 \x01(\x05H\x03\x88\x01\x01\x12\x1a\n\x0cstartVoltage\x18\x8a\x01 \x01(\x05H\x04\x88\x01\x01\x12\x18\n\ncarBatVolt\x18\x8b\x01 \x01(\x02H\x05\x88\x01\x01\x12\x14\n\x06\x62\x61tSoc\x18\x86\x02 \x01(\x02H\x06\x88\x01\x01\x12\x1d\n\x0f\x63hargeToFull268\x18\x8c\x02 \x01(\x05H\x07\x88\x01\x01\x12\x18\n\nunknown269\x18\x8d\x02 \x01(\x05H\x08\x88\x01\x01\x12\x1a\n\x0cstationPower\x18\xa9\x03 \x01(\x02H\t\x88\x01\x01\x12\x18\n\nunknown427\x18\xab\x03 \x01(\x05H\n\x88\x01\x01\x12\x18\n\nunknown428\x18\xac\x03 \x01(\x05H\x0b\x88\x01\x01\x12\x1b\n\roperationMode\x18\xc5\x04 \x01(\x05H\x0c\x88\x01\x01\x12\x17\n\tstartStop\x18\xd5\x04 \x01(\x05H\r\x88\x01\x01\x12\x1c\n\x0epermanentWatts\x18\xd6\x04 \x01(\x02H\x0e\x88\x01\x01\x12\x16\n\x08wifiRssi\x18\xda\x04 \x01(\x02H\x0f\x88\x01\x01\x12\x18\n\nratedPower\x18\xdb\x04 \x01(\x02H\x10\x88\x01\x01\x12\x1c\n\x0e\x63\x61\x62leLength608\x18\xe0\x04 \x01(\x02H\x11\x88\x01\x01\x12\x18\n\nunknown609\x18\xe1\x04 \x01(\x02H\x12\x88\x01\x01\x42\n\n\x08_status1B\x07\n\x05_tempB\x12\n\x10_alternatorPowerB\x0f\n\r_switchOFF130B\x0f\n\r_startVoltageB\r\n\x0b_carBatVoltB\t\n\x07_batSocB\x12\n\x10_chargeToFull268B\r\n\x0b_unknown269B\x0f\n\r_stationPowerB\r\n\x0b_unknown427B\r\n\x0b_unknown428B\x10\n\x0e_operationModeB\x0c\n\n_startStopB\x11\n\x0f_permanentWattsB\x0b\n\t_wifiRssiB\r\n\x0b_ratedPowerB\x11\n\x0f_cableLength608B\r\n\x0b_unknown609\"\x9d\x02\n\rAlternatorSet\x12\x19\n\x0cswitchOFF130\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x1a\n\roperationMode\x18t \x01(\x05H\x01\x88\x01\x01\x12\x16\n\tstartStop\x18z \x01(\x05H\x02\x88\x01\x01\x12\x1b\n\x0epermanentWatts\x18{ \x01(\x02H\x03\x88\x01\x01\x12\x1a\n\x0cstartVoltage\x18\x89\x01 \x01(\x05H\x04\x88\x01\x01\x12\x1c\n\x0e\x63\x61\x62leLength608\x18\xcb\x01 \x01(\x02H\x05\x88\x01\x01\x42\x0f\n\r_switchOFF130B\x10\n\x0e_operationModeB\x0c\n\n_startStopB\x11\n\x0f_permanentWattsB\x0f\n\r_startVoltageB\x11\n\x0f_cableLength608\"\xcd\x03\n\tSetHeader\x12-\n\x05pdata\x18\x01 \x01(\x0b\x32\x19.alternator.AlternatorSetH\x00\x88\x01\x01\x12\x0b\n\x03src\x18\x02 \x01(\x05\x12\x0c\n\x04\x64\x65st\x18\x03 \x01(\x05\x12\r\n\x05\x64_src\x18\x04 \x01(\x05\x12\x0e\n\x06\x64_dest\x18\x05 \x01(\x05\x12\x10\n\x08\x65nc_type\x18\x06 \x01(\x05\x12\x12\n\ncheck_type\x18\x07 \x01(\x05\x12\x10\n\x08\x63md_func\x18\x08 \x01(\x05\x12\x0e\n\x06\x63md_id\x18\t \x01(\x05\x12\x10\n\x08\x64\x61ta_len\x18\n \x01(\x05\x12\x10\n\x08need_ack\x18\x0b \x01(\x05\x12\x0e\n\x06is_ack\x18\x0c \x01(\x05\x12\x0b\n\x03seq\x18\x0e \x01(\x05\x12\x12\n\nproduct_id\x18\x0f \x01(\x05\x12\x0f\n\x07version\x18\x10 \x01(\x05\x12\x13\n\x0bpayload_ver\x18\x11 \x01(\x05\x12\x11\n\ttime_snap\x18\x12 \x01(\x05\x12\x11\n\tis_rw_cmd\x18\x13 \x01(\x05\x12\x10\n\x08is_queue\x18\x14 \x01(\x05\x12\x10\n\x08\x61\x63k_type\x18\x15 \x01(\x05\x12\x0c\n\x04\x63ode\x18\x16 \x01(\t\x12\x0c\n\x04\x66rom\x18\x17 \x01(\t\x12\x11\n\tmodule_sn\x18\x18 \x01(\t\x12\x11\n\tdevice_sn\x18\x19 \x01(\tB\x08\n\x06_pdata\"3\n\nSetMessage\x12%\n\x06header\x18\x01 \x01(\x0b\x32\x15.alternator.SetHeader\"\xbe\x02\n\x0fHeartbeatHeader\x12.\n\x05pdata\x18\x01 \x01(\x0b\x32\x1f.alternator.AlternatorHeartbeat\x12\x0b\n\x03src\x18\x02 \x01(\x05\x12\x0c\n\x04\x64\x65st\x18\x03 \x01(\x05\x12\r\n\x05\x64_src\x18\x04 \x01(\x05\x12\x0e\n\x06\x64_dest\x18\x05 \x01(\x05\x12\x10\n\x08\x65nc_type\x18\x06 \x01(\x05\x12\x12\n\ncheck_type\x18\x07 \x01(\x05\x12\x10\n\x08\x63md_func\x18\x08 \x01(\x05\x12\x0e\n\x06\x63md_id\x18\t \x01(\x05\x12\x10\n\x08\x64\x61ta_len\x18\n \x01(\x05\x12\x10\n\x08need_ack\x18\x0b \x01(\x05\x12\x0e\n\x06is_ack\x18\x0c \x01(\x05\x12\x0b\n\x03seq\x18\x0e \x01(\x05\x12\x12\n\nproduct_id\x18\x0f \x01(\x05\x12\x0f\n\x07version\x18\x10 \x01(\x05\x12\x13\n\x0bpayload_ver\x18\x11 \x01(\x05\"?\n\x10HeartbeatMessage\x12+\n\x06header\x18\x01 \x01(\x0b\x32\x1b.alternator.HeartbeatHeaderb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'alternator_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _globals['_ALTERNATORHEARTBEAT']._serialized_start=33
+  _globals['_ALTERNATORHEARTBEAT']._serialized_end=852
+  _globals['_ALTERNATORSET']._serialized_start=855
+  _globals['_ALTERNATORSET']._serialized_end=1140
+  _globals['_SETHEADER']._serialized_start=1143
+  _globals['_SETHEADER']._serialized_end=1604
+  _globals['_SETMESSAGE']._serialized_start=1606
+  _globals['_SETMESSAGE']._serialized_end=1657
+  _globals['_HEARTBEATHEADER']._serialized_start=1660
+  _globals['_HEARTBEATHEADER']._serialized_end=1978
+  _globals['_HEARTBEATMESSAGE']._serialized_start=1980
+  _globals['_HEARTBEATMESSAGE']._serialized_end=2043
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,312 @@
+"""Schema-driven decoding of EcoFlow binary (protobuf) device messages.
+
+Every binary device family wraps its payloads in the same envelope: an outer message whose
+field 1 holds one or more headers (ecopacket.Header, alternator.HeartbeatHeader, ...), each
+with the device payload (pdata) and its cmd_func/cmd_id, encryption type and sequence number.
+EcoPacketDecoder walks that envelope once, decrypts pdata where needed and decodes it through
+a per-device table of (cmd_func, cmd_id) -> ProtoMessage into a flat params dict. Reports that
+do not map to params (energy totals, event records, ...) can be returned as parsed messages.
+"""
+import dataclasses
+import logging
+import struct
+import threading
+from typing import Any, Callable, Iterator, NamedTuple
+
+from google.protobuf.descriptor import FieldDescriptor
+from google.protobuf.message import DecodeError, Message
+
+_LOGGER = logging.getLogger(__name__)
+
+WIRE_VARINT = 0
+WIRE_FIXED64 = 1
+WIRE_LEN = 2
+WIRE_FIXED32 = 5
+
+# header field numbers, the same in every EcoFlow header message
+_ENVELOPE_HEADER_TAG = (1 << 3) | WIRE_LEN
+_HEADER_PDATA_TAG = (1 << 3) | WIRE_LEN
+_HEADER_SRC_TAG = (2 << 3) | WIRE_VARINT
+_HEADER_ENC_TYPE_TAG = (6 << 3) | WIRE_VARINT
+_HEADER_CMD_FUNC_TAG = (8 << 3) | WIRE_VARINT
+_HEADER_CMD_ID_TAG = (9 << 3) | WIRE_VARINT
+_HEADER_SEQ_TAG = (14 << 3) | WIRE_VARINT
+
+_FLOAT = struct.Struct("<f")
+_DOUBLE = struct.Struct("<d")
+_XOR_TABLES = [bytes(b ^ key for b in range(256)) for key in range(256)]
+
+# field kinds of the wire tables
+_KIND_UNSIGNED = 0
+_KIND_SIGNED = 1
+_KIND_ZIGZAG = 2
+_KIND_FLOAT = 3
+_KIND_DOUBLE = 4
+
+_VARINT_KINDS = {
+    FieldDescriptor.TYPE_INT32: _KIND_SIGNED,
+    FieldDescriptor.TYPE_INT64: _KIND_SIGNED,
+    FieldDescriptor.TYPE_UINT32: _KIND_UNSIGNED,
+    FieldDescriptor.TYPE_UINT64: _KIND_UNSIGNED,
+    FieldDescriptor.TYPE_BOOL: _KIND_UNSIGNED,
+    FieldDescriptor.TYPE_ENUM: _KIND_SIGNED,
+    FieldDescriptor.TYPE_SINT32: _KIND_ZIGZAG,
+    FieldDescriptor.TYPE_SINT64: _KIND_ZIGZAG,
+}
+
+
+class EcoFrame(NamedTuple):
+    cmd_func: int | None
+    cmd_id: int | None
+    seq: int | None
+    src: int | None
+    pdata: memoryview
+
+
+def read_varint(buf: memoryview, pos: int) -> tuple[int, int]:
+    b = buf[pos]
+    if b < 0x80:
+        return b, pos + 1
+    value = b & 0x7F
+    shift = 7
+    while True:
+        pos += 1
+        b = buf[pos]
+        value |= (b & 0x7F) << shift
+        if b < 0x80:
+            return value, pos + 1
+        shift += 7
+
+
+def skip_field(buf: memoryview, pos: int, wire_type: int) -> int:
+    if wire_type == WIRE_VARINT:
+        while buf[pos] & 0x80:
+            pos += 1
+        return pos + 1
+    if wire_type == WIRE_FIXED32:
+        return pos + 4
+    if wire_type == WIRE_FIXED64:
+        return pos + 8
+    if wire_type == WIRE_LEN:
+        (length, pos) = read_varint(buf, pos)
+        return pos + length
+    raise ValueError(f"unsupported wire type {wire_type}")
+
+
+def _is_repeated(field: FieldDescriptor) -> bool:
+    # FieldDescriptor.label is gone in newer protobuf releases, is_repeated is not in older ones
+    is_repeated = getattr(field, "is_repeated", None)
+    return is_repeated if is_repeated is not None else field.label == FieldDescriptor.LABEL_REPEATED
+
+
+def xor_when_flagged(enc_type: int | None, seq: int | None, src: int | None) -> bool:
+    """pdata is XOR-ed with the low byte of seq when the header says so (enc_type 1)."""
+    return enc_type == 1
+
+
+def never_xored(enc_type: int | None, seq: int | None, src: int | None) -> bool:
+    """pdata is parsed as sent, whatever the header says."""
+    return False
+
+
+@dataclasses.dataclass
+class ProtoMessage:
+    """How the pdata of one (cmd_func, cmd_id) becomes params.
+
+    By default pdata is parsed with the generated message class and the present fields are
+    copied by name. With wire=True, scalar fields are read straight from the wire through a
+    table derived from the descriptor; use it when devices send wire types that differ from
+    the schema (list them in varint_on_wire).
+    """
+    message: type[Message]
+    divisors: dict[str, float] = dataclasses.field(default_factory=dict)
+    negated: frozenset[str] = frozenset()
+    wire: bool = False
+    varint_on_wire: frozenset[str] = frozenset()
+
+    def __post_init__(self):
+        self.__scaled = {name: (-1.0 if name in self.negated else 1.0, self.divisors.get(name, 1.0))
+                         for name in set(self.divisors) | set(self.negated)}
+        self.__local = threading.local()
+        fields = self.message.DESCRIPTOR.fields
+        self.__repeated = frozenset(field.name for field in fields if _is_repeated(field))
+        self.__nested = frozenset(field.name for field in fields if field.type == FieldDescriptor.TYPE_MESSAGE)
+        self.__flat = not self.__repeated and not self.__nested
+        self.__fields = self.__build_wire_fields() if self.wire else {}
+
+    def decode(self, pdata: memoryview, params: dict[str, Any]):
+        if self.wire:
+            self.__decode_wire(pdata, params)
+            return
+
+        # one parsed message per thread, reused for every frame
+        message = getattr(self.__local, "message", None)
+        if message is None:
+            message = self.__local.message = self.message()
+        message.ParseFromString(pdata)
+        if self.__flat:
+            for (field, value) in message.ListFields():
+                params[field.name] = value
+        else:
+            for (field, value) in message.ListFields():
+                name = field.name
+                if name in self.__nested:
+                    continue
+                params[name] = list(value) if name in self.__repeated else value
+        for (name, (sign, divisor)) in self.__scaled.items():
+            if name in params:
+                params[name] = params[name] * sign / divisor
+
+    def __build_wire_fields(self) -> dict[int, tuple[str, int, tuple[float, float] | None]]:
+        """Scalar fields by tag: key, kind and (sign, divisor); None keeps the value as it is."""
+        fields: dict[int, tuple[str, int, tuple[float, float] | None]] = {}
+        for field in self.message.DESCRIPTOR.fields:
+            if field.name in self.__repeated:
+                continue
+            factor = self.__scaled.get(field.name)
+            if field.type in (FieldDescriptor.TYPE_FLOAT, FieldDescriptor.TYPE_DOUBLE):
+                kind = _KIND_FLOAT if field.type == FieldDescriptor.TYPE_FLOAT else _KIND_DOUBLE
+                wire_type = WIRE_FIXED32 if kind == _KIND_FLOAT else WIRE_FIXED64
+                fields[(field.number << 3) | wire_type] = (field.name, kind, factor)
+                if field.name in self.varint_on_wire:
+                    fields[(field.number << 3) | WIRE_VARINT] = (field.name, _KIND_SIGNED, factor)
+            elif field.type in _VARINT_KINDS:
+                fields[(field.number << 3) | WIRE_VARINT] = (field.name, _VARINT_KINDS[field.type], factor)
+        return fields
+
+    def __decode_wire(self, buf: memoryview, params: dict[str, Any]):
+        fields = self.__fields
+        end = len(buf)
+        pos = 0
+        while pos < end:
+            # almost all tags fit in one or two bytes
+            b = buf[pos]
+            if b < 0x80:
+                tag = b
+                pos += 1
+            elif buf[pos + 1] < 0x80:
+                tag = (b & 0x7F) | (buf[pos + 1] << 7)
+                pos += 2
+            else:
+                (tag, pos) = read_varint(buf, pos)
+            field = fields.get(tag)
+            if field is None:
+                pos = skip_field(buf, pos, tag & 0x7)
+                continue
+
+            (name, kind, factor) = field
+            if kind == _KIND_FLOAT:
+                if pos + 4 > end:
+                    break
+                value = _FLOAT.unpack_from(buf, pos)[0]
+                pos += 4
+            elif kind == _KIND_DOUBLE:
+                if pos + 8 > end:
+                    break
+                value = _DOUBLE.unpack_from(buf, pos)[0]
+                pos += 8
+            else:
+                b = buf[pos]
+                if b < 0x80:
+                    value = b
+                    pos += 1
+                else:
+                    (value, pos) = read_varint(buf, pos)
+                    if kind == _KIND_SIGNED and value >= 1 << 63:
+                        value -= 1 << 64
+                if kind == _KIND_ZIGZAG:
+                    value = (value >> 1) ^ -(value & 1)
+            params[name] = value if factor is None else value * factor[0] / factor[1]
+
+
+class EcoPacketDecoder:
+    """Decodes EcoFlow envelopes through a (cmd_func, cmd_id) -> ProtoMessage table.
+
+    Frames without a table entry use default (if given) or are skipped. Frames listed in
+    records are parsed into new instances of their message class and handed back as
+    (cmd_func, cmd_id, message). One decoder can serve all devices of a family, from any number
+    of threads.
+    """
+
+    def __init__(self, messages: dict[tuple[int, int], ProtoMessage], default: ProtoMessage | None = None,
+                 encrypted: Callable[[int | None, int | None, int | None], bool] = xor_when_flagged,
+                 records: dict[tuple[int, int], type[Message]] | None = None):
+        self.__messages = messages
+        self.__default = default
+        self.__encrypted = encrypted
+        self.__records = records or {}
+
+    def frames(self, data: bytes, seq: int | None = None) -> Iterator[EcoFrame]:
+        """Yields every header of the envelope with decrypted pdata, without copying
+        unencrypted payloads. seq overrides the sequence number of the headers."""
+        buf = memoryview(data)
+        end = len(buf)
+        pos = 0
+        while pos < end:
+            (tag, pos) = read_varint(buf, pos)
+            if tag != _ENVELOPE_HEADER_TAG:
+                pos = skip_field(buf, pos, tag & 0x7)
+                continue
+            (length, pos) = read_varint(buf, pos)
+            frame = self.__header(buf[pos:pos + length], seq)
+            pos += length
+            if frame is not None:
+                yield frame
+
+    def decode(self, data: bytes, params: dict[str, Any] | None = None, seq: int | None = None,
+               records: list[tuple[int, int, Message]] | None = None) -> dict[str, Any]:
+        """Flat params of all frames with a known (cmd_func, cmd_id), record frames are appended
+        to records when it is given. A garbled tail is dropped, whatever was decoded before it
+        is kept."""
+        params = {} if params is None else params
+        try:
+            for frame in self.frames(data, seq):
+                key = (frame.cmd_func, frame.cmd_id)
+                record = self.__records.get(key)
+                if record is not None:
+                    if records is not None:
+                        parsed = record()
+                        parsed.ParseFromString(frame.pdata)
+                        records.append((frame.cmd_func, frame.cmd_id, parsed))
+                    continue
+                message = self.__messages.get(key, self.__default)
+                if message is not None:
+                    message.decode(frame.pdata, params)
+                else:
+                    _LOGGER.debug(f"No message for cmd_func {frame.cmd_func} cmd_id {frame.cmd_id}")
+        except (IndexError, ValueError, struct.error, DecodeError) as error:
+            _LOGGER.debug(f"Stopped decoding at a garbled frame: {error}")
+        return params
+
+    def __header(self, buf: memoryview, seq: int | None) -> EcoFrame | None:
+        pdata = None
+        varints: dict[int, int] = {}
+        end = len(buf)
+        pos = 0
+        while pos < end:
+            # header tags and most of their values are single-byte varints
+            tag = buf[pos]
+            pos += 1
+            if tag >= 0x80:
+                (tag, pos) = read_varint(buf, pos - 1)
+            if tag & 0x7 == WIRE_VARINT:
+                value = buf[pos]
+                pos += 1
+                if value >= 0x80:
+                    (value, pos) = read_varint(buf, pos - 1)
+                varints[tag] = value
+            elif tag == _HEADER_PDATA_TAG:
+                (length, pos) = read_varint(buf, pos)
+                pdata = buf[pos:pos + length]
+                pos += length
+            else:
+                pos = skip_field(buf, pos, tag & 0x7)
+
+        if pdata is None:
+            return None
+        header_seq = varints.get(_HEADER_SEQ_TAG)
+        src = varints.get(_HEADER_SRC_TAG)
+        key = seq if seq is not None else header_seq
+        if key is not None and key & 0xFF and self.__encrypted(varints.get(_HEADER_ENC_TYPE_TAG), key, src):
+            pdata = memoryview(bytes(pdata).translate(_XOR_TABLES[key & 0xFF]))
+        return EcoFrame(varints.get(_HEADER_CMD_FUNC_TAG), varints.get(_HEADER_CMD_ID_TAG), header_seq, src, pdata)
@@ -2,21 +2,16 @@ from homeassistant.components.number import NumberEntity
 from homeassistant.components.select import SelectEntity
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.components.switch import SwitchEntity
-from .data_bridge import to_plain
+from ..data_bridge import to_plain
 
 from custom_components.ecoflow_cloud_alt import EcoflowApiClient
-from custom_components.ecoflow_cloud_alt.devices import BaseDevice, const
-from custom_components.ecoflow_cloud_alt.sensor import (
-    LevelSensorEntity,
-    TempSensorEntity,
-    InWattsSensorEntity,
-    VoltSensorEntity,
-    RemainSensorEntity,
-    StatusSensorEntity
-)
+from custom_components.ecoflow_cloud_alt.devices import BaseDevice
+from custom_components.ecoflow_cloud_alt.entities import create_entities
+from custom_components.ecoflow_cloud_alt.sensor import StatusSensorEntity
 from custom_components.ecoflow_cloud_alt.switch import EnabledEntity
 from custom_components.ecoflow_cloud_alt.number import MaxBatteryLevelEntity, MinBatteryLevelEntity
 from custom_components.ecoflow_cloud_alt.select import DictSelectEntity
+from ..internal.alternator_charger import ALTERNATOR_CHARGER_SENSORS
 
 
 class AlternatorCharger(BaseDevice):
@@ -27,27 +22,7 @@ class AlternatorCharger(BaseDevice):
     """
 
     def sensors(self, client: EcoflowApiClient) -> list[SensorEntity]:
-        return [
-            # Battery
-            LevelSensorEntity(client, self, "batSoc", const.MAIN_BATTERY_LEVEL),
-            
-            # Temperature
-            TempSensorEntity(client, self, "temp", const.BATTERY_TEMP),
-            
-            # Power
-            InWattsSensorEntity(client, self, "alternatorPower", "Alternator Power"),
-            InWattsSensorEntity(client, self, "stationPower", "Station Power"),
-            InWattsSensorEntity(client, self, "ratedPower", "Rated Power", False),
-            
-            # Voltage
-            VoltSensorEntity(client, self, "carBatVolt", "Car Battery Voltage"),
-            
-            # Time
-            RemainSensorEntity(client, self, "chargeToFull268", "Charging Time", False),
-            
-            # Status
-            StatusSensorEntity(client, self)
-        ]
+        return create_entities(client, self, ALTERNATOR_CHARGER_SENSORS) + [StatusSensorEntity(client, self)]
 
     def numbers(self, client: EcoflowApiClient) -> list[NumberEntity]:
         return [
@@ -143,7 +118,9 @@ class AlternatorCharger(BaseDevice):
             )
         ]
 
-    def _prepare_data(self, raw_data) -> dict[str, any]:
+    def _prepare_data(self, raw_data) -> dict[str, any] | None:
         res = super()._prepare_data(raw_data)
-        res = to_plain(res)
+        if res is None:
+            return None
+        res = to_plain(res, self.data.keys)
         return res
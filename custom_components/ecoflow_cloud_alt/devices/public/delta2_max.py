@@ -1,4 +1,4 @@
-from .data_bridge import to_plain
+from ..data_bridge import to_plain
 from ..internal.delta2_max import Delta2Max as InternalDelta2Max
 from ...api import EcoflowApiClient
 from ...sensor import StatusSensorEntity
@@ -6,9 +6,11 @@ from ...sensor import StatusSensorEntity
 
 class Delta2Max(InternalDelta2Max):
 
-    def _prepare_data(self, raw_data) -> dict[str, any]:
+    def _prepare_data(self, raw_data) -> dict[str, any] | None:
         res = super()._prepare_data(raw_data)
-        res = to_plain(res)
+        if res is None:
+            return None
+        res = to_plain(res, self.data.keys)
         return res
 
     def _status_sensor(self, client: EcoflowApiClient) -> StatusSensorEntity:
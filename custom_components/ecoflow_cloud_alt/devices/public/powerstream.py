@@ -1,7 +1,7 @@
-from .data_bridge import to_plain
+from ..data_bridge import to_plain
 from .. import BaseDevice, const
 from ...api import EcoflowApiClient
-from ...entities import BaseSensorEntity, BaseNumberEntity, BaseSwitchEntity, BaseSelectEntity
+from ...entities import BaseSensorEntity, BaseNumberEntity, BaseSwitchEntity, BaseSelectEntity, EcoFlowEntityDescription, create_entities
 from ...number import MinBatteryLevelEntity, MaxBatteryLevelEntity, BrightnessLevelEntity, DeciChargingPowerEntity
 from ...select import PowerDictSelectEntity
 from ...sensor import StatusSensorEntity, InWattsSolarSensorEntity, DecivoltSensorEntity, CentivoltSensorEntity, \
@@ -9,78 +9,79 @@ from ...sensor import StatusSensorEntity, InWattsSolarSensorEntity, DecivoltSens
     AmpSensorEntity, RemainSensorEntity, DecihertzSensorEntity
 
 
+POWERSTREAM_SENSORS = (
+    EcoFlowEntityDescription(CelsiusSensorEntity, "20_1.espTempsensor", "ESP Temperature"),
+
+    EcoFlowEntityDescription(InWattsSolarSensorEntity, "20_1.pv1InputWatts", "Solar 1 Watts"),
+    EcoFlowEntityDescription(DecivoltSensorEntity, "20_1.pv1InputVolt", "Solar 1 Input Potential"),
+    EcoFlowEntityDescription(CentivoltSensorEntity, "20_1.pv1OpVolt", "Solar 1 Op Potential"),
+    EcoFlowEntityDescription(DeciampSensorEntity, "20_1.pv1InputCur", "Solar 1 Current"),
+    EcoFlowEntityDescription(DecicelsiusSensorEntity, "20_1.pv1Temp", "Solar 1 Temperature"),
+    EcoFlowEntityDescription(MiscSensorEntity, "20_1.pv1RelayStatus", "Solar 1 Relay Status"),
+    EcoFlowEntityDescription(MiscSensorEntity, "20_1.pv1ErrCode", "Solar 1 Error Code", False),
+    EcoFlowEntityDescription(MiscSensorEntity, "20_1.pv1WarnCode", "Solar 1 Warning Code", False),
+    EcoFlowEntityDescription(MiscSensorEntity, "20_1.pv1Statue", "Solar 1 Status", False),
+
+    EcoFlowEntityDescription(InWattsSolarSensorEntity, "20_1.pv2InputWatts", "Solar 2 Watts"),
+    EcoFlowEntityDescription(DecivoltSensorEntity, "20_1.pv2InputVolt", "Solar 2 Input Potential"),
+    EcoFlowEntityDescription(CentivoltSensorEntity, "20_1.pv2OpVolt", "Solar 2 Op Potential"),
+    EcoFlowEntityDescription(DeciampSensorEntity, "20_1.pv2InputCur", "Solar 2 Current"),
+    EcoFlowEntityDescription(DecicelsiusSensorEntity, "20_1.pv2Temp", "Solar 2 Temperature"),
+    EcoFlowEntityDescription(MiscSensorEntity, "20_1.pv2RelayStatus", "Solar 2 Relay Status"),
+    EcoFlowEntityDescription(MiscSensorEntity, "20_1.pv2ErrCode", "Solar 2 Error Code", False),
+    EcoFlowEntityDescription(MiscSensorEntity, "20_1.pv2WarningCode", "Solar 2 Warning Code", False),
+    EcoFlowEntityDescription(MiscSensorEntity, "20_1.pv2Statue", "Solar 2 Status", False),
+
+    EcoFlowEntityDescription(MiscSensorEntity, "20_1.bpType", "Battery Type", False),
+    EcoFlowEntityDescription(LevelSensorEntity, "20_1.batSoc", "Battery Charge"),
+    EcoFlowEntityDescription(DeciwattsSensorEntity, "20_1.batInputWatts", "Battery Input Watts"),
+    EcoFlowEntityDescription(DecivoltSensorEntity, "20_1.batInputVolt", "Battery Input Potential"),
+    EcoFlowEntityDescription(DecivoltSensorEntity, "20_1.batOpVolt", "Battery Op Potential"),
+    EcoFlowEntityDescription(AmpSensorEntity, "20_1.batInputCur", "Battery Input Current"),
+    EcoFlowEntityDescription(DecicelsiusSensorEntity, "20_1.batTemp", "Battery Temperature"),
+    EcoFlowEntityDescription(RemainSensorEntity, "20_1.chgRemainTime", "Charge Time"),
+    EcoFlowEntityDescription(RemainSensorEntity, "20_1.dsgRemainTime", "Discharge Time"),
+    EcoFlowEntityDescription(MiscSensorEntity, "20_1.batErrCode", "Battery Error Code", False),
+    EcoFlowEntityDescription(MiscSensorEntity, "20_1.batWarningCode", "Battery Warning Code", False),
+    EcoFlowEntityDescription(MiscSensorEntity, "20_1.batStatue", "Battery Status", False),
+
+    EcoFlowEntityDescription(DecivoltSensorEntity, "20_1.llcInputVolt", "LLC Input Potential", False),
+    EcoFlowEntityDescription(DecivoltSensorEntity, "20_1.llcOpVolt", "LLC Op Potential", False),
+    EcoFlowEntityDescription(DecicelsiusSensorEntity, "20_1.llcTemp", "LLC Temperature"),
+    EcoFlowEntityDescription(MiscSensorEntity, "20_1.llcErrCode", "LLC Error Code", False),
+    EcoFlowEntityDescription(MiscSensorEntity, "20_1.llcWarningCode", "LLC Warning Code", False),
+    EcoFlowEntityDescription(MiscSensorEntity, "20_1.llcStatue", "LLC Status", False),
+
+    EcoFlowEntityDescription(MiscSensorEntity, "20_1.invOnOff", "Inverter On/Off Status"),
+    EcoFlowEntityDescription(DeciwattsSensorEntity, "20_1.invOutputWatts", "Inverter Output Watts"),
+    EcoFlowEntityDescription(DecivoltSensorEntity, "20_1.invInputVolt", "Inverter Output Potential", False),
+    EcoFlowEntityDescription(DecivoltSensorEntity, "20_1.invOpVolt", "Inverter Op Potential"),
+    EcoFlowEntityDescription(AmpSensorEntity, "20_1.invOutputCur", "Inverter Output Current"),
+    #  EcoFlowEntityDescription(AmpSensorEntity, "inv_dc_cur", "Inverter DC Current"),
+    EcoFlowEntityDescription(DecihertzSensorEntity, "20_1.invFreq", "Inverter Frequency"),
+    EcoFlowEntityDescription(DecicelsiusSensorEntity, "20_1.invTemp", "Inverter Temperature"),
+    EcoFlowEntityDescription(MiscSensorEntity, "20_1.invRelayStatus", "Inverter Relay Status"),
+    EcoFlowEntityDescription(MiscSensorEntity, "20_1.invErrCode", "Inverter Error Code", False),
+    EcoFlowEntityDescription(MiscSensorEntity, "20_1.invWarnCode", "Inverter Warning Code", False),
+    EcoFlowEntityDescription(MiscSensorEntity, "20_1.invStatue", "Inverter Status", False),
+
+    EcoFlowEntityDescription(DeciwattsSensorEntity, "20_1.permanentWatts", "Other Loads"),
+    EcoFlowEntityDescription(DeciwattsSensorEntity, "20_1.dynamicWatts", "Smart Plug Loads"),
+    EcoFlowEntityDescription(DeciwattsSensorEntity, "20_1.ratedPower", "Rated Power"),
+
+    EcoFlowEntityDescription(MiscSensorEntity, "20_1.lowerLimit", "Lower Battery Limit", False),
+    EcoFlowEntityDescription(MiscSensorEntity, "20_1.upperLimit", "Upper Battery Limit", False),
+    EcoFlowEntityDescription(MiscSensorEntity, "20_1.wirelessErrCode", "Wireless Error Code", False),
+    EcoFlowEntityDescription(MiscSensorEntity, "20_1.wirelessWarnCode", "Wireless Warning Code", False),
+    EcoFlowEntityDescription(MiscSensorEntity, "20_1.invBrightness", "LED Brightness", False),
+    EcoFlowEntityDescription(MiscSensorEntity, "20_1.heartbeatFrequency", "Heartbeat Frequency", False),
+)
+
+
 class PowerStream(BaseDevice):
 
     def sensors(self, client: EcoflowApiClient) -> list[BaseSensorEntity]:
-        return [
-            CelsiusSensorEntity(client, self, "20_1.espTempsensor", "ESP Temperature"),
-            
-            InWattsSolarSensorEntity(client, self, "20_1.pv1InputWatts", "Solar 1 Watts"),
-            DecivoltSensorEntity(client, self, "20_1.pv1InputVolt", "Solar 1 Input Potential"),
-            CentivoltSensorEntity(client, self, "20_1.pv1OpVolt", "Solar 1 Op Potential"),
-            DeciampSensorEntity(client, self, "20_1.pv1InputCur", "Solar 1 Current"),
-            DecicelsiusSensorEntity(client, self, "20_1.pv1Temp", "Solar 1 Temperature"),
-            MiscSensorEntity(client, self, "20_1.pv1RelayStatus", "Solar 1 Relay Status"),
-            MiscSensorEntity(client, self, "20_1.pv1ErrCode", "Solar 1 Error Code", False),
-            MiscSensorEntity(client, self, "20_1.pv1WarnCode", "Solar 1 Warning Code", False),
-            MiscSensorEntity(client, self, "20_1.pv1Statue", "Solar 1 Status", False),
-
-            InWattsSolarSensorEntity(client, self, "20_1.pv2InputWatts", "Solar 2 Watts"),
-            DecivoltSensorEntity(client, self, "20_1.pv2InputVolt", "Solar 2 Input Potential"),
-            CentivoltSensorEntity(client, self, "20_1.pv2OpVolt", "Solar 2 Op Potential"),
-            DeciampSensorEntity(client, self, "20_1.pv2InputCur", "Solar 2 Current"),
-            DecicelsiusSensorEntity(client, self, "20_1.pv2Temp", "Solar 2 Temperature"),
-            MiscSensorEntity(client, self, "20_1.pv2RelayStatus", "Solar 2 Relay Status"),
-            MiscSensorEntity(client, self, "20_1.pv2ErrCode", "Solar 2 Error Code", False),
-            MiscSensorEntity(client, self, "20_1.pv2WarningCode", "Solar 2 Warning Code", False),
-            MiscSensorEntity(client, self, "20_1.pv2Statue", "Solar 2 Status", False),
-
-            MiscSensorEntity(client, self, "20_1.bpType", "Battery Type", False),
-            LevelSensorEntity(client, self, "20_1.batSoc", "Battery Charge"),
-            DeciwattsSensorEntity(client, self, "20_1.batInputWatts", "Battery Input Watts"),
-            DecivoltSensorEntity(client, self, "20_1.batInputVolt", "Battery Input Potential"),
-            DecivoltSensorEntity(client, self, "20_1.batOpVolt", "Battery Op Potential"),
-            AmpSensorEntity(client, self, "20_1.batInputCur", "Battery Input Current"),
-            DecicelsiusSensorEntity(client, self, "20_1.batTemp", "Battery Temperature"),
-            RemainSensorEntity(client, self, "20_1.chgRemainTime", "Charge Time"),
-            RemainSensorEntity(client, self, "20_1.dsgRemainTime", "Discharge Time"),
-            MiscSensorEntity(client, self, "20_1.batErrCode", "Battery Error Code", False),
-            MiscSensorEntity(client, self, "20_1.batWarningCode", "Battery Warning Code", False),
-            MiscSensorEntity(client, self, "20_1.batStatue", "Battery Status", False),
-
-            DecivoltSensorEntity(client, self, "20_1.llcInputVolt", "LLC Input Potential", False),
-            DecivoltSensorEntity(client, self, "20_1.llcOpVolt", "LLC Op Potential", False),
-            DecicelsiusSensorEntity(client, self, "20_1.llcTemp", "LLC Temperature"),
-            MiscSensorEntity(client, self, "20_1.llcErrCode", "LLC Error Code", False),
-            MiscSensorEntity(client, self, "20_1.llcWarningCode", "LLC Warning Code", False),
-            MiscSensorEntity(client, self, "20_1.llcStatue", "LLC Status", False),
-
-            MiscSensorEntity(client, self, "20_1.invOnOff", "Inverter On/Off Status"),
-            DeciwattsSensorEntity(client, self, "20_1.invOutputWatts", "Inverter Output Watts"),
-            DecivoltSensorEntity(client, self, "20_1.invInputVolt", "Inverter Output Potential", False),
-            DecivoltSensorEntity(client, self, "20_1.invOpVolt", "Inverter Op Potential"),
-            AmpSensorEntity(client, self, "20_1.invOutputCur", "Inverter Output Current"),
-            #  AmpSensorEntity(client, self, "inv_dc_cur", "Inverter DC Current"),
-            DecihertzSensorEntity(client, self, "20_1.invFreq", "Inverter Frequency"),
-            DecicelsiusSensorEntity(client, self, "20_1.invTemp", "Inverter Temperature"),
-            MiscSensorEntity(client, self, "20_1.invRelayStatus", "Inverter Relay Status"),
-            MiscSensorEntity(client, self, "20_1.invErrCode", "Inverter Error Code", False),
-            MiscSensorEntity(client, self, "20_1.invWarnCode", "Inverter Warning Code", False),
-            MiscSensorEntity(client, self, "20_1.invStatue", "Inverter Status", False),
-
-            DeciwattsSensorEntity(client, self, "20_1.permanentWatts", "Other Loads"),
-            DeciwattsSensorEntity(client, self, "20_1.dynamicWatts", "Smart Plug Loads"),
-            DeciwattsSensorEntity(client, self, "20_1.ratedPower", "Rated Power"),
-
-            MiscSensorEntity(client, self, "20_1.lowerLimit", "Lower Battery Limit", False),
-            MiscSensorEntity(client, self, "20_1.upperLimit", "Upper Battery Limit", False),
-            MiscSensorEntity(client, self, "20_1.wirelessErrCode", "Wireless Error Code", False),
-            MiscSensorEntity(client, self, "20_1.wirelessWarnCode", "Wireless Warning Code", False),
-            MiscSensorEntity(client, self, "20_1.invBrightness", "LED Brightness", False),
-            MiscSensorEntity(client, self, "20_1.heartbeatFrequency", "Heartbeat Frequency", False),
-
-            StatusSensorEntity(client, self)
-        ]
+        return create_entities(client, self, POWERSTREAM_SENSORS) + [StatusSensorEntity(client, self)]
 
 
     def numbers(self, client: EcoflowApiClient) -> list[BaseNumberEntity]:
@@ -117,9 +118,11 @@ class PowerStream(BaseDevice):
                                    "params": {"supplyPriority": value}}),
         ]
 
-    def _prepare_data(self, raw_data) -> dict[str, any]:
+    def _prepare_data(self, raw_data) -> dict[str, any] | None:
         res = super()._prepare_data(raw_data)
-        res = to_plain(res)
+        if res is None:
+            return None
+        res = to_plain(res, self.data.keys)
         return res
 
     def _status_sensor(self, client: EcoflowApiClient) -> StatusSensorEntity:
@@ -2,27 +2,30 @@ from homeassistant.components.number import NumberEntity
 from homeassistant.components.select import SelectEntity
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.components.switch import SwitchEntity
-from .data_bridge import to_plain
+from ..data_bridge import to_plain
 
 from custom_components.ecoflow_cloud_alt import EcoflowApiClient
 from custom_components.ecoflow_cloud_alt.devices import BaseDevice, const
+from custom_components.ecoflow_cloud_alt.entities import EcoFlowEntityDescription, create_entities
 from custom_components.ecoflow_cloud_alt.number import BrightnessLevelEntity
 from custom_components.ecoflow_cloud_alt.sensor import TempSensorEntity, VoltSensorEntity, AmpSensorEntity, \
     DeciwattsSensorEntity
 from custom_components.ecoflow_cloud_alt.switch import EnabledEntity
 
 
+SMART_PLUG_SENSORS = (
+    EcoFlowEntityDescription(TempSensorEntity, "2_1.temp", const.TEMPERATURE),
+    EcoFlowEntityDescription(VoltSensorEntity, "2_1.volt", const.VOLT),
+    EcoFlowEntityDescription(AmpSensorEntity, "2_1.current", const.CURRENT)
+        .attr("2_1.maxCur", const.MAX_CURRENT, 0),
+    EcoFlowEntityDescription(DeciwattsSensorEntity, "2_1.watts", const.POWER)
+)
+
+
 class SmartPlug(BaseDevice):
 
     def sensors(self, client: EcoflowApiClient) -> list[SensorEntity]:
-        return [
-            TempSensorEntity(client, self, "2_1.temp", const.TEMPERATURE),
-            VoltSensorEntity(client, self, "2_1.volt", const.VOLT),
-            AmpSensorEntity(client, self, "2_1.current", const.CURRENT)
-                .attr("2_1.maxCur", const.MAX_CURRENT, 0),
-            DeciwattsSensorEntity(client, self, "2_1.watts", const.POWER)
-
-        ]
+        return create_entities(client, self, SMART_PLUG_SENSORS)
 
     def numbers(self, client: EcoflowApiClient) -> list[NumberEntity]:
         return [
@@ -43,8 +46,10 @@ class SmartPlug(BaseDevice):
     def selects(self, client: EcoflowApiClient) -> list[SelectEntity]:
         return []
 
-    def _prepare_data(self, raw_data) -> dict[str, any]:
+    def _prepare_data(self, raw_data) -> dict[str, any] | None:
         res = super()._prepare_data(raw_data)
-        res = to_plain(res)
+        if res is None:
+            return None
+        res = to_plain(res, self.data.keys)
 
         return res
\ No newline at end of file
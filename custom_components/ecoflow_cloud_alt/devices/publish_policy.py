@@ -0,0 +1,40 @@
+import dataclasses
+
+FAMILY_WATTS = "watts"
+FAMILY_VOLTS = "volts"
+FAMILY_TEMPERATURES = "temperatures"
+
+
+@dataclasses.dataclass(frozen=True)
+class PublishPolicy:
+    """When a sensor of a family writes a new value.
+
+    A new value within the deadband of the last written one (max(deadband, deadband_relative
+    * |last|), deadband in the family unit: W, V, °C) is held back, as is any value arriving less
+    than min_interval seconds after the last write. A held value is written once max_interval
+    seconds have passed since the last write (0: only when it leaves the deadband).
+    """
+    deadband: float = 0.0
+    deadband_relative: float = 0.0
+    min_interval: float = 0.0
+    max_interval: float = 0.0
+
+    def active(self) -> bool:
+        return self.deadband > 0 or self.deadband_relative > 0 or self.min_interval > 0
+
+    def band(self, last: float, scale: float = 1.0) -> float:
+        """The deadband around last, in native units of which scale make one family unit."""
+        return max(self.deadband * scale, self.deadband_relative * abs(last))
+
+
+def publish_policies(deadband_watts: float, deadband_volts: float, deadband_temperatures: float,
+                     deadband_percent: float, min_interval: float, max_interval: float) -> dict[str, PublishPolicy]:
+    """Policies of the families with any filtering configured."""
+    policies = {}
+    for (family, deadband) in ((FAMILY_WATTS, deadband_watts), (FAMILY_VOLTS, deadband_volts),
+                               (FAMILY_TEMPERATURES, deadband_temperatures)):
+        policy = PublishPolicy(max(deadband, 0.0), max(deadband_percent, 0.0) / 100,
+                               max(min_interval, 0.0), max(max_interval, 0.0))
+        if policy.active():
+            policies[family] = policy
+    return policies
@@ -0,0 +1,114 @@
+import logging
+import threading
+from asyncio import TimerHandle
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+FALLBACK_TICK_SEC = 5.0
+
+
+class EcoflowPushScheduler:
+    """Broadcasts new device data from the event loop as it arrives, instead of polling.
+
+    Data holders mark their coordinator dirty from any thread; the first mark schedules one
+    flush on the loop, no earlier than min_interval after the previous flush, and a flush
+    broadcasts every dirty coordinator at once. One scheduler (and one fallback timer) serves
+    all devices of a client: coordinators without data for their refresh period are still
+    broadcast, so the status entities notice devices going offline.
+    """
+
+    def __init__(self, hass: HomeAssistant, min_interval: float):
+        self.__hass = hass
+        self.__min_interval = max(min_interval, 0.0)
+        self.__lock = threading.Lock()
+        self.__coordinators: dict[Any, float] = {}
+        self.__dirty: dict[Any, None] = {}
+        self.__scheduled = False
+        self.__running = False
+        self.__flush_handle: TimerHandle | None = None
+        self.__tick_handle: TimerHandle | None = None
+        self.__last_flush = 0.0
+
+        self.marks = 0
+        self.flushes = 0
+        self.pushes = 0
+        self.fallback_pushes = 0
+
+    def add(self, coordinator):
+        self.__coordinators[coordinator] = 0.0
+
+    def mark(self, coordinator):
+        """Called by data holders, from any thread."""
+        with self.__lock:
+            self.marks += 1
+            self.__dirty[coordinator] = None
+            if self.__scheduled or not self.__running:
+                return
+            self.__scheduled = True
+        self.__hass.loop.call_soon_threadsafe(self.__schedule_flush)
+
+    @callback
+    def start(self):
+        with self.__lock:
+            self.__running = True
+            self.__scheduled = bool(self.__dirty)
+        if self.__scheduled:
+            self.__schedule_flush()
+        self.__tick_handle = self.__hass.loop.call_later(FALLBACK_TICK_SEC, self.__tick)
+
+    @callback
+    def stop(self):
+        with self.__lock:
+            self.__running = False
+            self.__dirty.clear()
+        for handle in (self.__flush_handle, self.__tick_handle):
+            if handle is not None:
+                handle.cancel()
+        self.__flush_handle = None
+        self.__tick_handle = None
+
+    def stats(self) -> dict[str, Any]:
+        return {"min_interval": self.__min_interval, "marks": self.marks, "flushes": self.flushes,
+                "pushes": self.pushes, "fallback_pushes": self.fallback_pushes}
+
+    @callback
+    def __schedule_flush(self):
+        delay = self.__last_flush + self.__min_interval - self.__hass.loop.time()
+        if delay > 0:
+            self.__flush_handle = self.__hass.loop.call_later(delay, self.__flush)
+        else:
+            self.__flush()
+
+    @callback
+    def __flush(self):
+        self.__flush_handle = None
+        with self.__lock:
+            if not self.__running:
+                return
+            dirty = self.__dirty
+            self.__dirty = {}
+            self.__scheduled = False
+        now = self.__last_flush = self.__hass.loop.time()
+        self.flushes += 1
+        for coordinator in dirty:
+            self.__push(coordinator, now)
+        self.pushes += len(dirty)
+
+    @callback
+    def __tick(self):
+        now = self.__hass.loop.time()
+        for (coordinator, last_push) in list(self.__coordinators.items()):
+            if now - last_push >= coordinator.refresh_period:
+                self.__push(coordinator, now)
+                self.fallback_pushes += 1
+        self.__tick_handle = self.__hass.loop.call_later(FALLBACK_TICK_SEC, self.__tick)
+
+    def __push(self, coordinator, now: float):
+        self.__coordinators[coordinator] = now
+        try:
+            coordinator.async_push()
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception(f"Failed to broadcast {coordinator.name}")
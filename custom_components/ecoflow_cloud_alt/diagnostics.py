@@ -1,10 +1,16 @@
+import dataclasses
 from datetime import timedelta
 
+from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
 from . import ECOFLOW_DOMAIN
 from .api import EcoflowApiClient
+from .devices.json_payload import JSON_PARSER
+
+# MQTT client ids contain the account (public API: the MQTT user name, private API: the user id)
+TO_REDACT_MQTT = {"client_id"}
 
 
 def _to_serializable(x):
@@ -18,7 +24,7 @@ def _to_serializable(x):
 
 async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry):
     client: EcoflowApiClient = hass.data[ECOFLOW_DOMAIN][entry.entry_id]
-    values = {"EcoFlow":[]}
+    values = {"EcoFlow":[], "json_parser": JSON_PARSER}
     for (sn, device) in client.devices.items():
         value = {
             'device':    device.device_info.device_type,
@@ -30,6 +36,20 @@ async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigE
             'get':       [dict(sorted(k.items())) for k in device.data.get],
             'get_reply': [dict(sorted(k.items())) for k in device.data.get_reply],
             'raw_data': device.data.raw_data,
+            'json_errors': device.json_parser.errors,
+            'fan_out': {'updates': device.coordinator.fan_outs, 'entity_callbacks': device.coordinator.fan_out_callbacks},
+            'state_writes': {'flushes': device.coordinator.write_flushes,
+                             'entities': device.coordinator.written_states,
+                             'per_hour': round(device.coordinator.state_writes_per_hour(), 1),
+                             'held': device.coordinator.held_states,
+                             'policies': {family: dataclasses.asdict(policy)
+                                          for (family, policy) in device.publish_policies.items()}},
         }
         values["EcoFlow"].append(value)
+    if client.mqtt_client:
+        values["mqtt"] = async_redact_data(client.mqtt_client.stats(), TO_REDACT_MQTT)
+    if client.push_scheduler:
+        values["push"] = client.push_scheduler.stats()
+    if client.energy_store:
+        values["energy_store"] = client.energy_store.stats()
     return values
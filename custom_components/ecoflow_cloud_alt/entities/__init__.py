@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import dataclasses
 import inspect
-from typing import Any, Callable, OrderedDict, Mapping
+import time
+from asyncio import TimerHandle
+from typing import Any, Callable, Iterable, Mapping
 
-import jsonpath_ng.ext as jp
 from homeassistant.components.button import ButtonEntity
 from homeassistant.components.number import NumberEntity
 from homeassistant.components.select import SelectEntity
@@ -14,7 +16,32 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from custom_components.ecoflow_cloud_alt import ECOFLOW_DOMAIN
 from custom_components.ecoflow_cloud_alt.api import EcoflowApiClient
-from custom_components.ecoflow_cloud_alt.devices import BaseDevice, EcoflowDeviceUpdateCoordinator
+from custom_components.ecoflow_cloud_alt.devices import BaseDevice, EcoflowDeviceUpdateCoordinator, EcoflowKeyContext
+from custom_components.ecoflow_cloud_alt.devices.key_path import MISSING, KeyPath, key_path
+from custom_components.ecoflow_cloud_alt.devices.publish_policy import PublishPolicy
+
+
+def reads_params(keys: Iterable[str], command: Callable[[Any, dict[str, Any]], dict[str, Any]]):
+    """Declares the params keys a command built from params looks up, so the device keeps them
+    (see EcoflowDataHolder.keys)."""
+    command.params_keys = frozenset(keys)
+    return command
+
+
+def value_conversion(scale: float | None) -> Callable[[Any], Any] | None:
+    """One call converting a raw value to int() of it times scale; None keeps raw values as they are.
+
+    Scales below 1 divide by their inverse (0.1: int(val) / 10), so results round as the division.
+    """
+    if scale is None:
+        return None
+    if scale == 1:
+        return int
+    if scale > 1:
+        factor = int(scale)
+        return lambda val: int(val) * factor
+    divisor = round(1 / scale)
+    return lambda val: int(val) / divisor
 
 
 class EcoFlowAbstractEntity(CoordinatorEntity[EcoflowDeviceUpdateCoordinator]):
@@ -30,12 +57,16 @@ class EcoFlowAbstractEntity(CoordinatorEntity[EcoflowDeviceUpdateCoordinator]):
 
     @property
     def device_info(self) -> DeviceInfo | None:
-        return DeviceInfo(
-            identifiers={(ECOFLOW_DOMAIN, f"{self._type_prefix()}{self._device.device_info.sn}")},
-            manufacturer="EcoFlow",
-            name=self._device.device_info.name,
-            model=self._device.device_info.device_type,
-        )
+        # one DeviceInfo per device, shared by all its entities
+        info = self._device.entity_device_info
+        if info is None:
+            info = self._device.entity_device_info = DeviceInfo(
+                identifiers={(ECOFLOW_DOMAIN, f"{self._type_prefix()}{self._device.device_info.sn}")},
+                manufacturer="EcoFlow",
+                name=self._device.device_info.name,
+                model=self._device.device_info.device_type,
+            )
+        return info
 
     def _type_prefix(self):
         return "api-" if self._device.device_info.public_api else ""
@@ -49,24 +80,37 @@ class EcoFlowAbstractEntity(CoordinatorEntity[EcoflowDeviceUpdateCoordinator]):
 
 
 class EcoFlowDictEntity(EcoFlowAbstractEntity):
+    # params values pass through _convert before _update_value: subclasses set a _value_scale, turned
+    # into _convert once per class by value_conversion, or a _convert (staticmethod) of their own
+    _value_scale: float | None = None
+    _convert: Callable[[Any], Any] | None = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "_value_scale" in cls.__dict__:
+            convert = value_conversion(cls._value_scale)
+            cls._convert = None if convert is None else staticmethod(convert)
 
     def __init__(self, client: EcoflowApiClient, device: BaseDevice, mqtt_key: str, title: str, enabled: bool = True,
                  auto_enable: bool = False):
         super().__init__(client, device, title, mqtt_key)
 
         self.__mqtt_key = mqtt_key
-        self._mqtt_key_adopted = self._adopt_json_key(mqtt_key)
-        self._mqtt_key_expr = jp.parse(self._mqtt_key_adopted)
+        self._mqtt_key_path = key_path(self._adopt_json_key(mqtt_key))
 
         self._auto_enable = auto_enable
         self._attr_entity_registry_enabled_default = enabled
         self._attr_entity_registry_visible_default = enabled
         self._attr_available  = enabled
-        self.__attributes_mapping: dict[str, str] = {}
-        self.__attrs = OrderedDict[str, Any]()
+        # (params key, title, path) of the attributes; most entities have none and keep the shared ()
+        self.__attributes: tuple[tuple[str, str, KeyPath], ...] = ()
+        # created by the first attr call, entities without attributes report an empty dict
+        self.__attrs: dict[str, Any] | None = None
 
     def attr(self, mqtt_key: str, title: str, default: Any) -> EcoFlowDictEntity:
-        self.__attributes_mapping[mqtt_key] = title
+        self.__attributes += ((mqtt_key, title, key_path(self._adopt_json_key(mqtt_key))),)
+        if self.__attrs is None:
+            self.__attrs = {}
         self.__attrs[title] = default
         return self
 
@@ -80,6 +124,10 @@ class EcoFlowDictEntity(EcoFlowAbstractEntity):
     def mqtt_key(self):
         return self.__mqtt_key
 
+    @property
+    def _mqtt_key_adopted(self) -> str:
+        return self._mqtt_key_path.path
+
     @property
     def auto_enable(self):
         return self._auto_enable
@@ -88,42 +136,87 @@ class EcoFlowDictEntity(EcoFlowAbstractEntity):
     def enabled_default(self):
         return self._attr_entity_registry_enabled_default
 
+    def consumed_keys(self) -> set[str]:
+        """params keys this entity reads; only the keys of added (enabled) entities are kept."""
+        return {self.__mqtt_key, *(mqtt_key for (mqtt_key, _, _) in self.__attributes)}
+
     async def async_added_to_hass(self):
+        # updates only when one of the keys changed, see EcoflowDeviceUpdateCoordinator.async_add_key_listener
+        keys = frozenset(self.consumed_keys()) if self._device.flat_json() else None
+        self.coordinator_context = EcoflowKeyContext(keys)
         await super().async_added_to_hass()
+        if keys is not None:
+            self._device.data.consume_keys(self, keys)
+        # the fan-out only delivers keys changed after this listener was added: start from the current params
+        self._updated(self._device.data.params)
         # d = self._device.data.params_observable().subscribe(self._updated)
         # self.async_on_remove(d.dispose)
 
+    async def async_will_remove_from_hass(self):
+        self._device.data.release_keys(self)
+        await super().async_will_remove_from_hass()
+
     def _handle_coordinator_update(self) -> None:
         if self.coordinator.data.changed:
             self._updated(self.coordinator.data.data_holder.params)
 
     def _updated(self, data: dict[str, Any]):
         # update attributes
-        for key, title in self.__attributes_mapping.items():
-            key_expr = jp.parse(self._adopt_json_key(key))
-            attr_values = key_expr.find(data)
-            if len(attr_values) == 1:
-                self.__attrs[title] = attr_values[0].value
+        for (_, title, path) in self.__attributes:
+            attr_value = path.get(data)
+            if attr_value is not MISSING:
+                self.__attrs[title] = attr_value
 
         # update value
-        values = self._mqtt_key_expr.find(data)
-        if len(values) == 1:
+        value = self._mqtt_key_path.get(data)
+        if value is not MISSING:
             self._attr_available = True
             if self._auto_enable:
                 self._attr_entity_registry_enabled_default = True
                 self._attr_entity_registry_visible_default = True
 
-            if self._update_value(values[0].value):
-                self.schedule_update_ha_state()
+            if self._convert is not None:
+                value = self._convert(value)
+            if self._update_value(value):
+                self.coordinator.async_schedule_write(self)
 
     @property
     def extra_state_attributes(self) -> Mapping[str, Any] | None:
-        return self.__attrs
+        return self.__attrs if self.__attrs is not None else {}
 
     def _update_value(self, val: Any) -> bool:
         return False
 
 
+@dataclasses.dataclass(frozen=True, slots=True)
+class EcoFlowEntityDescription:
+    """A dict entity of a device type, without the device.
+
+    Device modules keep their entities in tables of descriptions, built once at import and shared
+    by every device of the type; create_entities makes the entities of one device from a table.
+    """
+    entity_class: type[EcoFlowDictEntity]
+    mqtt_key: str
+    title: str
+    enabled: bool = True
+    auto_enable: bool = False
+    attrs: tuple[tuple[str, str, Any], ...] = ()
+
+    def attr(self, mqtt_key: str, title: str, default: Any) -> EcoFlowEntityDescription:
+        return dataclasses.replace(self, attrs=self.attrs + ((mqtt_key, title, default),))
+
+    def create(self, client: EcoflowApiClient, device: BaseDevice) -> EcoFlowDictEntity:
+        entity = self.entity_class(client, device, self.mqtt_key, self.title, self.enabled, self.auto_enable)
+        for (mqtt_key, title, default) in self.attrs:
+            entity.attr(mqtt_key, title, default)
+        return entity
+
+
+def create_entities(client: EcoflowApiClient, device: BaseDevice,
+                    descriptions: tuple[EcoFlowEntityDescription, ...]) -> list[EcoFlowDictEntity]:
+    return [description.create(client, device) for description in descriptions]
+
+
 class EcoFlowBaseCommandEntity(EcoFlowDictEntity):
     def __init__(self, client: EcoflowApiClient, device: BaseDevice, mqtt_key: str, title: str,
                  command: Callable[[Any], dict[str, Any]] | Callable[[Any, dict[str, Any]], dict[str, Any]] | None,
@@ -131,6 +224,10 @@ class EcoFlowBaseCommandEntity(EcoFlowDictEntity):
         super().__init__(client, device, mqtt_key, title, enabled, auto_enable)
         self._command = command
 
+    def consumed_keys(self) -> set[str]:
+        # commands built from other params declare the keys they look up, see reads_params
+        return super().consumed_keys() | getattr(self._command, "params_keys", frozenset())
+
     def command_dict(self, value: Any) -> dict[str, Any] | None:
         if self._command:
             p_count = len(inspect.signature(self._command).parameters)
@@ -165,14 +262,85 @@ class BaseNumberEntity(NumberEntity, EcoFlowBaseCommandEntity):
 
 
 class BaseSensorEntity(SensorEntity, EcoFlowDictEntity):
+    # publish policy family (devices/publish_policy.py) and how many native units make one family unit
+    _publish_family: str | None = None
+    _publish_scale: float = 1
+
+    # publish policy state, on the instance only once a policy is used
+    __policy: PublishPolicy | None = None
+    __last_write = 0.0
+    __held: Any = MISSING
+    __held_due = 0.0
+    __held_handle: TimerHandle | None = None
+
+    def __init__(self, client: EcoflowApiClient, device: BaseDevice, mqtt_key: str, title: str, enabled: bool = True,
+                 auto_enable: bool = False):
+        super().__init__(client, device, mqtt_key, title, enabled, auto_enable)
+        if self._publish_family is not None and self._publish_family in device.publish_policies:
+            self.__policy = device.publish_policies[self._publish_family]
+
+    async def async_will_remove_from_hass(self):
+        self.__release_held()
+        await super().async_will_remove_from_hass()
 
     def _update_value(self, val: Any) -> bool:
         if self._attr_native_value != val:
+            if self.__policy is not None and not self.__publish_now(val):
+                return False
             self._attr_native_value = val
             return True
         else:
+            self.__release_held()
             return False
 
+    def __publish_now(self, val: Any) -> bool:
+        last = self._attr_native_value
+        if (self.__last_write == 0.0 or isinstance(val, bool) or not isinstance(val, (int, float))
+                or not isinstance(last, (int, float))):
+            self.__last_write = time.monotonic()
+            return True
+
+        policy = self.__policy
+        now = time.monotonic()
+        elapsed = now - self.__last_write
+        outside = abs(val - last) > policy.band(last, self._publish_scale)
+        if elapsed >= policy.min_interval and (outside or 0 < policy.max_interval <= elapsed):
+            self.__last_write = now
+            self.__release_held()
+            return True
+
+        self.__held = val
+        self.coordinator.held_states += 1
+        if outside:
+            due = self.__last_write + policy.min_interval
+        elif policy.max_interval > 0:
+            due = self.__last_write + max(policy.min_interval, policy.max_interval)
+        else:
+            return False
+        if self.__held_handle is None or due < self.__held_due:
+            if self.__held_handle is not None:
+                self.__held_handle.cancel()
+            self.__held_due = due
+            self.__held_handle = self.hass.loop.call_later(max(due - now, 0.0), self.__write_held)
+        return False
+
+    def __write_held(self):
+        self.__held_handle = None
+        (val, self.__held) = (self.__held, MISSING)
+        # the held value is converted and has passed the _update_value overrides already: write it as is,
+        # another pass through them would convert (scale) it twice
+        if val is not MISSING and self.hass is not None and self._attr_native_value != val:
+            self._attr_native_value = val
+            self.__last_write = time.monotonic()
+            self.coordinator.async_schedule_write(self)
+
+    def __release_held(self):
+        if self.__held is not MISSING:
+            self.__held = MISSING
+        if self.__held_handle is not None:
+            self.__held_handle.cancel()
+            self.__held_handle = None
+
 
 class BaseSwitchEntity(SwitchEntity, EcoFlowBaseCommandEntity):
     pass
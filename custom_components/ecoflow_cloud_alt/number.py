@@ -43,9 +43,7 @@ class ChargingPowerEntity(ValueUpdateEntity):
 
 class DeciChargingPowerEntity(ChargingPowerEntity):
     _attr_mode = NumberMode.BOX
-
-    def _update_value(self, val: Any) -> bool:
-        return super()._update_value(int(val) / 10)
+    _value_scale = 0.1
 
     async def async_set_native_value(self, value: float):
         if self._command:
@@ -77,6 +75,9 @@ class BatteryBackupLevel(MinMaxLevelEntity):
         self._min_key = min_key
         self._max_key = max_key
 
+    def consumed_keys(self) -> set[str]:
+        return super().consumed_keys() | {self._min_key, self._max_key}
+
     def _updated(self, data: dict[str, Any]):
         if self._min_key in data:
             self._attr_native_min_value = int(data[self._min_key]) + 5  # min + 5%
@@ -2,8 +2,10 @@ from homeassistant.core import callback, HomeAssistant
 
 from custom_components.ecoflow_cloud_alt import ATTR_STATUS_UPDATES, ATTR_STATUS_DATA_LAST_UPDATE, \
     ATTR_STATUS_LAST_UPDATE, ATTR_STATUS_PHASE, ATTR_QUOTA_REQUESTS
+from custom_components.ecoflow_cloud_alt.api.supervisor import SUPERVISOR_STATES
 
 
 @callback
 def exclude_attributes(hass: HomeAssistant) -> set[str]:
-    return {ATTR_STATUS_UPDATES, ATTR_STATUS_DATA_LAST_UPDATE, ATTR_STATUS_LAST_UPDATE, ATTR_STATUS_PHASE, ATTR_QUOTA_REQUESTS}
+    return {ATTR_STATUS_UPDATES, ATTR_STATUS_DATA_LAST_UPDATE, ATTR_STATUS_LAST_UPDATE, ATTR_STATUS_PHASE, ATTR_QUOTA_REQUESTS} | \
+        {f"time_{state}" for state in SUPERVISOR_STATES}
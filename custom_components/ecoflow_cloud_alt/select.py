@@ -20,22 +20,25 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
 class DictSelectEntity(BaseSelectEntity):
     _attr_entity_category = EntityCategory.CONFIG
     _attr_available = False
+    _value_scale = 1
 
     def __init__(self, client: EcoflowApiClient, device: BaseDevice, mqtt_key: str, title: str, options: dict[str, int],
                  command: Callable[[int], dict[str, Any]] | None, enabled: bool = True, auto_enable: bool = False):
         super().__init__(client, device, mqtt_key, title, command, enabled, auto_enable)
         self._options_dict = options
         self._options = list(options.keys())
+        # option of each value; values shared by several options match none of them
+        values = list(options.values())
+        self._option_by_value = {v: k for (k, v) in options.items() if values.count(v) == 1}
         self._current_option = None
 
     def options_dict(self) -> dict[str, int]:
         return self._options_dict
 
     def _update_value(self, val: Any) -> bool:
-        ival = int(val)
-        lval = [k for k, v in self._options_dict.items() if v == ival]
-        if len(lval) == 1:
-            self._current_option = lval[0]
+        option = self._option_by_value.get(val)
+        if option is not None:
+            self._current_option = option
             return True
         else:
             return False
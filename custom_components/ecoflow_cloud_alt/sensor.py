@@ -1,5 +1,5 @@
 import logging
-import struct
+import time
 from typing import Any, Mapping, OrderedDict
 
 from homeassistant.components.binary_sensor import BinarySensorEntity, BinarySensorDeviceClass
@@ -8,24 +8,49 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (PERCENTAGE,
                                  UnitOfElectricCurrent, UnitOfElectricPotential, UnitOfEnergy, UnitOfFrequency,
                                  UnitOfPower, UnitOfTemperature, UnitOfTime)
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import dt
 
 from . import ECOFLOW_DOMAIN, ATTR_STATUS_SN, ATTR_STATUS_DATA_LAST_UPDATE, ATTR_STATUS_LAST_UPDATE, \
     ATTR_STATUS_RECONNECTS, \
-    ATTR_STATUS_PHASE, ATTR_MQTT_CONNECTED, ATTR_QUOTA_REQUESTS
+    ATTR_STATUS_PHASE, ATTR_MQTT_CONNECTED, ATTR_QUOTA_REQUESTS, SIGNAL_ENERGY_TYPES
 from .api import EcoflowApiClient
 from .devices import BaseDevice
+from .devices.publish_policy import FAMILY_WATTS, FAMILY_VOLTS, FAMILY_TEMPERATURES
 from .entities import BaseSensorEntity, EcoFlowAbstractEntity, EcoFlowDictEntity
 
 _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback):
     client: EcoflowApiClient = hass.data[ECOFLOW_DOMAIN][entry.entry_id]
+    anchors = set(client.mqtt_client.connection_anchors())
     for (sn, device) in client.devices.items():
-        async_add_entities(device.sensors(client))
+        sensors = device.sensors(client)
+        if sn in anchors:
+            # one per MQTT connection, on a device it serves: all devices of a connection share its stats
+            sensors.append(MqttConnectionSensorEntity(client, device))
+        async_add_entities(sensors)
+
+    if client.energy_store is not None:
+        added: set[tuple[str, int]] = set()
+
+        @callback
+        def add_energy_history_sensors():
+            new_sensors = []
+            for (sn, device) in client.devices.items():
+                for watth_type in client.energy_store.latest_energy(sn):
+                    if (sn, watth_type) not in added:
+                        added.add((sn, watth_type))
+                        new_sensors.append(EnergyHistorySensorEntity(client, device, watth_type))
+            if new_sensors:
+                async_add_entities(new_sensors)
+
+        add_energy_history_sensors()
+        entry.async_on_unload(async_dispatcher_connect(hass, SIGNAL_ENERGY_TYPES.format(entry.entry_id),
+                                                       add_energy_history_sensors))
 
 
 class MiscBinarySensorEntity(BinarySensorEntity, EcoFlowDictEntity):
@@ -39,16 +64,12 @@ class ChargingStateSensorEntity(BaseSensorEntity):
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_icon = "mdi:battery-charging"
     _attr_device_class = BinarySensorDeviceClass.BATTERY_CHARGING
+    _convert = staticmethod({0: "unused", 1: "charging", 2: "discharging"}.get)
 
     def _update_value(self, val: Any) -> bool:
-        if val == 0:
-            return super()._update_value("unused")
-        elif val == 1:
-            return super()._update_value("charging")
-        elif val == 2:
-            return super()._update_value("discharging")
-        else:
+        if val is None:
             return False
+        return super()._update_value(val)
 
 
 class CyclesSensorEntity(BaseSensorEntity):
@@ -72,18 +93,18 @@ class LevelSensorEntity(BaseSensorEntity):
     _attr_state_class = SensorStateClass.MEASUREMENT
 
 
+def remaining_time(val: Any) -> int:
+    """int() of val, 0 for values out of 0..5000."""
+    ival = int(val)
+    return ival if 0 <= ival <= 5000 else 0
+
+
 class RemainSensorEntity(BaseSensorEntity):
     _attr_device_class = SensorDeviceClass.DURATION
     _attr_native_unit_of_measurement = UnitOfTime.MINUTES
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_value = 0
-
-    def _update_value(self, val: Any) -> Any:
-        ival = int(val)
-        if ival < 0 or ival > 5000:
-            ival = 0
-
-        return super()._update_value(ival)
+    _convert = staticmethod(remaining_time)
 
 
 class SecondsRemainSensorEntity(BaseSensorEntity):
@@ -91,16 +112,11 @@ class SecondsRemainSensorEntity(BaseSensorEntity):
     _attr_native_unit_of_measurement = UnitOfTime.SECONDS
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_value = 0
-
-    def _update_value(self, val: Any) -> Any:
-        ival = int(val)
-        if ival < 0 or ival > 5000:
-            ival = 0
-
-        return super()._update_value(ival)
+    _convert = staticmethod(remaining_time)
 
 
 class TempSensorEntity(BaseSensorEntity):
+    _publish_family = FAMILY_TEMPERATURES
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
@@ -108,18 +124,16 @@ class TempSensorEntity(BaseSensorEntity):
     _attr_native_value = -1
 
 class CelsiusSensorEntity(TempSensorEntity):
-    def _update_value(self, val: Any) -> bool:
-        return super()._update_value(int(val))
+    _value_scale = 1
 
 class DecicelsiusSensorEntity(TempSensorEntity):
-    def _update_value(self, val: Any) -> bool:
-        return super()._update_value(int(val) / 10)
+    _value_scale = 0.1
 
 class MilliCelsiusSensorEntity(TempSensorEntity):
-    def _update_value(self, val: Any) -> bool:
-        return super()._update_value(int(val) / 100)
+    _value_scale = 0.01
 
 class VoltSensorEntity(BaseSensorEntity):
+    _publish_family = FAMILY_VOLTS
     _attr_device_class = SensorDeviceClass.VOLTAGE
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_native_unit_of_measurement = UnitOfElectricPotential.VOLT
@@ -129,6 +143,8 @@ class VoltSensorEntity(BaseSensorEntity):
 
 
 class MilliVoltSensorEntity(BaseSensorEntity):
+    _publish_family = FAMILY_VOLTS
+    _publish_scale = 1000
     _attr_device_class = SensorDeviceClass.VOLTAGE
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_native_unit_of_measurement = UnitOfElectricPotential.MILLIVOLT
@@ -136,11 +152,16 @@ class MilliVoltSensorEntity(BaseSensorEntity):
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_value = 3
 
+def byte_swapped(val: int) -> int:
+    """The 32-bit value with its bytes in reverse order (big endian read as little endian)."""
+    return int.from_bytes(val.to_bytes(4, "big"), "little")
+
 class BeSensorEntity(BaseSensorEntity):
-    def _update_value(self, val: Any) -> bool:
-        return super()._update_value(int(struct.unpack('<I', struct.pack('>I', val))[0]))
+    _convert = staticmethod(byte_swapped)
 
 class BeMilliVoltSensorEntity(BeSensorEntity):
+    _publish_family = FAMILY_VOLTS
+    _publish_scale = 1000
     _attr_device_class = SensorDeviceClass.VOLTAGE
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_native_unit_of_measurement = UnitOfElectricPotential.MILLIVOLT
@@ -158,19 +179,17 @@ class OutMilliVoltSensorEntity(MilliVoltSensorEntity):
 
 
 class DecivoltSensorEntity(BaseSensorEntity):
+    _publish_family = FAMILY_VOLTS
     _attr_device_class = SensorDeviceClass.VOLTAGE
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_native_unit_of_measurement = UnitOfElectricPotential.VOLT
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_value = 0
-
-    def _update_value(self, val: Any) -> bool:
-        return super()._update_value(int(val) / 10)
+    _value_scale = 0.1
 
 
 class CentivoltSensorEntity(DecivoltSensorEntity):
-    def _update_value(self, val: Any) -> bool:
-        return super()._update_value(int(val) / 10)
+    _value_scale = 0.01
 
 
 class AmpSensorEntity(BaseSensorEntity):
@@ -187,12 +206,11 @@ class DeciampSensorEntity(BaseSensorEntity):
     _attr_native_unit_of_measurement = UnitOfElectricCurrent.AMPERE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_value = 0
-
-    def _update_value(self, val: Any) -> bool:
-        return super()._update_value(int(val) / 10)
+    _value_scale = 0.1
 
 
 class WattsSensorEntity(BaseSensorEntity):
+    _publish_family = FAMILY_WATTS
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_device_class = SensorDeviceClass.POWER
     _attr_native_unit_of_measurement = UnitOfPower.WATT
@@ -203,15 +221,47 @@ class EnergySensorEntity(BaseSensorEntity):
     _attr_device_class = SensorDeviceClass.ENERGY
     _attr_native_unit_of_measurement = UnitOfEnergy.WATT_HOUR
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _value_scale = 1
 
     def _update_value(self, val: Any) -> bool:
-        ival = int(val)
-        if ival > 0:
-            return super()._update_value(ival)
+        if val > 0:
+            return super()._update_value(val)
         else:
             return False
 
 
+class EnergyHistorySensorEntity(SensorEntity, EcoFlowAbstractEntity):
+    """Energy of the current period of one watth_type, from the energy totals the device reports
+    (api/energy_store.py). A new period starts from a lower value, which TOTAL_INCREASING takes
+    as a meter reset."""
+    _attr_device_class = SensorDeviceClass.ENERGY
+    _attr_native_unit_of_measurement = UnitOfEnergy.WATT_HOUR
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(self, client: EcoflowApiClient, device: BaseDevice, watth_type: int):
+        super().__init__(client, device, f"Energy Total {watth_type}", f"energy_history_{watth_type}")
+        self._watth_type = watth_type
+        self._period_start: int | None = None
+        self._attrs: dict[str, Any] = {}
+        self.__update_value()
+
+    def _handle_coordinator_update(self) -> None:
+        if self.__update_value():
+            self.coordinator.async_schedule_write(self)
+
+    def __update_value(self) -> bool:
+        latest = self._client.energy_store.latest_energy(self._device.device_info.sn).get(self._watth_type)
+        if latest is None or (latest[0] == self._period_start and latest[1] == self._attr_native_value):
+            return False
+        (self._period_start, self._attr_native_value) = latest
+        self._attrs = {"period_start": dt.utc_from_timestamp(self._period_start)}
+        return True
+
+    @property
+    def extra_state_attributes(self) -> Mapping[str, Any] | None:
+        return self._attrs
+
+
 class CapacitySensorEntity(BaseSensorEntity):
     _attr_device_class = SensorDeviceClass.CURRENT
     _attr_native_unit_of_measurement = "mAh"
@@ -219,8 +269,7 @@ class CapacitySensorEntity(BaseSensorEntity):
 
 
 class DeciwattsSensorEntity(WattsSensorEntity):
-    def _update_value(self, val: Any) -> bool:
-        return super()._update_value(int(val) / 10)
+    _value_scale = 0.1
 
 
 class InWattsSensorEntity(WattsSensorEntity):
@@ -229,9 +278,7 @@ class InWattsSensorEntity(WattsSensorEntity):
 
 class InWattsSolarSensorEntity(InWattsSensorEntity):
     _attr_icon = "mdi:solar-power"
-
-    def _update_value(self, val: Any) -> bool:
-        return super()._update_value(int(val) / 10)
+    _value_scale = 0.1
 
 
 class OutWattsSensorEntity(WattsSensorEntity):
@@ -240,9 +287,7 @@ class OutWattsSensorEntity(WattsSensorEntity):
 
 class OutWattsDcSensorEntity(WattsSensorEntity):
     _attr_icon = "mdi:transmission-tower-export"
-
-    def _update_value(self, val: Any) -> bool:
-        return super()._update_value(int(val) / 10)
+    _value_scale = 0.1
 
 
 class InVoltSensorEntity(VoltSensorEntity):
@@ -250,24 +295,18 @@ class InVoltSensorEntity(VoltSensorEntity):
 
 class InVoltSolarSensorEntity(VoltSensorEntity):
     _attr_icon = "mdi:solar-power"
-
-    def _update_value(self, val: Any) -> bool:
-        return super()._update_value(int(val) / 10)
+    _value_scale = 0.1
 
 class OutVoltDcSensorEntity(VoltSensorEntity):
     _attr_icon = "mdi:transmission-tower-export"
-    
-    def _update_value(self, val: Any) -> bool:
-        return super()._update_value(int(val) / 10)      
+    _value_scale = 0.1
 
 class InAmpSensorEntity(AmpSensorEntity):
     _attr_icon = "mdi:transmission-tower-import"
 
 class InAmpSolarSensorEntity(AmpSensorEntity):
     _attr_icon = "mdi:solar-power"
-
-    def _update_value(self, val: Any) -> bool:
-        return super()._update_value(int(val) * 10)
+    _value_scale = 10
 
 class InEnergySensorEntity(EnergySensorEntity):
     _attr_icon = "mdi:transmission-tower-import"
@@ -285,8 +324,7 @@ class FrequencySensorEntity(BaseSensorEntity):
 
 
 class DecihertzSensorEntity(FrequencySensorEntity):
-    def _update_value(self, val: Any) -> bool:
-        return super()._update_value(int(val) / 10)
+    _value_scale = 0.1
 
 
 class StatusSensorEntity(SensorEntity, EcoFlowAbstractEntity):
@@ -296,8 +334,10 @@ class StatusSensorEntity(SensorEntity, EcoFlowAbstractEntity):
         super().__init__(client, device, "Status", "status")
         self._online = -1
         self._last_update = dt.utcnow().replace(year=2000, month=1, day=1, hour=0, minute=0, second=0)
-        self._skip_count = 0
-        self._offline_skip_count = int(120 / self.coordinator.update_interval.seconds) # 2 minutes
+        # seconds without new data, by the clock: in push mode updates do not come every refresh period
+        self._last_seen = time.monotonic()
+        self._silence = 0.0
+        self._offline_after = 120.0  # 2 minutes
         self._attrs = OrderedDict[str, Any]()
         self._attrs[ATTR_STATUS_SN] = self._device.device_info.sn
         self._attrs[ATTR_STATUS_DATA_LAST_UPDATE] = None
@@ -309,28 +349,29 @@ class StatusSensorEntity(SensorEntity, EcoFlowAbstractEntity):
         if self._last_update < update_time:
             self._last_update = max(update_time, self._last_update)
             self._attrs[ATTR_STATUS_DATA_LAST_UPDATE] = update_time
-            self._attrs[ATTR_MQTT_CONNECTED] = self._client.mqtt_client.is_connected()
-            self._skip_count = 0
+            self._attrs[ATTR_MQTT_CONNECTED] = self._client.mqtt_client.is_connected(self._device.device_info.sn)
+            self._last_seen = time.monotonic()
+            self._silence = 0.0
             changed = True
         else:
-            self._skip_count += 1
+            self._silence = time.monotonic() - self._last_seen
 
         changed = self._actualize_status() or changed
 
         if changed:
-            self.schedule_update_ha_state()
+            self.coordinator.async_schedule_write(self)
 
     def _actualize_status(self) -> bool:
         changed = False
-        if self._online != 0 and self._skip_count >= self._offline_skip_count:
+        if self._online != 0 and self._silence >= self._offline_after:
             self._online = 0
             self._attr_native_value = "assume_offline"
-            self._attrs[ATTR_MQTT_CONNECTED] = self._client.mqtt_client.is_connected()
+            self._attrs[ATTR_MQTT_CONNECTED] = self._client.mqtt_client.is_connected(self._device.device_info.sn)
             changed = True
-        elif self._online != 1 and self._skip_count == 0:
+        elif self._online != 1 and self._silence == 0:
             self._online = 1
             self._attr_native_value = "online"
-            self._attrs[ATTR_MQTT_CONNECTED] = self._client.mqtt_client.is_connected()
+            self._attrs[ATTR_MQTT_CONNECTED] = self._client.mqtt_client.is_connected(self._device.device_info.sn)
             changed = True
         return changed
 
@@ -347,19 +388,19 @@ class QuotaStatusSensorEntity(StatusSensorEntity):
 
     def _actualize_status(self) -> bool:
         changed = False
-        if self._online != 0 and self._skip_count >= self._offline_skip_count * 2:
+        if self._online != 0 and self._silence >= self._offline_after * 2:
             self._online = 0
             self._attr_native_value = "assume_offline"
-            self._attrs[ATTR_MQTT_CONNECTED] = self._client.mqtt_client.is_connected()
+            self._attrs[ATTR_MQTT_CONNECTED] = self._client.mqtt_client.is_connected(self._device.device_info.sn)
             changed = True
-        elif self._online != 0 and self._skip_count >= self._offline_skip_count:
+        elif self._online != 0 and self._silence >= self._offline_after:
             self.hass.async_create_background_task(self._client.quota_all(self._device.device_info.sn), "get quota")
             self._attrs[ATTR_QUOTA_REQUESTS] = self._attrs[ATTR_QUOTA_REQUESTS] + 1
             changed = True
-        elif self._online != 1 and self._skip_count == 0:
+        elif self._online != 1 and self._silence == 0:
             self._online = 1
             self._attr_native_value = "online"
-            self._attrs[ATTR_MQTT_CONNECTED] = self._client.mqtt_client.is_connected()
+            self._attrs[ATTR_MQTT_CONNECTED] = self._client.mqtt_client.is_connected(self._device.device_info.sn)
             changed = True
         return changed
 
@@ -367,6 +408,7 @@ class QuotaStatusSensorEntity(StatusSensorEntity):
 class ReconnectStatusSensorEntity(StatusSensorEntity):
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
+    # refresh periods without new data after which to reconnect
     CONNECT_PHASES = [3, 5, 7]
 
     def __init__(self, client: EcoflowApiClient, device: BaseDevice):
@@ -375,12 +417,49 @@ class ReconnectStatusSensorEntity(StatusSensorEntity):
         self._attrs[ATTR_STATUS_RECONNECTS] = 0
 
     def _actualize_status(self) -> bool:
-        time_to_reconnect = self._skip_count in self.CONNECT_PHASES
+        if self._silence == 0:
+            self._attrs[ATTR_STATUS_PHASE] = 0
+        phase = self._attrs[ATTR_STATUS_PHASE]
+        # updates may come less often than every refresh period: a phase is due once its time has passed
+        time_to_reconnect = (phase < len(self.CONNECT_PHASES) and
+                             self._silence >= self.CONNECT_PHASES[phase] * self.coordinator.refresh_period)
 
         if self._online == 1 and time_to_reconnect:
+            self._attrs[ATTR_STATUS_PHASE] = phase + 1
             self._attrs[ATTR_STATUS_RECONNECTS] = self._attrs[ATTR_STATUS_RECONNECTS] + 1
-            self._client.mqtt_client.reconnect()
+            self._client.mqtt_client.reconnect(self._device.device_info.sn)
             return True
         else:
             return super()._actualize_status()
 
+
+
+class MqttConnectionSensorEntity(SensorEntity, EcoFlowAbstractEntity):
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:lan-connect"
+
+    def __init__(self, client: EcoflowApiClient, device: BaseDevice):
+        super().__init__(client, device, "MQTT Connection", "mqtt_connection")
+        self._attrs = OrderedDict[str, Any]()
+        self.__counters = OrderedDict[str, Any]()
+
+    def _handle_coordinator_update(self) -> None:
+        stats = self._client.mqtt_client.supervisor_stats(self._device.device_info.sn)
+        attrs = OrderedDict[str, Any]()
+        attrs[ATTR_STATUS_RECONNECTS] = stats["attempts"]
+        for key in ("failures", "merged_requests", "last_error", "last_reason"):
+            attrs[key] = stats[key]
+
+        # the time_* counters grow every second: they are refreshed with the other values, but
+        # do not cause a state write on their own
+        if self._attr_native_value != stats["state"] or self.__counters != attrs:
+            self._attr_native_value = stats["state"]
+            self.__counters = attrs
+            self._attrs = OrderedDict[str, Any](attrs)
+            for (state, sec) in stats["time_in_state"].items():
+                self._attrs[f"time_{state}"] = round(sec)
+            self.coordinator.async_schedule_write(self)
+
+    @property
+    def extra_state_attributes(self) -> Mapping[str, Any] | None:
+        return self._attrs
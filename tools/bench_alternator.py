@@ -0,0 +1,89 @@
+"""Per-message cost of the Alternator Charger heartbeat decoder.
+
+Frames come from the cloud stand-in (tools/ecoflow_standin). With --baseline, the decoder
+from another git revision is timed on the same frames, for a before/after comparison:
+
+    python -m tools.bench_alternator --baseline HEAD~1
+"""
+import argparse
+import importlib
+import logging
+import subprocess
+import sys
+import time
+import types
+from pathlib import Path
+
+from tools.ecoflow_standin.fleet import StandinDevice
+
+ROOT = Path(__file__).resolve().parent.parent
+PROTO_DIR = "custom_components/ecoflow_cloud_alt/devices/proto"
+DECODER_PATH = f"{PROTO_DIR}/alternator_pb.py"
+# the proto directory as a bare package, without importing the integration (and Home Assistant)
+PROTO_PACKAGE = "ecoflow_bench_proto"
+
+
+def proto_package():
+    if PROTO_PACKAGE not in sys.modules:
+        package = types.ModuleType(PROTO_PACKAGE)
+        package.__path__ = [str(ROOT / PROTO_DIR)]
+        sys.modules[PROTO_PACKAGE] = package
+
+
+def load_current() -> types.ModuleType:
+    proto_package()
+    return importlib.import_module(f"{PROTO_PACKAGE}.alternator_pb")
+
+
+def load_revision(revision: str) -> types.ModuleType:
+    proto_package()
+    source = subprocess.run(["git", "show", f"{revision}:{DECODER_PATH}"], cwd=ROOT, check=True,
+                            capture_output=True, text=True).stdout
+    module = types.ModuleType(f"alternator_pb_{revision}")
+    module.__file__ = f"{revision}:{DECODER_PATH}"
+    module.__package__ = PROTO_PACKAGE
+    exec(compile(source, module.__file__, "exec"), module.__dict__)
+    return module
+
+
+def measure(module: types.ModuleType, frames: list[bytes], rounds: int) -> tuple[float, dict]:
+    decoder = module.get_alternator_protobuf()
+    result = decoder.decode_heartbeat(frames[0])
+    best = float("inf")
+    for _ in range(rounds):
+        begin = time.perf_counter()
+        for frame in frames:
+            decoder.decode_heartbeat(frame)
+        best = min(best, (time.perf_counter() - begin) / len(frames))
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m tools.bench_alternator", description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline", help="git revision to compare against")
+    parser.add_argument("--frames", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    device = StandinDevice("F371Z00000000000", "ALTERNATOR_CHARGER", False)
+    frames = [device.next_payloads()[0] for _ in range(args.frames)]
+    print(f"{len(frames)} heartbeat frames, {sum(map(len, frames)) / len(frames):.0f} bytes each, "
+          f"best of {args.rounds} rounds")
+
+    candidates = []
+    if args.baseline:
+        candidates.append((args.baseline, load_revision(args.baseline)))
+    candidates.append(("working tree", load_current()))
+
+    baseline_cost = None
+    for (name, module) in candidates:
+        (cost, result) = measure(module, frames, args.rounds)
+        ratio = f"  ({baseline_cost / cost:.1f}x)" if baseline_cost else ""
+        print(f"{name:>14}: {cost * 1e6:8.2f} us/message{ratio}")
+        print(f"{'':>14}  {result}")
+        baseline_cost = baseline_cost or cost
+
+
+if __name__ == "__main__":
+    sys.exit(main())
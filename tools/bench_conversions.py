@@ -0,0 +1,75 @@
+"""Per-update cost of the value conversions of the sensor classes in sensor.py.
+
+Every BaseSensorEntity subclass of sensor.py converts a changing params value --updates times
+and compares it with its state, as EcoFlowDictEntity._updated does after the key lookup (best
+of --repeat runs). With --root, the integration is imported from another checkout (e.g. a
+worktree of an older revision, whose entities convert in _update_value), to compare both:
+
+    python -m tools.bench_conversions [--updates 20000] [--root ../old-checkout]
+
+Needs Home Assistant importable, like the integration itself.
+"""
+import argparse
+import asyncio
+import inspect
+import sys
+import time
+from pathlib import Path
+
+KEY = "benchValue"
+
+
+async def measure(args) -> int:
+    from homeassistant.core import HomeAssistant
+    from custom_components.ecoflow_cloud_alt import sensor
+    from custom_components.ecoflow_cloud_alt.devices import EcoflowDeviceInfo
+    from custom_components.ecoflow_cloud_alt.devices.registry import devices
+    from custom_components.ecoflow_cloud_alt.entities import BaseSensorEntity, EcoFlowDictEntity
+
+    hass = HomeAssistant(str(Path.cwd()))
+    device = devices["DELTA_2"](EcoflowDeviceInfo(False, "BENCH0000000001", "Bench", "DELTA_2", 1,
+                                                  "/data", "/set", "/set_reply", None, None))
+    device.configure(hass, 5)
+
+    classes = [cls for (_, cls) in inspect.getmembers(sensor, inspect.isclass)
+               if issubclass(cls, BaseSensorEntity) and cls.__module__ == sensor.__name__]
+    # older revisions convert in _update_value only
+    converts = "_convert" in vars(EcoFlowDictEntity)
+    # values stay in the range every class accepts (durations up to 5000, 32-bit for byte swaps)
+    values = [1000 + index % 997 for index in range(args.updates)]
+
+    total = 0.0
+    print(f"{len(classes)} sensor classes, {args.updates} updates each, best of {args.repeat}")
+    for cls in classes:
+        entity = cls(None, device, KEY, "Bench")
+        convert = entity._convert if converts else None
+        update = entity._update_value
+        elapsed = float("inf")
+        for _ in range(args.repeat):
+            begin = time.perf_counter()
+            if convert is not None:
+                for val in values:
+                    update(convert(val))
+            else:
+                for val in values:
+                    update(val)
+            elapsed = min(elapsed, time.perf_counter() - begin)
+        total += elapsed
+        print(f"  {cls.__name__:>32}: {elapsed / args.updates * 1e9:7.0f} ns per update")
+    print(f"  {'mean':>32}: {total / len(classes) / args.updates * 1e9:7.0f} ns per update")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m tools.bench_conversions", description=__doc__.splitlines()[0])
+    parser.add_argument("--updates", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--root", help="checkout to import the integration from")
+    args = parser.parse_args()
+    if args.root:
+        sys.path.insert(0, str(Path(args.root).resolve()))
+    return asyncio.run(measure(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
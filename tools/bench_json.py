@@ -0,0 +1,111 @@
+"""Parse cost of JSON device payloads: the previous str-decoding path against bytes parsing.
+
+Payloads are the Delta Pro and River 2 messages of an MQTT capture (see tools/mqtt_replay.py),
+or stand-in messages of both devices without --capture:
+
+    python -m tools.bench_json [--capture ecoflow.cap]
+"""
+import argparse
+import importlib.util
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from tools.ecoflow_standin.fleet import StandinDevice
+
+ROOT = Path(__file__).resolve().parent.parent
+COMPONENT = ROOT / "custom_components/ecoflow_cloud_alt"
+DEVICE_TYPES = {"DELTA_PRO", "RIVER_2", "DELTA Pro", "RIVER 2"}
+
+
+def load_file(name: str, path: Path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def captured_payloads(path: str) -> dict[str, list[bytes]]:
+    capture = load_file("ecoflow_bench_capture", COMPONENT / "api/capture.py")
+    topics: dict[str, str] = {}
+    payloads: dict[str, list[bytes]] = {}
+    for (record_type, _, topic, payload) in capture.read_capture(path):
+        if record_type == capture.RECORD_DEVICES:
+            for info in json.loads(payload).values():
+                if info["device_type"] in DEVICE_TYPES:
+                    topics[info["data_topic"]] = info["device_type"]
+        elif topic in topics:
+            payloads.setdefault(topics[topic], []).append(payload)
+    return payloads
+
+
+def standin_payloads(count: int) -> dict[str, list[bytes]]:
+    payloads: dict[str, list[bytes]] = {}
+    for (sn, device_type, public_api) in (("DCABZ0000000000", "DELTA_PRO", False),
+                                          ("R601Z0000000000", "RIVER_2", False),
+                                          ("R601Z0000000001", "RIVER_2", True)):
+        device = StandinDevice(sn, device_type, public_api)
+        name = f"{device_type} ({'public' if public_api else 'private'})"
+        payloads[name] = [payload for _ in range(count) for payload in device.next_payloads()]
+    return payloads
+
+
+def previous_parse(raw_data: bytes) -> Any:
+    try:
+        try:
+            payload = raw_data.decode("utf-8", errors='ignore')
+            return json.loads(payload)
+        except UnicodeDecodeError:
+            return json.loads(raw_data)
+        except Exception:
+            return json.loads(raw_data)
+    except Exception:
+        return None
+
+
+def measure(parse: Callable[[bytes], Any], payloads: list[bytes], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        begin = time.perf_counter()
+        for payload in payloads:
+            parse(payload)
+        best = min(best, (time.perf_counter() - begin) / len(payloads))
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m tools.bench_json", description=__doc__.splitlines()[0])
+    parser.add_argument("--capture", help="MQTT capture file, Delta Pro and River 2 payloads are taken from it")
+    parser.add_argument("--messages", type=int, default=500, help="stand-in messages per device without --capture")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    json_payload = load_file("ecoflow_bench_json_payload", COMPONENT / "devices/json_payload.py")
+    parsers: list[tuple[str, Callable[[bytes], Any]]] = [
+        ("previous", previous_parse),
+        ("json", json_payload.json_loads),
+    ]
+    if json_payload.orjson is not None:
+        parsers.append(("orjson bytes", json_payload.orjson.loads))
+    parsers.append((f"integration ({json_payload.JSON_PARSER})", json_payload.JsonPayloadParser("bench").parse))
+
+    payloads = captured_payloads(args.capture) if args.capture else standin_payloads(args.messages)
+    if not payloads:
+        print("no Delta Pro or River 2 payloads found")
+        return 1
+
+    for (name, messages) in payloads.items():
+        print(f"{name}: {len(messages)} messages, {sum(map(len, messages)) / len(messages):.0f} bytes each, "
+              f"best of {args.rounds} rounds")
+        baseline = None
+        for (parser_name, parse) in parsers:
+            cost = measure(parse, messages, args.rounds)
+            ratio = f"  ({baseline / cost:.1f}x)" if baseline else ""
+            print(f"  {parser_name:>20}: {cost * 1e6:7.2f} us/message{ratio}")
+            baseline = baseline or cost
+
+
+if __name__ == "__main__":
+    sys.exit(main())
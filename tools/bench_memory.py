@@ -0,0 +1,89 @@
+"""Memory kept per device and per entity, by tracemalloc.
+
+Creates --devices devices of one type with all their entities, the way setup does, and reports
+what stays allocated: the devices (data holder, coordinator), their entities, and the DeviceInfo
+objects handed out by device_info while they are held (as during platform setup). With --root,
+the integration is imported from another checkout (e.g. a worktree of an older revision):
+
+    python -m tools.bench_memory [--device-type DELTA_2_MAX] [--public] [--root ../old-checkout]
+
+Needs Home Assistant importable, like the integration itself.
+"""
+import argparse
+import asyncio
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+PLATFORMS = ("sensors", "numbers", "switches", "selects", "buttons")
+
+
+def retained(build: Callable[[], Any]) -> tuple[Any, int]:
+    """What build returns, and the bytes it leaves allocated."""
+    gc.collect()
+    before = tracemalloc.take_snapshot()
+    result = build()
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    return result, sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+
+async def measure(args) -> int:
+    from homeassistant.core import HomeAssistant
+    from custom_components.ecoflow_cloud_alt.devices import EcoflowDeviceInfo
+    from custom_components.ecoflow_cloud_alt.devices.registry import device_by_product, devices
+
+    registry = device_by_product if args.public else devices
+    if args.device_type not in registry:
+        print(f"unknown device type {args.device_type}, one of: {', '.join(registry)}")
+        return 1
+    device_class = registry[args.device_type]
+    hass = HomeAssistant(str(Path.cwd()))
+
+    def create_devices():
+        created = []
+        for index in range(args.devices):
+            info = EcoflowDeviceInfo(args.public, f"BENCH{index:010d}", f"Bench {index}", args.device_type, 1,
+                                     f"/data/{index}", f"/set/{index}", f"/set_reply/{index}", None, None)
+            device = device_class(info)
+            device.configure(hass, 5)
+            created.append(device)
+        return created
+
+    def create_entities(created):
+        return [entity for device in created for platform in PLATFORMS for entity in getattr(device, platform)(None)]
+
+    # warm up: imports, caches shared by all devices and interned keys are not per device
+    create_entities(create_devices()[:1])
+
+    tracemalloc.start()
+    (created, device_bytes) = retained(create_devices)
+    (entities, entity_bytes) = retained(lambda: create_entities(created))
+    (_, info_bytes) = retained(lambda: [entity.device_info for entity in entities])
+    tracemalloc.stop()
+
+    per_device = len(entities) / len(created)
+    print(f"{args.device_type}: {len(created)} devices, {per_device:.0f} entities each")
+    print(f"  device (holder, coordinator): {device_bytes / len(created):9.0f} bytes")
+    print(f"  entity:                       {entity_bytes / len(entities):9.0f} bytes")
+    print(f"  device_info of all entities:  {info_bytes / len(created):9.0f} bytes per device")
+    print(f"  total per device:             {(device_bytes + entity_bytes + info_bytes) / len(created):9.0f} bytes")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m tools.bench_memory", description=__doc__.splitlines()[0])
+    parser.add_argument("--device-type", default="DELTA_2_MAX")
+    parser.add_argument("--public", action="store_true", help="a public API device (product names)")
+    parser.add_argument("--devices", type=int, default=20)
+    parser.add_argument("--root", help="checkout to import the integration from")
+    args = parser.parse_args()
+    if args.root:
+        sys.path.insert(0, str(Path(args.root).resolve()))
+    return asyncio.run(measure(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""Per-message cost of PowerStream (private API) heartbeat decoding.
+
+Compares the previous approach (SendHeaderMsg/InverterHeartbeat per frame, HasField over
+every descriptor field) with the shared envelope decoder, on heartbeats from an MQTT capture
+(see tools/mqtt_replay.py) or from the cloud stand-in:
+
+    python -m tools.bench_powerstream [--capture ecoflow.cap]
+"""
+import argparse
+import importlib
+import importlib.util
+import json
+import logging
+import sys
+import time
+import types
+from pathlib import Path
+from typing import Callable
+
+from tools.ecoflow_standin.fleet import StandinDevice
+
+ROOT = Path(__file__).resolve().parent.parent
+COMPONENT = ROOT / "custom_components/ecoflow_cloud_alt"
+# bare packages, so neither the integration nor Home Assistant gets imported
+PACKAGES = {"ecoflow_bench_proto": COMPONENT / "devices/proto",
+            "ecoflow_bench_internal_proto": COMPONENT / "devices/internal/proto"}
+
+
+def import_module(name: str) -> types.ModuleType:
+    (package, _, _) = name.partition(".")
+    if package not in sys.modules:
+        module = types.ModuleType(package)
+        module.__path__ = [str(PACKAGES[package])]
+        sys.modules[package] = module
+    return importlib.import_module(name)
+
+
+def captured_frames(path: str) -> list[bytes]:
+    spec = importlib.util.spec_from_file_location("ecoflow_bench_capture", COMPONENT / "api/capture.py")
+    capture = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(capture)
+
+    topics: set[str] = set()
+    frames: list[bytes] = []
+    for (record_type, _, topic, payload) in capture.read_capture(path):
+        if record_type == capture.RECORD_DEVICES:
+            for info in json.loads(payload).values():
+                if info["device_type"] == "POWERSTREAM" and not info["public_api"]:
+                    topics.add(info["data_topic"])
+        elif topic in topics:
+            frames.append(payload)
+    return frames
+
+
+def standin_frames(count: int) -> list[bytes]:
+    device = StandinDevice("HW51Z00000000000", "POWERSTREAM", False)
+    return [device.next_payloads()[0] for _ in range(count)]
+
+
+def previous_decoder() -> Callable[[bytes], dict]:
+    ecopacket = import_module("ecoflow_bench_internal_proto.ecopacket_pb2")
+    powerstream = import_module("ecoflow_bench_internal_proto.powerstream_pb2")
+
+    def decode(payload: bytes) -> dict:
+        params = {}
+        packet = ecopacket.SendHeaderMsg()
+        packet.ParseFromString(payload)
+        if packet.msg.cmd_id == 1:
+            heartbeat = powerstream.InverterHeartbeat()
+            heartbeat.ParseFromString(packet.msg.pdata)
+            for descriptor in heartbeat.DESCRIPTOR.fields:
+                if heartbeat.HasField(descriptor.name):
+                    params[descriptor.name] = getattr(heartbeat, descriptor.name)
+        return params
+
+    return decode
+
+
+def engine_decoder() -> Callable[[bytes], dict]:
+    engine = import_module("ecoflow_bench_proto.engine")
+    powerstream = import_module("ecoflow_bench_internal_proto.powerstream_pb2")
+    # same table as devices/internal/powerstream.py
+    decoder = engine.EcoPacketDecoder({(20, 1): engine.ProtoMessage(powerstream.InverterHeartbeat)},
+                                      encrypted=engine.never_xored)
+    return decoder.decode
+
+
+def measure(decode: Callable[[bytes], dict], frames: list[bytes], rounds: int) -> tuple[float, float, float]:
+    best = float("inf")
+    costs: list[float] = []
+    for _ in range(rounds):
+        costs = []
+        for frame in frames:
+            begin = time.perf_counter()
+            decode(frame)
+            costs.append(time.perf_counter() - begin)
+        best = min(best, sum(costs) / len(costs))
+    costs.sort()
+    return best, costs[len(costs) // 2], costs[min(len(costs) - 1, int(len(costs) * 0.99))]
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m tools.bench_powerstream", description=__doc__.splitlines()[0])
+    parser.add_argument("--capture", help="MQTT capture file, PowerStream heartbeats are taken from it")
+    parser.add_argument("--frames", type=int, default=2000, help="number of stand-in frames without --capture")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    frames = captured_frames(args.capture) if args.capture else standin_frames(args.frames)
+    if not frames:
+        print("no PowerStream heartbeats found")
+        return 1
+    print(f"{len(frames)} frames, {sum(map(len, frames)) / len(frames):.0f} bytes each, best of {args.rounds} rounds")
+
+    baseline = None
+    for (name, decode) in (("previous", previous_decoder()), ("engine", engine_decoder())):
+        (mean, p50, p99) = measure(decode, frames, args.rounds)
+        ratio = f"  ({baseline / mean:.1f}x)" if baseline else ""
+        print(f"{name:>9}: mean {mean * 1e6:7.2f} us, p50 {p50 * 1e6:7.2f} us, p99 {p99 * 1e6:7.2f} us{ratio}")
+        baseline = baseline or mean
+
+
+if __name__ == "__main__":
+    sys.exit(main())
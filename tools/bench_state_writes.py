@@ -0,0 +1,121 @@
+"""Loop callbacks and state writes per quota message: one scheduled write per entity against the
+batched per-device flush of EcoflowDeviceUpdateCoordinator.async_schedule_write.
+
+Home Assistant is not needed: entities are modelled by their write path only. Every state write
+counts as one state_changed event on the bus. A burst of --burst messages is handled in the same
+loop iteration, as when several coordinator updates of a device land between two loop turns:
+
+    python -m tools.bench_state_writes [--entities 80] [--changed 0.4] [--burst 3]
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+
+
+class CountingLoop(asyncio.SelectorEventLoop):
+    def __init__(self):
+        super().__init__()
+        self.callbacks = 0
+
+    def call_soon(self, callback, *args, context=None):
+        self.callbacks += 1
+        return super().call_soon(callback, *args, context=context)
+
+    def call_soon_threadsafe(self, callback, *args, context=None):
+        self.callbacks += 1
+        return super().call_soon_threadsafe(callback, *args, context=context)
+
+
+class Bus:
+    def __init__(self):
+        self.state_changed = 0
+
+
+class Entity:
+    def __init__(self, loop: CountingLoop, bus: Bus):
+        self.loop = loop
+        self.bus = bus
+        self.hass = True
+
+    def async_write_ha_state(self):
+        self.bus.state_changed += 1
+
+    def schedule_update_ha_state(self):
+        # Entity.schedule_update_ha_state: one loop callback, and one write, per call
+        self.loop.call_soon_threadsafe(self.async_write_ha_state)
+
+
+class Batcher:
+    """The write batching of the coordinator."""
+
+    def __init__(self, loop: CountingLoop):
+        self.loop = loop
+        self.pending: dict[Entity, None] = {}
+
+    def async_schedule_write(self, entity: Entity):
+        if not self.pending:
+            self.loop.call_soon(self.flush)
+        self.pending[entity] = None
+
+    def flush(self):
+        entities = self.pending
+        self.pending = {}
+        for entity in entities:
+            if entity.hass is not None:
+                entity.async_write_ha_state()
+
+
+def changed_entities(count: int, changed: float, messages: int) -> list[list[int]]:
+    rnd = random.Random(42)
+    return [[index for index in range(count) if rnd.random() < changed] for _ in range(messages)]
+
+
+async def run(batched: bool, updates: list[list[int]], count: int, burst: int) -> tuple[int, int, float]:
+    loop = asyncio.get_running_loop()
+    bus = Bus()
+    entities = [Entity(loop, bus) for _ in range(count)]
+    batcher = Batcher(loop)
+    loop.callbacks = 0
+
+    begin = time.perf_counter()
+    for offset in range(0, len(updates), burst):
+        for changed in updates[offset:offset + burst]:
+            for index in changed:
+                if batched:
+                    batcher.async_schedule_write(entities[index])
+                else:
+                    entities[index].schedule_update_ha_state()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - begin
+    return loop.callbacks, bus.state_changed, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m tools.bench_state_writes", description=__doc__.splitlines()[0])
+    parser.add_argument("--entities", type=int, default=80, help="entities of the device")
+    parser.add_argument("--changed", type=float, default=0.4, help="share of entities changed by a message")
+    parser.add_argument("--burst", type=int, default=3, help="messages handled in one loop iteration")
+    parser.add_argument("--messages", type=int, default=3000)
+    args = parser.parse_args()
+
+    updates = changed_entities(args.entities, args.changed, args.messages)
+    print(f"{args.messages} messages, {args.entities} entities, "
+          f"{sum(map(len, updates)) / len(updates):.1f} changed per message, {args.burst} per loop iteration")
+    baseline = None
+    for (name, batched) in (("per entity", False), ("batched", True)):
+        loop = CountingLoop()
+        try:
+            (callbacks, writes, elapsed) = loop.run_until_complete(run(batched, updates, args.entities, args.burst))
+        finally:
+            loop.close()
+        ratio = f"  ({baseline / elapsed:.1f}x)" if baseline else ""
+        print(f"  {name:>10}: {callbacks / args.messages:6.1f} loop callbacks, {writes / args.messages:6.1f} "
+              f"state_changed events, {elapsed / args.messages * 1e6:7.1f} us per message{ratio}")
+        baseline = baseline or elapsed
+
+
+if __name__ == "__main__":
+    sys.exit(main())
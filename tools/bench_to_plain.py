@@ -0,0 +1,103 @@
+"""Per-message cost of flattening public API messages (devices/data_bridge.py to_plain).
+
+Times to_plain on Delta 2 Max-like quota messages and counts what every call leaves allocated
+(the returned message, its params dict and keys), by tracemalloc. With --baseline, the
+to_plain of another git revision runs on the same messages:
+
+    python -m tools.bench_to_plain --baseline HEAD~1
+"""
+import argparse
+import json
+import subprocess
+import sys
+import time
+import tracemalloc
+import types
+from pathlib import Path
+from typing import Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+BRIDGE_PATHS = ("custom_components/ecoflow_cloud_alt/devices/data_bridge.py",
+                "custom_components/ecoflow_cloud_alt/devices/public/data_bridge.py")
+
+
+def load_bridge(revision: str | None) -> types.ModuleType:
+    for path in BRIDGE_PATHS:
+        if revision is None:
+            if not (ROOT / path).exists():
+                continue
+            source = (ROOT / path).read_text()
+        else:
+            result = subprocess.run(["git", "show", f"{revision}:{path}"], cwd=ROOT, capture_output=True, text=True)
+            if result.returncode != 0:
+                continue
+            source = result.stdout
+        module = types.ModuleType(f"data_bridge_{revision or 'current'}")
+        exec(compile(source, f"{revision or 'working tree'}:{path}", "exec"), module.__dict__)
+        return module
+    raise FileNotFoundError(f"no data_bridge.py in {revision or 'the working tree'}")
+
+
+def sample_payloads() -> list[bytes]:
+    # a quota burst: one message per module, plus a cmdFunc/cmdId message
+    modules = {"pdStatus": 120, "mpptStatus": 60, "bmsStatus": 70, "emsStatus": 40, "invStatus": 50}
+    payloads = [json.dumps({"typeCode": type_code, "cmdFunc": 254, "cmdId": 21, "id": 1, "version": "1.0",
+                            "timestamp": 1760000000, "moduleSn": "R351ZEB4HF000000",
+                            "params": {f"field{i}": i * 3 for i in range(count)}}).encode()
+                for (type_code, count) in modules.items()]
+    payloads.append(json.dumps({"cmdFunc": 20, "cmdId": 1, "id": 2, "version": "1.0",
+                                "param": {f"field{i}": i for i in range(40)}}).encode())
+    return payloads
+
+
+def measure(to_plain: Callable, messages: list[bytes], rounds: int) -> tuple[float, float, float]:
+    decoded = [[json.loads(message) for message in messages] for _ in range(rounds)]
+    to_plain(json.loads(messages[0]))
+
+    best = float("inf")
+    for batch in decoded:
+        begin = time.perf_counter()
+        for raw in batch:
+            to_plain(raw)
+        best = min(best, (time.perf_counter() - begin) / len(batch))
+
+    # what every call leaves behind, with the results kept alive
+    batch = [json.loads(message) for message in messages]
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    results = [to_plain(raw) for raw in batch]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "lineno")
+    blocks = sum(stat.count_diff for stat in stats)
+    size = sum(stat.size_diff for stat in stats)
+    del results
+    return best, blocks / len(batch), size / len(batch)
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m tools.bench_to_plain", description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline", help="git revision to compare against")
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    payloads = sample_payloads()
+    print(f"{len(payloads)} messages, {sum(len(json.loads(p).get('params', {})) for p in payloads) // len(payloads)} "
+          f"params each, best of {args.rounds} rounds")
+
+    candidates = []
+    if args.baseline:
+        candidates.append((args.baseline, load_bridge(args.baseline)))
+    candidates.append(("working tree", load_bridge(None)))
+
+    baseline_cost = None
+    for (name, module) in candidates:
+        (cost, blocks, size) = measure(module.to_plain, payloads, args.rounds)
+        ratio = f"  ({baseline_cost / cost:.1f}x)" if baseline_cost else ""
+        print(f"{name:>14}: {cost * 1e6:7.2f} us/message, {blocks:6.1f} blocks / {size / 1024:6.1f} KiB "
+              f"left per message{ratio}")
+        baseline_cost = baseline_cost or cost
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,2 @@
+"""Local stand-in for the EcoFlow cloud: REST endpoints plus an MQTT broker that emits
+device telemetry. See README.md in this directory."""
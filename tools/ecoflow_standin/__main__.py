@@ -0,0 +1,127 @@
+import argparse
+import asyncio
+import json
+import logging
+import time
+
+from .broker import StandinBroker
+from .fleet import PRIVATE_USER_ID, StandinDevice, build_fleet
+from .rest import StandinRestServer
+
+_LOGGER = logging.getLogger("ecoflow_standin")
+
+
+class StandinCloud:
+
+    def __init__(self, broker: StandinBroker, devices: list[StandinDevice], rate: float):
+        self.broker = broker
+        self.devices = {device.sn: device for device in devices}
+        self.rate = rate
+        self.get_replies = 0
+        self.set_replies = 0
+        broker.client_publish_hooks.append(self.__on_client_publish)
+
+    async def emit(self):
+        """Publish one telemetry burst per device every 1/rate seconds."""
+        interval = 1.0 / self.rate
+        next_tick = time.monotonic()
+        while True:
+            for device in self.devices.values():
+                for payload in device.next_payloads():
+                    self.broker.publish(device.data_topic, payload)
+                status_topic = device.status_topic()
+                if status_topic and device.seq % 60 == 1:
+                    self.broker.publish(status_topic, json.dumps({"params": {"status": 1}}).encode("utf-8"))
+            next_tick += interval
+            await asyncio.sleep(max(0.0, next_tick - time.monotonic()))
+
+    async def report(self, period: float):
+        last = (0, 0)
+        while True:
+            await asyncio.sleep(period)
+            published = self.broker.published - last[0]
+            delivered = self.broker.delivered - last[1]
+            last = (self.broker.published, self.broker.delivered)
+            _LOGGER.info(f"{len(self.broker.sessions)} clients, {published / period:.1f} msg/s published, "
+                         f"{delivered / period:.1f} msg/s delivered, get/set replies: "
+                         f"{self.get_replies}/{self.set_replies}")
+
+    def __on_client_publish(self, topic: str, payload: bytes):
+        levels = topic.split("/")
+        # /app/{user_id}/{sn}/thing/property/{get|set}
+        if len(levels) != 7 or levels[1] != "app" or levels[6] not in ("get", "set"):
+            return
+        device = self.devices.get(levels[3])
+        if device is None:
+            return
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            message = {}
+
+        if levels[6] == "get":
+            self.get_replies += 1
+            reply = {"id": message.get("id"), "version": "1.1", "operateType": "latestQuotas",
+                     "data": {"online": 1, "quotaMap": device.quota()}}
+        else:
+            self.set_replies += 1
+            reply = {"id": message.get("id"), "version": "1.0", "operateType": message.get("operateType"),
+                     "data": {"ack": 0}}
+        self.broker.publish(f"{topic}_reply", json.dumps(reply).encode("utf-8"))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(prog="python -m tools.ecoflow_standin",
+                                     description="Local EcoFlow cloud stand-in for load and latency testing")
+    parser.add_argument("--api", choices=["private", "public"], default="public")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--advertise", default=None, help="MQTT host name reported to clients (default: --host)")
+    parser.add_argument("--http-port", type=int, default=8080)
+    parser.add_argument("--mqtt-port", type=int, default=1883)
+    parser.add_argument("--rate", type=float, default=1.0, help="telemetry bursts per device per second")
+    parser.add_argument("--delta-pro", type=int, default=0)
+    parser.add_argument("--river2", type=int, default=0)
+    parser.add_argument("--powerstream", type=int, default=0)
+    parser.add_argument("--alternator", type=int, default=0)
+    parser.add_argument("--report", type=float, default=10.0, help="stats log period, seconds")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    return parser.parse_args()
+
+
+async def main(args):
+    counts = {"DELTA_PRO": args.delta_pro, "RIVER_2": args.river2,
+              "POWERSTREAM": args.powerstream, "ALTERNATOR_CHARGER": args.alternator}
+    if not any(counts.values()):
+        counts["RIVER_2"] = 1
+    devices = build_fleet(counts, args.api == "public")
+
+    broker = StandinBroker(args.host, args.mqtt_port)
+    await broker.start()
+    rest = StandinRestServer(args.host, args.http_port, args.advertise or args.host, args.mqtt_port, devices)
+    rest.start()
+    cloud = StandinCloud(broker, devices, args.rate)
+
+    base_uri = f"http://{args.advertise or args.host}:{args.http_port}"
+    if args.api == "public":
+        base_uri += "/iot-open/sign"
+    _LOGGER.info(f"{len(devices)} {args.api} API devices, api_base_uri: {base_uri}")
+    if args.api == "private":
+        _LOGGER.info(f"private API user id: {PRIVATE_USER_ID}; add devices manually with these serial numbers:")
+    for device in devices:
+        _LOGGER.info(f"  {device.sn} {device.device_type}")
+
+    try:
+        await asyncio.gather(cloud.emit(), cloud.report(args.report))
+    finally:
+        rest.stop()
+        await broker.stop()
+
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    logging.basicConfig(level=logging.DEBUG if arguments.verbose else logging.INFO,
+                        format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    try:
+        asyncio.run(main(arguments))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,173 @@
+"""Minimal MQTT 3.1.1 broker, just enough for the integration's paho client.
+
+Supports CONNECT, SUBSCRIBE/UNSUBSCRIBE with '+' and '#' filters, PUBLISH with QoS 0/1
+from clients, PINGREQ and DISCONNECT. Messages are delivered to subscribers with QoS 0.
+Authentication and retained messages are ignored.
+"""
+import asyncio
+import logging
+import struct
+from typing import Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+CONNECT = 1
+CONNACK = 2
+PUBLISH = 3
+PUBACK = 4
+SUBSCRIBE = 8
+SUBACK = 9
+UNSUBSCRIBE = 10
+UNSUBACK = 11
+PINGREQ = 12
+PINGRESP = 13
+DISCONNECT = 14
+
+
+def topic_matches(topic_filter: str, topic: str) -> bool:
+    filter_levels = topic_filter.split("/")
+    topic_levels = topic.split("/")
+    for (index, level) in enumerate(filter_levels):
+        if level == "#":
+            return True
+        if index >= len(topic_levels):
+            return False
+        if level != "+" and level != topic_levels[index]:
+            return False
+    return len(filter_levels) == len(topic_levels)
+
+
+def _encode_length(length: int) -> bytes:
+    out = bytearray()
+    while True:
+        byte = length % 128
+        length //= 128
+        if length:
+            byte |= 0x80
+        out.append(byte)
+        if not length:
+            return bytes(out)
+
+
+def _string(value: bytes) -> bytes:
+    return struct.pack("!H", len(value)) + value
+
+
+def encode_publish(topic: str, payload: bytes) -> bytes:
+    body = _string(topic.encode("utf-8")) + payload
+    return bytes([PUBLISH << 4]) + _encode_length(len(body)) + body
+
+
+class BrokerSession:
+
+    def __init__(self, broker: "StandinBroker", reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.broker = broker
+        self.reader = reader
+        self.writer = writer
+        self.client_id = ""
+        self.subscriptions: set[str] = set()
+        self.delivered = 0
+
+    def send(self, packet: bytes):
+        if not self.writer.is_closing():
+            self.writer.write(packet)
+
+    async def run(self):
+        try:
+            while True:
+                header = await self.reader.readexactly(1)
+                length, multiplier = 0, 1
+                while True:
+                    byte = (await self.reader.readexactly(1))[0]
+                    length += (byte & 0x7F) * multiplier
+                    multiplier *= 128
+                    if not byte & 0x80:
+                        break
+                body = await self.reader.readexactly(length) if length else b""
+                if not self.__handle(header[0] >> 4, header[0] & 0x0F, body):
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.broker.sessions.discard(self)
+            self.writer.close()
+
+    def __handle(self, packet_type: int, flags: int, body: bytes) -> bool:
+        if packet_type == CONNECT:
+            name_len = struct.unpack("!H", body[0:2])[0]
+            pos = 2 + name_len + 4  # protocol name, level, connect flags, keepalive
+            id_len = struct.unpack("!H", body[pos:pos + 2])[0]
+            self.client_id = body[pos + 2:pos + 2 + id_len].decode("utf-8")
+            self.send(bytes([CONNACK << 4, 2, 0, 0]))
+            _LOGGER.info(f"client connected: {self.client_id}")
+        elif packet_type == SUBSCRIBE:
+            packet_id = body[0:2]
+            pos, granted = 2, bytearray()
+            while pos < len(body):
+                topic_len = struct.unpack("!H", body[pos:pos + 2])[0]
+                self.subscriptions.add(body[pos + 2:pos + 2 + topic_len].decode("utf-8"))
+                granted.append(min(body[pos + 2 + topic_len], 1))
+                pos += 3 + topic_len
+            self.send(bytes([SUBACK << 4]) + _encode_length(2 + len(granted)) + packet_id + bytes(granted))
+            _LOGGER.info(f"{self.client_id} subscribed, {len(self.subscriptions)} filters")
+        elif packet_type == UNSUBSCRIBE:
+            packet_id = body[0:2]
+            pos = 2
+            while pos < len(body):
+                topic_len = struct.unpack("!H", body[pos:pos + 2])[0]
+                self.subscriptions.discard(body[pos + 2:pos + 2 + topic_len].decode("utf-8"))
+                pos += 2 + topic_len
+            self.send(bytes([UNSUBACK << 4, 2]) + packet_id)
+        elif packet_type == PUBLISH:
+            qos = (flags >> 1) & 0x03
+            topic_len = struct.unpack("!H", body[0:2])[0]
+            topic = body[2:2 + topic_len].decode("utf-8")
+            pos = 2 + topic_len
+            if qos > 0:
+                self.send(bytes([PUBACK << 4, 2]) + body[pos:pos + 2])
+                pos += 2
+            self.broker.publish(topic, body[pos:], from_client=True)
+        elif packet_type == PINGREQ:
+            self.send(bytes([PINGRESP << 4, 0]))
+        elif packet_type == DISCONNECT:
+            return False
+        return True
+
+
+class StandinBroker:
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.sessions: set[BrokerSession] = set()
+        self.client_publish_hooks: list[Callable[[str, bytes], None]] = []
+        self.published = 0
+        self.delivered = 0
+        self.__server: asyncio.AbstractServer | None = None
+
+    async def start(self):
+        self.__server = await asyncio.start_server(self.__accept, self.host, self.port)
+        _LOGGER.info(f"MQTT broker listening on {self.host}:{self.port}")
+
+    async def stop(self):
+        if self.__server:
+            self.__server.close()
+            await self.__server.wait_closed()
+
+    def publish(self, topic: str, payload: bytes, from_client: bool = False):
+        self.published += 1
+        packet = None
+        for session in list(self.sessions):
+            if any(topic_matches(topic_filter, topic) for topic_filter in session.subscriptions):
+                packet = packet or encode_publish(topic, payload)
+                session.send(packet)
+                session.delivered += 1
+                self.delivered += 1
+        if from_client:
+            for hook in self.client_publish_hooks:
+                hook(topic, payload)
+
+    async def __accept(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        session = BrokerSession(self, reader, writer)
+        self.sessions.add(session)
+        await session.run()
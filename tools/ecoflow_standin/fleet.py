@@ -0,0 +1,231 @@
+import json
+import random
+import struct
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+PRIVATE_USER_ID = "1000001"
+PUBLIC_USERNAME = "open-standin"
+
+# internal device type -> product name reported by /device/list
+PRODUCT_NAMES = {
+    "DELTA_PRO": "DELTA Pro",
+    "RIVER_2": "RIVER 2",
+    "POWERSTREAM": "PowerStream",
+    "ALTERNATOR_CHARGER": "Alternator Charger",
+}
+
+SN_PREFIXES = {
+    "DELTA_PRO": "DCABZ",
+    "RIVER_2": "R601Z",
+    "POWERSTREAM": "HW51Z",
+    "ALTERNATOR_CHARGER": "F371Z",
+}
+
+
+def _varint(value: int) -> bytes:
+    value &= 0xFFFFFFFFFFFFFFFF
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def pb_varint(field_number: int, value: int) -> bytes:
+    return _varint(field_number << 3) + _varint(value)
+
+
+def pb_float(field_number: int, value: float) -> bytes:
+    return _varint((field_number << 3) | 5) + struct.pack("<f", value)
+
+
+def pb_bytes(field_number: int, value: bytes) -> bytes:
+    return _varint((field_number << 3) | 2) + _varint(len(value)) + value
+
+
+def _walk(value: float, low: float, high: float, step: float) -> float:
+    return min(high, max(low, value + random.uniform(-step, step)))
+
+
+@dataclass
+class StandinDevice:
+    sn: str
+    device_type: str
+    public_api: bool
+    seq: int = 0
+    state: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def product_name(self) -> str:
+        return PRODUCT_NAMES[self.device_type]
+
+    @property
+    def data_topic(self) -> str:
+        if self.public_api:
+            return f"/open/{PUBLIC_USERNAME}/{self.sn}/quota"
+        return f"/app/device/property/{self.sn}"
+
+    def status_topic(self) -> str | None:
+        return f"/open/{PUBLIC_USERNAME}/{self.sn}/status" if self.public_api else None
+
+    def quota(self) -> dict[str, Any]:
+        """Flat parameters as returned by /device/quota/all and latestQuotas."""
+        if self.device_type == "DELTA_PRO":
+            return self.__delta_pro()
+        if self.device_type == "RIVER_2":
+            return self.__river2()
+        if self.device_type == "POWERSTREAM":
+            return {f"20_1.{k}": v for (k, v) in self.__powerstream_public().items()}
+        return {}
+
+    def next_payloads(self) -> list[bytes]:
+        """One telemetry burst, encoded the way the real device sends it."""
+        self.seq += 1
+        now = int(time.time() * 1000)
+        if self.device_type == "POWERSTREAM":
+            if self.public_api:
+                return [self.__json({"cmdFunc": 20, "cmdId": 1, "param": self.__powerstream_public(),
+                                     "timestamp": now})]
+            return [self.__powerstream_protobuf()]
+        if self.device_type == "ALTERNATOR_CHARGER":
+            return [self.__alternator_protobuf()]
+        if self.device_type == "RIVER_2" and self.public_api:
+            params = self.__river2()
+            groups: dict[str, dict[str, Any]] = {}
+            for (key, value) in params.items():
+                (prefix, name) = key.split(".", 1)
+                groups.setdefault(prefix, {})[name] = value
+            type_codes = {"pd": "pdStatus", "mppt": "mpptStatus", "inv": "invStatus",
+                          "bms_bmsStatus": "bmsStatus", "bms_emsStatus": "emsStatus"}
+            return [self.__json({"typeCode": type_codes[prefix], "params": values, "timestamp": now})
+                    for (prefix, values) in groups.items()]
+        return [self.__json({"id": self.seq, "version": "1.0", "timestamp": now, "moduleType": 0,
+                             "params": self.quota()})]
+
+    def __json(self, message: dict[str, Any]) -> bytes:
+        return json.dumps(message, separators=(",", ":")).encode("utf-8")
+
+    def __value(self, key: str, low: float, high: float, step: float) -> int:
+        value = _walk(self.state.get(key, (low + high) / 2), low, high, step)
+        self.state[key] = value
+        return int(value)
+
+    def __delta_pro(self) -> dict[str, Any]:
+        return {
+            "bmsMaster.soc": self.__value("soc", 5, 100, 1),
+            "bmsMaster.designCap": 45000,
+            "bmsMaster.fullCap": 44000,
+            "bmsMaster.remainCap": self.__value("remainCap", 1000, 44000, 200),
+            "bmsMaster.soh": 99,
+            "bmsMaster.temp": self.__value("temp", 18, 40, 1),
+            "bmsMaster.amp": self.__value("amp", -20000, 20000, 500),
+            "bmsMaster.cycles": 42,
+            "ems.lcdShowSoc": self.__value("soc", 5, 100, 0),
+            "ems.chgRemainTime": self.__value("chgRemain", 0, 600, 5),
+            "ems.dsgRemainTime": self.__value("dsgRemain", 0, 5000, 20),
+            "pd.wattsInSum": self.__value("in", 0, 3000, 40),
+            "pd.wattsOutSum": self.__value("out", 0, 3600, 40),
+            "pd.typec1Watts": self.__value("typec1", 0, 100, 3),
+            "pd.usb1Watts": self.__value("usb1", 0, 18, 1),
+            "inv.inputWatts": self.__value("acIn", 0, 3000, 40),
+            "inv.outputWatts": self.__value("acOut", 0, 3600, 40),
+            "inv.acInVol": self.__value("acInVol", 220000, 240000, 500),
+            "inv.invOutVol": self.__value("acOutVol", 228000, 232000, 200),
+            "mppt.inWatts": self.__value("solar", 0, 16000, 100),
+            "mppt.inVol": self.__value("solarVol", 0, 1500, 10),
+            "mppt.outWatts": self.__value("dcOut", 0, 1200, 10),
+        }
+
+    def __river2(self) -> dict[str, Any]:
+        return {
+            "bms_bmsStatus.soc": self.__value("soc", 5, 100, 1),
+            "bms_bmsStatus.temp": self.__value("temp", 18, 40, 1),
+            "bms_bmsStatus.vol": self.__value("vol", 24000, 29000, 50),
+            "bms_bmsStatus.cycles": 17,
+            "bms_emsStatus.lcdShowSoc": self.__value("soc", 5, 100, 0),
+            "bms_emsStatus.chgRemainTime": self.__value("chgRemain", 0, 600, 5),
+            "bms_emsStatus.dsgRemainTime": self.__value("dsgRemain", 0, 5000, 20),
+            "pd.wattsInSum": self.__value("in", 0, 360, 10),
+            "pd.wattsOutSum": self.__value("out", 0, 300, 10),
+            "pd.usb1Watts": self.__value("usb1", 0, 12, 1),
+            "pd.typec1Watts": self.__value("typec1", 0, 60, 2),
+            "inv.inputWatts": self.__value("acIn", 0, 360, 10),
+            "inv.outputWatts": self.__value("acOut", 0, 300, 10),
+            "inv.acInVol": self.__value("acInVol", 220000, 240000, 500),
+            "inv.invOutVol": self.__value("acOutVol", 228000, 232000, 200),
+            "mppt.inWatts": self.__value("solar", 0, 1100, 10),
+        }
+
+    def __powerstream_fields(self) -> dict[str, int]:
+        return {
+            "pv1_input_watts": self.__value("pv1w", 0, 4000, 30),
+            "pv1_input_volt": self.__value("pv1v", 0, 550, 5),
+            "pv1_input_cur": self.__value("pv1c", 0, 130, 3),
+            "pv1_temp": self.__value("pv1t", 150, 450, 3),
+            "pv2_input_watts": self.__value("pv2w", 0, 4000, 30),
+            "pv2_input_volt": self.__value("pv2v", 0, 550, 5),
+            "pv2_input_cur": self.__value("pv2c", 0, 130, 3),
+            "pv2_temp": self.__value("pv2t", 150, 450, 3),
+            "bat_soc": self.__value("soc", 5, 100, 1),
+            "bat_input_watts": self.__value("batw", -8000, 8000, 50),
+            "bat_temp": self.__value("batt", 150, 400, 3),
+            "inv_output_watts": self.__value("invw", 0, 8000, 50),
+            "inv_op_volt": self.__value("invv", 2250, 2350, 5),
+            "inv_freq": self.__value("freq", 499, 501, 1),
+            "inv_temp": self.__value("invt", 200, 500, 3),
+            "permanent_watts": self.__value("perm", 0, 8000, 0),
+            "dynamic_watts": self.__value("dyn", 0, 8000, 30),
+            "rated_power": 8000,
+        }
+
+    def __powerstream_public(self) -> dict[str, int]:
+        names = {"pv1_input_watts": "pv1InputWatts", "pv1_input_volt": "pv1InputVolt", "pv1_input_cur": "pv1InputCur",
+                 "pv1_temp": "pv1Temp", "pv2_input_watts": "pv2InputWatts", "pv2_input_volt": "pv2InputVolt",
+                 "pv2_input_cur": "pv2InputCur", "pv2_temp": "pv2Temp", "bat_soc": "batSoc",
+                 "bat_input_watts": "batInputWatts", "bat_temp": "batTemp", "inv_output_watts": "invOutputWatts",
+                 "inv_op_volt": "invOpVolt", "inv_freq": "invFreq", "inv_temp": "invTemp",
+                 "permanent_watts": "permanentWatts", "dynamic_watts": "dynamicWatts", "rated_power": "ratedPower"}
+        return {names[k]: v for (k, v) in self.__powerstream_fields().items()}
+
+    def __powerstream_protobuf(self) -> bytes:
+        # field numbers of InverterHeartbeat in devices/internal/proto/powerstream.proto
+        numbers = {"pv1_input_volt": 16, "pv1_input_cur": 18, "pv1_input_watts": 19, "pv1_temp": 20,
+                   "pv2_input_volt": 21, "pv2_input_cur": 23, "pv2_input_watts": 24, "pv2_temp": 25,
+                   "bat_input_watts": 29, "bat_temp": 30, "bat_soc": 31, "inv_op_volt": 36,
+                   "inv_output_watts": 38, "inv_temp": 39, "inv_freq": 40, "permanent_watts": 48,
+                   "dynamic_watts": 49, "rated_power": 58}
+        pdata = b"".join(pb_varint(numbers[k], v) for (k, v) in self.__powerstream_fields().items())
+        header = (pb_bytes(1, pdata) + pb_varint(2, 1) + pb_varint(3, 32) + pb_varint(8, 20) + pb_varint(9, 1)
+                  + pb_varint(10, len(pdata)) + pb_varint(14, self.seq))
+        return pb_bytes(1, header)
+
+    def __alternator_protobuf(self) -> bytes:
+        # field numbers of AlternatorHeartbeat in devices/proto/alternator.proto
+        pdata = (pb_varint(102, self.__value("temp", 20, 60, 1))
+                 + pb_float(105, -float(self.__value("alt", 0, 800, 20)))
+                 + pb_varint(138, 130)
+                 + pb_float(139, self.__value("carVol", 11, 15, 1) + random.random())
+                 + pb_varint(262, self.__value("soc", 5, 100, 1))
+                 + pb_varint(268, self.__value("toFull", 0, 600, 5))
+                 + pb_float(425, -float(self.__value("station", 0, 800, 20)))
+                 + pb_varint(581, 1)
+                 + pb_varint(597, 1)
+                 + pb_float(598, 800.0)
+                 + pb_float(603, 800.0))
+        seq = self.seq & 0xFF
+        encrypted = bytes(b ^ seq for b in pdata)
+        header = (pb_bytes(1, encrypted) + pb_varint(2, 20) + pb_varint(3, 32) + pb_varint(6, 1)
+                  + pb_varint(8, 254) + pb_varint(9, 21) + pb_varint(10, len(pdata)) + pb_varint(14, seq))
+        return pb_bytes(1, header)
+
+
+def build_fleet(counts: dict[str, int], public_api: bool) -> list[StandinDevice]:
+    devices = []
+    for (device_type, count) in counts.items():
+        for index in range(count):
+            sn = f"{SN_PREFIXES[device_type]}{index:011d}"
+            devices.append(StandinDevice(sn, device_type, public_api))
+    return devices
@@ -0,0 +1,84 @@
+"""REST endpoints of the private (app) and public (open) EcoFlow APIs used by the integration."""
+import json
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from .fleet import PRIVATE_USER_ID, PUBLIC_USERNAME, StandinDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class StandinRestServer:
+
+    def __init__(self, host: str, port: int, mqtt_host: str, mqtt_port: int, devices: list[StandinDevice]):
+        self.mqtt_host = mqtt_host
+        self.mqtt_port = mqtt_port
+        self.devices = {device.sn: device for device in devices}
+        self.requests = 0
+        self.__server = ThreadingHTTPServer((host, port), self.__handler_class())
+        self.__thread: threading.Thread | None = None
+
+    def start(self):
+        self.__thread = threading.Thread(target=self.__server.serve_forever, name="standin-rest", daemon=True)
+        self.__thread.start()
+        _LOGGER.info(f"REST API listening on {self.__server.server_address[0]}:{self.__server.server_address[1]}")
+
+    def stop(self):
+        self.__server.shutdown()
+        self.__server.server_close()
+
+    def route(self, method: str, path: str, query: dict[str, list[str]]) -> tuple[int, dict]:
+        self.requests += 1
+        if method == "POST" and path == "/auth/login":
+            return 200, self.__success({"token": "standin-token",
+                                        "user": {"userId": PRIVATE_USER_ID, "name": "Stand-in User"}})
+        if path in ("/iot-auth/app/certification", "/iot-open/sign/certification"):
+            account = PUBLIC_USERNAME if path.startswith("/iot-open") else f"app-{PRIVATE_USER_ID}"
+            return 200, self.__success({"url": self.mqtt_host, "port": str(self.mqtt_port),
+                                        "certificateAccount": account, "certificatePassword": "standin",
+                                        "protocol": "mqtt"})
+        if path == "/iot-open/sign/device/list":
+            return 200, self.__success([{"sn": device.sn, "deviceName": f"{device.product_name} {device.sn[-4:]}",
+                                         "productName": device.product_name, "online": 1}
+                                        for device in self.devices.values()])
+        if path == "/iot-open/sign/device/quota/all":
+            device = self.devices.get(query.get("sn", [""])[0])
+            if device is None:
+                return 200, {"code": "1006", "message": "device not found"}
+            return 200, self.__success(device.quota())
+        return 404, {"code": "404", "message": f"unknown endpoint {path}"}
+
+    @staticmethod
+    def __success(data) -> dict:
+        return {"code": "0", "message": "Success", "data": data}
+
+    def __handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                self.__respond("GET")
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                if length:
+                    self.rfile.read(length)
+                self.__respond("POST")
+
+            def __respond(self, method: str):
+                url = urlparse(self.path)
+                (status, body) = server.route(method, url.path, parse_qs(url.query))
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                _LOGGER.debug(format % args)
+
+        return Handler
@@ -0,0 +1,120 @@
+"""Replays an MQTT capture through the integration's message path.
+
+Captures are written by the integration when the entry data contains "mqtt_capture_file".
+Every message is routed and decoded exactly as on the ingest thread
+(topic -> device, BaseDevice.handle_message -> _prepare_data -> EcoflowDataHolder), either
+at the original pace or as fast as possible, and the per-message cost is reported.
+
+    python -m tools.mqtt_replay ecoflow.cap [--realtime] [--loops N] [--params out.json]
+
+Needs Home Assistant importable, like the integration itself.
+"""
+import argparse
+import json
+import statistics
+import time
+
+from custom_components.ecoflow_cloud_alt.api.capture import RECORD_DEVICES, RECORD_MESSAGE, read_capture
+from custom_components.ecoflow_cloud_alt.api.ecoflow_mqtt import build_routes
+from custom_components.ecoflow_cloud_alt.devices import BaseDevice, DiagnosticDevice, EcoflowDeviceInfo
+from custom_components.ecoflow_cloud_alt.devices.data_holder import EcoflowDataHolder
+
+
+def create_device(info: EcoflowDeviceInfo) -> BaseDevice:
+    from custom_components.ecoflow_cloud_alt.devices.registry import device_by_product, devices
+    registry = device_by_product if info.public_api else devices
+    device = registry[info.device_type](info) if info.device_type in registry else DiagnosticDevice(info)
+    # the data holder only, no coordinator: nothing is broadcast to Home Assistant
+    device.data = EcoflowDataHolder()
+    return device
+
+
+def load_capture(path: str) -> tuple[dict[str, BaseDevice], list[tuple[float, str, bytes]]]:
+    devices: dict[str, BaseDevice] = {}
+    messages: list[tuple[float, str, bytes]] = []
+    for (record_type, received, topic, payload) in read_capture(path):
+        if record_type == RECORD_DEVICES:
+            for (sn, info) in json.loads(payload).items():
+                if sn not in devices:
+                    devices[sn] = create_device(EcoflowDeviceInfo(**info))
+        elif record_type == RECORD_MESSAGE:
+            messages.append((received, topic, payload))
+    return devices, messages
+
+
+def replay(devices: dict[str, BaseDevice], messages: list[tuple[float, str, bytes]], realtime: bool) -> dict:
+    routes = build_routes(devices)
+    costs: list[float] = []
+    unmatched = 0
+    errors = 0
+
+    started = time.perf_counter()
+    first_received = messages[0][0] if messages else 0.0
+    for (received, topic, payload) in messages:
+        if realtime:
+            delay = (received - first_received) - (time.perf_counter() - started)
+            if delay > 0:
+                time.sleep(delay)
+
+        route = routes.get(topic)
+        if route is None:
+            unmatched += 1
+            continue
+        (device, kind) = route
+        begin = time.perf_counter()
+        try:
+            device.handle_message(kind, payload)
+        except Exception:
+            errors += 1
+        costs.append(time.perf_counter() - begin)
+    elapsed = time.perf_counter() - started
+
+    return {"messages": len(messages), "handled": len(costs), "unmatched": unmatched, "errors": errors,
+            "elapsed": elapsed, "costs": costs}
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m tools.mqtt_replay", description=__doc__.splitlines()[0])
+    parser.add_argument("capture")
+    parser.add_argument("--realtime", action="store_true", help="keep the original message timing")
+    parser.add_argument("--loops", type=int, default=1, help="replay the capture N times (fast mode)")
+    parser.add_argument("--params", help="write the resulting params of every device to this JSON file")
+    args = parser.parse_args()
+
+    (devices, messages) = load_capture(args.capture)
+    print(f"{args.capture}: {len(messages)} messages, {len(devices)} devices")
+    for (sn, device) in devices.items():
+        print(f"  {sn}: {device.device_info.device_type} ({type(device).__name__})")
+
+    costs: list[float] = []
+    elapsed = 0.0
+    for _ in range(args.loops if not args.realtime else 1):
+        result = replay(devices, messages, args.realtime)
+        costs.extend(result["costs"])
+        elapsed += result["elapsed"]
+        print(f"handled {result['handled']}, unmatched {result['unmatched']}, errors {result['errors']}")
+
+    if costs:
+        total = sum(costs)
+        print(f"wall time  {elapsed:.3f} s, {len(costs) / elapsed:.0f} msg/s")
+        print(f"decode     {total:.3f} s, {len(costs) / total:.0f} msg/s")
+        print(f"per message: mean {statistics.fmean(costs) * 1e6:.1f} us, p50 {percentile(costs, 0.5) * 1e6:.1f} us, "
+              f"p99 {percentile(costs, 0.99) * 1e6:.1f} us, max {max(costs) * 1e6:.1f} us")
+
+    for (sn, device) in devices.items():
+        print(f"  {sn}: {len(device.data.params)} params")
+    if args.params:
+        with open(args.params, "w") as file:
+            json.dump({sn: device.data.params for (sn, device) in devices.items()}, file, indent=2, default=str,
+                      sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()